@@ -0,0 +1,232 @@
+"""Measure the SDK's throughput and latency against a local stand-in of the API
+
+Usage:
+    python benchmarks/api_bench.py                          # compare against benchmarks/api_bench.json
+    python benchmarks/api_bench.py --update                 # record the results as the new baseline
+    python benchmarks/api_bench.py --only get,send_stream --output results.json
+
+Starts ``benchmarks/mock_api.py`` in its own process, so the server doesn't compete with the client for the GIL, and
+runs each scenario ``--iterations`` times on ``--concurrency`` threads after a warm-up:
+
+    list         walk every page of list_projects with pagination.iter_all
+    get          get_project
+    get_async    get_project.asyncio_detailed, --concurrency calls gathered at a time
+    send         send_message
+    send_stream  send_message with stream=True, reading every event
+    upload       create_source with an --upload-kib file
+    decode       decode a get_pages body of --decode-items pages, without the network
+
+Results are written as JSON: per scenario, the operations per second and the mean, p50, p90 and p99 latencies in
+milliseconds. The check fails (exit status 1) when a scenario's p50 is more than ``--tolerance`` slower than the
+baseline's.
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "api_bench.json")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from openapi_examples import load_spec, response_example  # noqa: E402
+
+from customgpt_client import CustomGPT, pagination  # noqa: E402
+from customgpt_client.api.conversations import send_message  # noqa: E402
+from customgpt_client.api.projects import get_project, list_projects  # noqa: E402
+from customgpt_client.api.sources import create_source  # noqa: E402
+from customgpt_client.decoding import decode  # noqa: E402
+from customgpt_client.models import CreateSourceMultipartData, GetPagesResponse200, SendMessageJsonBody  # noqa: E402
+from customgpt_client.types import File  # noqa: E402
+
+SCENARIOS = ("list", "get", "get_async", "send", "send_stream", "upload", "decode")
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def summarize(latencies: List[float], wall: float) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "ops": len(ordered),
+        "ops_per_second": round(len(ordered) / wall, 1),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        "p50_ms": round(percentile(ordered, 0.5) * 1000, 3),
+        "p90_ms": round(percentile(ordered, 0.9) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+    }
+
+
+def run(operation: Callable[[], Any], iterations: int, concurrency: int, warmup: int) -> Dict[str, float]:
+    def timed(_: int) -> float:
+        started = time.perf_counter()
+        operation()
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(warmup)))
+        started = time.perf_counter()
+        latencies = list(executor.map(timed, range(iterations)))
+        return summarize(latencies, time.perf_counter() - started)
+
+
+def run_async(client: CustomGPT, iterations: int, concurrency: int, warmup: int) -> Dict[str, float]:
+    async def timed() -> float:
+        started = time.perf_counter()
+        await get_project.asyncio_detailed(1, client=client)
+        return time.perf_counter() - started
+
+    async def main() -> Dict[str, float]:
+        await asyncio.gather(*(timed() for _ in range(warmup)))
+        latencies: List[float] = []
+        started = time.perf_counter()
+        for batch in range(0, iterations, concurrency):
+            latencies += await asyncio.gather(*(timed() for _ in range(min(concurrency, iterations - batch))))
+        result = summarize(latencies, time.perf_counter() - started)
+        await client.aclose()
+        return result
+
+    return asyncio.run(main())
+
+
+def scenarios(client: CustomGPT, args: argparse.Namespace) -> Dict[str, Callable[[], Any]]:
+    upload = b"%PDF" * (args.upload_kib * 256)
+    prompt = SendMessageJsonBody(prompt="Write me hello world program in C")
+    spec = load_spec(args.spec)
+    operation = spec["paths"]["/api/v1/projects/{projectId}/pages"]["get"]
+    pages_body = json.dumps(response_example(spec, operation, args.decode_items)[1]).encode()
+
+    def upload_source() -> Any:
+        with File(payload=io.BytesIO(upload), file_name="doc.pdf", mime_type="application/pdf") as file:
+            return create_source.sync_detailed(1, client=client, multipart_data=CreateSourceMultipartData(file=file))
+
+    return {
+        "list": lambda: sum(1 for _ in pagination.iter_all(list_projects, client=client)),
+        "get": lambda: get_project.sync_detailed(1, client=client),
+        "send": lambda: send_message.sync_detailed(1, "1", client=client, json_body=prompt),
+        "send_stream": lambda: send_message.sync_detailed(1, "1", client=client, json_body=prompt, stream=True)
+        .until_done()
+        .answer,
+        "upload": upload_source,
+        "decode": lambda: decode(GetPagesResponse200, client.json_codec.loads(pages_body)).data.pages.total,
+    }
+
+
+def measure(args: argparse.Namespace) -> Dict[str, Any]:
+    command = [
+        sys.executable,
+        os.path.join(ROOT, "benchmarks", "mock_api.py"),
+        f"--page-size={args.page_size}",
+        f"--last-page={args.last_page}",
+        f"--stream-chunks={args.stream_chunks}",
+    ] + ([f"--spec={args.spec}"] if args.spec else [])
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        base_url = server.stdout.readline().strip()
+        client = CustomGPT(
+            api_key="benchmark", base_url=base_url, pool_maxsize=max(args.concurrency, 10), rate_limiter=None
+        )
+        with client:
+            operations = scenarios(client, args)
+            results = {}
+            for name in args.only:
+                if name == "get_async":
+                    results[name] = run_async(client, args.iterations, args.concurrency, args.warmup)
+                else:
+                    results[name] = run(operations[name], args.iterations, args.concurrency, args.warmup)
+                print(f"{name:12} {json.dumps(results[name])}", file=sys.stderr)
+            codec = client.json_codec.name
+    finally:
+        server.terminate()
+        server.wait()
+    return {
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "json_codec": codec},
+        "parameters": {
+            name: getattr(args, name)
+            for name in (
+                "iterations",
+                "concurrency",
+                "page_size",
+                "last_page",
+                "stream_chunks",
+                "upload_kib",
+                "decode_items",
+            )
+        },
+        "results": results,
+    }
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Get the scenarios whose median latency regressed beyond tolerance, printing the comparison"""
+    regressions = []
+    print(f"{'scenario':12} {'p50 ms':>10} {'baseline':>10} {'change':>8}")
+    for name, current in result["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            print(f"{name:12} {current['p50_ms']:>10} {'-':>10}")
+            continue
+        change = current["p50_ms"] / previous["p50_ms"] - 1 if previous["p50_ms"] else 0.0
+        print(f"{name:12} {current['p50_ms']:>10} {previous['p50_ms']:>10} {change:>+8.1%}")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", help="The openapi.json to serve (default: the one at the repository root)")
+    parser.add_argument("--only", default=",".join(SCENARIOS), help="Comma-separated scenarios (default: all)")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed operations per scenario (default: 200)")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed operations per scenario (default: 20)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Operations in flight at once (default: 1)")
+    parser.add_argument("--page-size", type=int, default=100, help="Items per listing page (default: 100)")
+    parser.add_argument("--last-page", type=int, default=10, help="Pages walked by the list scenario (default: 10)")
+    parser.add_argument("--stream-chunks", type=int, default=50, help="Events of a streamed message (default: 50)")
+    parser.add_argument("--upload-kib", type=int, default=1024, help="Size of the uploaded file (default: 1024)")
+    parser.add_argument("--decode-items", type=int, default=1000, help="Pages in the decoded body (default: 1000)")
+    parser.add_argument("--output", help="Also write the results to this file")
+    parser.add_argument("--baseline", default=BASELINE, help="The results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown as a fraction (default: 0.25)")
+    parser.add_argument("--update", action="store_true", help="Store the results as the new baseline")
+    args = parser.parse_args()
+    args.only = [name for name in args.only.split(",") if name]
+    unknown = set(args.only) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    result = measure(args)
+    for path in filter(None, [args.output, args.baseline if args.update else None]):
+        with open(path, "w") as file:
+            json.dump(result, file, indent=2)
+            file.write("\n")
+    if args.update:
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline recorded yet, run with --update")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    if baseline.get("parameters") != result["parameters"]:
+        print("The baseline was recorded with other parameters, the numbers may not be comparable")
+    regressions = compare(result, baseline, args.tolerance)
+    if regressions:
+        print(f"Regression: {', '.join(regressions)} slower than the baseline by more than {args.tolerance:.0%}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Measure the wall time of ``import customgpt_client`` in fresh interpreters
+
+Usage:
+    python benchmarks/import_time.py                 # compare against benchmarks/import_time.json
+    python benchmarks/import_time.py --update        # record the current timing as the new baseline
+
+Each run starts ``--runs`` new interpreters, times the import inside them and reports the median. The check fails
+(exit status 1) when the median is more than ``--tolerance`` slower than the baseline.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "import_time.json")
+
+SNIPPET = """
+import sys, time
+started = time.perf_counter()
+import customgpt_client
+elapsed = time.perf_counter() - started
+models = sum(name.startswith("customgpt_client.models.") for name in sys.modules)
+print(elapsed, models)
+"""
+
+
+def measure(runs: int) -> dict:
+    timings = []
+    models = 0
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", SNIPPET], cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        models = int(output[1])
+    return {
+        "median_seconds": round(statistics.median(timings), 4),
+        "min_seconds": round(min(timings), 4),
+        "models_loaded": models,
+        "python": platform.python_version(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="Number of fresh interpreters to time (default: 15)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown as a fraction (default: 0.25)")
+    parser.add_argument("--update", action="store_true", help="Store the result as the new baseline")
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(json.dumps(result, indent=2))
+    if args.update:
+        with open(BASELINE, "w") as file:
+            json.dump(result, file, indent=2)
+            file.write("\n")
+        return 0
+    if not os.path.exists(BASELINE):
+        print("No baseline recorded yet, run with --update")
+        return 0
+
+    with open(BASELINE) as file:
+        baseline = json.load(file)
+    limit = baseline["median_seconds"] * (1 + args.tolerance)
+    if result["median_seconds"] > limit or result["models_loaded"] > baseline["models_loaded"]:
+        print(f"Regression: median {result['median_seconds']}s vs baseline {baseline['median_seconds']}s")
+        return 1
+    print(f"OK: median {result['median_seconds']}s within {limit:.4f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Serve a local stand-in of the CustomGPT API built from openapi.json, for the benchmarks
+
+Usage:
+    python benchmarks/mock_api.py [--port 8080] [--page-size 100] [--last-page 10] [--stream-chunks 50]
+
+Every operation of the spec answers with the example of its first successful response. Listings hold
+``--page-size`` items per page and report ``--last-page`` pages; ``send_message`` with ``stream=1`` answers with
+``--stream-chunks`` server-sent ``progress`` events and a ``finish`` event, written as they would arrive. Request
+bodies (uploads included) are read and dropped. Bodies are built once per page and kept, so the server costs as
+little as possible per request. The first line printed is the base URL.
+"""
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from openapi_examples import find_paginator, load_spec, operations, path_pattern, response_example  # noqa: E402
+
+PREVIEW = b"%PDF-1.4 " + bytes(range(256)) * 64
+
+
+class MockAPI:
+    """The canned answers of every operation of a spec
+
+    Args:
+        spec: The loaded openapi.json.
+        page_size: The number of items in each page of a listing.
+        last_page: The number of pages listings report.
+        stream_chunks: The number of progress events of a streamed message.
+    """
+
+    def __init__(self, spec: Dict[str, Any], page_size: int = 100, last_page: int = 10, stream_chunks: int = 50):
+        self.spec = spec
+        self.page_size = page_size
+        self.last_page = last_page
+        self.stream_chunks = stream_chunks
+        self.routes: List[Tuple[str, Pattern[str], Dict[str, Any]]] = [
+            (method.upper(), path_pattern(path), operation) for method, path, operation in operations(spec)
+        ]
+        self._bodies: Dict[Tuple[int, int], Tuple[int, bytes]] = {}
+
+    def route(self, method: str, path: str) -> Optional[Dict[str, Any]]:
+        for route_method, pattern, operation in self.routes:
+            if route_method == method and pattern.fullmatch(path):
+                return operation
+        return None
+
+    def body(self, operation: Dict[str, Any], page: int) -> Tuple[int, bytes]:
+        key = (id(operation), page)
+        if key not in self._bodies:
+            status, document = response_example(self.spec, operation, self.page_size)
+            paginator = find_paginator(document)
+            if paginator is not None:
+                paginator.update(current_page=page, last_page=self.last_page, per_page=self.page_size)
+                paginator["total"] = self.page_size * self.last_page
+                for index, item in enumerate(paginator["data"]):
+                    if isinstance(item, dict) and "id" in item:
+                        item["id"] = (page - 1) * self.page_size + index + 1
+            self._bodies[key] = (status, PREVIEW if document is None else json.dumps(document).encode())
+        return self._bodies[key]
+
+    def stream_events(self) -> List[bytes]:
+        words = [f"word{index} " for index in range(self.stream_chunks)]
+        events = [
+            b"data: " + json.dumps({"status": "progress", "message": word}).encode() + b"\n\n" for word in words
+        ]
+        finish = {"status": "finish", "citations": [1, 2], "prompt_id": 1, "message": "".join(words)}
+        return events + [b"data: " + json.dumps(finish).encode() + b"\n\n"]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs add ~40ms to each kept-alive request
+    disable_nagle_algorithm = True
+    server: "MockServer"
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        while length > 0:
+            length -= len(self.rfile.read(min(length, 1 << 16)))
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        api = self.server.api
+        operation = api.route(self.command, url.path)
+        if operation is None:
+            self._send(404, b'{"status": "error", "data": {"code": 404, "message": "Not found"}}')
+        elif query.get("stream") == ["1"]:
+            self._stream(api.stream_events())
+        else:
+            page = int(query.get("page", ["1"])[0])
+            self._send(*api.body(operation, page))
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/pdf" if body is PREVIEW else "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, events: List[bytes]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for event in events:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, api: MockAPI, port: int = 0) -> None:
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.api = api
+
+    @property
+    def base_url(self) -> str:
+        return "http://127.0.0.1:{}".format(self.server_address[1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", help="The openapi.json to serve (default: the one at the repository root)")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+    parser.add_argument("--page-size", type=int, default=100, help="Items per page of a listing (default: 100)")
+    parser.add_argument("--last-page", type=int, default=10, help="Pages of a listing (default: 10)")
+    parser.add_argument("--stream-chunks", type=int, default=50, help="Events of a streamed message (default: 50)")
+    args = parser.parse_args()
+
+    api = MockAPI(load_spec(args.spec), args.page_size, args.last_page, args.stream_chunks)
+    with MockServer(api, args.port) as server:
+        print(server.base_url, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Time from_dict, to_dict and round-trips of every response model, on bodies built from openapi.json
+
+Usage:
+    python benchmarks/model_bench.py                        # compare against benchmarks/model_bench.json
+    python benchmarks/model_bench.py --update               # record the results as the new baseline
+    python benchmarks/model_bench.py --only GetPages --sizes 10000
+
+The suite is generated from the spec: every response of an operation the SDK has an endpoint for gets the model
+named after it (e.g. ``GetPagesResponse200``) and a body built by ``openapi_examples.response_example`` with its
+listing holding each of ``--sizes`` items. Bodies without a listing are only timed once, at the first size. Each case
+times
+
+    from_dict    Model.from_dict(body)
+    to_dict      model.to_dict()
+    round_trip   Model.from_dict(body).to_dict()
+
+calibrated like ``timeit`` to run at least ``--min-time`` seconds, and keeps the fastest of ``--repeat`` rounds over
+the whole suite, in microseconds per call. The check fails (exit status 1) when from_dict, to_dict or round_trip get
+more than ``--tolerance`` slower than the baseline over the suite (the geometric mean of every case's change), and
+says so when the model templates changed since the baseline was recorded: rerun it after editing
+``templates/model.py.jinja`` or ``templates/property_templates`` and regenerating the models.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "model_bench.json")
+# The templates the models are generated from, at the root of the SDKs
+TEMPLATES = os.path.join(ROOT, "..", "templates")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from openapi_examples import load_spec, operations, response_example  # noqa: E402
+
+from customgpt_client import models  # noqa: E402
+from customgpt_client.instrumentation import endpoint_name  # noqa: E402
+
+OPERATIONS = ("from_dict", "to_dict", "round_trip")
+
+
+def templates_digest() -> str:
+    """Hash the templates models are generated from, to tell whether they changed since the baseline"""
+    digest = hashlib.sha256()
+    paths = [os.path.join(TEMPLATES, "model.py.jinja")] + sorted(
+        glob.glob(os.path.join(TEMPLATES, "property_templates", "*.jinja"))
+    )
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+
+def response_models(spec: Dict[str, Any]) -> Iterator[Tuple[type, Dict[str, Any], str]]:
+    """Yield the model, operation and status of every response of the spec the SDK decodes"""
+    for method, path, operation in operations(spec):
+        endpoint = endpoint_name(method, path)
+        if endpoint is None:
+            continue
+        for status in sorted(operation.get("responses", {})):
+            name = "".join(part.capitalize() for part in endpoint.split("_")) + f"Response{status}"
+            model = getattr(models, name, None)
+            if model is not None:
+                yield model, operation, status
+
+
+def body(spec: Dict[str, Any], operation: Dict[str, Any], status: str, items: int) -> Any:
+    """Build the body of one response of an operation, with ``items`` items in its listing"""
+    return response_example(spec, operation, items, status)[1]
+
+
+def cases(spec: Dict[str, Any], sizes: List[int]) -> Iterator[Tuple[str, type, int, Dict[str, Any]]]:
+    """Yield the model name, model, size and body of every case of the suite"""
+    for model, operation, status in response_models(spec):
+        previous = None
+        for items in sizes:
+            document = body(spec, operation, status, items)
+            if not isinstance(document, dict) or document == previous:
+                break
+            previous = document
+            yield model.__name__, model, items, document
+
+
+def calibrate(function: Callable[[], Any], min_time: float) -> Tuple[timeit.Timer, int]:
+    """Get a timer of a call and the number of calls that lasts at least ``min_time`` seconds"""
+    timer = timeit.Timer(function)
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < min_time:
+        number = max(number + 1, int(number * min_time / max(elapsed, 1e-9) * 1.2))
+        elapsed = timer.timeit(number)
+    return timer, number
+
+
+def measure(args: argparse.Namespace) -> Dict[str, Any]:
+    spec = load_spec(args.spec)
+    results: Dict[str, Dict[str, Any]] = {}
+    timers: List[Tuple[Dict[str, float], str, timeit.Timer, int]] = []
+    for name, model, items, document in cases(spec, args.sizes):
+        if args.only and not any(part in name for part in args.only):
+            continue
+        try:
+            instance = model.from_dict(document)
+            instance.to_dict()
+        except Exception as exception:  # A spec example the model can't hold is reported, not timed
+            results.setdefault(name, {})[str(items)] = {"error": f"{type(exception).__name__}: {exception}"}
+            print(f"{name}[{items}] skipped: {exception!r}", file=sys.stderr)
+            continue
+        functions = {
+            "from_dict": lambda model=model, document=document: model.from_dict(document),
+            "to_dict": instance.to_dict,
+            "round_trip": lambda model=model, document=document: model.from_dict(document).to_dict(),
+        }
+        timings = results.setdefault(name, {})[str(items)] = {}
+        for operation, function in functions.items():
+            timers.append((timings, operation, *calibrate(function, args.min_time)))
+
+    # Each round times every case once, so the fastest of the rounds are far apart in time and a stretch where the
+    # machine is busy slows one round of a case down rather than all of them
+    for round_number in range(args.repeat):
+        for timings, operation, timer, number in timers:
+            elapsed = round(timer.timeit(number) / number * 1e6, 3)
+            timings[operation] = min(timings.get(operation, elapsed), elapsed)
+        print(f"round {round_number + 1}/{args.repeat} done", file=sys.stderr)
+    return {
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "templates": templates_digest(),
+        "parameters": {"sizes": args.sizes, "min_time": args.min_time, "repeat": args.repeat},
+        "results": results,
+    }
+
+
+def geometric_mean(values: List[float]) -> float:
+    return math.exp(sum(math.log(value) for value in values) / len(values))
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, show: int) -> List[str]:
+    """Get the operations whose time over the suite regressed beyond tolerance, printing the comparison
+
+    Single cases vary too much from one process to the next to be checked on their own (a few microseconds, laid out
+    differently in memory), so the check is on the geometric mean of the ratios to the baseline of each operation;
+    the ``show`` cases that slowed down the most are printed to tell which models to look at.
+    """
+    ratios: Dict[str, List[Tuple[float, str]]] = {operation: [] for operation in OPERATIONS}
+    for name, sizes in result["results"].items():
+        for items, timings in sizes.items():
+            previous = baseline.get("results", {}).get(name, {}).get(items, {})
+            for operation in OPERATIONS:
+                if timings.get(operation) and previous.get(operation):
+                    ratios[operation].append((timings[operation] / previous[operation], f"{name}[{items}].{operation}"))
+
+    slowest = sorted((case for cases in ratios.values() for case in cases), reverse=True)[:show]
+    for ratio, case in slowest:
+        print(f"{case:60} {ratio - 1:>+8.1%}")
+    regressions = []
+    print(f"{'operation':12} {'cases':>6} {'change':>8}")
+    for operation, cases in ratios.items():
+        if not cases:
+            continue
+        change = geometric_mean([ratio for ratio, _ in cases]) - 1
+        print(f"{operation:12} {len(cases):>6} {change:>+8.1%}")
+        if change > tolerance:
+            regressions.append(operation)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", help="The openapi.json to build bodies from (default: the repository's)")
+    parser.add_argument("--only", default="", help="Comma-separated parts of the model names to time (default: all)")
+    parser.add_argument("--sizes", default="1,100,10000", help="Comma-separated listing sizes (default: 1,100,10000)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Seconds each run lasts at least (default: 0.05)")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds of which the fastest is kept (default: 5)")
+    parser.add_argument("--output", help="Also write the results to this file")
+    parser.add_argument("--baseline", default=BASELINE, help="The results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed slowdown as a fraction (default: 0.1)")
+    parser.add_argument("--show", type=int, default=10, help="Slowest cases to print (default: 10)")
+    parser.add_argument("--update", action="store_true", help="Store the results as the new baseline")
+    args = parser.parse_args()
+    args.only = [part for part in args.only.split(",") if part]
+    args.sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    result = measure(args)
+    for path in filter(None, [args.output, args.baseline if args.update else None]):
+        with open(path, "w") as file:
+            json.dump(result, file, indent=2)
+            file.write("\n")
+    cases_timed = sum(len(sizes) for sizes in result["results"].values())
+    print(f"{len(result['results'])} models, {cases_timed} cases")
+    if args.update:
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline recorded yet, run with --update")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    if baseline.get("templates") != result["templates"]:
+        print("The model templates changed since the baseline was recorded")
+    if baseline.get("parameters") != result["parameters"]:
+        print("The baseline was recorded with other parameters, the numbers may not be comparable")
+    regressions = compare(result, baseline, args.tolerance, args.show)
+    if regressions:
+        print(f"Regression: {', '.join(regressions)} slower than the baseline by more than {args.tolerance:.0%}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
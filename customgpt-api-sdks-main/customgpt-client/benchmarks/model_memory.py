@@ -0,0 +1,84 @@
+"""Measure the memory held by the models of a large get_pages listing
+
+Usage:
+    python benchmarks/model_memory.py [--items 100000] [--lazy]
+
+Builds a get_pages response body with ``--items`` pages, times decoding it with ``json.loads`` and
+``GetPagesResponse200.from_dict``, then decodes it again under tracemalloc to measure how much memory the parsed
+response keeps alive once the decoded JSON is no longer referenced by the caller. With ``--lazy`` the response is
+decoded lazily, as by a client with ``lazy_decoding`` set, and only the page count is read.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customgpt_client import decoding  # noqa: E402
+from customgpt_client.models import GetPagesResponse200  # noqa: E402
+
+TIMESTAMP = "2023-04-30 16:43:53"
+
+
+def page(index: int) -> dict:
+    return {
+        "id": index,
+        "page_url": f"https://example.com/docs/{index}",
+        "page_url_hash": f"{index:032x}",
+        "project_id": 1,
+        "s3_path": None,
+        "crawl_status": "ok",
+        "index_status": "ok",
+        "is_file": False,
+        "is_file_kept": True,
+        "filename": None,
+        "filesize": None,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+        "deleted_at": None,
+    }
+
+
+def listing(items: int) -> bytes:
+    project = {"id": 1, "project_name": "Docs", "created_at": TIMESTAMP, "updated_at": TIMESTAMP, "deleted_at": None}
+    pages = {"current_page": 1, "data": [page(index) for index in range(items)], "last_page": 1, "total": items}
+    return json.dumps({"status": "success", "data": {"project": project, "pages": pages}}).encode()
+
+
+def measure(items: int, lazy: bool = False) -> dict:
+    body = listing(items)
+    started = time.perf_counter()
+    decoding.decode(GetPagesResponse200, json.loads(body), lazy).data.pages.total
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    parsed = decoding.decode(GetPagesResponse200, json.loads(body), lazy)
+    assert parsed.data.pages.total == items
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "items": items,
+        "lazy": lazy,
+        "retained_bytes": retained,
+        "peak_bytes": peak,
+        "bytes_per_item": round(retained / items, 1),
+        "decode_seconds": round(elapsed, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000, help="Number of pages in the listing (default: 100000)")
+    parser.add_argument("--lazy", action="store_true", help="Decode lazily and only read the page count")
+    args = parser.parse_args()
+    print(json.dumps(measure(args.items, args.lazy), indent=2))
+
+
+if __name__ == "__main__":
+    main()
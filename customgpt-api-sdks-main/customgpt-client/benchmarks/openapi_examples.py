@@ -0,0 +1,119 @@
+"""Build example documents from the schemas and property examples of the API's openapi.json
+
+Used by the benchmarks to get realistic payloads without calling the API. Every property takes its ``example`` (or
+``default``, or first ``enum`` value) when the spec has one and a placeholder of its type otherwise. Arrays get
+``items`` elements when they are the first array on their path from the root, one element when nested, so a listing
+can be scaled without its items growing too.
+"""
+import json
+import os
+import re
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The spec the SDK is generated from, at the root of the repository
+DEFAULT_SPEC = os.path.join(ROOT, "..", "..", "openapi.json")
+
+METHODS = ("get", "post", "put", "patch", "delete")
+TIMESTAMP = "2023-04-30 16:43:53"
+PLACEHOLDERS = {"string": "string", "integer": 1, "number": 1.5, "boolean": False, "null": None}
+MAX_DEPTH = 12
+
+
+def load_spec(path: Optional[str] = None) -> Dict[str, Any]:
+    with open(path or DEFAULT_SPEC) as file:
+        return json.load(file)
+
+
+def _resolve(spec: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    while "$ref" in schema:
+        node: Any = spec
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = node
+    return schema
+
+
+def example(
+    spec: Dict[str, Any], schema: Dict[str, Any], items: int = 1, _depth: int = 0, _nested: bool = False
+) -> Any:
+    """Build an example document for a schema of the spec"""
+    schema = _resolve(spec, schema)
+    for key in ("example", "default"):
+        if key in schema and not (schema.get("type") == "array" and isinstance(schema[key], list) and not schema[key]):
+            return schema[key]
+    if "enum" in schema:
+        return schema["enum"][0]
+    for key in ("allOf", "oneOf", "anyOf"):
+        if key in schema:
+            if key != "allOf":
+                return example(spec, schema[key][0], items, _depth, _nested)
+            merged: Dict[str, Any] = {}
+            for part in schema[key]:
+                value = example(spec, part, items, _depth, _nested)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "array" or "items" in schema:
+        if _depth >= MAX_DEPTH:
+            return []
+        item = schema.get("items", {})
+        return [example(spec, item, items, _depth + 1, True) for _ in range(1 if _nested else items)]
+    if kind == "object" or "properties" in schema:
+        if _depth >= MAX_DEPTH:
+            return {}
+        return {
+            name: example(spec, prop, items, _depth + 1, _nested)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "string" and schema.get("format") == "date-time":
+        return TIMESTAMP
+    if kind == "string" and schema.get("format") == "binary":
+        return ""
+    return PLACEHOLDERS.get(kind or "string")
+
+
+def operations(spec: Dict[str, Any]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """Yield the method, path and description of every operation"""
+    for path, item in spec["paths"].items():
+        for method, operation in item.items():
+            if method in METHODS:
+                yield method, path, operation
+
+
+def path_pattern(path: str) -> "re.Pattern[str]":
+    """Get the regex matching the concrete paths of a templated path, e.g. /api/v1/projects/{projectId}"""
+    return re.compile(re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(path)))
+
+
+def response_example(
+    spec: Dict[str, Any], operation: Dict[str, Any], items: int = 1, status: Optional[str] = None
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """Get the status and example JSON body of a response of an operation, by default its first successful one"""
+    for code, response in sorted(operation.get("responses", {}).items()):
+        if code != status if status is not None else not code.startswith("2"):
+            continue
+        response = _resolve(spec, response)
+        content = response.get("content", {}).get("application/json")
+        if content is None:
+            return int(code), None
+        if "example" in content:
+            return int(code), content["example"]
+        return int(code), example(spec, content.get("schema", {}), items)
+    return 200, None
+
+
+def find_paginator(document: Any) -> Optional[Dict[str, Any]]:
+    """Find the object holding ``data`` and ``last_page`` in a listing response"""
+    if isinstance(document, dict):
+        if "last_page" in document and isinstance(document.get("data"), list):
+            return document
+        for value in document.values():
+            found = find_paginator(value)
+            if found is not None:
+                return found
+    return None
@@ -1 +1,4 @@
 """ Contains methods for accessing the API """
+from ..lazy import lazy_submodules
+
+__getattr__ = lazy_submodules(__name__)
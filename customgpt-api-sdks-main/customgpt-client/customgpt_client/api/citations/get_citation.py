@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_citation_response_200 import GetCitationResponse200
 from ...models.get_citation_response_400 import GetCitationResponse400
 from ...models.get_citation_response_401 import GetCitationResponse401
@@ -39,19 +37,27 @@ def _parse_response(
     *, client: {}, response: None
 ) -> Optional[Union[GetCitationResponse200, GetCitationResponse400, GetCitationResponse401, GetCitationResponse404]]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetCitationResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            GetCitationResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = GetCitationResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            GetCitationResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetCitationResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            GetCitationResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = GetCitationResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            GetCitationResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if client.raise_on_unexpected_status:
@@ -77,6 +83,7 @@ def sync_detailed(
     citation_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Get the Open Graph data for a citation.
 
@@ -96,6 +103,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetCitationResponse200, GetCitationResponse400, GetCitationResponse401, GetCitationResponse404]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -104,11 +112,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -141,6 +148,7 @@ def sync(
         project_id=project_id,
         citation_id=citation_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -149,6 +157,7 @@ async def asyncio_detailed(
     citation_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[Union[GetCitationResponse200, GetCitationResponse400, GetCitationResponse401, GetCitationResponse404]]:
     kwargs = _get_kwargs(
         project_id=project_id,
@@ -156,11 +165,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -194,5 +202,6 @@ async def asyncio(
             project_id=project_id,
             citation_id=citation_id,
             client=client,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.create_conversation_json_body import CreateConversationJsonBody
 from ...models.create_conversation_response_201 import CreateConversationResponse201
 from ...models.create_conversation_response_400 import CreateConversationResponse400
@@ -50,23 +48,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.CREATED:
-        response_201 = CreateConversationResponse201.from_dict(json.loads(response.text))
+        response_201 = decode(
+            CreateConversationResponse201, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_201
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = CreateConversationResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            CreateConversationResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = CreateConversationResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            CreateConversationResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = CreateConversationResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            CreateConversationResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = CreateConversationResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            CreateConversationResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -100,6 +108,7 @@ def sync_detailed(
     *,
     client: {},
     json_body: CreateConversationJsonBody,
+    parse: Optional[bool] = None,
 ):
     """Create a new conversation.
 
@@ -123,6 +132,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[CreateConversationResponse201, CreateConversationResponse400, CreateConversationResponse401, CreateConversationResponse404, CreateConversationResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -131,11 +141,10 @@ def sync_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -180,6 +189,7 @@ def sync(
         project_id=project_id,
         client=client,
         json_body=json_body,
+        parse=True,
     ).parsed
 
 
@@ -188,6 +198,7 @@ async def asyncio_detailed(
     *,
     client: {},
     json_body: CreateConversationJsonBody,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         CreateConversationResponse201,
@@ -203,11 +214,10 @@ async def asyncio_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -253,5 +263,6 @@ async def asyncio(
             project_id=project_id,
             client=client,
             json_body=json_body,
+            parse=True,
         )
     ).parsed
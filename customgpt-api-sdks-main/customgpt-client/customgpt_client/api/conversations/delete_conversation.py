@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.delete_conversation_response_200 import DeleteConversationResponse200
 from ...models.delete_conversation_response_400 import DeleteConversationResponse400
 from ...models.delete_conversation_response_401 import DeleteConversationResponse401
@@ -48,23 +46,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = DeleteConversationResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            DeleteConversationResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = DeleteConversationResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            DeleteConversationResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = DeleteConversationResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            DeleteConversationResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = DeleteConversationResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            DeleteConversationResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = DeleteConversationResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            DeleteConversationResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -98,6 +106,7 @@ def sync_detailed(
     session_id: str,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Delete a conversation.
 
@@ -119,6 +128,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[DeleteConversationResponse200, DeleteConversationResponse400, DeleteConversationResponse401, DeleteConversationResponse404, DeleteConversationResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -127,11 +137,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -174,6 +183,7 @@ def sync(
         project_id=project_id,
         session_id=session_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -182,6 +192,7 @@ async def asyncio_detailed(
     session_id: str,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         DeleteConversationResponse200,
@@ -197,11 +208,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -245,5 +255,6 @@ async def asyncio(
             project_id=project_id,
             session_id=session_id,
             client=client,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_conversations_order import GetConversationsOrder
 from ...models.get_conversations_response_200 import GetConversationsResponse200
 from ...models.get_conversations_response_400 import GetConversationsResponse400
@@ -68,23 +66,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetConversationsResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            GetConversationsResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = GetConversationsResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            GetConversationsResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetConversationsResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            GetConversationsResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = GetConversationsResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            GetConversationsResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = GetConversationsResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            GetConversationsResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -120,6 +128,7 @@ def sync_detailed(
     page: Union[Unset, None, int] = 1,
     order: Union[Unset, None, GetConversationsOrder] = GetConversationsOrder.DESC,
     user_filter: Union[Unset, None, GetConversationsUserFilter] = GetConversationsUserFilter.ALL,
+    parse: Optional[bool] = None,
 ):
     """List all conversations for a project.
 
@@ -140,6 +149,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetConversationsResponse200, GetConversationsResponse400, GetConversationsResponse401, GetConversationsResponse404, GetConversationsResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -150,11 +160,10 @@ def sync_detailed(
         user_filter=user_filter,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -200,6 +209,7 @@ def sync(
         page=page,
         order=order,
         user_filter=user_filter,
+        parse=True,
     ).parsed
 
 
@@ -210,6 +220,7 @@ async def asyncio_detailed(
     page: Union[Unset, None, int] = 1,
     order: Union[Unset, None, GetConversationsOrder] = GetConversationsOrder.DESC,
     user_filter: Union[Unset, None, GetConversationsUserFilter] = GetConversationsUserFilter.ALL,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         GetConversationsResponse200,
@@ -227,11 +238,10 @@ async def asyncio_detailed(
         user_filter=user_filter,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -278,5 +288,6 @@ async def asyncio(
             page=page,
             order=order,
             user_filter=user_filter,
+            parse=True,
         )
     ).parsed
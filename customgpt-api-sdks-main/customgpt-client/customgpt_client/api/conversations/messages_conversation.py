@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.messages_conversation_order import MessagesConversationOrder
 from ...models.messages_conversation_response_200 import MessagesConversationResponse200
 from ...models.messages_conversation_response_400 import MessagesConversationResponse400
@@ -63,23 +61,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = MessagesConversationResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            MessagesConversationResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = MessagesConversationResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            MessagesConversationResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = MessagesConversationResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            MessagesConversationResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = MessagesConversationResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            MessagesConversationResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = MessagesConversationResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            MessagesConversationResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -115,6 +123,7 @@ def sync_detailed(
     client: {},
     page: Union[Unset, None, int] = 1,
     order: Union[Unset, None, MessagesConversationOrder] = MessagesConversationOrder.DESC,
+    parse: Optional[bool] = None,
 ):
     """Retrieve messages that have been sent in a conversation.
 
@@ -141,6 +150,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[MessagesConversationResponse200, MessagesConversationResponse400, MessagesConversationResponse401, MessagesConversationResponse404, MessagesConversationResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -151,11 +161,10 @@ def sync_detailed(
         order=order,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -207,6 +216,7 @@ def sync(
         client=client,
         page=page,
         order=order,
+        parse=True,
     ).parsed
 
 
@@ -217,6 +227,7 @@ async def asyncio_detailed(
     client: {},
     page: Union[Unset, None, int] = 1,
     order: Union[Unset, None, MessagesConversationOrder] = MessagesConversationOrder.DESC,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         MessagesConversationResponse200,
@@ -234,11 +245,10 @@ async def asyncio_detailed(
         order=order,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -291,5 +301,6 @@ async def asyncio(
             client=client,
             page=page,
             order=order,
+            parse=True,
         )
     ).parsed
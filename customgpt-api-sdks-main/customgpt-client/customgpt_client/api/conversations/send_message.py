@@ -1,17 +1,15 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-from sseclient import SSEClient
-
 from ... import errors
+from ...decoding import decode
 from ...models.send_message_json_body import SendMessageJsonBody
 from ...models.send_message_response_200 import SendMessageResponse200
 from ...models.send_message_response_400 import SendMessageResponse400
 from ...models.send_message_response_401 import SendMessageResponse401
 from ...models.send_message_response_404 import SendMessageResponse404
 from ...models.send_message_response_500 import SendMessageResponse500
+from ...streaming import AsyncMessageStream, MessageStream
 from ...types import UNSET, Response, Unset
 
 
@@ -68,23 +66,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = SendMessageResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            SendMessageResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = SendMessageResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            SendMessageResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = SendMessageResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            SendMessageResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = SendMessageResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            SendMessageResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = SendMessageResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            SendMessageResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -121,6 +129,7 @@ def sync_detailed(
     json_body: SendMessageJsonBody,
     stream: Union[Unset, None, bool] = False,
     lang: Union[Unset, None, str] = "en",
+    parse: Optional[bool] = None,
 ):
     """Send a message to a conversation.
 
@@ -149,6 +158,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[SendMessageResponse200, SendMessageResponse400, SendMessageResponse401, SendMessageResponse404, SendMessageResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -160,14 +170,16 @@ def sync_detailed(
         lang=lang,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
     if stream:
-        return SSEClient(response)
-    else:
-        return _build_response(client=client, response=response)
+        response = client.request(
+            **kwargs,
+        )
+        return MessageStream(response)
+
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -223,6 +235,7 @@ def sync(
         json_body=json_body,
         stream=stream,
         lang=lang,
+        parse=True,
     ).parsed
 
 
@@ -234,6 +247,7 @@ async def asyncio_detailed(
     json_body: SendMessageJsonBody,
     stream: Union[Unset, None, bool] = False,
     lang: Union[Unset, None, str] = "en",
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         SendMessageResponse200,
@@ -252,14 +266,16 @@ async def asyncio_detailed(
         lang=lang,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
     if stream:
-        return SSEClient(response)
-    else:
-        return _build_response(client=client, response=response)
+        response = await client.arequest(
+            **kwargs,
+        )
+        return AsyncMessageStream(response)
+
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -316,5 +332,6 @@ async def asyncio(
             json_body=json_body,
             stream=stream,
             lang=lang,
+            parse=True,
         )
     ).parsed
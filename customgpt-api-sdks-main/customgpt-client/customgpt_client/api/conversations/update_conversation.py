@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.update_conversation_json_body import UpdateConversationJsonBody
 from ...models.update_conversation_response_200 import UpdateConversationResponse200
 from ...models.update_conversation_response_400 import UpdateConversationResponse400
@@ -53,23 +51,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = UpdateConversationResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            UpdateConversationResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = UpdateConversationResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            UpdateConversationResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = UpdateConversationResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            UpdateConversationResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = UpdateConversationResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            UpdateConversationResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = UpdateConversationResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            UpdateConversationResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -104,6 +112,7 @@ def sync_detailed(
     *,
     client: {},
     json_body: UpdateConversationJsonBody,
+    parse: Optional[bool] = None,
 ):
     """Update a conversation.
 
@@ -125,6 +134,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[UpdateConversationResponse200, UpdateConversationResponse400, UpdateConversationResponse401, UpdateConversationResponse404, UpdateConversationResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -134,11 +144,10 @@ def sync_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -183,6 +192,7 @@ def sync(
         session_id=session_id,
         client=client,
         json_body=json_body,
+        parse=True,
     ).parsed
 
 
@@ -192,6 +202,7 @@ async def asyncio_detailed(
     *,
     client: {},
     json_body: UpdateConversationJsonBody,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         UpdateConversationResponse200,
@@ -208,11 +219,10 @@ async def asyncio_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -258,5 +268,6 @@ async def asyncio(
             session_id=session_id,
             client=client,
             json_body=json_body,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_page_metadata_response_200 import GetPageMetadataResponse200
 from ...models.get_page_metadata_response_400 import GetPageMetadataResponse400
 from ...models.get_page_metadata_response_401 import GetPageMetadataResponse401
@@ -43,19 +41,27 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetPageMetadataResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            GetPageMetadataResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = GetPageMetadataResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            GetPageMetadataResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetPageMetadataResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            GetPageMetadataResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = GetPageMetadataResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            GetPageMetadataResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if client.raise_on_unexpected_status:
@@ -85,6 +91,7 @@ def sync_detailed(
     page_id: str,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Get the Metadata for a certain page.
 
@@ -101,6 +108,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetPageMetadataResponse200, GetPageMetadataResponse400, GetPageMetadataResponse401, GetPageMetadataResponse404]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -109,11 +117,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -147,6 +154,7 @@ def sync(
         project_id=project_id,
         page_id=page_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -155,6 +163,7 @@ async def asyncio_detailed(
     page_id: str,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         GetPageMetadataResponse200, GetPageMetadataResponse400, GetPageMetadataResponse401, GetPageMetadataResponse404
@@ -166,11 +175,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -205,5 +213,6 @@ async def asyncio(
             project_id=project_id,
             page_id=page_id,
             client=client,
+            parse=True,
         )
     ).parsed
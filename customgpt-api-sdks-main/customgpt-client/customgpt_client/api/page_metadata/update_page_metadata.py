@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.update_page_metadata_json_body import UpdatePageMetadataJsonBody
 from ...models.update_page_metadata_response_200 import UpdatePageMetadataResponse200
 from ...models.update_page_metadata_response_400 import UpdatePageMetadataResponse400
@@ -53,23 +51,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = UpdatePageMetadataResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            UpdatePageMetadataResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = UpdatePageMetadataResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            UpdatePageMetadataResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = UpdatePageMetadataResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            UpdatePageMetadataResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = UpdatePageMetadataResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            UpdatePageMetadataResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = UpdatePageMetadataResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            UpdatePageMetadataResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -104,6 +112,7 @@ def sync_detailed(
     *,
     client: {},
     json_body: UpdatePageMetadataJsonBody,
+    parse: Optional[bool] = None,
 ):
     """Update metadata for a certain page.
 
@@ -121,6 +130,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[UpdatePageMetadataResponse200, UpdatePageMetadataResponse400, UpdatePageMetadataResponse401, UpdatePageMetadataResponse404, UpdatePageMetadataResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -130,11 +140,10 @@ def sync_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -175,6 +184,7 @@ def sync(
         page_id=page_id,
         client=client,
         json_body=json_body,
+        parse=True,
     ).parsed
 
 
@@ -184,6 +194,7 @@ async def asyncio_detailed(
     *,
     client: {},
     json_body: UpdatePageMetadataJsonBody,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         UpdatePageMetadataResponse200,
@@ -200,11 +211,10 @@ async def asyncio_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -246,5 +256,6 @@ async def asyncio(
             page_id=page_id,
             client=client,
             json_body=json_body,
+            parse=True,
         )
     ).parsed
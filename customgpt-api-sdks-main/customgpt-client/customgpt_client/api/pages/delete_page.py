@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.delete_page_response_200 import DeletePageResponse200
 from ...models.delete_page_response_400 import DeletePageResponse400
 from ...models.delete_page_response_401 import DeletePageResponse401
@@ -46,23 +44,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = DeletePageResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            DeletePageResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = DeletePageResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            DeletePageResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = DeletePageResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            DeletePageResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = DeletePageResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            DeletePageResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = DeletePageResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            DeletePageResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -96,6 +104,7 @@ def sync_detailed(
     page_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Delete a certain page that belongs to a certain project.
 
@@ -116,6 +125,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[DeletePageResponse200, DeletePageResponse400, DeletePageResponse401, DeletePageResponse404, DeletePageResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -124,11 +134,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -170,6 +179,7 @@ def sync(
         project_id=project_id,
         page_id=page_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -178,6 +188,7 @@ async def asyncio_detailed(
     page_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         DeletePageResponse200,
@@ -193,11 +204,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -240,5 +250,6 @@ async def asyncio(
             project_id=project_id,
             page_id=page_id,
             client=client,
+            parse=True,
         )
     ).parsed
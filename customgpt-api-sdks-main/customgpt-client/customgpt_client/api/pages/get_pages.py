@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_pages_order import GetPagesOrder
 from ...models.get_pages_response_200 import GetPagesResponse200
 from ...models.get_pages_response_400 import GetPagesResponse400
@@ -57,23 +55,23 @@ def _parse_response(
     Union[GetPagesResponse200, GetPagesResponse400, GetPagesResponse401, GetPagesResponse404, GetPagesResponse500]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetPagesResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(GetPagesResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = GetPagesResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(GetPagesResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetPagesResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(GetPagesResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = GetPagesResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(GetPagesResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = GetPagesResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(GetPagesResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -103,6 +101,7 @@ def sync_detailed(
     page: Union[Unset, None, int] = 1,
     duration: Union[Unset, None, int] = 90,
     order: Union[Unset, None, GetPagesOrder] = GetPagesOrder.DESC,
+    parse: Optional[bool] = None,
 ):
     """List all pages that belong to a project.
 
@@ -127,6 +126,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetPagesResponse200, GetPagesResponse400, GetPagesResponse401, GetPagesResponse404, GetPagesResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -137,11 +137,10 @@ def sync_detailed(
         order=order,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -185,6 +184,7 @@ def sync(
         page=page,
         duration=duration,
         order=order,
+        parse=True,
     ).parsed
 
 
@@ -195,6 +195,7 @@ async def asyncio_detailed(
     page: Union[Unset, None, int] = 1,
     duration: Union[Unset, None, int] = 90,
     order: Union[Unset, None, GetPagesOrder] = GetPagesOrder.DESC,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[GetPagesResponse200, GetPagesResponse400, GetPagesResponse401, GetPagesResponse404, GetPagesResponse500]
 ]:
@@ -206,11 +207,10 @@ async def asyncio_detailed(
         order=order,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -255,5 +255,6 @@ async def asyncio(
             page=page,
             duration=duration,
             order=order,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.preview_citation_response_400 import PreviewCitationResponse400
 from ...models.preview_citation_response_401 import PreviewCitationResponse401
 from ...models.preview_citation_response_404 import PreviewCitationResponse404
@@ -40,19 +38,27 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = PreviewCitationResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            PreviewCitationResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = PreviewCitationResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            PreviewCitationResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = PreviewCitationResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            PreviewCitationResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = PreviewCitationResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            PreviewCitationResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -81,6 +87,7 @@ def sync_detailed(
     id: str,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Preview file from citation.
 
@@ -93,6 +100,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[PreviewCitationResponse400, PreviewCitationResponse401, PreviewCitationResponse404, PreviewCitationResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -100,11 +108,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -132,6 +139,7 @@ def sync(
     return sync_detailed(
         id=id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -139,6 +147,7 @@ async def asyncio_detailed(
     id: str,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         PreviewCitationResponse400, PreviewCitationResponse401, PreviewCitationResponse404, PreviewCitationResponse500
@@ -149,11 +158,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -182,5 +190,6 @@ async def asyncio(
         await asyncio_detailed(
             id=id,
             client=client,
+            parse=True,
         )
     ).parsed
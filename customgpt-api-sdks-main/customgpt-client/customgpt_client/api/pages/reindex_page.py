@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.reindex_page_response_200 import ReindexPageResponse200
 from ...models.reindex_page_response_400 import ReindexPageResponse400
 from ...models.reindex_page_response_401 import ReindexPageResponse401
@@ -48,23 +46,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = ReindexPageResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            ReindexPageResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = ReindexPageResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            ReindexPageResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = ReindexPageResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            ReindexPageResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.FORBIDDEN:
-        response_403 = ReindexPageResponse403.from_dict(json.loads(response.text))
+        response_403 = decode(
+            ReindexPageResponse403, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_403
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = ReindexPageResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            ReindexPageResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -98,6 +106,7 @@ def sync_detailed(
     page_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Reindex a certain page that belongs to a certain project.
 
@@ -115,6 +124,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[ReindexPageResponse200, ReindexPageResponse400, ReindexPageResponse401, ReindexPageResponse403, ReindexPageResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -123,11 +133,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -166,6 +175,7 @@ def sync(
         project_id=project_id,
         page_id=page_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -174,6 +184,7 @@ async def asyncio_detailed(
     page_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         ReindexPageResponse200,
@@ -189,11 +200,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -233,5 +243,6 @@ async def asyncio(
             project_id=project_id,
             page_id=page_id,
             client=client,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.create_plugin_json_body import CreatePluginJsonBody
 from ...models.create_plugin_response_201 import CreatePluginResponse201
 from ...models.create_plugin_response_400 import CreatePluginResponse400
@@ -50,23 +48,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.CREATED:
-        response_201 = CreatePluginResponse201.from_dict(json.loads(response.text))
+        response_201 = decode(
+            CreatePluginResponse201, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_201
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = CreatePluginResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            CreatePluginResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = CreatePluginResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            CreatePluginResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = CreatePluginResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            CreatePluginResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = CreatePluginResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            CreatePluginResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -100,6 +108,7 @@ def sync_detailed(
     *,
     client: {},
     json_body: CreatePluginJsonBody,
+    parse: Optional[bool] = None,
 ):
     """Create a plugin.
 
@@ -117,6 +126,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[CreatePluginResponse201, CreatePluginResponse400, CreatePluginResponse401, CreatePluginResponse404, CreatePluginResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -125,11 +135,10 @@ def sync_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -168,6 +177,7 @@ def sync(
         project_id=project_id,
         client=client,
         json_body=json_body,
+        parse=True,
     ).parsed
 
 
@@ -176,6 +186,7 @@ async def asyncio_detailed(
     *,
     client: {},
     json_body: CreatePluginJsonBody,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         CreatePluginResponse201,
@@ -191,11 +202,10 @@ async def asyncio_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -235,5 +245,6 @@ async def asyncio(
             project_id=project_id,
             client=client,
             json_body=json_body,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_plugin_response_200 import GetPluginResponse200
 from ...models.get_plugin_response_400 import GetPluginResponse400
 from ...models.get_plugin_response_401 import GetPluginResponse401
@@ -39,23 +37,33 @@ def _parse_response(
     Union[GetPluginResponse200, GetPluginResponse400, GetPluginResponse401, GetPluginResponse404, GetPluginResponse500]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetPluginResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            GetPluginResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = GetPluginResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            GetPluginResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetPluginResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            GetPluginResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = GetPluginResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            GetPluginResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = GetPluginResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            GetPluginResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -82,6 +90,7 @@ def sync_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Show a certain project plugin.
 
@@ -97,6 +106,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetPluginResponse200, GetPluginResponse400, GetPluginResponse401, GetPluginResponse404, GetPluginResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -104,11 +114,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -137,6 +146,7 @@ def sync(
     return sync_detailed(
         project_id=project_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -144,6 +154,7 @@ async def asyncio_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[GetPluginResponse200, GetPluginResponse400, GetPluginResponse401, GetPluginResponse404, GetPluginResponse500]
 ]:
@@ -152,11 +163,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -186,5 +196,6 @@ async def asyncio(
         await asyncio_detailed(
             project_id=project_id,
             client=client,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.update_plugin_json_body import UpdatePluginJsonBody
 from ...models.update_plugin_response_200 import UpdatePluginResponse200
 from ...models.update_plugin_response_400 import UpdatePluginResponse400
@@ -50,23 +48,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = UpdatePluginResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            UpdatePluginResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = UpdatePluginResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            UpdatePluginResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = UpdatePluginResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            UpdatePluginResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = UpdatePluginResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            UpdatePluginResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = UpdatePluginResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            UpdatePluginResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -100,6 +108,7 @@ def sync_detailed(
     *,
     client: {},
     json_body: UpdatePluginJsonBody,
+    parse: Optional[bool] = None,
 ):
     """Update a plugin.
 
@@ -116,6 +125,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[UpdatePluginResponse200, UpdatePluginResponse400, UpdatePluginResponse401, UpdatePluginResponse404, UpdatePluginResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -124,11 +134,10 @@ def sync_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -166,6 +175,7 @@ def sync(
         project_id=project_id,
         client=client,
         json_body=json_body,
+        parse=True,
     ).parsed
 
 
@@ -174,6 +184,7 @@ async def asyncio_detailed(
     *,
     client: {},
     json_body: UpdatePluginJsonBody,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         UpdatePluginResponse200,
@@ -189,11 +200,10 @@ async def asyncio_detailed(
         json_body=json_body,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -232,5 +242,6 @@ async def asyncio(
             project_id=project_id,
             client=client,
             json_body=json_body,
+            parse=True,
         )
     ).parsed
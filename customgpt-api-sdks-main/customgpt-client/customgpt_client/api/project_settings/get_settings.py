@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_settings_response_200 import GetSettingsResponse200
 from ...models.get_settings_response_400 import GetSettingsResponse400
 from ...models.get_settings_response_401 import GetSettingsResponse401
@@ -45,23 +43,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetSettingsResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            GetSettingsResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = GetSettingsResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            GetSettingsResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetSettingsResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            GetSettingsResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = GetSettingsResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            GetSettingsResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = GetSettingsResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            GetSettingsResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -94,6 +102,7 @@ def sync_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Get project settings.
 
@@ -113,6 +122,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetSettingsResponse200, GetSettingsResponse400, GetSettingsResponse401, GetSettingsResponse404, GetSettingsResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -120,11 +130,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -163,6 +172,7 @@ def sync(
     return sync_detailed(
         project_id=project_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -170,6 +180,7 @@ async def asyncio_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         GetSettingsResponse200,
@@ -184,11 +195,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -228,5 +238,6 @@ async def asyncio(
         await asyncio_detailed(
             project_id=project_id,
             client=client,
+            parse=True,
         )
     ).parsed
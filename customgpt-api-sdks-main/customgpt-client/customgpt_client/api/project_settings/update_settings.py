@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.update_settings_multipart_data import UpdateSettingsMultipartData
 from ...models.update_settings_response_200 import UpdateSettingsResponse200
 from ...models.update_settings_response_400 import UpdateSettingsResponse400
@@ -43,19 +41,27 @@ def _parse_response(
     Union[UpdateSettingsResponse200, UpdateSettingsResponse400, UpdateSettingsResponse401, UpdateSettingsResponse500]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = UpdateSettingsResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            UpdateSettingsResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = UpdateSettingsResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            UpdateSettingsResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = UpdateSettingsResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            UpdateSettingsResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = UpdateSettingsResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            UpdateSettingsResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -83,6 +89,7 @@ def sync_detailed(
     *,
     client: {},
     multipart_data: UpdateSettingsMultipartData,
+    parse: Optional[bool] = None,
 ):
     """Update project settings.
 
@@ -103,6 +110,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[UpdateSettingsResponse200, UpdateSettingsResponse400, UpdateSettingsResponse401, UpdateSettingsResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -111,11 +119,10 @@ def sync_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -151,6 +158,7 @@ def sync(
         project_id=project_id,
         client=client,
         multipart_data=multipart_data,
+        parse=True,
     ).parsed
 
 
@@ -159,6 +167,7 @@ async def asyncio_detailed(
     *,
     client: {},
     multipart_data: UpdateSettingsMultipartData,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[UpdateSettingsResponse200, UpdateSettingsResponse400, UpdateSettingsResponse401, UpdateSettingsResponse500]
 ]:
@@ -168,11 +177,10 @@ async def asyncio_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -209,5 +217,6 @@ async def asyncio(
             project_id=project_id,
             client=client,
             multipart_data=multipart_data,
+            parse=True,
         )
     ).parsed
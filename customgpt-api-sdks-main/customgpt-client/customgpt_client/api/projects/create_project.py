@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.create_project_multipart_data import CreateProjectMultipartData
 from ...models.create_project_response_201 import CreateProjectResponse201
 from ...models.create_project_response_400 import CreateProjectResponse400
@@ -42,19 +40,27 @@ def _parse_response(
     Union[CreateProjectResponse201, CreateProjectResponse400, CreateProjectResponse401, CreateProjectResponse500]
 ]:
     if response.status_code == HTTPStatus.CREATED:
-        response_201 = CreateProjectResponse201.from_dict(json.loads(response.text))
+        response_201 = decode(
+            CreateProjectResponse201, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_201
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = CreateProjectResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            CreateProjectResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = CreateProjectResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            CreateProjectResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = CreateProjectResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            CreateProjectResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -81,6 +87,7 @@ def sync_detailed(
     *,
     client: {},
     multipart_data: CreateProjectMultipartData,
+    parse: Optional[bool] = None,
 ):
     """Create a new project.
 
@@ -104,6 +111,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[CreateProjectResponse201, CreateProjectResponse400, CreateProjectResponse401, CreateProjectResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -111,11 +119,10 @@ def sync_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -152,6 +159,7 @@ def sync(
     return sync_detailed(
         client=client,
         multipart_data=multipart_data,
+        parse=True,
     ).parsed
 
 
@@ -159,6 +167,7 @@ async def asyncio_detailed(
     *,
     client: {},
     multipart_data: CreateProjectMultipartData,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[CreateProjectResponse201, CreateProjectResponse400, CreateProjectResponse401, CreateProjectResponse500]
 ]:
@@ -167,11 +176,10 @@ async def asyncio_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -209,5 +217,6 @@ async def asyncio(
         await asyncio_detailed(
             client=client,
             multipart_data=multipart_data,
+            parse=True,
         )
     ).parsed
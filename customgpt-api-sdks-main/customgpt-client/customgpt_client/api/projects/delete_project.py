@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.delete_project_response_200 import DeleteProjectResponse200
 from ...models.delete_project_response_400 import DeleteProjectResponse400
 from ...models.delete_project_response_401 import DeleteProjectResponse401
@@ -45,23 +43,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = DeleteProjectResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            DeleteProjectResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = DeleteProjectResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            DeleteProjectResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = DeleteProjectResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            DeleteProjectResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = DeleteProjectResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            DeleteProjectResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = DeleteProjectResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            DeleteProjectResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -94,6 +102,7 @@ def sync_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Delete a certain project.
 
@@ -112,6 +121,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[DeleteProjectResponse200, DeleteProjectResponse400, DeleteProjectResponse401, DeleteProjectResponse404, DeleteProjectResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -119,11 +129,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -161,6 +170,7 @@ def sync(
     return sync_detailed(
         project_id=project_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -168,6 +178,7 @@ async def asyncio_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         DeleteProjectResponse200,
@@ -182,11 +193,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -225,5 +235,6 @@ async def asyncio(
         await asyncio_detailed(
             project_id=project_id,
             client=client,
+            parse=True,
         )
     ).parsed
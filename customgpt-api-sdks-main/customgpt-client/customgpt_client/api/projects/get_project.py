@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_project_response_200 import GetProjectResponse200
 from ...models.get_project_response_400 import GetProjectResponse400
 from ...models.get_project_response_401 import GetProjectResponse401
@@ -55,23 +53,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetProjectResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            GetProjectResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = GetProjectResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            GetProjectResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetProjectResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            GetProjectResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = GetProjectResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            GetProjectResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = GetProjectResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            GetProjectResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -106,6 +114,7 @@ def sync_detailed(
     client: {},
     width: Union[Unset, None, str] = "100%",
     height: Union[Unset, None, str] = "auto",
+    parse: Optional[bool] = None,
 ):
     """Show a certain project.
 
@@ -123,6 +132,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetProjectResponse200, GetProjectResponse400, GetProjectResponse401, GetProjectResponse404, GetProjectResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -132,11 +142,10 @@ def sync_detailed(
         height=height,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -177,6 +186,7 @@ def sync(
         client=client,
         width=width,
         height=height,
+        parse=True,
     ).parsed
 
 
@@ -186,6 +196,7 @@ async def asyncio_detailed(
     client: {},
     width: Union[Unset, None, str] = "100%",
     height: Union[Unset, None, str] = "auto",
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         GetProjectResponse200,
@@ -202,11 +213,10 @@ async def asyncio_detailed(
         height=height,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -248,5 +258,6 @@ async def asyncio(
             client=client,
             width=width,
             height=height,
+            parse=True,
         )
     ).parsed
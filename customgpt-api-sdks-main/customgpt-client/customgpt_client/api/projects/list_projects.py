@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.list_projects_order import ListProjectsOrder
 from ...models.list_projects_response_200 import ListProjectsResponse200
 from ...models.list_projects_response_401 import ListProjectsResponse401
@@ -58,15 +56,21 @@ def _parse_response(
     *, client: {}, response: None
 ) -> Optional[Union[ListProjectsResponse200, ListProjectsResponse401, ListProjectsResponse500]]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = ListProjectsResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            ListProjectsResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = ListProjectsResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            ListProjectsResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = ListProjectsResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            ListProjectsResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -95,6 +99,7 @@ def sync_detailed(
     order: Union[Unset, None, ListProjectsOrder] = ListProjectsOrder.DESC,
     width: Union[Unset, None, str] = "100%",
     height: Union[Unset, None, str] = "auto",
+    parse: Optional[bool] = None,
 ):
     """List all projects.
 
@@ -120,6 +125,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[ListProjectsResponse200, ListProjectsResponse401, ListProjectsResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -131,11 +137,10 @@ def sync_detailed(
         height=height,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -180,6 +185,7 @@ def sync(
         order=order,
         width=width,
         height=height,
+        parse=True,
     ).parsed
 
 
@@ -191,6 +197,7 @@ async def asyncio_detailed(
     order: Union[Unset, None, ListProjectsOrder] = ListProjectsOrder.DESC,
     width: Union[Unset, None, str] = "100%",
     height: Union[Unset, None, str] = "auto",
+    parse: Optional[bool] = None,
 ) -> Response[Union[ListProjectsResponse200, ListProjectsResponse401, ListProjectsResponse500]]:
     kwargs = _get_kwargs(
         client=client,
@@ -201,11 +208,10 @@ async def asyncio_detailed(
         height=height,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -251,5 +257,6 @@ async def asyncio(
             order=order,
             width=width,
             height=height,
+            parse=True,
         )
     ).parsed
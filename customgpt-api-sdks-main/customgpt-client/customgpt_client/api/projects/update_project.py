@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.update_project_multipart_data import UpdateProjectMultipartData
 from ...models.update_project_response_200 import UpdateProjectResponse200
 from ...models.update_project_response_400 import UpdateProjectResponse400
@@ -50,23 +48,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = UpdateProjectResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            UpdateProjectResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = UpdateProjectResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            UpdateProjectResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = UpdateProjectResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            UpdateProjectResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = UpdateProjectResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            UpdateProjectResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = UpdateProjectResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            UpdateProjectResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -100,6 +108,7 @@ def sync_detailed(
     *,
     client: {},
     multipart_data: UpdateProjectMultipartData,
+    parse: Optional[bool] = None,
 ):
     """Update a certain project.
 
@@ -120,6 +129,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[UpdateProjectResponse200, UpdateProjectResponse400, UpdateProjectResponse401, UpdateProjectResponse404, UpdateProjectResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -128,11 +138,10 @@ def sync_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -174,6 +183,7 @@ def sync(
         project_id=project_id,
         client=client,
         multipart_data=multipart_data,
+        parse=True,
     ).parsed
 
 
@@ -182,6 +192,7 @@ async def asyncio_detailed(
     *,
     client: {},
     multipart_data: UpdateProjectMultipartData,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         UpdateProjectResponse200,
@@ -197,11 +208,10 @@ async def asyncio_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -244,5 +254,6 @@ async def asyncio(
             project_id=project_id,
             client=client,
             multipart_data=multipart_data,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.create_source_multipart_data import CreateSourceMultipartData
 from ...models.create_source_response_201 import CreateSourceResponse201
 from ...models.create_source_response_400 import CreateSourceResponse400
@@ -50,23 +48,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.CREATED:
-        response_201 = CreateSourceResponse201.from_dict(json.loads(response.text))
+        response_201 = decode(
+            CreateSourceResponse201, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_201
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = CreateSourceResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            CreateSourceResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = CreateSourceResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            CreateSourceResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = CreateSourceResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            CreateSourceResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = CreateSourceResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            CreateSourceResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -100,6 +108,7 @@ def sync_detailed(
     *,
     client: {},
     multipart_data: CreateSourceMultipartData,
+    parse: Optional[bool] = None,
 ):
     """Create a new project source.
 
@@ -121,6 +130,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[CreateSourceResponse201, CreateSourceResponse400, CreateSourceResponse401, CreateSourceResponse404, CreateSourceResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -129,11 +139,10 @@ def sync_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -176,6 +185,7 @@ def sync(
         project_id=project_id,
         client=client,
         multipart_data=multipart_data,
+        parse=True,
     ).parsed
 
 
@@ -184,6 +194,7 @@ async def asyncio_detailed(
     *,
     client: {},
     multipart_data: CreateSourceMultipartData,
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         CreateSourceResponse201,
@@ -199,11 +210,10 @@ async def asyncio_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -247,5 +257,6 @@ async def asyncio(
             project_id=project_id,
             client=client,
             multipart_data=multipart_data,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.delete_source_response_200 import DeleteSourceResponse200
 from ...models.delete_source_response_400 import DeleteSourceResponse400
 from ...models.delete_source_response_401 import DeleteSourceResponse401
@@ -48,23 +46,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = DeleteSourceResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            DeleteSourceResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = DeleteSourceResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            DeleteSourceResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = DeleteSourceResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            DeleteSourceResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = DeleteSourceResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            DeleteSourceResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = DeleteSourceResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            DeleteSourceResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -98,6 +106,7 @@ def sync_detailed(
     source_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Delete a project source.
 
@@ -113,6 +122,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[DeleteSourceResponse200, DeleteSourceResponse400, DeleteSourceResponse401, DeleteSourceResponse404, DeleteSourceResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -121,11 +131,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -162,6 +171,7 @@ def sync(
         project_id=project_id,
         source_id=source_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -170,6 +180,7 @@ async def asyncio_detailed(
     source_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         DeleteSourceResponse200,
@@ -185,11 +196,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -227,5 +237,6 @@ async def asyncio(
             project_id=project_id,
             source_id=source_id,
             client=client,
+            parse=True,
         )
     ).parsed
@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.list_sources_response_200 import ListSourcesResponse200
 from ...models.list_sources_response_400 import ListSourcesResponse400
 from ...models.list_sources_response_401 import ListSourcesResponse401
@@ -45,23 +43,33 @@ def _parse_response(
     ]
 ]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = ListSourcesResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            ListSourcesResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
-        response_400 = ListSourcesResponse400.from_dict(json.loads(response.text))
+        response_400 = decode(
+            ListSourcesResponse400, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_400
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = ListSourcesResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            ListSourcesResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = ListSourcesResponse404.from_dict(json.loads(response.text))
+        response_404 = decode(
+            ListSourcesResponse404, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = ListSourcesResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            ListSourcesResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -94,6 +102,7 @@ def sync_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """List a certain project's sources.
 
@@ -110,6 +119,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[ListSourcesResponse200, ListSourcesResponse400, ListSourcesResponse401, ListSourcesResponse404, ListSourcesResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -117,11 +127,10 @@ def sync_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -157,6 +166,7 @@ def sync(
     return sync_detailed(
         project_id=project_id,
         client=client,
+        parse=True,
     ).parsed
 
 
@@ -164,6 +174,7 @@ async def asyncio_detailed(
     project_id: int,
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[
     Union[
         ListSourcesResponse200,
@@ -178,11 +189,10 @@ async def asyncio_detailed(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -219,5 +229,6 @@ async def asyncio(
         await asyncio_detailed(
             project_id=project_id,
             client=client,
+            parse=True,
         )
     ).parsed
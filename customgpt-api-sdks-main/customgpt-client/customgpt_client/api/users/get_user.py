@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.get_user_response_200 import GetUserResponse200
 from ...models.get_user_response_401 import GetUserResponse401
 from ...models.get_user_response_500 import GetUserResponse500
@@ -34,15 +32,15 @@ def _parse_response(
     *, client: {}, response: None
 ) -> Optional[Union[GetUserResponse200, GetUserResponse401, GetUserResponse500]]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = GetUserResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(GetUserResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_200
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = GetUserResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(GetUserResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = GetUserResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(GetUserResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding)
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -66,6 +64,7 @@ def _build_response(
 def sync_detailed(
     *,
     client: {},
+    parse: Optional[bool] = None,
 ):
     """Show the user's profile.
 
@@ -79,17 +78,17 @@ def sync_detailed(
 
     Returns:
         Response[Union[GetUserResponse200, GetUserResponse401, GetUserResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -112,22 +111,23 @@ def sync(
 
     return sync_detailed(
         client=client,
+        parse=True,
     ).parsed
 
 
 async def asyncio_detailed(
     *,
     client: {},
+    parse: Optional[bool] = None,
 ) -> Response[Union[GetUserResponse200, GetUserResponse401, GetUserResponse500]]:
     kwargs = _get_kwargs(
         client=client,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -151,5 +151,6 @@ async def asyncio(
     return (
         await asyncio_detailed(
             client=client,
+            parse=True,
         )
     ).parsed
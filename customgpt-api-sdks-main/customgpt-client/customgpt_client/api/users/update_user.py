@@ -1,10 +1,8 @@
-import json
 from http import HTTPStatus
 from typing import Any, Dict, Optional, Union
 
-import requests
-
 from ... import errors
+from ...decoding import decode
 from ...models.update_user_multipart_data import UpdateUserMultipartData
 from ...models.update_user_response_200 import UpdateUserResponse200
 from ...models.update_user_response_401 import UpdateUserResponse401
@@ -39,15 +37,21 @@ def _parse_response(
     *, client: {}, response: None
 ) -> Optional[Union[UpdateUserResponse200, UpdateUserResponse401, UpdateUserResponse500]]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = UpdateUserResponse200.from_dict(json.loads(response.text))
+        response_200 = decode(
+            UpdateUserResponse200, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_200
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = UpdateUserResponse401.from_dict(json.loads(response.text))
+        response_401 = decode(
+            UpdateUserResponse401, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = UpdateUserResponse500.from_dict(json.loads(response.text))
+        response_500 = decode(
+            UpdateUserResponse500, client.json_codec.loads(response.content), lazy=client.lazy_decoding
+        )
 
         return response_500
     if client.raise_on_unexpected_status:
@@ -72,6 +76,7 @@ def sync_detailed(
     *,
     client: {},
     multipart_data: UpdateUserMultipartData,
+    parse: Optional[bool] = None,
 ):
     """Update the user's profile.
 
@@ -87,6 +92,7 @@ def sync_detailed(
 
     Returns:
         Response[Union[UpdateUserResponse200, UpdateUserResponse401, UpdateUserResponse500]]
+        Or a RawResponse when parse (by default the client's parse) is False.
     """
 
     kwargs = _get_kwargs(
@@ -94,11 +100,10 @@ def sync_detailed(
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return client.request_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return client.request_parsed(kwargs, _build_response)
 
 
 def sync(
@@ -125,6 +130,7 @@ def sync(
     return sync_detailed(
         client=client,
         multipart_data=multipart_data,
+        parse=True,
     ).parsed
 
 
@@ -132,17 +138,17 @@ async def asyncio_detailed(
     *,
     client: {},
     multipart_data: UpdateUserMultipartData,
+    parse: Optional[bool] = None,
 ) -> Response[Union[UpdateUserResponse200, UpdateUserResponse401, UpdateUserResponse500]]:
     kwargs = _get_kwargs(
         client=client,
         multipart_data=multipart_data,
     )
 
-    response = requests.request(
-        **kwargs,
-    )
+    if not (client.parse if parse is None else parse):
+        return await client.arequest_raw(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return await client.arequest_parsed(kwargs, _build_response)
 
 
 async def asyncio(
@@ -170,5 +176,6 @@ async def asyncio(
         await asyncio_detailed(
             client=client,
             multipart_data=multipart_data,
+            parse=True,
         )
     ).parsed
@@ -0,0 +1,105 @@
+""" Contains the bulk operations that dispatch many endpoint calls concurrently """
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import attr
+
+from .api import projects
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 0.5
+
+BulkCallback = Callable[[int, str], None]
+
+
+@attr.s(auto_attribs=True)
+class BulkDeleteResult:
+    """The outcome of delete_projects
+
+    Attributes:
+        succeeded: The IDs of the projects deleted.
+        failed: The IDs of the projects that could not be deleted, with the reason.
+        retried: The IDs of the projects whose deletion had to be retried, with the number of retries, whether it
+            eventually succeeded or not.
+    """
+
+    succeeded: List[int] = attr.ib(factory=list)
+    failed: Dict[int, str] = attr.ib(factory=dict)
+    retried: Dict[int, int] = attr.ib(factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"succeeded": self.succeeded, "failed": self.failed, "retried": self.retried}
+
+
+def delete_projects(
+    project_ids: Iterable[int],
+    *,
+    client: Any,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    on_project: Optional[BulkCallback] = None,
+) -> BulkDeleteResult:
+    """Delete many projects, sending up to ``concurrency`` delete_project calls at once
+
+    The calls go through the client, so they are paced by its rate limiter (429 answers are retried there). Server
+    errors and failed connections are retried here, up to ``retries`` times per project with an exponential backoff.
+    A retry answered with a 404 counts as a deletion: the attempt before it deleted the project but its answer was
+    lost, e.g. to a read timeout.
+
+    Args:
+        project_ids: The IDs of the projects to delete.
+        client: The client to send the requests with.
+        concurrency: The maximum number of deletions in flight.
+        retries: How many times a deletion that failed with a 5xx or a connection error is tried again.
+        on_project: Called with each project ID and its outcome as it is known: ``succeeded``, ``failed`` or
+            ``retrying`` (the latter from the worker threads).
+    """
+    result = BulkDeleteResult()
+
+    def delete(project_id: int) -> None:
+        for attempt in range(retries + 1):
+            if attempt:
+                result.retried[project_id] = attempt
+                if on_project is not None:
+                    on_project(project_id, "retrying")
+                time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                response = projects.delete_project.sync_detailed(project_id, client=client, parse=True)
+            except OSError:
+                # requests' connection errors and timeouts
+                if attempt == retries:
+                    raise
+                continue
+            if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR and attempt < retries:
+                continue
+            if response.status_code == HTTPStatus.NOT_FOUND and attempt:
+                return
+            if response.status_code != HTTPStatus.OK:
+                raise RuntimeError(f"delete_project returned {int(response.status_code)}")
+            if not getattr(getattr(response.parsed, "data", None), "deleted", False):
+                raise RuntimeError("the project was not deleted")
+            return
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = {executor.submit(delete, project_id): project_id for project_id in project_ids}
+        for future in as_completed(futures):
+            project_id = futures[future]
+            try:
+                future.result()
+            except Exception as error:
+                outcome = "failed"
+                result.failed[project_id] = str(error) or type(error).__name__
+            else:
+                outcome = "succeeded"
+                result.succeeded.append(project_id)
+            if on_project is not None:
+                on_project(project_id, outcome)
+
+    result.succeeded.sort()
+    return result
+
+
+__all__ = ["BulkDeleteResult", "delete_projects", "DEFAULT_CONCURRENCY", "DEFAULT_RETRIES"]
@@ -0,0 +1,176 @@
+""" Contains the in-memory response cache a client can keep for the API's read-mostly endpoints """
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Mapping, MutableMapping, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+import attr
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_MAXSIZE = 1024
+
+# The GET endpoints whose responses are cached, by the path they are served from
+CACHEABLE_ENDPOINTS: Dict[str, Pattern[str]] = {
+    "get_user": re.compile(r"/api/v1/user"),
+    "get_project": re.compile(r"/api/v1/projects/[^/]+"),
+    "get_settings": re.compile(r"/api/v1/projects/[^/]+/settings"),
+    "get_plugin": re.compile(r"/api/v1/projects/[^/]+/plugins"),
+    "get_page_metadata": re.compile(r"/api/v1/projects/[^/]+/pages/[^/]+/metadata"),
+    "get_citation": re.compile(r"/api/v1/projects/[^/]+/citations/[^/]+"),
+}
+
+# Seconds a cached response is used without asking the API again
+DEFAULT_TTLS: Dict[str, float] = {
+    "get_user": 300.0,
+    "get_project": 60.0,
+    "get_settings": 60.0,
+    "get_plugin": 60.0,
+    "get_page_metadata": 300.0,
+    "get_citation": 3600.0,
+}
+
+
+@attr.s(auto_attribs=True)
+class CachedResponse:
+    """A response served from a ResponseCache, standing in for the ``requests`` or ``httpx`` response"""
+
+    status_code: int
+    headers: MutableMapping[str, str]
+    content: bytes
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+@attr.s(auto_attribs=True)
+class _Entry:
+    path: str
+    response: CachedResponse
+    expires_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ResponseCache:
+    """A size-bounded LRU cache of the responses of read-mostly GET endpoints
+
+    Pass one to a client as ``cache`` to have its ``get_project``, ``get_settings``, ``get_plugin``,
+    ``get_page_metadata``, ``get_citation`` and ``get_user`` responses kept for the endpoint's TTL. Expired responses
+    that carried an ``ETag`` or ``Last-Modified`` header are revalidated with a conditional request and reused when the
+    API answers 304. Any other request sent through the client (``update_*``, ``delete_*``, ...) drops the cached
+    responses of its URL and of the URLs below it, e.g. deleting a project forgets its settings too.
+
+    Responses are keyed by method, URL, query parameters and credentials, so a cache can be shared between clients.
+
+    Args:
+        maxsize: The maximum number of responses kept; the least recently used ones are dropped first.
+        ttls: Seconds to keep the responses of an endpoint, by endpoint name, on top of DEFAULT_TTLS. A TTL of 0 or
+            None disables caching of that endpoint.
+        clock: The monotonic clock in seconds used for expiry.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttls: Dict[str, Optional[float]] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, kwargs: Mapping[str, Any]) -> Optional[Tuple[Hashable, float]]:
+        """Return the cache key and TTL of a request built by an endpoint's _get_kwargs, None if it isn't cached"""
+        if kwargs.get("method", "").lower() != "get" or kwargs.get("stream"):
+            return None
+        url = kwargs["url"]
+        path = urlsplit(url).path
+        for name, pattern in CACHEABLE_ENDPOINTS.items():
+            if pattern.fullmatch(path):
+                ttl = self.ttls.get(name)
+                if not ttl:
+                    return None
+                params = tuple(sorted((kwargs.get("params") or {}).items()))
+                credentials = tuple(sorted((kwargs.get("headers") or {}).items()))
+                return (url, params, credentials), ttl
+        return None
+
+    def get(self, key: Hashable) -> Tuple[Optional[CachedResponse], Dict[str, str]]:
+        """Look up a request
+
+        Returns:
+            The cached response if it is still fresh, and the conditional headers to send otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, {}
+            self._entries.move_to_end(key)
+            if self.clock() < entry.expires_at:
+                self.hits += 1
+                return entry.response, {}
+            self.misses += 1
+            headers = {}
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+            if not headers:
+                del self._entries[key]
+            return None, headers
+
+    def store(self, key: Hashable, ttl: float, url: str, response: Any) -> Any:
+        """Record the response of a cached request, returning the response the caller should use
+
+        A 304 answer to a conditional request refreshes the cached response and returns it; a 200 replaces it.
+        """
+        with self._lock:
+            if response.status_code == 304 and key in self._entries:
+                entry = self._entries[key]
+                entry.expires_at = self.clock() + ttl
+                self.revalidations += 1
+                return entry.response
+            if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+                self._entries.pop(key, None)
+                return response
+            headers = CaseInsensitiveDict(response.headers)
+            cached = CachedResponse(status_code=response.status_code, headers=headers, content=response.content)
+            self._entries[key] = _Entry(
+                path=urlsplit(url).path,
+                response=cached,
+                expires_at=self.clock() + ttl,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return response
+
+    def invalidate(self, url: str) -> None:
+        """Drop the cached responses of ``url`` and of every URL below it"""
+        path = urlsplit(url).path.rstrip("/")
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if (entry.path + "/").startswith(path + "/")]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = ["ResponseCache", "CachedResponse", "CACHEABLE_ENDPOINTS", "DEFAULT_TTLS", "DEFAULT_MAXSIZE"]
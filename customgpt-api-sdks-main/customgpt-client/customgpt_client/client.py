@@ -1,54 +1,87 @@
 # Imports
 
+import asyncio
 import ssl
-from typing import Any, Dict, Union
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 import attr
-
-from customgpt_client.api.citations import get_citation
-from customgpt_client.api.conversations import (
-    create_conversation,
-    delete_conversation,
-    get_conversations,
-    messages_conversation,
-    send_message,
-    update_conversation,
-)
-from customgpt_client.api.page_metadata import get_page_metadata, update_page_metadata
-from customgpt_client.api.pages import delete_page, get_pages, preview_citation, reindex_page
-from customgpt_client.api.project_plugins import create_plugin, get_plugin, update_plugin
-from customgpt_client.api.project_settings import get_settings, update_settings
-from customgpt_client.api.projects import (
-    create_project,
-    delete_project,
-    get_project,
-    list_projects,
-    stats_project,
-    update_project,
+import requests
+
+from customgpt_client import bulk, ingest, models, pagination
+from customgpt_client.api import (
+    citations,
+    conversations,
+    page_metadata,
+    pages,
+    project_plugins,
+    project_settings,
+    projects,
+    sources,
+    users,
 )
-from customgpt_client.api.sources import create_source, delete_source, list_sources
-from customgpt_client.api.users import get_user, update_user
-from customgpt_client.models import (
-    CreateConversationJsonBody,
-    CreatePluginJsonBody,
-    CreateProjectMultipartData,
-    CreateSourceMultipartData,
-    SendMessageJsonBody,
-    UpdateConversationJsonBody,
-    UpdatePageMetadataJsonBody,
-    UpdatePluginJsonBody,
-    UpdateProjectMultipartData,
-    UpdateSettingsMultipartData,
-    UpdateUserMultipartData,
+from customgpt_client.cache import ResponseCache
+from customgpt_client.coalesce import SingleFlight, request_key
+from customgpt_client.codec import JSONCodec, default_codec, encode_json_body
+from customgpt_client.disk_cache import DiskCache
+from customgpt_client.instrumentation import RequestEvent, endpoint_name
+from customgpt_client.ratelimit import DEFAULT_MAX_RETRIES, RateLimiter
+from customgpt_client.resources import ResourceAccessor
+from customgpt_client.streaming import AsyncRawResponse, RawResponse
+from customgpt_client.transport import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    build_async_client,
+    build_session,
+    send,
+    send_async,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+T = TypeVar("T")
+
 # Initialize the client
+# The client built from the class level settings is kept around so that every call made through
+# the resource classes shares its connection pool; it is only rebuilt when those settings change.
+
+_default_client: Optional[Tuple[Tuple[Any, ...], "CustomGPT"]] = None
+_default_client_lock = threading.Lock()
+
 
 def set_client():
+    global _default_client
     api_key = CustomGPT.api_key if hasattr(CustomGPT, "api_key") else ""
     base_url = CustomGPT.base_url if hasattr(CustomGPT, "base_url") else "https://app.customgpt.ai"
     timeout = CustomGPT.timeout if hasattr(CustomGPT, "timeout") else 100.0
-    return CustomGPT(api_key=api_key, base_url=base_url, timeout=timeout)
+    pool_connections = (
+        CustomGPT.pool_connections if hasattr(CustomGPT, "pool_connections") else DEFAULT_POOL_CONNECTIONS
+    )
+    pool_maxsize = CustomGPT.pool_maxsize if hasattr(CustomGPT, "pool_maxsize") else DEFAULT_POOL_MAXSIZE
+    keep_alive = CustomGPT.keep_alive if hasattr(CustomGPT, "keep_alive") else True
+    settings = (api_key, base_url, timeout, pool_connections, pool_maxsize, keep_alive)
+    with _default_client_lock:
+        if _default_client is None or _default_client[0] != settings:
+            client = CustomGPT(
+                api_key=api_key,
+                base_url=base_url,
+                timeout=timeout,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                keep_alive=keep_alive,
+            )
+            _default_client = (settings, client)
+        return _default_client[1]
+
+# Get the client a resource call goes through: the one it is bound to (client.projects.list(...))
+# or the default client
+
+def bound_client(kwargs):
+    client = kwargs.pop("client", None)
+    return set_client() if client is None else client
 
 # Function to retrieve data from kwargs
 
@@ -74,6 +107,32 @@ class CustomGPT:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document.
         follow_redirects: Whether or not to follow redirects. Default value is False.
+        pool_connections: The number of per-host connection pools kept by the client's session.
+        pool_maxsize: The maximum number of connections kept open to a single host.
+        pool_block: Whether to wait for a free pooled connection instead of opening an extra one when
+            pool_maxsize connections to a host are already in use.
+        keep_alive: Whether to reuse connections between requests. Default value is True.
+        rate_limiter: The RateLimiter pacing this client's requests to the API's rate limits. Pass the same limiter to
+            several clients to have them share one budget, or None to send requests unpaced.
+        max_rate_limit_retries: How many times a request answered with a 429 is retried once the limiter allows it.
+        json_codec: The JSONCodec encoding request bodies and decoding responses. Defaults to orjson when it is
+            installed and to the standard library json module otherwise.
+        parse: Whether the *_detailed endpoint functions decode responses into models. When False they return a
+            RawResponse (AsyncRawResponse) with the status, headers and unread body instead, e.g. to relay responses
+            as they are. A parse argument given to the call takes precedence.
+        lazy_decoding: Whether the *_detailed endpoint functions keep the decoded JSON of a response and build each
+            field of its model (nested models, lists, datetimes) only when it is first read. Reading a count off a
+            large listing then costs close to nothing.
+        cache: A ResponseCache keeping the responses of the read-mostly endpoints (get_project, get_settings, ...),
+            or None (the default) to always ask the API.
+        disk_cache: A DiskCache keeping citations and citation previews on disk, shared between processes.
+        coalesce_requests: Whether identical GETs made while one is already in flight (from other threads or tasks)
+            wait for it and share its Response instead of sending their own request. The callers then share the
+            parsed models too, so they should not modify them.
+        on_request: Called with a RequestEvent before each request is sent (or answered from a cache).
+        on_response: Called with the completed RequestEvent once a response is received and, for the *_detailed
+            endpoint functions, parsed: endpoint name, timings, sizes, parse time and retries.
+        on_error: Called with the RequestEvent of a request that failed with an exception, before it is raised.
     """
 
     api_key: str
@@ -86,6 +145,27 @@ class CustomGPT:
     verify_ssl: Union[str, bool, ssl.SSLContext] = attr.ib(True, kw_only=True)
     raise_on_unexpected_status: bool = attr.ib(False, kw_only=True)
     follow_redirects: bool = attr.ib(False, kw_only=True)
+    pool_connections: int = attr.ib(DEFAULT_POOL_CONNECTIONS, kw_only=True)
+    pool_maxsize: int = attr.ib(DEFAULT_POOL_MAXSIZE, kw_only=True)
+    pool_block: bool = attr.ib(False, kw_only=True)
+    keep_alive: bool = attr.ib(True, kw_only=True)
+    rate_limiter: Optional[RateLimiter] = attr.ib(factory=RateLimiter, kw_only=True)
+    max_rate_limit_retries: int = attr.ib(DEFAULT_MAX_RETRIES, kw_only=True)
+    json_codec: JSONCodec = attr.ib(factory=default_codec, kw_only=True)
+    parse: bool = attr.ib(True, kw_only=True)
+    lazy_decoding: bool = attr.ib(False, kw_only=True)
+    cache: Optional[ResponseCache] = attr.ib(None, kw_only=True)
+    disk_cache: Optional[DiskCache] = attr.ib(None, kw_only=True)
+    coalesce_requests: bool = attr.ib(False, kw_only=True)
+    on_request: Optional[Callable[[RequestEvent], None]] = attr.ib(None, kw_only=True)
+    on_response: Optional[Callable[[RequestEvent], None]] = attr.ib(None, kw_only=True)
+    on_error: Optional[Callable[[RequestEvent], None]] = attr.ib(None, kw_only=True)
+    _session: Optional[requests.Session] = attr.ib(None, init=False, repr=False, eq=False)
+    _session_lock: threading.Lock = attr.ib(factory=threading.Lock, init=False, repr=False, eq=False)
+    _async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = attr.ib(
+        factory=weakref.WeakKeyDictionary, init=False, repr=False, eq=False
+    )
+    _single_flight: SingleFlight = attr.ib(factory=SingleFlight, init=False, repr=False, eq=False)
 
     def with_headers(self, headers: Dict[str, str]) -> "CustomGPT":
         """Get a new client matching this one with additional headers"""
@@ -110,82 +190,371 @@ class CustomGPT:
         auth_header_value = f"{self.prefix} {self.api_key}" if self.prefix else self.api_key
         return {self.auth_header_name: auth_header_value, **self.headers}
 
+    def get_session(self) -> requests.Session:
+        """Get the pooled session used for every request made with this client"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = build_session(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        pool_block=self.pool_block,
+                        keep_alive=self.keep_alive,
+                        verify_ssl=self.verify_ssl,
+                    )
+        return self._session
+
+    def request(self, **kwargs: Any) -> requests.Response:
+        """Send a request built by an endpoint's _get_kwargs through the pooled session
+
+        The request waits for the rate limiter first and is retried when the API answers with a 429. With a cache,
+        cached responses are answered from it and other requests drop the cached responses they may change.
+        """
+        return self._instrumented(kwargs)
+
+    def _start_event(self, kwargs: Dict[str, Any]) -> Optional[RequestEvent]:
+        """Create the RequestEvent of a request if the client has hooks, calling on_request"""
+        if self.on_request is None and self.on_response is None and self.on_error is None:
+            return None
+        event = RequestEvent(endpoint_name(kwargs["method"], kwargs["url"]), kwargs["method"].upper(), kwargs["url"])
+        if self.on_request is not None:
+            self.on_request(event)
+        return event
+
+    def _finish_event(self, event: RequestEvent, error: Optional[BaseException] = None) -> None:
+        if event.total is None:
+            event.total = time.perf_counter() - event.started
+        if error is not None:
+            event.error = error
+            if self.on_error is not None:
+                self.on_error(event)
+        elif self.on_response is not None:
+            self.on_response(event)
+
+    def _instrumented(self, kwargs: Dict[str, Any], build_response: Optional[Callable[..., Any]] = None) -> Any:
+        """Send a request, building its Response with build_response if given, and report it to the hooks"""
+        event = self._start_event(kwargs)
+        if event is None:
+            response = self._request(kwargs)
+            return response if build_response is None else build_response(client=self, response=response)
+        try:
+            response = self._request(kwargs, event)
+            event.total = time.perf_counter() - event.started
+            if build_response is not None:
+                parse_started = time.perf_counter()
+                response = build_response(client=self, response=response)
+                event.parse_time = time.perf_counter() - parse_started
+        except Exception as error:
+            self._finish_event(event, error)
+            raise
+        self._finish_event(event)
+        return response
+
+    def _request(self, kwargs: Dict[str, Any], event: Optional[RequestEvent] = None) -> requests.Response:
+        encode_json_body(kwargs, self.json_codec)
+        cached = self._cache_for(kwargs)
+        if cached is None:
+            response = self._send(kwargs, event)
+            if kwargs["method"].lower() != "get":
+                for cache in (self.disk_cache, self.cache):
+                    if cache is not None:
+                        cache.invalidate(kwargs["url"])
+            return response
+
+        cache, key, ttl = cached
+        response, conditional_headers = cache.get(key)
+        if response is not None:
+            if event is not None:
+                event.cached = True
+                event.record_response(response, streamed=False)
+            return response
+        headers = kwargs.get("headers")
+        if conditional_headers:
+            kwargs["headers"] = {**(headers or {}), **conditional_headers}
+        response = cache.store(key, ttl, kwargs["url"], self._send(kwargs, event))
+        if conditional_headers and response.status_code == 304:
+            # The cached response was evicted while it was being revalidated, so the full response is needed after all
+            response.close()
+            kwargs["headers"] = headers
+            response = cache.store(key, ttl, kwargs["url"], self._send(kwargs, event))
+        return response
+
+    def _cache_for(self, kwargs: Dict[str, Any]) -> Optional[Tuple[Any, Any, Any]]:
+        """Return the cache keeping the response of a request, with the request's key and TTL in it"""
+        for cache in (self.disk_cache, self.cache):
+            if cache is not None:
+                cached = cache.key(kwargs)
+                if cached is not None:
+                    return (cache, *cached)
+        return None
+
+    def _send(self, kwargs: Dict[str, Any], event: Optional[RequestEvent] = None) -> requests.Response:
+        limiter = self.rate_limiter
+        for attempt in range(self.max_rate_limit_retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            if event is None:
+                response = send(self.get_session(), **kwargs)
+            else:
+                event.retries = attempt
+                response = event.timed(send, self.get_session(), **kwargs)
+            if limiter is None or limiter.update(response.status_code, response.headers) is None:
+                break
+            if attempt < self.max_rate_limit_retries:
+                response.close()
+        if event is not None:
+            event.record_response(response, streamed=bool(kwargs.get("stream")))
+        return response
+
+    def request_parsed(self, kwargs: Dict[str, Any], build_response: Callable[..., T]) -> T:
+        """Send a request built by an endpoint's _get_kwargs and build its Response with the endpoint's _build_response
+
+        With coalesce_requests set, identical GETs already in flight are waited for instead of sent again.
+        """
+
+        def fetch() -> T:
+            return self._instrumented(kwargs, build_response)
+
+        key = request_key(kwargs) if self.coalesce_requests else None
+        if key is None:
+            return fetch()
+        return self._single_flight.do(key, fetch)
+
+    def request_raw(self, **kwargs: Any) -> RawResponse:
+        """Send a request like request, leaving the response body unread"""
+        kwargs["stream"] = True
+        return RawResponse(self.request(**kwargs))
+
+    def get_async_client(self) -> "httpx.AsyncClient":
+        """Get the pooled asynchronous client used by the asyncio endpoint functions
+
+        Connections can't be shared between event loops, so one pool is kept per running loop.
+        """
+        loop = asyncio.get_running_loop()
+        async_client = self._async_clients.get(loop)
+        if async_client is None or async_client.is_closed:
+            async_client = build_async_client(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                keep_alive=self.keep_alive,
+                verify_ssl=self.verify_ssl,
+            )
+            self._async_clients[loop] = async_client
+        return async_client
+
+    async def arequest(self, **kwargs: Any) -> "httpx.Response":
+        """Send a request built by an endpoint's _get_kwargs without blocking the event loop, see request"""
+        return await self._ainstrumented(kwargs)
+
+    async def _ainstrumented(self, kwargs: Dict[str, Any], build_response: Optional[Callable[..., Any]] = None) -> Any:
+        """Send a request without blocking the event loop and report it to the hooks, see _instrumented"""
+        event = self._start_event(kwargs)
+        if event is None:
+            response = await self._arequest(kwargs)
+            return response if build_response is None else build_response(client=self, response=response)
+        try:
+            response = await self._arequest(kwargs, event)
+            event.total = time.perf_counter() - event.started
+            if build_response is not None:
+                parse_started = time.perf_counter()
+                response = build_response(client=self, response=response)
+                event.parse_time = time.perf_counter() - parse_started
+        except Exception as error:
+            self._finish_event(event, error)
+            raise
+        self._finish_event(event)
+        return response
+
+    async def _arequest(self, kwargs: Dict[str, Any], event: Optional[RequestEvent] = None) -> "httpx.Response":
+        encode_json_body(kwargs, self.json_codec)
+        cached = self._cache_for(kwargs)
+        if cached is None:
+            response = await self._asend(kwargs, event)
+            if kwargs["method"].lower() != "get":
+                for cache in (self.disk_cache, self.cache):
+                    if cache is not None:
+                        cache.invalidate(kwargs["url"])
+            return response
+
+        cache, key, ttl = cached
+        response, conditional_headers = cache.get(key)
+        if response is not None:
+            if event is not None:
+                event.cached = True
+                event.record_response(response, streamed=False)
+            return response
+        headers = kwargs.get("headers")
+        if conditional_headers:
+            kwargs["headers"] = {**(headers or {}), **conditional_headers}
+        response = cache.store(key, ttl, kwargs["url"], await self._asend(kwargs, event))
+        if conditional_headers and response.status_code == 304:
+            # The cached response was evicted while it was being revalidated, so the full response is needed after all
+            await response.aclose()
+            kwargs["headers"] = headers
+            response = cache.store(key, ttl, kwargs["url"], await self._asend(kwargs, event))
+        return response
+
+    async def _asend(self, kwargs: Dict[str, Any], event: Optional[RequestEvent] = None) -> "httpx.Response":
+        limiter = self.rate_limiter
+        for attempt in range(self.max_rate_limit_retries + 1):
+            if limiter is not None:
+                await limiter.aacquire()
+            if event is None:
+                response = await send_async(self.get_async_client(), **kwargs)
+            else:
+                event.retries = attempt
+                response = await send_async(self.get_async_client(), trace=event.async_trace(), **kwargs)
+            if limiter is None or limiter.update(response.status_code, response.headers) is None:
+                break
+            if attempt < self.max_rate_limit_retries:
+                await response.aclose()
+        if event is not None:
+            event.record_response(response, streamed=bool(kwargs.get("stream")))
+        return response
+
+    async def arequest_parsed(self, kwargs: Dict[str, Any], build_response: Callable[..., T]) -> T:
+        """Send a request without blocking the event loop and build its Response, see request_parsed"""
+
+        async def fetch() -> T:
+            return await self._ainstrumented(kwargs, build_response)
+
+        key = request_key(kwargs) if self.coalesce_requests else None
+        if key is None:
+            return await fetch()
+        return await self._single_flight.ado(key, fetch)
+
+    async def arequest_raw(self, **kwargs: Any) -> AsyncRawResponse:
+        """Send a request like arequest, leaving the response body unread"""
+        kwargs["stream"] = True
+        return AsyncRawResponse(await self.arequest(**kwargs))
+
+    def close(self) -> None:
+        """Close the pooled connections held by this client
+
+        The pool of each event loop is closed in that loop, without waiting for it to be done; the pools of loops
+        already closed went with their loop.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+        for loop, async_client in list(self._async_clients.items()):
+            self._async_clients.pop(loop, None)
+            if not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(async_client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        """Close the pooled connections held by this client, waiting for the one of the running event loop"""
+        async_client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if async_client is not None:
+            await async_client.aclose()
+        self.close()
+
+    def __enter__(self) -> "CustomGPT":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "CustomGPT":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
 # Class for representing the Project object of the CustomGPT API
 # The Project object contains methods for creating, updating, deleting, and listing projects, 
 # both synchronously and asynchronously
 
     class Project:
         def list(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return list_projects.sync_detailed(client=client, *args, **kwargs)
+            return projects.list_projects.sync_detailed(client=client, *args, **kwargs)
 
         def alist(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
+
+            return projects.list_projects.asyncio_detailed(client=client, *args, **kwargs)
+
+        def iter_all(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
 
-            return list_projects.asyncio_detailed(client=client, *args, **kwargs)
+            return pagination.iter_all(projects.list_projects, client=client, *args, **kwargs)
+
+        def aiter_all(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return pagination.aiter_all(projects.list_projects, client=client, *args, **kwargs)
 
         def create(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["project_name", "sitemap_path", "file_data_retension", "file"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = CreateProjectMultipartData(**json)
+            kwargs["multipart_data"] = models.CreateProjectMultipartData(**json)
 
-            return create_project.sync_detailed(client=client, *args, **kwargs)
+            return projects.create_project.sync_detailed(client=client, *args, **kwargs)
 
         def acreate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["project_name", "sitemap_path", "file_data_retension", "file"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = CreateProjectMultipartData(**json)
+            kwargs["multipart_data"] = models.CreateProjectMultipartData(**json)
 
-            return create_project.asyncio_detailed(client=client, *args, **kwargs)
+            return projects.create_project.asyncio_detailed(client=client, *args, **kwargs)
 
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_project.sync_detailed(client=client, *args, **kwargs)
+            return projects.get_project.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_project.asyncio_detailed(client=client, *args, **kwargs)
+            return projects.get_project.asyncio_detailed(client=client, *args, **kwargs)
 
         def update(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["project_name", "is_shared", "sitemap_path", "file_data_retension", "file"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = UpdateProjectMultipartData(**json)
+            kwargs["multipart_data"] = models.UpdateProjectMultipartData(**json)
 
-            return update_project.sync_detailed(client=client, *args, **kwargs)
+            return projects.update_project.sync_detailed(client=client, *args, **kwargs)
 
         def aupdate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["project_name", "is_shared", "sitemap_path", "file_data_retension", "file"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = UpdateProjectMultipartData(**json)
+            kwargs["multipart_data"] = models.UpdateProjectMultipartData(**json)
 
-            return update_project.asyncio_detailed(client=client, *args, **kwargs)
+            return projects.update_project.asyncio_detailed(client=client, *args, **kwargs)
 
         def delete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_project.sync_detailed(client=client, *args, **kwargs)
+            return projects.delete_project.sync_detailed(client=client, *args, **kwargs)
 
         def adelete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_project.asyncio_detailed(client=client, *args, **kwargs)
+            return projects.delete_project.asyncio_detailed(client=client, *args, **kwargs)
 
         def stats(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return stats_project.sync_detailed(client=client, *args, **kwargs)
+            return projects.stats_project.sync_detailed(client=client, *args, **kwargs)
 
         def astats(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
+
+            return projects.stats_project.asyncio_detailed(client=client, *args, **kwargs)
+
+        def delete_many(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return bulk.delete_projects(client=client, *args, **kwargs)
 
-            return stats_project.asyncio_detailed(client=client, *args, **kwargs)
+    projects = ResourceAccessor(Project)
 
 # Class for representing the Page object of the CustomGPT API
 # The Page object contains methods for getting, deleting, reindexing, and previewing pages,
@@ -193,44 +562,56 @@ class CustomGPT:
 
     class Page:
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_pages.sync_detailed(client=client, *args, **kwargs)
+            return pages.get_pages.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
+
+            return pages.get_pages.asyncio_detailed(client=client, *args, **kwargs)
+
+        def iter_all(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return pagination.iter_all(pages.get_pages, client=client, *args, **kwargs)
+
+        def aiter_all(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
 
-            return get_pages.asyncio_detailed(client=client, *args, **kwargs)
+            return pagination.aiter_all(pages.get_pages, client=client, *args, **kwargs)
 
         def delete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_page.sync_detailed(client=client, *args, **kwargs)
+            return pages.delete_page.sync_detailed(client=client, *args, **kwargs)
 
         def adelete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_page.asyncio_detailed(client=client, *args, **kwargs)
+            return pages.delete_page.asyncio_detailed(client=client, *args, **kwargs)
 
         def reindex(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return reindex_page.sync_detailed(client=client, *args, **kwargs)
+            return pages.reindex_page.sync_detailed(client=client, *args, **kwargs)
 
         def areindex(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return reindex_page.asyncio_detailed(client=client, *args, **kwargs)
+            return pages.reindex_page.asyncio_detailed(client=client, *args, **kwargs)
 
         def preview(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return preview_citation.sync_detailed(client=client, *args, **kwargs)
+            return pages.preview_citation.sync_detailed(client=client, *args, **kwargs)
 
         def apreview(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return preview_citation.asyncio_detailed(client=client, *args, **kwargs)
+            return pages.preview_citation.asyncio_detailed(client=client, *args, **kwargs)
+
+    pages = ResourceAccessor(Page)
 
 # Class for representing the PageMetadata object of the CustomGPT API
 # The PageMetadata object contains methods for getting and updating page metadata,
@@ -238,30 +619,32 @@ class CustomGPT:
 
     class PageMetadata:
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_page_metadata.sync_detailed(client=client, *args, **kwargs)
+            return page_metadata.get_page_metadata.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_page_metadata.asyncio_detailed(client=client, *args, **kwargs)
+            return page_metadata.get_page_metadata.asyncio_detailed(client=client, *args, **kwargs)
 
         def update(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["title", "url", "description", "image"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = UpdatePageMetadataJsonBody(**json)
+            kwargs["json_body"] = models.UpdatePageMetadataJsonBody(**json)
 
-            return update_page_metadata.sync_detailed(client=client, *args, **kwargs)
+            return page_metadata.update_page_metadata.sync_detailed(client=client, *args, **kwargs)
 
         def aupdate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["title", "url", "description", "image"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = UpdatePageMetadataJsonBody(**json)
+            kwargs["json_body"] = models.UpdatePageMetadataJsonBody(**json)
+
+            return page_metadata.update_page_metadata.asyncio_detailed(client=client, *args, **kwargs)
 
-            return update_page_metadata.asyncio_detailed(client=client, *args, **kwargs)
+    page_metadata = ResourceAccessor(PageMetadata)
 
 # Class for representing the ProjectSettings object of the CustomGPT API
 # The ProjectSettings object contains methods for getting and updating project settings,
@@ -269,17 +652,17 @@ class CustomGPT:
 
     class ProjectSettings:
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_settings.sync_detailed(client=client, *args, **kwargs)
+            return project_settings.get_settings.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_settings.asyncio_detailed(client=client, *args, **kwargs)
+            return project_settings.get_settings.asyncio_detailed(client=client, *args, **kwargs)
 
         def update(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = [
                 "chat_bot_avatar",
                 "chat_bot_bg",
@@ -301,12 +684,12 @@ class CustomGPT:
                 "remove_branding",
             ]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = UpdateSettingsMultipartData(**json)
+            kwargs["multipart_data"] = models.UpdateSettingsMultipartData(**json)
 
-            return update_settings.sync_detailed(client=client, *args, **kwargs)
+            return project_settings.update_settings.sync_detailed(client=client, *args, **kwargs)
 
         def aupdate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = [
                 "chat_bot_avatar",
                 "chat_bot_bg",
@@ -328,9 +711,11 @@ class CustomGPT:
                 "remove_branding",
             ]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = UpdateSettingsMultipartData(**json)
+            kwargs["multipart_data"] = models.UpdateSettingsMultipartData(**json)
+
+            return project_settings.update_settings.asyncio_detailed(client=client, *args, **kwargs)
 
-            return update_settings.asyncio_detailed(client=client, *args, **kwargs)
+    project_settings = ResourceAccessor(ProjectSettings)
 
 # Class for representing the ProjectPlugins object of the CustomGPT API
 # The ProjectPlugins object contains methods for getting, updating, and creating project plugins,
@@ -339,46 +724,48 @@ class CustomGPT:
 
     class ProjectPlugins:
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_plugin.sync_detailed(client=client, *args, **kwargs)
+            return project_plugins.get_plugin.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_plugin.asyncio_detailed(client=client, *args, **kwargs)
+            return project_plugins.get_plugin.asyncio_detailed(client=client, *args, **kwargs)
 
         def update(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["model_name", "human_name", "keywords", "description", "is_active"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = UpdatePluginJsonBody(**json)
+            kwargs["json_body"] = models.UpdatePluginJsonBody(**json)
 
-            return update_plugin.sync_detailed(client=client, *args, **kwargs)
+            return project_plugins.update_plugin.sync_detailed(client=client, *args, **kwargs)
 
         def aupdate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["model_name", "human_name", "keywords", "description", "is_active"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = UpdatePluginJsonBody(**json)
+            kwargs["json_body"] = models.UpdatePluginJsonBody(**json)
 
-            return update_plugin.asyncio_detailed(client=client, *args, **kwargs)
+            return project_plugins.update_plugin.asyncio_detailed(client=client, *args, **kwargs)
 
         def create(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["model_name", "human_name", "keywords", "description", "is_active"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = CreatePluginJsonBody(**json)
+            kwargs["json_body"] = models.CreatePluginJsonBody(**json)
 
-            return create_plugin.sync_detailed(client=client, *args, **kwargs)
+            return project_plugins.create_plugin.sync_detailed(client=client, *args, **kwargs)
 
         def acreate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["model_name", "human_name", "keywords", "description", "is_active"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = CreatePluginJsonBody(**json)
+            kwargs["json_body"] = models.CreatePluginJsonBody(**json)
 
-            return create_plugin.asyncio_detailed(client=client, *args, **kwargs)
+            return project_plugins.create_plugin.asyncio_detailed(client=client, *args, **kwargs)
+
+    project_plugins = ResourceAccessor(ProjectPlugins)
 
 # Class for representing the Conversation object of the CustomGPT API
 # The Conversation object contains methods for creating, updating, deleting, 
@@ -387,96 +774,120 @@ class CustomGPT:
 
     class Conversation:
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_conversations.sync_detailed(client=client, *args, **kwargs)
+            return conversations.get_conversations.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
+
+            return conversations.get_conversations.asyncio_detailed(client=client, *args, **kwargs)
 
-            return get_conversations.asyncio_detailed(client=client, *args, **kwargs)
+        def iter_all(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return pagination.iter_all(conversations.get_conversations, client=client, *args, **kwargs)
+
+        def aiter_all(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return pagination.aiter_all(conversations.get_conversations, client=client, *args, **kwargs)
 
         def create(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["name"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = CreateConversationJsonBody(**json)
+            kwargs["json_body"] = models.CreateConversationJsonBody(**json)
 
-            return create_conversation.sync_detailed(client=client, *args, **kwargs)
+            return conversations.create_conversation.sync_detailed(client=client, *args, **kwargs)
 
         def acreate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["name"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = CreateConversationJsonBody(**json)
+            kwargs["json_body"] = models.CreateConversationJsonBody(**json)
 
-            return create_conversation.asyncio_detailed(client=client, *args, **kwargs)
+            return conversations.create_conversation.asyncio_detailed(client=client, *args, **kwargs)
 
         def update(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["name"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = UpdateConversationJsonBody(**json)
+            kwargs["json_body"] = models.UpdateConversationJsonBody(**json)
 
-            return update_conversation.sync_detailed(client=client, *args, **kwargs)
+            return conversations.update_conversation.sync_detailed(client=client, *args, **kwargs)
 
         def aupdate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["name"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = UpdateConversationJsonBody(**json)
+            kwargs["json_body"] = models.UpdateConversationJsonBody(**json)
 
-            return update_conversation.asyncio_detailed(client=client, *args, **kwargs)
+            return conversations.update_conversation.asyncio_detailed(client=client, *args, **kwargs)
 
         def delete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_conversation.sync_detailed(client=client, *args, **kwargs)
+            return conversations.delete_conversation.sync_detailed(client=client, *args, **kwargs)
 
         def adelete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_conversation.asyncio_detailed(client=client, *args, **kwargs)
+            return conversations.delete_conversation.asyncio_detailed(client=client, *args, **kwargs)
 
         def messages(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return messages_conversation.sync_detailed(client=client, *args, **kwargs)
+            return conversations.messages_conversation.sync_detailed(client=client, *args, **kwargs)
 
         def amessages(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
+
+            return conversations.messages_conversation.asyncio_detailed(client=client, *args, **kwargs)
 
-            return messages_conversation.asyncio_detailed(client=client, *args, **kwargs)
+        def iter_messages(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return pagination.iter_all(conversations.messages_conversation, client=client, *args, **kwargs)
+
+        def aiter_messages(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return pagination.aiter_all(conversations.messages_conversation, client=client, *args, **kwargs)
 
         def send(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["prompt", "custom_persona"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = SendMessageJsonBody(**json)
+            kwargs["json_body"] = models.SendMessageJsonBody(**json)
 
-            return send_message.sync_detailed(client=client, *args, **kwargs)
+            return conversations.send_message.sync_detailed(client=client, *args, **kwargs)
 
         def asend(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["prompt", "custom_persona"]
             json = pluck_data(fields, kwargs)
-            kwargs["json_body"] = SendMessageJsonBody(**json)
+            kwargs["json_body"] = models.SendMessageJsonBody(**json)
 
-            return send_message.asyncio_detailed(client=client, *args, **kwargs)
+            return conversations.send_message.asyncio_detailed(client=client, *args, **kwargs)
+
+    conversations = ResourceAccessor(Conversation)
 
 # Class for representing the Citation object of the CustomGPT API
 # The Citation object contains methods for getting citations both synchronously and asynchronously
 
     class Citation:
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_citation.sync_detailed(client=client, *args, **kwargs)
+            return citations.get_citation.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
+
+            return citations.get_citation.asyncio_detailed(client=client, *args, **kwargs)
 
-            return get_citation.asyncio_detailed(client=client, *args, **kwargs)
+    citations = ResourceAccessor(Citation)
 
 # Class for representing the Source object of the CustomGPT API
 # The Source object contains methods for creating, deleting, and listing sources,
@@ -484,40 +895,47 @@ class CustomGPT:
 
     class Source:
         def list(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return list_sources.sync_detailed(client=client, *args, **kwargs)
+            return sources.list_sources.sync_detailed(client=client, *args, **kwargs)
 
         def alist(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return list_sources.asyncio_detailed(client=client, *args, **kwargs)
+            return sources.list_sources.asyncio_detailed(client=client, *args, **kwargs)
 
         def create(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["sitemap_path", "file_data_retension", "file"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = CreateSourceMultipartData(**json)
+            kwargs["multipart_data"] = models.CreateSourceMultipartData(**json)
 
-            return create_source.sync_detailed(client=client, *args, **kwargs)
+            return sources.create_source.sync_detailed(client=client, *args, **kwargs)
 
         def acreate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["sitemap_path", "file_data_retension", "file"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = CreateSourceMultipartData(**json)
+            kwargs["multipart_data"] = models.CreateSourceMultipartData(**json)
 
-            return create_source.asyncio_detailed(client=client, *args, **kwargs)
+            return sources.create_source.asyncio_detailed(client=client, *args, **kwargs)
 
         def delete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_source.sync_detailed(client=client, *args, **kwargs)
+            return sources.delete_source.sync_detailed(client=client, *args, **kwargs)
 
         def adelete(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return delete_source.asyncio_detailed(client=client, *args, **kwargs)
+            return sources.delete_source.asyncio_detailed(client=client, *args, **kwargs)
+
+        def ingest_directory(*args: Any, **kwargs: Any):
+            client = bound_client(kwargs)
+
+            return ingest.ingest_directory(client=client, *args, **kwargs)
+
+    sources = ResourceAccessor(Source)
 
 # Class for representing the User object of the CustomGPT API
 # The User object contains methods for getting and updating user information,
@@ -525,27 +943,29 @@ class CustomGPT:
 
     class User:
         def get(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_user.sync_detailed(client=client, *args, **kwargs)
+            return users.get_user.sync_detailed(client=client, *args, **kwargs)
 
         def aget(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
 
-            return get_user.asyncio_detailed(client=client, *args, **kwargs)
+            return users.get_user.asyncio_detailed(client=client, *args, **kwargs)
 
         def update(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["profile_photo", "name"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = UpdateUserMultipartData(**json)
+            kwargs["multipart_data"] = models.UpdateUserMultipartData(**json)
 
-            return update_user.sync_detailed(client=client, *args, **kwargs)
+            return users.update_user.sync_detailed(client=client, *args, **kwargs)
 
         def aupdate(*args: Any, **kwargs: Any):
-            client = set_client()
+            client = bound_client(kwargs)
             fields = ["profile_photo", "name"]
             json = pluck_data(fields, kwargs)
-            kwargs["multipart_data"] = UpdateUserMultipartData(**json)
+            kwargs["multipart_data"] = models.UpdateUserMultipartData(**json)
+
+            return users.update_user.asyncio_detailed(client=client, *args, **kwargs)
 
-            return update_user.asyncio_detailed(client=client, *args, **kwargs)
+    users = ResourceAccessor(User)
@@ -0,0 +1,110 @@
+""" Contains the single-flight coalescing of identical concurrent requests """
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def request_key(kwargs: Mapping[str, Any]) -> Optional[Hashable]:
+    """Return what identifies a request built by an endpoint's _get_kwargs, None if it must not be coalesced
+
+    Only idempotent, non-streamed GETs are coalesced.
+    """
+    if kwargs.get("method", "").lower() != "get" or kwargs.get("stream"):
+        return None
+    return (
+        kwargs["url"],
+        tuple(sorted((kwargs.get("params") or {}).items())),
+        tuple(sorted((kwargs.get("headers") or {}).items())),
+    )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs a single call at a time per key, handing its outcome to every caller that asked while it was running
+
+    Works across threads (``do``) and across the tasks of each event loop (``ado``). In an event loop the call runs in
+    a task of its own, so a caller that is cancelled only stops waiting for it; the call itself is cancelled once no
+    caller is left waiting.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _AsyncCall] = {}
+
+    def do(self, key: Hashable, call: Callable[[], T]) -> T:
+        with self._lock:
+            pending = self._calls.get(key)
+            if pending is None:
+                pending = self._calls[key] = _Call()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        try:
+            pending.result = call()
+        except BaseException as error:
+            pending.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            pending.done.set()
+        return pending.result
+
+    async def ado(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pending = self._tasks.get((loop, key))
+            if pending is None:
+                pending = self._tasks[(loop, key)] = _AsyncCall(asyncio.ensure_future(call()))
+                pending.task.add_done_callback(lambda task: self._finish(loop, key, pending))
+            pending.waiters += 1
+
+        try:
+            # Shielded so a cancelled caller doesn't cancel the call the others wait for
+            return await asyncio.shield(pending.task)
+        except asyncio.CancelledError:
+            if pending.waiters == 1 and not pending.task.done():
+                pending.task.cancel()
+            raise
+        finally:
+            pending.waiters -= 1
+
+    def _finish(self, loop: asyncio.AbstractEventLoop, key: Hashable, pending: _AsyncCall) -> None:
+        with self._lock:
+            if self._tasks.get((loop, key)) is pending:
+                del self._tasks[(loop, key)]
+        # A call whose callers all went away may still fail; don't report its error as never retrieved
+        if not pending.task.cancelled():
+            pending.task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls) + len(self._tasks)
+
+
+__all__ = ["SingleFlight", "request_key"]
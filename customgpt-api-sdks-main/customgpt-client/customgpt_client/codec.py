@@ -0,0 +1,57 @@
+""" Contains the JSON codecs used by a client to encode request bodies and decode response bodies """
+import json
+from typing import Any, Dict
+
+
+class JSONCodec:
+    """Encodes and decodes JSON with the standard library
+
+    Bodies are decoded straight from the response bytes, skipping the charset detection and bytes to str pass of
+    ``requests``' ``Response.text``. Subclass it and override loads and dumps to plug in another JSON library.
+    """
+
+    name = "json"
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def dumps(self, obj: Any) -> bytes:
+        # Same output as the json= argument of requests
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON with ``orjson``, which needs to be installed"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, content: bytes) -> Any:
+        return self._orjson.loads(content)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+def default_codec() -> JSONCodec:
+    """Return the fastest codec available: ``orjson`` when it is installed, the standard library otherwise"""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
+
+
+def encode_json_body(kwargs: Dict[str, Any], codec: JSONCodec) -> None:
+    """Replace the ``json`` body of request keyword arguments built by an endpoint's _get_kwargs with its encoding"""
+    body = kwargs.pop("json", None)
+    if body is None:
+        return
+    kwargs["data"] = codec.dumps(body)
+    kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+
+
+__all__ = ["JSONCodec", "OrjsonCodec", "default_codec", "encode_json_body"]
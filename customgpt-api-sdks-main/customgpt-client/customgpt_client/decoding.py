@@ -0,0 +1,173 @@
+""" Contains the options and helpers shared by the from_dict of every model """
+import datetime
+import functools
+import sys
+import typing
+from io import BytesIO
+from typing import Any, Callable, Dict, Mapping, Optional, Type, TypeVar
+
+import attr
+from dateutil.parser import isoparse
+from dateutil.tz import UTC
+
+from .types import UNSET, File, Unset
+
+DATETIME_CACHE_SIZE = 4096
+
+T = TypeVar("T", bound="LazyModel")
+
+
+@attr.s(auto_attribs=True)
+class DecodeOptions:
+    """How responses are turned into models
+
+    Whether they are decoded lazily is up to each client, see ``CustomGPT.lazy_decoding``.
+
+    Attributes:
+        keep_additional_properties: Whether from_dict keeps the keys a model has no field for in its
+            additional_properties. Turn it off to drop them when decoding large listings.
+    """
+
+    keep_additional_properties: bool = True
+
+
+options = DecodeOptions()
+
+
+def unknown_properties(src_dict: Dict[str, Any], field_names: Mapping[str, str]) -> Dict[str, Any]:
+    """Return the keys of a decoded JSON object that its model has no field for
+
+    Args:
+        src_dict: The decoded JSON object.
+        field_names: The JSON key of each field of the model, mapped to its attribute name.
+    """
+    if not options.keep_additional_properties:
+        return {}
+    return {key: value for key, value in src_dict.items() if key not in field_names}
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse a timestamp of the API, e.g. ``2023-04-30 16:43:53`` or ``2023-04-30T16:43:53.000000Z``
+
+    The API's fixed formats are parsed with ``datetime.fromisoformat``; anything else falls back to
+    ``dateutil.parser.isoparse``. Listings repeat the same timestamps many times, so recently seen strings are cached
+    and share one (immutable) datetime.
+    """
+    try:
+        if value.endswith("Z"):
+            return datetime.datetime.fromisoformat(value[:-1]).replace(tzinfo=UTC)
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return isoparse(value)
+    if parsed.tzinfo is not None:
+        # Keep the dateutil tzinfo objects isoparse would have produced
+        return isoparse(value)
+    return parsed
+
+
+# The field types whose JSON value is the value of the field as it is
+_PLAIN_TYPES = (str, int, float, bool, type(None), Unset)
+
+
+def _field_decoder(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """Return the function turning a decoded JSON value into the value of a model field of ``field_type``
+
+    Missing keys are passed in as ``UNSET``. Fields from_dict would fail to decode from a missing key (nested models,
+    non-nullable datetimes) keep it; the others get the ``None`` or empty list from_dict gives them. Returns None for
+    the field types it doesn't know, which are then decoded by the model's from_dict.
+    """
+    if isinstance(field_type, typing.ForwardRef):
+        name = field_type.__forward_arg__
+
+        def decode_model(value: Any) -> Any:
+            if value is None or isinstance(value, Unset):
+                return value
+            from . import models
+
+            return getattr(models, name).lazy_from_dict(value)
+
+        return decode_model
+
+    if field_type is File:
+        # As from_dict does, a missing file being an empty one
+        return lambda value: File(payload=BytesIO(None if isinstance(value, Unset) else value))
+
+    origin = typing.get_origin(field_type)
+    if origin is list:
+        decode_item = _field_decoder(typing.get_args(field_type)[0])
+        if decode_item is None:
+            return None
+        return lambda value: [decode_item(item) for item in value or []] if not isinstance(value, Unset) else []
+    if origin is typing.Union:
+        args = typing.get_args(field_type)
+        missing = None if type(None) in args else UNSET
+        for arg in args:
+            if arg is datetime.datetime:
+                return lambda value: missing if isinstance(value, Unset) else value and parse_datetime(value)
+            if isinstance(arg, typing.ForwardRef) or typing.get_origin(arg) is list or arg is File:
+                return _field_decoder(arg)
+        if not all(arg in _PLAIN_TYPES for arg in args):
+            return None
+    elif field_type not in _PLAIN_TYPES and field_type is not Any:
+        return None
+    return lambda value: None if isinstance(value, Unset) else value
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_fields(cls: type) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    """Map each attribute of a model to the function building it from the model's decoded JSON"""
+    field_names: Mapping[str, str] = sys.modules[cls.__module__]._FIELD_NAMES  # type: ignore[attr-defined]
+    fields: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+        "additional_properties": lambda src_dict: unknown_properties(src_dict, field_names)
+    }
+    for key, name in field_names.items():
+        decoder = _field_decoder(attr.fields_dict(cls)[name].type)
+        if decoder is None:
+            fields[name] = lambda src_dict, name=name: getattr(cls.from_dict(src_dict), name)  # type: ignore
+        else:
+            fields[name] = lambda src_dict, key=key, decoder=decoder: decoder(src_dict.get(key, UNSET))
+    return fields
+
+
+class LazyModel:
+    """Base of the generated models, letting them be built field by field from their decoded JSON
+
+    ``from_dict`` decodes every field up front. ``lazy_from_dict`` only keeps the JSON object: each field is decoded the
+    first time it is read and then stored on the model like any other attribute.
+    """
+
+    __slots__ = ("_lazy_source",)
+
+    @classmethod
+    def lazy_from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
+        model = cls.__new__(cls)
+        model._lazy_source = src_dict
+        return model
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for slots that have not been set yet, i.e. fields of a lazy model not read so far
+        decoder = _lazy_fields(type(self)).get(name) if name != "_lazy_source" else None
+        if decoder is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = decoder(self._lazy_source)
+        setattr(self, name, value)
+        return value
+
+
+def decode(cls: Type[T], src_dict: Dict[str, Any], lazy: bool = False) -> T:
+    """Build the model of a response body, with ``lazy_from_dict`` when ``lazy`` is set"""
+    if lazy:
+        return cls.lazy_from_dict(src_dict)
+    return cls.from_dict(src_dict)  # type: ignore[attr-defined]
+
+
+__all__ = [
+    "DecodeOptions",
+    "options",
+    "unknown_properties",
+    "parse_datetime",
+    "LazyModel",
+    "decode",
+    "DATETIME_CACHE_SIZE",
+]
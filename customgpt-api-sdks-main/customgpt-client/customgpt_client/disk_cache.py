@@ -0,0 +1,183 @@
+""" Contains the persistent response cache for citations and citation previews """
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+from .cache import CachedResponse
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+INDEX_FILE_NAME = "index.sqlite3"
+
+# The GET endpoints whose responses are kept on disk; both are immutable per citation
+CACHEABLE_ENDPOINTS: Dict[str, Pattern[str]] = {
+    "get_citation": re.compile(r"/api/v1/projects/[^/]+/citations/[^/]+"),
+    "preview_citation": re.compile(r"/api/v1/preview/[^/]+"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (path);
+"""
+
+
+class DiskCache:
+    """A size-bounded, persistent cache of the ``get_citation`` and ``preview_citation`` responses
+
+    Pass one to a client as ``disk_cache``. Responses are kept in ``directory``: an SQLite index plus one file per body,
+    so several processes on the host can share the same directory. Once the bodies take more than ``max_bytes`` the
+    least recently read ones are dropped. Like a ResponseCache, requests other than GETs sent through the client drop
+    the cached responses at or below their URL (deleting a project forgets its citations).
+
+    Args:
+        directory: Where the index and bodies are kept; created if needed.
+        max_bytes: The total size of the bodies kept.
+        ttl: Seconds a response is kept, None (the default) to keep it until it is evicted.
+        clock: The wall clock in seconds used for expiry and recency, shared by every process.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        os.makedirs(os.path.join(directory, "bodies"), exist_ok=True)
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(os.path.join(self.directory, INDEX_FILE_NAME), timeout=30.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, "bodies", key[:2], key)
+
+    def key(self, kwargs: Mapping[str, Any]) -> Optional[Tuple[str, Optional[float]]]:
+        """Return the cache key and TTL of a request built by an endpoint's _get_kwargs, None if it isn't cached"""
+        if kwargs.get("method", "").lower() != "get" or kwargs.get("stream"):
+            return None
+        url = kwargs["url"]
+        if not any(pattern.fullmatch(urlsplit(url).path) for pattern in CACHEABLE_ENDPOINTS.values()):
+            return None
+        # Hashed so the credentials are never written to disk
+        identity = json.dumps(
+            [url, sorted((kwargs.get("params") or {}).items()), sorted((kwargs.get("headers") or {}).items())],
+            default=str,
+        )
+        return hashlib.sha256(identity.encode()).hexdigest(), self.ttl
+
+    def get(self, key: str) -> Tuple[Optional[CachedResponse], Dict[str, str]]:
+        """Look up a request, returning the cached response if there is a live one (and no conditional headers)"""
+        connection = self._connection()
+        row = connection.execute("SELECT status, headers, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        now = self.clock()
+        if row is not None and (row[2] is None or now < row[2]):
+            try:
+                with open(self._body_path(key), "rb") as file:
+                    content = file.read()
+            except FileNotFoundError:
+                pass
+            else:
+                with connection:
+                    connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                self.hits += 1
+                headers = CaseInsensitiveDict(json.loads(row[1]))
+                return CachedResponse(status_code=row[0], headers=headers, content=content), {}
+        if row is not None:
+            self._delete([key])
+        self.misses += 1
+        return None, {}
+
+    def store(self, key: str, ttl: Optional[float], url: str, response: Any) -> Any:
+        """Keep the response of a cached request if it succeeded, returning it"""
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return response
+        content = response.content
+        body_path = self._body_path(key)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(body_path))
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(content)
+        os.replace(temporary_path, body_path)
+
+        now = self.clock()
+        headers = json.dumps(dict(response.headers))
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, urlsplit(url).path, response.status_code, headers, len(content), ttl and now + ttl, now),
+            )
+        self._evict()
+        return response
+
+    def _evict(self) -> None:
+        connection = self._connection()
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            evicted.append(key)
+            total -= size
+        self._delete(evicted)
+
+    def _delete(self, keys: List[str]) -> None:
+        connection = self._connection()
+        with connection:
+            connection.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in keys])
+        for key in keys:
+            try:
+                os.remove(self._body_path(key))
+            except FileNotFoundError:
+                pass
+
+    def invalidate(self, url: str) -> None:
+        """Drop the cached responses of ``url`` and of every URL below it"""
+        path = urlsplit(url).path.rstrip("/")
+        rows = self._connection().execute(
+            "SELECT key FROM responses WHERE path = ? OR substr(path, 1, ?) = ?", (path, len(path) + 1, path + "/")
+        )
+        self._delete([key for (key,) in rows])
+
+    def clear(self) -> None:
+        self._delete([key for (key,) in self._connection().execute("SELECT key FROM responses")])
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+__all__ = ["DiskCache", "CACHEABLE_ENDPOINTS", "DEFAULT_MAX_BYTES"]
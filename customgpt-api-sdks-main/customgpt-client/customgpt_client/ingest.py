@@ -0,0 +1,247 @@
+""" Contains the bulk ingestion of a directory of documents into a project """
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+import attr
+
+from . import models
+from .api import sources
+from .types import UNSET, File, Unset
+
+DEFAULT_CONCURRENCY = 4
+CHECKPOINT_FILE_NAME = ".customgpt-ingest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+IngestCallback = Callable[[str, str], None]
+
+
+@attr.s(auto_attribs=True)
+class IngestResult:
+    """The outcome of ingest_directory, each list holding paths relative to the ingested directory
+
+    Attributes:
+        uploaded: The files uploaded by this run.
+        skipped: The files left alone because the project or the checkpoint already had their content.
+        failed: The files that could not be uploaded, with the reason.
+    """
+
+    uploaded: List[str] = attr.ib(factory=list)
+    skipped: List[str] = attr.ib(factory=list)
+    failed: Dict[str, str] = attr.ib(factory=dict)
+
+
+def file_hash(path: Union[str, "os.PathLike[str]"]) -> str:
+    """Return the MD5 hex digest of a file's content, the form of a source page's ``page_url_hash``"""
+    digest = hashlib.md5()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def ingested_hashes(project_id: int, *, client: Any) -> Set[str]:
+    """Return the ``page_url_hash`` of every uploaded file of a project
+
+    Raises:
+        RuntimeError: If the project's sources could not be listed.
+    """
+    response = sources.list_sources.sync_detailed(project_id, client=client, parse=True)
+    if response.status_code != HTTPStatus.OK:
+        raise RuntimeError(f"list_sources returned {int(response.status_code)}")
+    uploads = getattr(response.parsed.data, "uploads", UNSET)
+    pages = getattr(uploads, "pages", None) or []
+    return {page.page_url_hash for page in pages if isinstance(page.page_url_hash, str)}
+
+
+def _walk(directory: str, pattern: str, recursive: bool, exclude: Set[str]) -> Iterator[str]:
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if name == CHECKPOINT_FILE_NAME or not fnmatch.fnmatch(name, pattern):
+                continue
+            if os.path.realpath(path) not in exclude:
+                yield os.path.relpath(path, directory)
+        if not recursive:
+            break
+
+
+class Checkpoint:
+    """The file recording which files of a directory have been ingested, so an interrupted run can resume
+
+    The first line is a JSON document holding the project and every file recorded when it was last compacted, each
+    line after it a JSON document recording one more file. Recording a file appends its line rather than rewriting the
+    whole file, and ``compact()`` folds the lines back into the first one once a run is over. A line cut short by an
+    interruption is ignored: its file is only uploaded again.
+
+    Raises:
+        ValueError: If the file is the checkpoint of another project.
+    """
+
+    def __init__(self, path: str, project_id: int) -> None:
+        self.path = path
+        self.project_id = project_id
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self._load()
+        self.compact()
+
+    def _load(self) -> None:
+        with open(self.path) as file:
+            lines = file.read().splitlines()
+        if not lines:
+            return
+        try:
+            state = json.loads(lines[0])
+        except ValueError:
+            return
+        if state.get("project_id") != self.project_id:
+            raise ValueError(
+                f"{self.path} is the checkpoint of project {state.get('project_id')}, not {self.project_id}; pass "
+                "another checkpoint_path"
+            )
+        self.files = state.get("files", {})
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self.files[entry.pop("name")] = entry
+
+    def is_done(self, name: str, stat: os.stat_result) -> bool:
+        entry = self.files.get(name)
+        return entry is not None and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime
+
+    def hashes(self) -> Set[str]:
+        return {entry["hash"] for entry in self.files.values()}
+
+    def record(self, name: str, stat: os.stat_result, content_hash: str, source_id: Any = None) -> None:
+        entry = {"hash": content_hash, "size": stat.st_size, "mtime": stat.st_mtime, "source_id": source_id}
+        line = json.dumps({"name": name, **entry})
+        with self._lock:
+            self.files[name] = entry
+            with open(self.path, "a") as file:
+                file.write(line + "\n")
+
+    def compact(self) -> None:
+        """Rewrite the file as a single JSON document holding every file recorded"""
+        with self._lock:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump({"project_id": self.project_id, "files": self.files}, file)
+                file.write("\n")
+            os.replace(temp_path, self.path)
+
+
+def ingest_directory(
+    project_id: int,
+    directory: Union[str, "os.PathLike[str]"],
+    *,
+    client: Any,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    pattern: str = "*",
+    recursive: bool = True,
+    checkpoint_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    file_data_retension: Union[Unset, bool] = UNSET,
+    on_file: Optional[IngestCallback] = None,
+) -> IngestResult:
+    """Upload every file of a directory to a project as file sources
+
+    Files whose MD5 already appears as a ``page_url_hash`` in the project's uploads, or that the checkpoint file
+    records as ingested, are skipped. Every file done is appended to the checkpoint as it finishes, so running the same
+    call again after an interruption only uploads what is left. Up to ``concurrency`` files are uploaded at once, all
+    paced by the client's rate limiter.
+
+    Args:
+        project_id: The project to add the files to.
+        directory: The directory to walk.
+        client: The client to send the requests with.
+        concurrency: The maximum number of uploads in flight.
+        pattern: Only files whose name matches this glob pattern are uploaded.
+        recursive: Whether to descend into subdirectories.
+        checkpoint_path: Where to keep the checkpoint, ``.customgpt-ingest.json`` inside the directory by default.
+        file_data_retension: Passed on to every create_source call.
+        on_file: Called with ``(relative_path, outcome)`` as each file finishes, outcome being ``uploaded``,
+            ``skipped`` or ``failed``.
+
+    Raises:
+        RuntimeError: If the project's sources could not be listed.
+        ValueError: If the checkpoint file belongs to another project.
+    """
+    directory = os.fspath(directory)
+    checkpoint = Checkpoint(
+        os.fspath(checkpoint_path) if checkpoint_path else os.path.join(directory, CHECKPOINT_FILE_NAME), project_id
+    )
+    # A checkpoint kept inside the directory under another name must not be uploaded with the documents
+    exclude = {os.path.realpath(checkpoint.path), os.path.realpath(f"{checkpoint.path}.tmp")}
+    known = ingested_hashes(project_id, client=client) | checkpoint.hashes()
+    known_lock = threading.Lock()
+    result = IngestResult()
+
+    def ingest(name: str) -> str:
+        path = os.path.join(directory, name)
+        stat = os.stat(path)
+        if checkpoint.is_done(name, stat):
+            return "skipped"
+        content_hash = file_hash(path)
+        with known_lock:
+            if content_hash in known:
+                checkpoint.record(name, stat, content_hash)
+                return "skipped"
+            # Claimed up front so a duplicate file elsewhere in the directory is not uploaded twice
+            known.add(content_hash)
+
+        try:
+            with File.from_path(path) as file:
+                multipart_data = models.CreateSourceMultipartData(file=file, file_data_retension=file_data_retension)
+                response = sources.create_source.sync_detailed(
+                    project_id, client=client, multipart_data=multipart_data, parse=True
+                )
+            if response.status_code != HTTPStatus.CREATED:
+                raise RuntimeError(f"create_source returned {int(response.status_code)}")
+        except Exception:
+            with known_lock:
+                known.discard(content_hash)
+            raise
+
+        checkpoint.record(name, stat, content_hash, getattr(response.parsed.data, "id", None))
+        return "uploaded"
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            futures = {executor.submit(ingest, name): name for name in _walk(directory, pattern, recursive, exclude)}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as error:
+                    outcome = "failed"
+                    result.failed[name] = str(error)
+                else:
+                    getattr(result, outcome).append(name)
+                if on_file is not None:
+                    on_file(name, outcome)
+    finally:
+        checkpoint.compact()
+
+    result.uploaded.sort()
+    result.skipped.sort()
+    return result
+
+
+__all__ = [
+    "IngestResult",
+    "Checkpoint",
+    "ingest_directory",
+    "ingested_hashes",
+    "file_hash",
+    "DEFAULT_CONCURRENCY",
+    "CHECKPOINT_FILE_NAME",
+]
@@ -0,0 +1,300 @@
+""" Contains the request instrumentation: the events passed to a client's hooks and an in-memory metrics collector """
+import bisect
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import attr
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# The method and path of every endpoint, by endpoint name
+ENDPOINTS: Dict[str, Tuple[str, Pattern[str]]] = {
+    "get_citation": ("get", re.compile(r"/api/v1/projects/[^/]+/citations/[^/]+")),
+    "create_conversation": ("post", re.compile(r"/api/v1/projects/[^/]+/conversations")),
+    "delete_conversation": ("delete", re.compile(r"/api/v1/projects/[^/]+/conversations/[^/]+")),
+    "get_conversations": ("get", re.compile(r"/api/v1/projects/[^/]+/conversations")),
+    "messages_conversation": ("get", re.compile(r"/api/v1/projects/[^/]+/conversations/[^/]+/messages")),
+    "send_message": ("post", re.compile(r"/api/v1/projects/[^/]+/conversations/[^/]+/messages")),
+    "update_conversation": ("put", re.compile(r"/api/v1/projects/[^/]+/conversations/[^/]+")),
+    "get_page_metadata": ("get", re.compile(r"/api/v1/projects/[^/]+/pages/[^/]+/metadata")),
+    "update_page_metadata": ("put", re.compile(r"/api/v1/projects/[^/]+/pages/[^/]+/metadata")),
+    "delete_page": ("delete", re.compile(r"/api/v1/projects/[^/]+/pages/[^/]+")),
+    "get_pages": ("get", re.compile(r"/api/v1/projects/[^/]+/pages")),
+    "preview_citation": ("get", re.compile(r"/api/v1/preview/[^/]+")),
+    "reindex_page": ("post", re.compile(r"/api/v1/projects/[^/]+/pages/[^/]+/reindex")),
+    "create_plugin": ("post", re.compile(r"/api/v1/projects/[^/]+/plugins")),
+    "get_plugin": ("get", re.compile(r"/api/v1/projects/[^/]+/plugins")),
+    "update_plugin": ("put", re.compile(r"/api/v1/projects/[^/]+/plugins")),
+    "get_settings": ("get", re.compile(r"/api/v1/projects/[^/]+/settings")),
+    "update_settings": ("post", re.compile(r"/api/v1/projects/[^/]+/settings")),
+    "create_project": ("post", re.compile(r"/api/v1/projects")),
+    "delete_project": ("delete", re.compile(r"/api/v1/projects/[^/]+")),
+    "get_project": ("get", re.compile(r"/api/v1/projects/[^/]+")),
+    "list_projects": ("get", re.compile(r"/api/v1/projects")),
+    "stats_project": ("get", re.compile(r"/api/v1/projects/[^/]+/stats")),
+    "update_project": ("post", re.compile(r"/api/v1/projects/[^/]+")),
+    "create_source": ("post", re.compile(r"/api/v1/projects/[^/]+/sources")),
+    "delete_source": ("delete", re.compile(r"/api/v1/projects/[^/]+/sources/[^/]+")),
+    "list_sources": ("get", re.compile(r"/api/v1/projects/[^/]+/sources")),
+    "get_user": ("get", re.compile(r"/api/v1/user")),
+    "update_user": ("post", re.compile(r"/api/v1/user")),
+}
+
+# The event of the request being sent by each thread, for the connection timings
+_current = threading.local()
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def endpoint_name(method: str, url: str) -> Optional[str]:
+    """Get the name of the endpoint a request goes to, None if it isn't one of the API's"""
+    method, path = method.lower(), urlsplit(url).path
+    for name, (endpoint_method, pattern) in ENDPOINTS.items():
+        if endpoint_method == method and pattern.fullmatch(path):
+            return name
+    return None
+
+
+@attr.s(auto_attribs=True, eq=False)
+class RequestEvent:
+    """What is known of a request sent through a client, passed to its on_request, on_response and on_error hooks
+
+    The event is filled in as the request goes: on_request sees the endpoint, method and URL only. Durations are in
+    seconds; the connection timings are None when a pooled connection was reused, and ``connect`` includes resolving
+    the host name as neither transport times it apart. When a 429 was retried, the timings and sizes are those of the
+    last attempt while ``total`` covers them all.
+
+    Attributes:
+        endpoint: The endpoint name, e.g. ``send_message``, None for a URL outside the API.
+        method: The HTTP method.
+        url: The request URL, without its query string.
+        status_code: The response status.
+        request_bytes: The size of the request body.
+        response_bytes: The size of the response body, from Content-Length for a streamed response (None if unknown).
+        connect: The time spent opening a new connection.
+        tls: The time spent on the TLS handshake of a new connection.
+        ttfb: The time from sending the request to receiving the response headers.
+        total: The time from the call to the response being read (to its headers for a streamed response), parsing
+            excluded.
+        parse_time: The time spent decoding the response into models, None if it wasn't parsed.
+        retries: How many times the request was retried after a 429.
+        cached: Whether the response came from the client's cache instead of the API.
+        error: The exception the request failed with, for on_error.
+    """
+
+    endpoint: Optional[str]
+    method: str
+    url: str
+    status_code: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: Optional[int] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None
+    total: Optional[float] = None
+    parse_time: Optional[float] = None
+    retries: int = 0
+    cached: bool = False
+    error: Optional[BaseException] = None
+    started: float = attr.ib(factory=time.perf_counter, repr=False)
+
+    def record_response(self, response: Any, streamed: bool) -> None:
+        """Fill in the status, sizes and TTFB of the response of the last attempt"""
+        self.status_code = int(response.status_code)
+        request = getattr(response, "request", None)
+        length = request.headers.get("Content-Length") if request is not None else None
+        self.request_bytes = int(length) if length else 0
+        if self.ttfb is None:
+            try:
+                # requests measures up to the response headers
+                self.ttfb = response.elapsed.total_seconds()
+            except (AttributeError, RuntimeError):
+                pass
+        if streamed:
+            length = response.headers.get("Content-Length")
+            self.response_bytes = int(length) if length else None
+        else:
+            self.response_bytes = len(response.content)
+
+    def timed(self, send: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Send an attempt of the request with ``requests``, recording the timings of the connection it opens"""
+        self.connect = self.tls = self.ttfb = None
+        _current.event = self
+        try:
+            return send(*args, **kwargs)
+        finally:
+            _current.event = None
+
+    def async_trace(self) -> Callable[[str, Dict[str, Any]], Any]:
+        """Get an httpx ``trace`` extension recording the connection timings and TTFB of an attempt"""
+        self.connect = self.tls = self.ttfb = None
+        marks: Dict[str, float] = {}
+        attempt_started = time.perf_counter()
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            now = time.perf_counter()
+            if name.endswith(".started"):
+                marks[name[: -len(".started")]] = now
+            elif name == "connection.connect_tcp.complete":
+                self.connect = now - marks.get("connection.connect_tcp", now)
+            elif name == "connection.start_tls.complete":
+                self.tls = now - marks.get("connection.start_tls", now)
+            elif name.endswith(".receive_response_headers.complete"):
+                self.ttfb = now - attempt_started
+
+        return trace
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self) -> Any:
+        started = time.perf_counter()
+        connection = super()._new_conn()  # type: ignore[misc]
+        event = getattr(_current, "event", None)
+        if event is not None:
+            event.connect = time.perf_counter() - started
+        return connection
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()  # type: ignore[misc]
+        event = getattr(_current, "event", None)
+        if event is not None and isinstance(self, HTTPSConnection):
+            # connect opens the socket with _new_conn, then wraps it in TLS
+            event.tls = time.perf_counter() - started - (event.connect or 0.0)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+def time_connections(adapter: Any) -> None:
+    """Have the connections opened by a ``requests`` HTTPAdapter record their timings in the current event"""
+    adapter.poolmanager.pool_classes_by_scheme = {
+        "http": _TimedHTTPConnectionPool,
+        "https": _TimedHTTPSConnectionPool,
+    }
+
+
+@attr.s(auto_attribs=True)
+class EndpointMetrics:
+    """The requests made to one endpoint, as kept by a MetricsCollector
+
+    Attributes:
+        requests: The number of requests that got a response.
+        errors: The number of requests that failed with an exception.
+        retries: The number of 429 retries.
+        cached: The number of responses answered from a cache.
+        total_seconds: The sum of the ``total`` durations.
+        parse_seconds: The sum of the parse times.
+        request_bytes: The sum of the request body sizes.
+        response_bytes: The sum of the known response body sizes.
+        buckets: The upper bounds of the latency histogram, in seconds.
+        counts: The number of requests in each bucket, the last one counting those above every bound.
+    """
+
+    buckets: Sequence[float]
+    counts: List[int]
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    cached: int = 0
+    total_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total_seconds / self.requests if self.requests else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a latency quantile (0.5 for the median) as the upper bound of the bucket it falls in"""
+        if not self.requests:
+            return None
+        rank = q * self.requests
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class MetricsCollector:
+    """Keeps per-endpoint latency histograms and totals of the requests of the clients it is hooked into
+
+    Pass its ``on_response`` and ``on_error`` as a client's hooks; it is safe to share between threads and clients::
+
+        metrics = MetricsCollector()
+        client = CustomGPT(api_key="...", on_response=metrics.on_response, on_error=metrics.on_error)
+
+    Args:
+        buckets: The increasing upper bounds of the histogram buckets, in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+
+    def _metrics(self, event: RequestEvent) -> EndpointMetrics:
+        name = event.endpoint or f"{event.method.upper()} {event.url}"
+        metrics = self._endpoints.get(name)
+        if metrics is None:
+            metrics = self._endpoints[name] = EndpointMetrics(self.buckets, [0] * (len(self.buckets) + 1))
+        return metrics
+
+    def on_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics(event)
+            metrics.requests += 1
+            metrics.retries += event.retries
+            metrics.cached += event.cached
+            total = event.total or 0.0
+            metrics.total_seconds += total
+            metrics.parse_seconds += event.parse_time or 0.0
+            metrics.request_bytes += event.request_bytes
+            metrics.response_bytes += event.response_bytes or 0
+            metrics.counts[bisect.bisect_left(self.buckets, total)] += 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics(event)
+            metrics.errors += 1
+            metrics.retries += event.retries
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """Get a copy of the metrics kept so far, by endpoint name"""
+        with self._lock:
+            return {
+                name: attr.evolve(metrics, counts=list(metrics.counts)) for name, metrics in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+__all__ = [
+    "RequestEvent",
+    "MetricsCollector",
+    "EndpointMetrics",
+    "endpoint_name",
+    "ENDPOINTS",
+    "DEFAULT_BUCKETS",
+]
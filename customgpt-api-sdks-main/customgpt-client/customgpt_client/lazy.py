@@ -0,0 +1,44 @@
+""" Contains the module level __getattr__ hooks that import models and endpoint modules on first access """
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(package: str, modules: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the ``__getattr__`` / ``__dir__`` of a package exporting names from submodules it doesn't import
+
+    Args:
+        package: The ``__name__`` of the package.
+        modules: The relative name of the submodule defining each exported name, e.g. ``{"User": ".user"}``.
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Cached on the package so later lookups don't come back here
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *modules})
+
+    return __getattr__, __dir__
+
+
+def lazy_submodules(package: str) -> Callable[[str], Any]:
+    """Build the ``__getattr__`` of a package whose submodules are imported when first accessed as attributes"""
+
+    def __getattr__(name: str) -> Any:
+        try:
+            return importlib.import_module(f"{package}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{package}.{name}":
+                raise
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+    return __getattr__
+
+
+__all__ = ["lazy_attributes", "lazy_submodules"]
@@ -1,622 +1,1239 @@
-""" Contains all the data models used in inputs/outputs """
+""" Contains all the data models used in inputs/outputs
 
-from .conversation import Conversation
-from .create_conversation_json_body import CreateConversationJsonBody
-from .create_conversation_response_201 import CreateConversationResponse201
-from .create_conversation_response_201_data import CreateConversationResponse201Data
-from .create_conversation_response_201_status import CreateConversationResponse201Status
-from .create_conversation_response_400 import CreateConversationResponse400
-from .create_conversation_response_400_data import CreateConversationResponse400Data
-from .create_conversation_response_400_data_code import CreateConversationResponse400DataCode
-from .create_conversation_response_400_status import CreateConversationResponse400Status
-from .create_conversation_response_401 import CreateConversationResponse401
-from .create_conversation_response_401_data import CreateConversationResponse401Data
-from .create_conversation_response_401_data_code import CreateConversationResponse401DataCode
-from .create_conversation_response_401_status import CreateConversationResponse401Status
-from .create_conversation_response_404 import CreateConversationResponse404
-from .create_conversation_response_404_data import CreateConversationResponse404Data
-from .create_conversation_response_404_data_code import CreateConversationResponse404DataCode
-from .create_conversation_response_404_data_message import CreateConversationResponse404DataMessage
-from .create_conversation_response_404_status import CreateConversationResponse404Status
-from .create_conversation_response_500 import CreateConversationResponse500
-from .create_conversation_response_500_data import CreateConversationResponse500Data
-from .create_conversation_response_500_data_code import CreateConversationResponse500DataCode
-from .create_conversation_response_500_status import CreateConversationResponse500Status
-from .create_plugin_json_body import CreatePluginJsonBody
-from .create_plugin_response_201 import CreatePluginResponse201
-from .create_plugin_response_201_data import CreatePluginResponse201Data
-from .create_plugin_response_201_status import CreatePluginResponse201Status
-from .create_plugin_response_400 import CreatePluginResponse400
-from .create_plugin_response_400_data import CreatePluginResponse400Data
-from .create_plugin_response_400_data_code import CreatePluginResponse400DataCode
-from .create_plugin_response_400_status import CreatePluginResponse400Status
-from .create_plugin_response_401 import CreatePluginResponse401
-from .create_plugin_response_401_data import CreatePluginResponse401Data
-from .create_plugin_response_401_data_code import CreatePluginResponse401DataCode
-from .create_plugin_response_401_status import CreatePluginResponse401Status
-from .create_plugin_response_404 import CreatePluginResponse404
-from .create_plugin_response_404_data import CreatePluginResponse404Data
-from .create_plugin_response_404_data_code import CreatePluginResponse404DataCode
-from .create_plugin_response_404_data_message import CreatePluginResponse404DataMessage
-from .create_plugin_response_404_status import CreatePluginResponse404Status
-from .create_plugin_response_500 import CreatePluginResponse500
-from .create_plugin_response_500_data import CreatePluginResponse500Data
-from .create_plugin_response_500_data_code import CreatePluginResponse500DataCode
-from .create_plugin_response_500_status import CreatePluginResponse500Status
-from .create_project_multipart_data import CreateProjectMultipartData
-from .create_project_response_201 import CreateProjectResponse201
-from .create_project_response_201_data import CreateProjectResponse201Data
-from .create_project_response_201_data_type import CreateProjectResponse201DataType
-from .create_project_response_201_status import CreateProjectResponse201Status
-from .create_project_response_400 import CreateProjectResponse400
-from .create_project_response_400_data import CreateProjectResponse400Data
-from .create_project_response_400_data_code import CreateProjectResponse400DataCode
-from .create_project_response_400_data_message import CreateProjectResponse400DataMessage
-from .create_project_response_400_status import CreateProjectResponse400Status
-from .create_project_response_401 import CreateProjectResponse401
-from .create_project_response_401_data import CreateProjectResponse401Data
-from .create_project_response_401_data_code import CreateProjectResponse401DataCode
-from .create_project_response_401_status import CreateProjectResponse401Status
-from .create_project_response_500 import CreateProjectResponse500
-from .create_project_response_500_data import CreateProjectResponse500Data
-from .create_project_response_500_data_code import CreateProjectResponse500DataCode
-from .create_project_response_500_status import CreateProjectResponse500Status
-from .create_source_multipart_data import CreateSourceMultipartData
-from .create_source_response_201 import CreateSourceResponse201
-from .create_source_response_201_data import CreateSourceResponse201Data
-from .create_source_response_201_data_pages_item import CreateSourceResponse201DataPagesItem
-from .create_source_response_201_data_pages_item_crawl_status import CreateSourceResponse201DataPagesItemCrawlStatus
-from .create_source_response_201_data_pages_item_index_status import CreateSourceResponse201DataPagesItemIndexStatus
-from .create_source_response_201_data_settings import CreateSourceResponse201DataSettings
-from .create_source_response_201_data_type import CreateSourceResponse201DataType
-from .create_source_response_201_status import CreateSourceResponse201Status
-from .create_source_response_400 import CreateSourceResponse400
-from .create_source_response_400_data import CreateSourceResponse400Data
-from .create_source_response_400_data_code import CreateSourceResponse400DataCode
-from .create_source_response_400_data_message import CreateSourceResponse400DataMessage
-from .create_source_response_400_status import CreateSourceResponse400Status
-from .create_source_response_401 import CreateSourceResponse401
-from .create_source_response_401_data import CreateSourceResponse401Data
-from .create_source_response_401_data_code import CreateSourceResponse401DataCode
-from .create_source_response_401_status import CreateSourceResponse401Status
-from .create_source_response_404 import CreateSourceResponse404
-from .create_source_response_404_data import CreateSourceResponse404Data
-from .create_source_response_404_data_code import CreateSourceResponse404DataCode
-from .create_source_response_404_data_message import CreateSourceResponse404DataMessage
-from .create_source_response_404_status import CreateSourceResponse404Status
-from .create_source_response_500 import CreateSourceResponse500
-from .create_source_response_500_data import CreateSourceResponse500Data
-from .create_source_response_500_data_code import CreateSourceResponse500DataCode
-from .create_source_response_500_status import CreateSourceResponse500Status
-from .delete_conversation_response_200 import DeleteConversationResponse200
-from .delete_conversation_response_200_data import DeleteConversationResponse200Data
-from .delete_conversation_response_200_status import DeleteConversationResponse200Status
-from .delete_conversation_response_400 import DeleteConversationResponse400
-from .delete_conversation_response_400_data import DeleteConversationResponse400Data
-from .delete_conversation_response_400_data_code import DeleteConversationResponse400DataCode
-from .delete_conversation_response_400_status import DeleteConversationResponse400Status
-from .delete_conversation_response_401 import DeleteConversationResponse401
-from .delete_conversation_response_401_data import DeleteConversationResponse401Data
-from .delete_conversation_response_401_data_code import DeleteConversationResponse401DataCode
-from .delete_conversation_response_401_status import DeleteConversationResponse401Status
-from .delete_conversation_response_404 import DeleteConversationResponse404
-from .delete_conversation_response_404_data import DeleteConversationResponse404Data
-from .delete_conversation_response_404_data_code import DeleteConversationResponse404DataCode
-from .delete_conversation_response_404_data_message import DeleteConversationResponse404DataMessage
-from .delete_conversation_response_404_status import DeleteConversationResponse404Status
-from .delete_conversation_response_500 import DeleteConversationResponse500
-from .delete_conversation_response_500_data import DeleteConversationResponse500Data
-from .delete_conversation_response_500_data_code import DeleteConversationResponse500DataCode
-from .delete_conversation_response_500_status import DeleteConversationResponse500Status
-from .delete_page_response_200 import DeletePageResponse200
-from .delete_page_response_200_data import DeletePageResponse200Data
-from .delete_page_response_200_status import DeletePageResponse200Status
-from .delete_page_response_400 import DeletePageResponse400
-from .delete_page_response_400_data import DeletePageResponse400Data
-from .delete_page_response_400_data_code import DeletePageResponse400DataCode
-from .delete_page_response_400_status import DeletePageResponse400Status
-from .delete_page_response_401 import DeletePageResponse401
-from .delete_page_response_401_data import DeletePageResponse401Data
-from .delete_page_response_401_data_code import DeletePageResponse401DataCode
-from .delete_page_response_401_status import DeletePageResponse401Status
-from .delete_page_response_404 import DeletePageResponse404
-from .delete_page_response_404_data import DeletePageResponse404Data
-from .delete_page_response_404_data_code import DeletePageResponse404DataCode
-from .delete_page_response_404_data_message import DeletePageResponse404DataMessage
-from .delete_page_response_404_status import DeletePageResponse404Status
-from .delete_page_response_500 import DeletePageResponse500
-from .delete_page_response_500_data import DeletePageResponse500Data
-from .delete_page_response_500_data_code import DeletePageResponse500DataCode
-from .delete_page_response_500_status import DeletePageResponse500Status
-from .delete_project_response_200 import DeleteProjectResponse200
-from .delete_project_response_200_data import DeleteProjectResponse200Data
-from .delete_project_response_200_status import DeleteProjectResponse200Status
-from .delete_project_response_400 import DeleteProjectResponse400
-from .delete_project_response_400_data import DeleteProjectResponse400Data
-from .delete_project_response_400_data_code import DeleteProjectResponse400DataCode
-from .delete_project_response_400_status import DeleteProjectResponse400Status
-from .delete_project_response_401 import DeleteProjectResponse401
-from .delete_project_response_401_data import DeleteProjectResponse401Data
-from .delete_project_response_401_data_code import DeleteProjectResponse401DataCode
-from .delete_project_response_401_status import DeleteProjectResponse401Status
-from .delete_project_response_404 import DeleteProjectResponse404
-from .delete_project_response_404_data import DeleteProjectResponse404Data
-from .delete_project_response_404_data_code import DeleteProjectResponse404DataCode
-from .delete_project_response_404_data_message import DeleteProjectResponse404DataMessage
-from .delete_project_response_404_status import DeleteProjectResponse404Status
-from .delete_project_response_500 import DeleteProjectResponse500
-from .delete_project_response_500_data import DeleteProjectResponse500Data
-from .delete_project_response_500_data_code import DeleteProjectResponse500DataCode
-from .delete_project_response_500_status import DeleteProjectResponse500Status
-from .delete_source_response_200 import DeleteSourceResponse200
-from .delete_source_response_200_data import DeleteSourceResponse200Data
-from .delete_source_response_200_status import DeleteSourceResponse200Status
-from .delete_source_response_400 import DeleteSourceResponse400
-from .delete_source_response_400_data import DeleteSourceResponse400Data
-from .delete_source_response_400_data_code import DeleteSourceResponse400DataCode
-from .delete_source_response_400_status import DeleteSourceResponse400Status
-from .delete_source_response_401 import DeleteSourceResponse401
-from .delete_source_response_401_data import DeleteSourceResponse401Data
-from .delete_source_response_401_data_code import DeleteSourceResponse401DataCode
-from .delete_source_response_401_status import DeleteSourceResponse401Status
-from .delete_source_response_404 import DeleteSourceResponse404
-from .delete_source_response_404_data import DeleteSourceResponse404Data
-from .delete_source_response_404_data_code import DeleteSourceResponse404DataCode
-from .delete_source_response_404_data_message import DeleteSourceResponse404DataMessage
-from .delete_source_response_404_status import DeleteSourceResponse404Status
-from .delete_source_response_500 import DeleteSourceResponse500
-from .delete_source_response_500_data import DeleteSourceResponse500Data
-from .delete_source_response_500_data_code import DeleteSourceResponse500DataCode
-from .delete_source_response_500_status import DeleteSourceResponse500Status
-from .get_citation_response_200 import GetCitationResponse200
-from .get_citation_response_200_data import GetCitationResponse200Data
-from .get_citation_response_200_status import GetCitationResponse200Status
-from .get_citation_response_400 import GetCitationResponse400
-from .get_citation_response_400_data import GetCitationResponse400Data
-from .get_citation_response_400_data_code import GetCitationResponse400DataCode
-from .get_citation_response_400_status import GetCitationResponse400Status
-from .get_citation_response_401 import GetCitationResponse401
-from .get_citation_response_401_data import GetCitationResponse401Data
-from .get_citation_response_401_data_code import GetCitationResponse401DataCode
-from .get_citation_response_401_status import GetCitationResponse401Status
-from .get_citation_response_404 import GetCitationResponse404
-from .get_citation_response_404_data import GetCitationResponse404Data
-from .get_citation_response_404_data_code import GetCitationResponse404DataCode
-from .get_citation_response_404_data_message import GetCitationResponse404DataMessage
-from .get_citation_response_404_status import GetCitationResponse404Status
-from .get_conversations_order import GetConversationsOrder
-from .get_conversations_response_200 import GetConversationsResponse200
-from .get_conversations_response_200_data import GetConversationsResponse200Data
-from .get_conversations_response_200_data_data_item import GetConversationsResponse200DataDataItem
-from .get_conversations_response_200_status import GetConversationsResponse200Status
-from .get_conversations_response_400 import GetConversationsResponse400
-from .get_conversations_response_400_data import GetConversationsResponse400Data
-from .get_conversations_response_400_data_code import GetConversationsResponse400DataCode
-from .get_conversations_response_400_status import GetConversationsResponse400Status
-from .get_conversations_response_401 import GetConversationsResponse401
-from .get_conversations_response_401_data import GetConversationsResponse401Data
-from .get_conversations_response_401_data_code import GetConversationsResponse401DataCode
-from .get_conversations_response_401_status import GetConversationsResponse401Status
-from .get_conversations_response_404 import GetConversationsResponse404
-from .get_conversations_response_404_data import GetConversationsResponse404Data
-from .get_conversations_response_404_data_code import GetConversationsResponse404DataCode
-from .get_conversations_response_404_data_message import GetConversationsResponse404DataMessage
-from .get_conversations_response_404_status import GetConversationsResponse404Status
-from .get_conversations_response_500 import GetConversationsResponse500
-from .get_conversations_response_500_data import GetConversationsResponse500Data
-from .get_conversations_response_500_data_code import GetConversationsResponse500DataCode
-from .get_conversations_response_500_status import GetConversationsResponse500Status
-from .get_conversations_user_filter import GetConversationsUserFilter
-from .get_page_metadata_response_200 import GetPageMetadataResponse200
-from .get_page_metadata_response_200_data import GetPageMetadataResponse200Data
-from .get_page_metadata_response_200_status import GetPageMetadataResponse200Status
-from .get_page_metadata_response_400 import GetPageMetadataResponse400
-from .get_page_metadata_response_400_data import GetPageMetadataResponse400Data
-from .get_page_metadata_response_400_data_code import GetPageMetadataResponse400DataCode
-from .get_page_metadata_response_400_status import GetPageMetadataResponse400Status
-from .get_page_metadata_response_401 import GetPageMetadataResponse401
-from .get_page_metadata_response_401_data import GetPageMetadataResponse401Data
-from .get_page_metadata_response_401_data_code import GetPageMetadataResponse401DataCode
-from .get_page_metadata_response_401_status import GetPageMetadataResponse401Status
-from .get_page_metadata_response_404 import GetPageMetadataResponse404
-from .get_page_metadata_response_404_data import GetPageMetadataResponse404Data
-from .get_page_metadata_response_404_data_code import GetPageMetadataResponse404DataCode
-from .get_page_metadata_response_404_data_message import GetPageMetadataResponse404DataMessage
-from .get_page_metadata_response_404_status import GetPageMetadataResponse404Status
-from .get_pages_order import GetPagesOrder
-from .get_pages_response_200 import GetPagesResponse200
-from .get_pages_response_200_data import GetPagesResponse200Data
-from .get_pages_response_200_data_pages import GetPagesResponse200DataPages
-from .get_pages_response_200_data_pages_data_item import GetPagesResponse200DataPagesDataItem
-from .get_pages_response_200_data_pages_data_item_crawl_status import GetPagesResponse200DataPagesDataItemCrawlStatus
-from .get_pages_response_200_data_pages_data_item_index_status import GetPagesResponse200DataPagesDataItemIndexStatus
-from .get_pages_response_200_data_project import GetPagesResponse200DataProject
-from .get_pages_response_200_data_project_type import GetPagesResponse200DataProjectType
-from .get_pages_response_200_status import GetPagesResponse200Status
-from .get_pages_response_400 import GetPagesResponse400
-from .get_pages_response_400_data import GetPagesResponse400Data
-from .get_pages_response_400_data_code import GetPagesResponse400DataCode
-from .get_pages_response_400_status import GetPagesResponse400Status
-from .get_pages_response_401 import GetPagesResponse401
-from .get_pages_response_401_data import GetPagesResponse401Data
-from .get_pages_response_401_data_code import GetPagesResponse401DataCode
-from .get_pages_response_401_status import GetPagesResponse401Status
-from .get_pages_response_404 import GetPagesResponse404
-from .get_pages_response_404_data import GetPagesResponse404Data
-from .get_pages_response_404_data_code import GetPagesResponse404DataCode
-from .get_pages_response_404_data_message import GetPagesResponse404DataMessage
-from .get_pages_response_404_status import GetPagesResponse404Status
-from .get_pages_response_500 import GetPagesResponse500
-from .get_pages_response_500_data import GetPagesResponse500Data
-from .get_pages_response_500_data_code import GetPagesResponse500DataCode
-from .get_pages_response_500_status import GetPagesResponse500Status
-from .get_plugin_response_200 import GetPluginResponse200
-from .get_plugin_response_200_data import GetPluginResponse200Data
-from .get_plugin_response_200_status import GetPluginResponse200Status
-from .get_plugin_response_400 import GetPluginResponse400
-from .get_plugin_response_400_data import GetPluginResponse400Data
-from .get_plugin_response_400_data_code import GetPluginResponse400DataCode
-from .get_plugin_response_400_status import GetPluginResponse400Status
-from .get_plugin_response_401 import GetPluginResponse401
-from .get_plugin_response_401_data import GetPluginResponse401Data
-from .get_plugin_response_401_data_code import GetPluginResponse401DataCode
-from .get_plugin_response_401_status import GetPluginResponse401Status
-from .get_plugin_response_404 import GetPluginResponse404
-from .get_plugin_response_404_data import GetPluginResponse404Data
-from .get_plugin_response_404_data_code import GetPluginResponse404DataCode
-from .get_plugin_response_404_data_message import GetPluginResponse404DataMessage
-from .get_plugin_response_404_status import GetPluginResponse404Status
-from .get_plugin_response_500 import GetPluginResponse500
-from .get_plugin_response_500_data import GetPluginResponse500Data
-from .get_plugin_response_500_data_code import GetPluginResponse500DataCode
-from .get_plugin_response_500_status import GetPluginResponse500Status
-from .get_project_response_200 import GetProjectResponse200
-from .get_project_response_200_data import GetProjectResponse200Data
-from .get_project_response_200_data_type import GetProjectResponse200DataType
-from .get_project_response_200_status import GetProjectResponse200Status
-from .get_project_response_400 import GetProjectResponse400
-from .get_project_response_400_data import GetProjectResponse400Data
-from .get_project_response_400_data_code import GetProjectResponse400DataCode
-from .get_project_response_400_status import GetProjectResponse400Status
-from .get_project_response_401 import GetProjectResponse401
-from .get_project_response_401_data import GetProjectResponse401Data
-from .get_project_response_401_data_code import GetProjectResponse401DataCode
-from .get_project_response_401_status import GetProjectResponse401Status
-from .get_project_response_404 import GetProjectResponse404
-from .get_project_response_404_data import GetProjectResponse404Data
-from .get_project_response_404_data_code import GetProjectResponse404DataCode
-from .get_project_response_404_data_message import GetProjectResponse404DataMessage
-from .get_project_response_404_status import GetProjectResponse404Status
-from .get_project_response_500 import GetProjectResponse500
-from .get_project_response_500_data import GetProjectResponse500Data
-from .get_project_response_500_data_code import GetProjectResponse500DataCode
-from .get_project_response_500_status import GetProjectResponse500Status
-from .get_settings_response_200 import GetSettingsResponse200
-from .get_settings_response_200_data import GetSettingsResponse200Data
-from .get_settings_response_200_data_citations_view_type import GetSettingsResponse200DataCitationsViewType
-from .get_settings_response_200_status import GetSettingsResponse200Status
-from .get_settings_response_400 import GetSettingsResponse400
-from .get_settings_response_400_data import GetSettingsResponse400Data
-from .get_settings_response_400_data_code import GetSettingsResponse400DataCode
-from .get_settings_response_400_status import GetSettingsResponse400Status
-from .get_settings_response_401 import GetSettingsResponse401
-from .get_settings_response_401_data import GetSettingsResponse401Data
-from .get_settings_response_401_data_code import GetSettingsResponse401DataCode
-from .get_settings_response_401_status import GetSettingsResponse401Status
-from .get_settings_response_404 import GetSettingsResponse404
-from .get_settings_response_404_data import GetSettingsResponse404Data
-from .get_settings_response_404_data_code import GetSettingsResponse404DataCode
-from .get_settings_response_404_data_message import GetSettingsResponse404DataMessage
-from .get_settings_response_404_status import GetSettingsResponse404Status
-from .get_settings_response_500 import GetSettingsResponse500
-from .get_settings_response_500_data import GetSettingsResponse500Data
-from .get_settings_response_500_data_code import GetSettingsResponse500DataCode
-from .get_settings_response_500_status import GetSettingsResponse500Status
-from .get_user_response_200 import GetUserResponse200
-from .get_user_response_200_data import GetUserResponse200Data
-from .get_user_response_200_status import GetUserResponse200Status
-from .get_user_response_401 import GetUserResponse401
-from .get_user_response_401_data import GetUserResponse401Data
-from .get_user_response_401_data_code import GetUserResponse401DataCode
-from .get_user_response_401_status import GetUserResponse401Status
-from .get_user_response_500 import GetUserResponse500
-from .get_user_response_500_data import GetUserResponse500Data
-from .get_user_response_500_data_code import GetUserResponse500DataCode
-from .get_user_response_500_status import GetUserResponse500Status
-from .list_projects_order import ListProjectsOrder
-from .list_projects_response_200 import ListProjectsResponse200
-from .list_projects_response_200_data import ListProjectsResponse200Data
-from .list_projects_response_200_data_data_item import ListProjectsResponse200DataDataItem
-from .list_projects_response_200_data_data_item_type import ListProjectsResponse200DataDataItemType
-from .list_projects_response_200_status import ListProjectsResponse200Status
-from .list_projects_response_401 import ListProjectsResponse401
-from .list_projects_response_401_data import ListProjectsResponse401Data
-from .list_projects_response_401_data_code import ListProjectsResponse401DataCode
-from .list_projects_response_401_status import ListProjectsResponse401Status
-from .list_projects_response_500 import ListProjectsResponse500
-from .list_projects_response_500_data import ListProjectsResponse500Data
-from .list_projects_response_500_data_code import ListProjectsResponse500DataCode
-from .list_projects_response_500_status import ListProjectsResponse500Status
-from .list_sources_response_200 import ListSourcesResponse200
-from .list_sources_response_200_data import ListSourcesResponse200Data
-from .list_sources_response_200_data_sitemaps_item import ListSourcesResponse200DataSitemapsItem
-from .list_sources_response_200_data_sitemaps_item_pages_item import ListSourcesResponse200DataSitemapsItemPagesItem
-from .list_sources_response_200_data_sitemaps_item_pages_item_crawl_status import (
-    ListSourcesResponse200DataSitemapsItemPagesItemCrawlStatus,
-)
-from .list_sources_response_200_data_sitemaps_item_pages_item_index_status import (
-    ListSourcesResponse200DataSitemapsItemPagesItemIndexStatus,
-)
-from .list_sources_response_200_data_sitemaps_item_settings import ListSourcesResponse200DataSitemapsItemSettings
-from .list_sources_response_200_data_sitemaps_item_type import ListSourcesResponse200DataSitemapsItemType
-from .list_sources_response_200_data_uploads import ListSourcesResponse200DataUploads
-from .list_sources_response_200_data_uploads_pages_item import ListSourcesResponse200DataUploadsPagesItem
-from .list_sources_response_200_data_uploads_pages_item_crawl_status import (
-    ListSourcesResponse200DataUploadsPagesItemCrawlStatus,
-)
-from .list_sources_response_200_data_uploads_pages_item_index_status import (
-    ListSourcesResponse200DataUploadsPagesItemIndexStatus,
-)
-from .list_sources_response_200_data_uploads_settings import ListSourcesResponse200DataUploadsSettings
-from .list_sources_response_200_data_uploads_type import ListSourcesResponse200DataUploadsType
-from .list_sources_response_200_status import ListSourcesResponse200Status
-from .list_sources_response_400 import ListSourcesResponse400
-from .list_sources_response_400_data import ListSourcesResponse400Data
-from .list_sources_response_400_data_code import ListSourcesResponse400DataCode
-from .list_sources_response_400_status import ListSourcesResponse400Status
-from .list_sources_response_401 import ListSourcesResponse401
-from .list_sources_response_401_data import ListSourcesResponse401Data
-from .list_sources_response_401_data_code import ListSourcesResponse401DataCode
-from .list_sources_response_401_status import ListSourcesResponse401Status
-from .list_sources_response_404 import ListSourcesResponse404
-from .list_sources_response_404_data import ListSourcesResponse404Data
-from .list_sources_response_404_data_code import ListSourcesResponse404DataCode
-from .list_sources_response_404_data_message import ListSourcesResponse404DataMessage
-from .list_sources_response_404_status import ListSourcesResponse404Status
-from .list_sources_response_500 import ListSourcesResponse500
-from .list_sources_response_500_data import ListSourcesResponse500Data
-from .list_sources_response_500_data_code import ListSourcesResponse500DataCode
-from .list_sources_response_500_status import ListSourcesResponse500Status
-from .messages_conversation_order import MessagesConversationOrder
-from .messages_conversation_response_200 import MessagesConversationResponse200
-from .messages_conversation_response_200_data import MessagesConversationResponse200Data
-from .messages_conversation_response_200_data_conversation import MessagesConversationResponse200DataConversation
-from .messages_conversation_response_200_data_messages import MessagesConversationResponse200DataMessages
-from .messages_conversation_response_200_data_messages_data_item import (
-    MessagesConversationResponse200DataMessagesDataItem,
-)
-from .messages_conversation_response_200_data_messages_data_item_metadata import (
-    MessagesConversationResponse200DataMessagesDataItemMetadata,
-)
-from .messages_conversation_response_200_status import MessagesConversationResponse200Status
-from .messages_conversation_response_400 import MessagesConversationResponse400
-from .messages_conversation_response_400_data import MessagesConversationResponse400Data
-from .messages_conversation_response_400_data_code import MessagesConversationResponse400DataCode
-from .messages_conversation_response_400_status import MessagesConversationResponse400Status
-from .messages_conversation_response_401 import MessagesConversationResponse401
-from .messages_conversation_response_401_data import MessagesConversationResponse401Data
-from .messages_conversation_response_401_data_code import MessagesConversationResponse401DataCode
-from .messages_conversation_response_401_status import MessagesConversationResponse401Status
-from .messages_conversation_response_404 import MessagesConversationResponse404
-from .messages_conversation_response_404_data import MessagesConversationResponse404Data
-from .messages_conversation_response_404_data_code import MessagesConversationResponse404DataCode
-from .messages_conversation_response_404_data_message import MessagesConversationResponse404DataMessage
-from .messages_conversation_response_404_status import MessagesConversationResponse404Status
-from .messages_conversation_response_500 import MessagesConversationResponse500
-from .messages_conversation_response_500_data import MessagesConversationResponse500Data
-from .messages_conversation_response_500_data_code import MessagesConversationResponse500DataCode
-from .messages_conversation_response_500_status import MessagesConversationResponse500Status
-from .open_graph_cache import OpenGraphCache
-from .page import Page
-from .page_crawl_status import PageCrawlStatus
-from .page_index_status import PageIndexStatus
-from .page_metadata import PageMetadata
-from .preview_citation_response_400 import PreviewCitationResponse400
-from .preview_citation_response_400_data import PreviewCitationResponse400Data
-from .preview_citation_response_400_data_code import PreviewCitationResponse400DataCode
-from .preview_citation_response_400_status import PreviewCitationResponse400Status
-from .preview_citation_response_401 import PreviewCitationResponse401
-from .preview_citation_response_401_data import PreviewCitationResponse401Data
-from .preview_citation_response_401_data_code import PreviewCitationResponse401DataCode
-from .preview_citation_response_401_status import PreviewCitationResponse401Status
-from .preview_citation_response_404 import PreviewCitationResponse404
-from .preview_citation_response_404_data import PreviewCitationResponse404Data
-from .preview_citation_response_404_data_code import PreviewCitationResponse404DataCode
-from .preview_citation_response_404_data_message import PreviewCitationResponse404DataMessage
-from .preview_citation_response_404_status import PreviewCitationResponse404Status
-from .preview_citation_response_500 import PreviewCitationResponse500
-from .preview_citation_response_500_data import PreviewCitationResponse500Data
-from .preview_citation_response_500_data_code import PreviewCitationResponse500DataCode
-from .preview_citation_response_500_status import PreviewCitationResponse500Status
-from .project import Project
-from .project_plugin import ProjectPlugin
-from .project_settings import ProjectSettings
-from .project_settings_citations_view_type import ProjectSettingsCitationsViewType
-from .project_settings_response_source import ProjectSettingsResponseSource
-from .project_source import ProjectSource
-from .project_source_settings import ProjectSourceSettings
-from .project_source_type import ProjectSourceType
-from .project_type import ProjectType
-from .prompt_history import PromptHistory
-from .prompt_history_metadata import PromptHistoryMetadata
-from .reindex_page_response_200 import ReindexPageResponse200
-from .reindex_page_response_200_data import ReindexPageResponse200Data
-from .reindex_page_response_200_status import ReindexPageResponse200Status
-from .reindex_page_response_400 import ReindexPageResponse400
-from .reindex_page_response_400_data import ReindexPageResponse400Data
-from .reindex_page_response_400_data_code import ReindexPageResponse400DataCode
-from .reindex_page_response_400_status import ReindexPageResponse400Status
-from .reindex_page_response_401 import ReindexPageResponse401
-from .reindex_page_response_401_data import ReindexPageResponse401Data
-from .reindex_page_response_401_data_code import ReindexPageResponse401DataCode
-from .reindex_page_response_401_status import ReindexPageResponse401Status
-from .reindex_page_response_403 import ReindexPageResponse403
-from .reindex_page_response_403_data import ReindexPageResponse403Data
-from .reindex_page_response_403_data_code import ReindexPageResponse403DataCode
-from .reindex_page_response_403_data_message import ReindexPageResponse403DataMessage
-from .reindex_page_response_403_status import ReindexPageResponse403Status
-from .reindex_page_response_500 import ReindexPageResponse500
-from .reindex_page_response_500_data import ReindexPageResponse500Data
-from .reindex_page_response_500_data_code import ReindexPageResponse500DataCode
-from .reindex_page_response_500_status import ReindexPageResponse500Status
-from .send_message_json_body import SendMessageJsonBody
-from .send_message_response_200 import SendMessageResponse200
-from .send_message_response_200_data import SendMessageResponse200Data
-from .send_message_response_200_data_metadata import SendMessageResponse200DataMetadata
-from .send_message_response_200_status import SendMessageResponse200Status
-from .send_message_response_400 import SendMessageResponse400
-from .send_message_response_400_data import SendMessageResponse400Data
-from .send_message_response_400_data_code import SendMessageResponse400DataCode
-from .send_message_response_400_status import SendMessageResponse400Status
-from .send_message_response_401 import SendMessageResponse401
-from .send_message_response_401_data import SendMessageResponse401Data
-from .send_message_response_401_data_code import SendMessageResponse401DataCode
-from .send_message_response_401_status import SendMessageResponse401Status
-from .send_message_response_404 import SendMessageResponse404
-from .send_message_response_404_data import SendMessageResponse404Data
-from .send_message_response_404_data_code import SendMessageResponse404DataCode
-from .send_message_response_404_data_message import SendMessageResponse404DataMessage
-from .send_message_response_404_status import SendMessageResponse404Status
-from .send_message_response_500 import SendMessageResponse500
-from .send_message_response_500_data import SendMessageResponse500Data
-from .send_message_response_500_data_code import SendMessageResponse500DataCode
-from .send_message_response_500_status import SendMessageResponse500Status
-from .stats_project_response_200 import StatsProjectResponse200
-from .stats_project_response_200_data import StatsProjectResponse200Data
-from .stats_project_response_200_status import StatsProjectResponse200Status
-from .stats_project_response_400 import StatsProjectResponse400
-from .stats_project_response_400_data import StatsProjectResponse400Data
-from .stats_project_response_400_data_code import StatsProjectResponse400DataCode
-from .stats_project_response_400_status import StatsProjectResponse400Status
-from .stats_project_response_401 import StatsProjectResponse401
-from .stats_project_response_401_data import StatsProjectResponse401Data
-from .stats_project_response_401_data_code import StatsProjectResponse401DataCode
-from .stats_project_response_401_status import StatsProjectResponse401Status
-from .stats_project_response_404 import StatsProjectResponse404
-from .stats_project_response_404_data import StatsProjectResponse404Data
-from .stats_project_response_404_data_code import StatsProjectResponse404DataCode
-from .stats_project_response_404_data_message import StatsProjectResponse404DataMessage
-from .stats_project_response_404_status import StatsProjectResponse404Status
-from .stats_project_response_500 import StatsProjectResponse500
-from .stats_project_response_500_data import StatsProjectResponse500Data
-from .stats_project_response_500_data_code import StatsProjectResponse500DataCode
-from .stats_project_response_500_status import StatsProjectResponse500Status
-from .update_conversation_json_body import UpdateConversationJsonBody
-from .update_conversation_response_200 import UpdateConversationResponse200
-from .update_conversation_response_200_data import UpdateConversationResponse200Data
-from .update_conversation_response_200_status import UpdateConversationResponse200Status
-from .update_conversation_response_400 import UpdateConversationResponse400
-from .update_conversation_response_400_data import UpdateConversationResponse400Data
-from .update_conversation_response_400_data_code import UpdateConversationResponse400DataCode
-from .update_conversation_response_400_status import UpdateConversationResponse400Status
-from .update_conversation_response_401 import UpdateConversationResponse401
-from .update_conversation_response_401_data import UpdateConversationResponse401Data
-from .update_conversation_response_401_data_code import UpdateConversationResponse401DataCode
-from .update_conversation_response_401_status import UpdateConversationResponse401Status
-from .update_conversation_response_404 import UpdateConversationResponse404
-from .update_conversation_response_404_data import UpdateConversationResponse404Data
-from .update_conversation_response_404_data_code import UpdateConversationResponse404DataCode
-from .update_conversation_response_404_data_message import UpdateConversationResponse404DataMessage
-from .update_conversation_response_404_status import UpdateConversationResponse404Status
-from .update_conversation_response_500 import UpdateConversationResponse500
-from .update_conversation_response_500_data import UpdateConversationResponse500Data
-from .update_conversation_response_500_data_code import UpdateConversationResponse500DataCode
-from .update_conversation_response_500_status import UpdateConversationResponse500Status
-from .update_page_metadata_json_body import UpdatePageMetadataJsonBody
-from .update_page_metadata_response_200 import UpdatePageMetadataResponse200
-from .update_page_metadata_response_200_data import UpdatePageMetadataResponse200Data
-from .update_page_metadata_response_200_status import UpdatePageMetadataResponse200Status
-from .update_page_metadata_response_400 import UpdatePageMetadataResponse400
-from .update_page_metadata_response_400_data import UpdatePageMetadataResponse400Data
-from .update_page_metadata_response_400_data_code import UpdatePageMetadataResponse400DataCode
-from .update_page_metadata_response_400_status import UpdatePageMetadataResponse400Status
-from .update_page_metadata_response_401 import UpdatePageMetadataResponse401
-from .update_page_metadata_response_401_data import UpdatePageMetadataResponse401Data
-from .update_page_metadata_response_401_data_code import UpdatePageMetadataResponse401DataCode
-from .update_page_metadata_response_401_status import UpdatePageMetadataResponse401Status
-from .update_page_metadata_response_404 import UpdatePageMetadataResponse404
-from .update_page_metadata_response_404_data import UpdatePageMetadataResponse404Data
-from .update_page_metadata_response_404_data_code import UpdatePageMetadataResponse404DataCode
-from .update_page_metadata_response_404_data_message import UpdatePageMetadataResponse404DataMessage
-from .update_page_metadata_response_404_status import UpdatePageMetadataResponse404Status
-from .update_page_metadata_response_500 import UpdatePageMetadataResponse500
-from .update_page_metadata_response_500_data import UpdatePageMetadataResponse500Data
-from .update_page_metadata_response_500_data_code import UpdatePageMetadataResponse500DataCode
-from .update_page_metadata_response_500_status import UpdatePageMetadataResponse500Status
-from .update_plugin_json_body import UpdatePluginJsonBody
-from .update_plugin_response_200 import UpdatePluginResponse200
-from .update_plugin_response_200_data import UpdatePluginResponse200Data
-from .update_plugin_response_200_status import UpdatePluginResponse200Status
-from .update_plugin_response_400 import UpdatePluginResponse400
-from .update_plugin_response_400_data import UpdatePluginResponse400Data
-from .update_plugin_response_400_data_code import UpdatePluginResponse400DataCode
-from .update_plugin_response_400_status import UpdatePluginResponse400Status
-from .update_plugin_response_401 import UpdatePluginResponse401
-from .update_plugin_response_401_data import UpdatePluginResponse401Data
-from .update_plugin_response_401_data_code import UpdatePluginResponse401DataCode
-from .update_plugin_response_401_status import UpdatePluginResponse401Status
-from .update_plugin_response_404 import UpdatePluginResponse404
-from .update_plugin_response_404_data import UpdatePluginResponse404Data
-from .update_plugin_response_404_data_code import UpdatePluginResponse404DataCode
-from .update_plugin_response_404_data_message import UpdatePluginResponse404DataMessage
-from .update_plugin_response_404_status import UpdatePluginResponse404Status
-from .update_plugin_response_500 import UpdatePluginResponse500
-from .update_plugin_response_500_data import UpdatePluginResponse500Data
-from .update_plugin_response_500_data_code import UpdatePluginResponse500DataCode
-from .update_plugin_response_500_status import UpdatePluginResponse500Status
-from .update_project_multipart_data import UpdateProjectMultipartData
-from .update_project_response_200 import UpdateProjectResponse200
-from .update_project_response_200_data import UpdateProjectResponse200Data
-from .update_project_response_200_data_type import UpdateProjectResponse200DataType
-from .update_project_response_200_status import UpdateProjectResponse200Status
-from .update_project_response_400 import UpdateProjectResponse400
-from .update_project_response_400_data import UpdateProjectResponse400Data
-from .update_project_response_400_data_code import UpdateProjectResponse400DataCode
-from .update_project_response_400_status import UpdateProjectResponse400Status
-from .update_project_response_401 import UpdateProjectResponse401
-from .update_project_response_401_data import UpdateProjectResponse401Data
-from .update_project_response_401_data_code import UpdateProjectResponse401DataCode
-from .update_project_response_401_status import UpdateProjectResponse401Status
-from .update_project_response_404 import UpdateProjectResponse404
-from .update_project_response_404_data import UpdateProjectResponse404Data
-from .update_project_response_404_data_code import UpdateProjectResponse404DataCode
-from .update_project_response_404_data_message import UpdateProjectResponse404DataMessage
-from .update_project_response_404_status import UpdateProjectResponse404Status
-from .update_project_response_500 import UpdateProjectResponse500
-from .update_project_response_500_data import UpdateProjectResponse500Data
-from .update_project_response_500_data_code import UpdateProjectResponse500DataCode
-from .update_project_response_500_status import UpdateProjectResponse500Status
-from .update_settings_multipart_data import UpdateSettingsMultipartData
-from .update_settings_multipart_data_citations_view_type import UpdateSettingsMultipartDataCitationsViewType
-from .update_settings_response_200 import UpdateSettingsResponse200
-from .update_settings_response_200_data import UpdateSettingsResponse200Data
-from .update_settings_response_200_status import UpdateSettingsResponse200Status
-from .update_settings_response_400 import UpdateSettingsResponse400
-from .update_settings_response_400_data import UpdateSettingsResponse400Data
-from .update_settings_response_400_data_code import UpdateSettingsResponse400DataCode
-from .update_settings_response_400_data_message import UpdateSettingsResponse400DataMessage
-from .update_settings_response_400_status import UpdateSettingsResponse400Status
-from .update_settings_response_401 import UpdateSettingsResponse401
-from .update_settings_response_401_data import UpdateSettingsResponse401Data
-from .update_settings_response_401_data_code import UpdateSettingsResponse401DataCode
-from .update_settings_response_401_status import UpdateSettingsResponse401Status
-from .update_settings_response_500 import UpdateSettingsResponse500
-from .update_settings_response_500_data import UpdateSettingsResponse500Data
-from .update_settings_response_500_data_code import UpdateSettingsResponse500DataCode
-from .update_settings_response_500_status import UpdateSettingsResponse500Status
-from .update_user_multipart_data import UpdateUserMultipartData
-from .update_user_response_200 import UpdateUserResponse200
-from .update_user_response_200_data import UpdateUserResponse200Data
-from .update_user_response_200_status import UpdateUserResponse200Status
-from .update_user_response_401 import UpdateUserResponse401
-from .update_user_response_401_data import UpdateUserResponse401Data
-from .update_user_response_401_data_code import UpdateUserResponse401DataCode
-from .update_user_response_401_status import UpdateUserResponse401Status
-from .update_user_response_500 import UpdateUserResponse500
-from .update_user_response_500_data import UpdateUserResponse500Data
-from .update_user_response_500_data_code import UpdateUserResponse500DataCode
-from .update_user_response_500_status import UpdateUserResponse500Status
-from .user import User
+The models are imported when first accessed, so importing the package doesn't load all of them.
+"""
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .conversation import Conversation
+    from .create_conversation_json_body import CreateConversationJsonBody
+    from .create_conversation_response_201 import CreateConversationResponse201
+    from .create_conversation_response_201_data import CreateConversationResponse201Data
+    from .create_conversation_response_201_status import CreateConversationResponse201Status
+    from .create_conversation_response_400 import CreateConversationResponse400
+    from .create_conversation_response_400_data import CreateConversationResponse400Data
+    from .create_conversation_response_400_data_code import CreateConversationResponse400DataCode
+    from .create_conversation_response_400_status import CreateConversationResponse400Status
+    from .create_conversation_response_401 import CreateConversationResponse401
+    from .create_conversation_response_401_data import CreateConversationResponse401Data
+    from .create_conversation_response_401_data_code import CreateConversationResponse401DataCode
+    from .create_conversation_response_401_status import CreateConversationResponse401Status
+    from .create_conversation_response_404 import CreateConversationResponse404
+    from .create_conversation_response_404_data import CreateConversationResponse404Data
+    from .create_conversation_response_404_data_code import CreateConversationResponse404DataCode
+    from .create_conversation_response_404_data_message import CreateConversationResponse404DataMessage
+    from .create_conversation_response_404_status import CreateConversationResponse404Status
+    from .create_conversation_response_500 import CreateConversationResponse500
+    from .create_conversation_response_500_data import CreateConversationResponse500Data
+    from .create_conversation_response_500_data_code import CreateConversationResponse500DataCode
+    from .create_conversation_response_500_status import CreateConversationResponse500Status
+    from .create_plugin_json_body import CreatePluginJsonBody
+    from .create_plugin_response_201 import CreatePluginResponse201
+    from .create_plugin_response_201_data import CreatePluginResponse201Data
+    from .create_plugin_response_201_status import CreatePluginResponse201Status
+    from .create_plugin_response_400 import CreatePluginResponse400
+    from .create_plugin_response_400_data import CreatePluginResponse400Data
+    from .create_plugin_response_400_data_code import CreatePluginResponse400DataCode
+    from .create_plugin_response_400_status import CreatePluginResponse400Status
+    from .create_plugin_response_401 import CreatePluginResponse401
+    from .create_plugin_response_401_data import CreatePluginResponse401Data
+    from .create_plugin_response_401_data_code import CreatePluginResponse401DataCode
+    from .create_plugin_response_401_status import CreatePluginResponse401Status
+    from .create_plugin_response_404 import CreatePluginResponse404
+    from .create_plugin_response_404_data import CreatePluginResponse404Data
+    from .create_plugin_response_404_data_code import CreatePluginResponse404DataCode
+    from .create_plugin_response_404_data_message import CreatePluginResponse404DataMessage
+    from .create_plugin_response_404_status import CreatePluginResponse404Status
+    from .create_plugin_response_500 import CreatePluginResponse500
+    from .create_plugin_response_500_data import CreatePluginResponse500Data
+    from .create_plugin_response_500_data_code import CreatePluginResponse500DataCode
+    from .create_plugin_response_500_status import CreatePluginResponse500Status
+    from .create_project_multipart_data import CreateProjectMultipartData
+    from .create_project_response_201 import CreateProjectResponse201
+    from .create_project_response_201_data import CreateProjectResponse201Data
+    from .create_project_response_201_data_type import CreateProjectResponse201DataType
+    from .create_project_response_201_status import CreateProjectResponse201Status
+    from .create_project_response_400 import CreateProjectResponse400
+    from .create_project_response_400_data import CreateProjectResponse400Data
+    from .create_project_response_400_data_code import CreateProjectResponse400DataCode
+    from .create_project_response_400_data_message import CreateProjectResponse400DataMessage
+    from .create_project_response_400_status import CreateProjectResponse400Status
+    from .create_project_response_401 import CreateProjectResponse401
+    from .create_project_response_401_data import CreateProjectResponse401Data
+    from .create_project_response_401_data_code import CreateProjectResponse401DataCode
+    from .create_project_response_401_status import CreateProjectResponse401Status
+    from .create_project_response_500 import CreateProjectResponse500
+    from .create_project_response_500_data import CreateProjectResponse500Data
+    from .create_project_response_500_data_code import CreateProjectResponse500DataCode
+    from .create_project_response_500_status import CreateProjectResponse500Status
+    from .create_source_multipart_data import CreateSourceMultipartData
+    from .create_source_response_201 import CreateSourceResponse201
+    from .create_source_response_201_data import CreateSourceResponse201Data
+    from .create_source_response_201_data_pages_item import CreateSourceResponse201DataPagesItem
+    from .create_source_response_201_data_pages_item_crawl_status import CreateSourceResponse201DataPagesItemCrawlStatus
+    from .create_source_response_201_data_pages_item_index_status import CreateSourceResponse201DataPagesItemIndexStatus
+    from .create_source_response_201_data_settings import CreateSourceResponse201DataSettings
+    from .create_source_response_201_data_type import CreateSourceResponse201DataType
+    from .create_source_response_201_status import CreateSourceResponse201Status
+    from .create_source_response_400 import CreateSourceResponse400
+    from .create_source_response_400_data import CreateSourceResponse400Data
+    from .create_source_response_400_data_code import CreateSourceResponse400DataCode
+    from .create_source_response_400_data_message import CreateSourceResponse400DataMessage
+    from .create_source_response_400_status import CreateSourceResponse400Status
+    from .create_source_response_401 import CreateSourceResponse401
+    from .create_source_response_401_data import CreateSourceResponse401Data
+    from .create_source_response_401_data_code import CreateSourceResponse401DataCode
+    from .create_source_response_401_status import CreateSourceResponse401Status
+    from .create_source_response_404 import CreateSourceResponse404
+    from .create_source_response_404_data import CreateSourceResponse404Data
+    from .create_source_response_404_data_code import CreateSourceResponse404DataCode
+    from .create_source_response_404_data_message import CreateSourceResponse404DataMessage
+    from .create_source_response_404_status import CreateSourceResponse404Status
+    from .create_source_response_500 import CreateSourceResponse500
+    from .create_source_response_500_data import CreateSourceResponse500Data
+    from .create_source_response_500_data_code import CreateSourceResponse500DataCode
+    from .create_source_response_500_status import CreateSourceResponse500Status
+    from .delete_conversation_response_200 import DeleteConversationResponse200
+    from .delete_conversation_response_200_data import DeleteConversationResponse200Data
+    from .delete_conversation_response_200_status import DeleteConversationResponse200Status
+    from .delete_conversation_response_400 import DeleteConversationResponse400
+    from .delete_conversation_response_400_data import DeleteConversationResponse400Data
+    from .delete_conversation_response_400_data_code import DeleteConversationResponse400DataCode
+    from .delete_conversation_response_400_status import DeleteConversationResponse400Status
+    from .delete_conversation_response_401 import DeleteConversationResponse401
+    from .delete_conversation_response_401_data import DeleteConversationResponse401Data
+    from .delete_conversation_response_401_data_code import DeleteConversationResponse401DataCode
+    from .delete_conversation_response_401_status import DeleteConversationResponse401Status
+    from .delete_conversation_response_404 import DeleteConversationResponse404
+    from .delete_conversation_response_404_data import DeleteConversationResponse404Data
+    from .delete_conversation_response_404_data_code import DeleteConversationResponse404DataCode
+    from .delete_conversation_response_404_data_message import DeleteConversationResponse404DataMessage
+    from .delete_conversation_response_404_status import DeleteConversationResponse404Status
+    from .delete_conversation_response_500 import DeleteConversationResponse500
+    from .delete_conversation_response_500_data import DeleteConversationResponse500Data
+    from .delete_conversation_response_500_data_code import DeleteConversationResponse500DataCode
+    from .delete_conversation_response_500_status import DeleteConversationResponse500Status
+    from .delete_page_response_200 import DeletePageResponse200
+    from .delete_page_response_200_data import DeletePageResponse200Data
+    from .delete_page_response_200_status import DeletePageResponse200Status
+    from .delete_page_response_400 import DeletePageResponse400
+    from .delete_page_response_400_data import DeletePageResponse400Data
+    from .delete_page_response_400_data_code import DeletePageResponse400DataCode
+    from .delete_page_response_400_status import DeletePageResponse400Status
+    from .delete_page_response_401 import DeletePageResponse401
+    from .delete_page_response_401_data import DeletePageResponse401Data
+    from .delete_page_response_401_data_code import DeletePageResponse401DataCode
+    from .delete_page_response_401_status import DeletePageResponse401Status
+    from .delete_page_response_404 import DeletePageResponse404
+    from .delete_page_response_404_data import DeletePageResponse404Data
+    from .delete_page_response_404_data_code import DeletePageResponse404DataCode
+    from .delete_page_response_404_data_message import DeletePageResponse404DataMessage
+    from .delete_page_response_404_status import DeletePageResponse404Status
+    from .delete_page_response_500 import DeletePageResponse500
+    from .delete_page_response_500_data import DeletePageResponse500Data
+    from .delete_page_response_500_data_code import DeletePageResponse500DataCode
+    from .delete_page_response_500_status import DeletePageResponse500Status
+    from .delete_project_response_200 import DeleteProjectResponse200
+    from .delete_project_response_200_data import DeleteProjectResponse200Data
+    from .delete_project_response_200_status import DeleteProjectResponse200Status
+    from .delete_project_response_400 import DeleteProjectResponse400
+    from .delete_project_response_400_data import DeleteProjectResponse400Data
+    from .delete_project_response_400_data_code import DeleteProjectResponse400DataCode
+    from .delete_project_response_400_status import DeleteProjectResponse400Status
+    from .delete_project_response_401 import DeleteProjectResponse401
+    from .delete_project_response_401_data import DeleteProjectResponse401Data
+    from .delete_project_response_401_data_code import DeleteProjectResponse401DataCode
+    from .delete_project_response_401_status import DeleteProjectResponse401Status
+    from .delete_project_response_404 import DeleteProjectResponse404
+    from .delete_project_response_404_data import DeleteProjectResponse404Data
+    from .delete_project_response_404_data_code import DeleteProjectResponse404DataCode
+    from .delete_project_response_404_data_message import DeleteProjectResponse404DataMessage
+    from .delete_project_response_404_status import DeleteProjectResponse404Status
+    from .delete_project_response_500 import DeleteProjectResponse500
+    from .delete_project_response_500_data import DeleteProjectResponse500Data
+    from .delete_project_response_500_data_code import DeleteProjectResponse500DataCode
+    from .delete_project_response_500_status import DeleteProjectResponse500Status
+    from .delete_source_response_200 import DeleteSourceResponse200
+    from .delete_source_response_200_data import DeleteSourceResponse200Data
+    from .delete_source_response_200_status import DeleteSourceResponse200Status
+    from .delete_source_response_400 import DeleteSourceResponse400
+    from .delete_source_response_400_data import DeleteSourceResponse400Data
+    from .delete_source_response_400_data_code import DeleteSourceResponse400DataCode
+    from .delete_source_response_400_status import DeleteSourceResponse400Status
+    from .delete_source_response_401 import DeleteSourceResponse401
+    from .delete_source_response_401_data import DeleteSourceResponse401Data
+    from .delete_source_response_401_data_code import DeleteSourceResponse401DataCode
+    from .delete_source_response_401_status import DeleteSourceResponse401Status
+    from .delete_source_response_404 import DeleteSourceResponse404
+    from .delete_source_response_404_data import DeleteSourceResponse404Data
+    from .delete_source_response_404_data_code import DeleteSourceResponse404DataCode
+    from .delete_source_response_404_data_message import DeleteSourceResponse404DataMessage
+    from .delete_source_response_404_status import DeleteSourceResponse404Status
+    from .delete_source_response_500 import DeleteSourceResponse500
+    from .delete_source_response_500_data import DeleteSourceResponse500Data
+    from .delete_source_response_500_data_code import DeleteSourceResponse500DataCode
+    from .delete_source_response_500_status import DeleteSourceResponse500Status
+    from .get_citation_response_200 import GetCitationResponse200
+    from .get_citation_response_200_data import GetCitationResponse200Data
+    from .get_citation_response_200_status import GetCitationResponse200Status
+    from .get_citation_response_400 import GetCitationResponse400
+    from .get_citation_response_400_data import GetCitationResponse400Data
+    from .get_citation_response_400_data_code import GetCitationResponse400DataCode
+    from .get_citation_response_400_status import GetCitationResponse400Status
+    from .get_citation_response_401 import GetCitationResponse401
+    from .get_citation_response_401_data import GetCitationResponse401Data
+    from .get_citation_response_401_data_code import GetCitationResponse401DataCode
+    from .get_citation_response_401_status import GetCitationResponse401Status
+    from .get_citation_response_404 import GetCitationResponse404
+    from .get_citation_response_404_data import GetCitationResponse404Data
+    from .get_citation_response_404_data_code import GetCitationResponse404DataCode
+    from .get_citation_response_404_data_message import GetCitationResponse404DataMessage
+    from .get_citation_response_404_status import GetCitationResponse404Status
+    from .get_conversations_order import GetConversationsOrder
+    from .get_conversations_response_200 import GetConversationsResponse200
+    from .get_conversations_response_200_data import GetConversationsResponse200Data
+    from .get_conversations_response_200_data_data_item import GetConversationsResponse200DataDataItem
+    from .get_conversations_response_200_status import GetConversationsResponse200Status
+    from .get_conversations_response_400 import GetConversationsResponse400
+    from .get_conversations_response_400_data import GetConversationsResponse400Data
+    from .get_conversations_response_400_data_code import GetConversationsResponse400DataCode
+    from .get_conversations_response_400_status import GetConversationsResponse400Status
+    from .get_conversations_response_401 import GetConversationsResponse401
+    from .get_conversations_response_401_data import GetConversationsResponse401Data
+    from .get_conversations_response_401_data_code import GetConversationsResponse401DataCode
+    from .get_conversations_response_401_status import GetConversationsResponse401Status
+    from .get_conversations_response_404 import GetConversationsResponse404
+    from .get_conversations_response_404_data import GetConversationsResponse404Data
+    from .get_conversations_response_404_data_code import GetConversationsResponse404DataCode
+    from .get_conversations_response_404_data_message import GetConversationsResponse404DataMessage
+    from .get_conversations_response_404_status import GetConversationsResponse404Status
+    from .get_conversations_response_500 import GetConversationsResponse500
+    from .get_conversations_response_500_data import GetConversationsResponse500Data
+    from .get_conversations_response_500_data_code import GetConversationsResponse500DataCode
+    from .get_conversations_response_500_status import GetConversationsResponse500Status
+    from .get_conversations_user_filter import GetConversationsUserFilter
+    from .get_page_metadata_response_200 import GetPageMetadataResponse200
+    from .get_page_metadata_response_200_data import GetPageMetadataResponse200Data
+    from .get_page_metadata_response_200_status import GetPageMetadataResponse200Status
+    from .get_page_metadata_response_400 import GetPageMetadataResponse400
+    from .get_page_metadata_response_400_data import GetPageMetadataResponse400Data
+    from .get_page_metadata_response_400_data_code import GetPageMetadataResponse400DataCode
+    from .get_page_metadata_response_400_status import GetPageMetadataResponse400Status
+    from .get_page_metadata_response_401 import GetPageMetadataResponse401
+    from .get_page_metadata_response_401_data import GetPageMetadataResponse401Data
+    from .get_page_metadata_response_401_data_code import GetPageMetadataResponse401DataCode
+    from .get_page_metadata_response_401_status import GetPageMetadataResponse401Status
+    from .get_page_metadata_response_404 import GetPageMetadataResponse404
+    from .get_page_metadata_response_404_data import GetPageMetadataResponse404Data
+    from .get_page_metadata_response_404_data_code import GetPageMetadataResponse404DataCode
+    from .get_page_metadata_response_404_data_message import GetPageMetadataResponse404DataMessage
+    from .get_page_metadata_response_404_status import GetPageMetadataResponse404Status
+    from .get_pages_order import GetPagesOrder
+    from .get_pages_response_200 import GetPagesResponse200
+    from .get_pages_response_200_data import GetPagesResponse200Data
+    from .get_pages_response_200_data_pages import GetPagesResponse200DataPages
+    from .get_pages_response_200_data_pages_data_item import GetPagesResponse200DataPagesDataItem
+    from .get_pages_response_200_data_pages_data_item_crawl_status import GetPagesResponse200DataPagesDataItemCrawlStatus
+    from .get_pages_response_200_data_pages_data_item_index_status import GetPagesResponse200DataPagesDataItemIndexStatus
+    from .get_pages_response_200_data_project import GetPagesResponse200DataProject
+    from .get_pages_response_200_data_project_type import GetPagesResponse200DataProjectType
+    from .get_pages_response_200_status import GetPagesResponse200Status
+    from .get_pages_response_400 import GetPagesResponse400
+    from .get_pages_response_400_data import GetPagesResponse400Data
+    from .get_pages_response_400_data_code import GetPagesResponse400DataCode
+    from .get_pages_response_400_status import GetPagesResponse400Status
+    from .get_pages_response_401 import GetPagesResponse401
+    from .get_pages_response_401_data import GetPagesResponse401Data
+    from .get_pages_response_401_data_code import GetPagesResponse401DataCode
+    from .get_pages_response_401_status import GetPagesResponse401Status
+    from .get_pages_response_404 import GetPagesResponse404
+    from .get_pages_response_404_data import GetPagesResponse404Data
+    from .get_pages_response_404_data_code import GetPagesResponse404DataCode
+    from .get_pages_response_404_data_message import GetPagesResponse404DataMessage
+    from .get_pages_response_404_status import GetPagesResponse404Status
+    from .get_pages_response_500 import GetPagesResponse500
+    from .get_pages_response_500_data import GetPagesResponse500Data
+    from .get_pages_response_500_data_code import GetPagesResponse500DataCode
+    from .get_pages_response_500_status import GetPagesResponse500Status
+    from .get_plugin_response_200 import GetPluginResponse200
+    from .get_plugin_response_200_data import GetPluginResponse200Data
+    from .get_plugin_response_200_status import GetPluginResponse200Status
+    from .get_plugin_response_400 import GetPluginResponse400
+    from .get_plugin_response_400_data import GetPluginResponse400Data
+    from .get_plugin_response_400_data_code import GetPluginResponse400DataCode
+    from .get_plugin_response_400_status import GetPluginResponse400Status
+    from .get_plugin_response_401 import GetPluginResponse401
+    from .get_plugin_response_401_data import GetPluginResponse401Data
+    from .get_plugin_response_401_data_code import GetPluginResponse401DataCode
+    from .get_plugin_response_401_status import GetPluginResponse401Status
+    from .get_plugin_response_404 import GetPluginResponse404
+    from .get_plugin_response_404_data import GetPluginResponse404Data
+    from .get_plugin_response_404_data_code import GetPluginResponse404DataCode
+    from .get_plugin_response_404_data_message import GetPluginResponse404DataMessage
+    from .get_plugin_response_404_status import GetPluginResponse404Status
+    from .get_plugin_response_500 import GetPluginResponse500
+    from .get_plugin_response_500_data import GetPluginResponse500Data
+    from .get_plugin_response_500_data_code import GetPluginResponse500DataCode
+    from .get_plugin_response_500_status import GetPluginResponse500Status
+    from .get_project_response_200 import GetProjectResponse200
+    from .get_project_response_200_data import GetProjectResponse200Data
+    from .get_project_response_200_data_type import GetProjectResponse200DataType
+    from .get_project_response_200_status import GetProjectResponse200Status
+    from .get_project_response_400 import GetProjectResponse400
+    from .get_project_response_400_data import GetProjectResponse400Data
+    from .get_project_response_400_data_code import GetProjectResponse400DataCode
+    from .get_project_response_400_status import GetProjectResponse400Status
+    from .get_project_response_401 import GetProjectResponse401
+    from .get_project_response_401_data import GetProjectResponse401Data
+    from .get_project_response_401_data_code import GetProjectResponse401DataCode
+    from .get_project_response_401_status import GetProjectResponse401Status
+    from .get_project_response_404 import GetProjectResponse404
+    from .get_project_response_404_data import GetProjectResponse404Data
+    from .get_project_response_404_data_code import GetProjectResponse404DataCode
+    from .get_project_response_404_data_message import GetProjectResponse404DataMessage
+    from .get_project_response_404_status import GetProjectResponse404Status
+    from .get_project_response_500 import GetProjectResponse500
+    from .get_project_response_500_data import GetProjectResponse500Data
+    from .get_project_response_500_data_code import GetProjectResponse500DataCode
+    from .get_project_response_500_status import GetProjectResponse500Status
+    from .get_settings_response_200 import GetSettingsResponse200
+    from .get_settings_response_200_data import GetSettingsResponse200Data
+    from .get_settings_response_200_data_citations_view_type import GetSettingsResponse200DataCitationsViewType
+    from .get_settings_response_200_status import GetSettingsResponse200Status
+    from .get_settings_response_400 import GetSettingsResponse400
+    from .get_settings_response_400_data import GetSettingsResponse400Data
+    from .get_settings_response_400_data_code import GetSettingsResponse400DataCode
+    from .get_settings_response_400_status import GetSettingsResponse400Status
+    from .get_settings_response_401 import GetSettingsResponse401
+    from .get_settings_response_401_data import GetSettingsResponse401Data
+    from .get_settings_response_401_data_code import GetSettingsResponse401DataCode
+    from .get_settings_response_401_status import GetSettingsResponse401Status
+    from .get_settings_response_404 import GetSettingsResponse404
+    from .get_settings_response_404_data import GetSettingsResponse404Data
+    from .get_settings_response_404_data_code import GetSettingsResponse404DataCode
+    from .get_settings_response_404_data_message import GetSettingsResponse404DataMessage
+    from .get_settings_response_404_status import GetSettingsResponse404Status
+    from .get_settings_response_500 import GetSettingsResponse500
+    from .get_settings_response_500_data import GetSettingsResponse500Data
+    from .get_settings_response_500_data_code import GetSettingsResponse500DataCode
+    from .get_settings_response_500_status import GetSettingsResponse500Status
+    from .get_user_response_200 import GetUserResponse200
+    from .get_user_response_200_data import GetUserResponse200Data
+    from .get_user_response_200_status import GetUserResponse200Status
+    from .get_user_response_401 import GetUserResponse401
+    from .get_user_response_401_data import GetUserResponse401Data
+    from .get_user_response_401_data_code import GetUserResponse401DataCode
+    from .get_user_response_401_status import GetUserResponse401Status
+    from .get_user_response_500 import GetUserResponse500
+    from .get_user_response_500_data import GetUserResponse500Data
+    from .get_user_response_500_data_code import GetUserResponse500DataCode
+    from .get_user_response_500_status import GetUserResponse500Status
+    from .list_projects_order import ListProjectsOrder
+    from .list_projects_response_200 import ListProjectsResponse200
+    from .list_projects_response_200_data import ListProjectsResponse200Data
+    from .list_projects_response_200_data_data_item import ListProjectsResponse200DataDataItem
+    from .list_projects_response_200_data_data_item_type import ListProjectsResponse200DataDataItemType
+    from .list_projects_response_200_status import ListProjectsResponse200Status
+    from .list_projects_response_401 import ListProjectsResponse401
+    from .list_projects_response_401_data import ListProjectsResponse401Data
+    from .list_projects_response_401_data_code import ListProjectsResponse401DataCode
+    from .list_projects_response_401_status import ListProjectsResponse401Status
+    from .list_projects_response_500 import ListProjectsResponse500
+    from .list_projects_response_500_data import ListProjectsResponse500Data
+    from .list_projects_response_500_data_code import ListProjectsResponse500DataCode
+    from .list_projects_response_500_status import ListProjectsResponse500Status
+    from .list_sources_response_200 import ListSourcesResponse200
+    from .list_sources_response_200_data import ListSourcesResponse200Data
+    from .list_sources_response_200_data_sitemaps_item import ListSourcesResponse200DataSitemapsItem
+    from .list_sources_response_200_data_sitemaps_item_pages_item import ListSourcesResponse200DataSitemapsItemPagesItem
+    from .list_sources_response_200_data_sitemaps_item_pages_item_crawl_status import (
+        ListSourcesResponse200DataSitemapsItemPagesItemCrawlStatus,
+    )
+    from .list_sources_response_200_data_sitemaps_item_pages_item_index_status import (
+        ListSourcesResponse200DataSitemapsItemPagesItemIndexStatus,
+    )
+    from .list_sources_response_200_data_sitemaps_item_settings import ListSourcesResponse200DataSitemapsItemSettings
+    from .list_sources_response_200_data_sitemaps_item_type import ListSourcesResponse200DataSitemapsItemType
+    from .list_sources_response_200_data_uploads import ListSourcesResponse200DataUploads
+    from .list_sources_response_200_data_uploads_pages_item import ListSourcesResponse200DataUploadsPagesItem
+    from .list_sources_response_200_data_uploads_pages_item_crawl_status import (
+        ListSourcesResponse200DataUploadsPagesItemCrawlStatus,
+    )
+    from .list_sources_response_200_data_uploads_pages_item_index_status import (
+        ListSourcesResponse200DataUploadsPagesItemIndexStatus,
+    )
+    from .list_sources_response_200_data_uploads_settings import ListSourcesResponse200DataUploadsSettings
+    from .list_sources_response_200_data_uploads_type import ListSourcesResponse200DataUploadsType
+    from .list_sources_response_200_status import ListSourcesResponse200Status
+    from .list_sources_response_400 import ListSourcesResponse400
+    from .list_sources_response_400_data import ListSourcesResponse400Data
+    from .list_sources_response_400_data_code import ListSourcesResponse400DataCode
+    from .list_sources_response_400_status import ListSourcesResponse400Status
+    from .list_sources_response_401 import ListSourcesResponse401
+    from .list_sources_response_401_data import ListSourcesResponse401Data
+    from .list_sources_response_401_data_code import ListSourcesResponse401DataCode
+    from .list_sources_response_401_status import ListSourcesResponse401Status
+    from .list_sources_response_404 import ListSourcesResponse404
+    from .list_sources_response_404_data import ListSourcesResponse404Data
+    from .list_sources_response_404_data_code import ListSourcesResponse404DataCode
+    from .list_sources_response_404_data_message import ListSourcesResponse404DataMessage
+    from .list_sources_response_404_status import ListSourcesResponse404Status
+    from .list_sources_response_500 import ListSourcesResponse500
+    from .list_sources_response_500_data import ListSourcesResponse500Data
+    from .list_sources_response_500_data_code import ListSourcesResponse500DataCode
+    from .list_sources_response_500_status import ListSourcesResponse500Status
+    from .messages_conversation_order import MessagesConversationOrder
+    from .messages_conversation_response_200 import MessagesConversationResponse200
+    from .messages_conversation_response_200_data import MessagesConversationResponse200Data
+    from .messages_conversation_response_200_data_conversation import MessagesConversationResponse200DataConversation
+    from .messages_conversation_response_200_data_messages import MessagesConversationResponse200DataMessages
+    from .messages_conversation_response_200_data_messages_data_item import (
+        MessagesConversationResponse200DataMessagesDataItem,
+    )
+    from .messages_conversation_response_200_data_messages_data_item_metadata import (
+        MessagesConversationResponse200DataMessagesDataItemMetadata,
+    )
+    from .messages_conversation_response_200_status import MessagesConversationResponse200Status
+    from .messages_conversation_response_400 import MessagesConversationResponse400
+    from .messages_conversation_response_400_data import MessagesConversationResponse400Data
+    from .messages_conversation_response_400_data_code import MessagesConversationResponse400DataCode
+    from .messages_conversation_response_400_status import MessagesConversationResponse400Status
+    from .messages_conversation_response_401 import MessagesConversationResponse401
+    from .messages_conversation_response_401_data import MessagesConversationResponse401Data
+    from .messages_conversation_response_401_data_code import MessagesConversationResponse401DataCode
+    from .messages_conversation_response_401_status import MessagesConversationResponse401Status
+    from .messages_conversation_response_404 import MessagesConversationResponse404
+    from .messages_conversation_response_404_data import MessagesConversationResponse404Data
+    from .messages_conversation_response_404_data_code import MessagesConversationResponse404DataCode
+    from .messages_conversation_response_404_data_message import MessagesConversationResponse404DataMessage
+    from .messages_conversation_response_404_status import MessagesConversationResponse404Status
+    from .messages_conversation_response_500 import MessagesConversationResponse500
+    from .messages_conversation_response_500_data import MessagesConversationResponse500Data
+    from .messages_conversation_response_500_data_code import MessagesConversationResponse500DataCode
+    from .messages_conversation_response_500_status import MessagesConversationResponse500Status
+    from .open_graph_cache import OpenGraphCache
+    from .page import Page
+    from .page_crawl_status import PageCrawlStatus
+    from .page_index_status import PageIndexStatus
+    from .page_metadata import PageMetadata
+    from .preview_citation_response_400 import PreviewCitationResponse400
+    from .preview_citation_response_400_data import PreviewCitationResponse400Data
+    from .preview_citation_response_400_data_code import PreviewCitationResponse400DataCode
+    from .preview_citation_response_400_status import PreviewCitationResponse400Status
+    from .preview_citation_response_401 import PreviewCitationResponse401
+    from .preview_citation_response_401_data import PreviewCitationResponse401Data
+    from .preview_citation_response_401_data_code import PreviewCitationResponse401DataCode
+    from .preview_citation_response_401_status import PreviewCitationResponse401Status
+    from .preview_citation_response_404 import PreviewCitationResponse404
+    from .preview_citation_response_404_data import PreviewCitationResponse404Data
+    from .preview_citation_response_404_data_code import PreviewCitationResponse404DataCode
+    from .preview_citation_response_404_data_message import PreviewCitationResponse404DataMessage
+    from .preview_citation_response_404_status import PreviewCitationResponse404Status
+    from .preview_citation_response_500 import PreviewCitationResponse500
+    from .preview_citation_response_500_data import PreviewCitationResponse500Data
+    from .preview_citation_response_500_data_code import PreviewCitationResponse500DataCode
+    from .preview_citation_response_500_status import PreviewCitationResponse500Status
+    from .project import Project
+    from .project_plugin import ProjectPlugin
+    from .project_settings import ProjectSettings
+    from .project_settings_citations_view_type import ProjectSettingsCitationsViewType
+    from .project_settings_response_source import ProjectSettingsResponseSource
+    from .project_source import ProjectSource
+    from .project_source_settings import ProjectSourceSettings
+    from .project_source_type import ProjectSourceType
+    from .project_type import ProjectType
+    from .prompt_history import PromptHistory
+    from .prompt_history_metadata import PromptHistoryMetadata
+    from .reindex_page_response_200 import ReindexPageResponse200
+    from .reindex_page_response_200_data import ReindexPageResponse200Data
+    from .reindex_page_response_200_status import ReindexPageResponse200Status
+    from .reindex_page_response_400 import ReindexPageResponse400
+    from .reindex_page_response_400_data import ReindexPageResponse400Data
+    from .reindex_page_response_400_data_code import ReindexPageResponse400DataCode
+    from .reindex_page_response_400_status import ReindexPageResponse400Status
+    from .reindex_page_response_401 import ReindexPageResponse401
+    from .reindex_page_response_401_data import ReindexPageResponse401Data
+    from .reindex_page_response_401_data_code import ReindexPageResponse401DataCode
+    from .reindex_page_response_401_status import ReindexPageResponse401Status
+    from .reindex_page_response_403 import ReindexPageResponse403
+    from .reindex_page_response_403_data import ReindexPageResponse403Data
+    from .reindex_page_response_403_data_code import ReindexPageResponse403DataCode
+    from .reindex_page_response_403_data_message import ReindexPageResponse403DataMessage
+    from .reindex_page_response_403_status import ReindexPageResponse403Status
+    from .reindex_page_response_500 import ReindexPageResponse500
+    from .reindex_page_response_500_data import ReindexPageResponse500Data
+    from .reindex_page_response_500_data_code import ReindexPageResponse500DataCode
+    from .reindex_page_response_500_status import ReindexPageResponse500Status
+    from .send_message_json_body import SendMessageJsonBody
+    from .send_message_response_200 import SendMessageResponse200
+    from .send_message_response_200_data import SendMessageResponse200Data
+    from .send_message_response_200_data_metadata import SendMessageResponse200DataMetadata
+    from .send_message_response_200_status import SendMessageResponse200Status
+    from .send_message_response_400 import SendMessageResponse400
+    from .send_message_response_400_data import SendMessageResponse400Data
+    from .send_message_response_400_data_code import SendMessageResponse400DataCode
+    from .send_message_response_400_status import SendMessageResponse400Status
+    from .send_message_response_401 import SendMessageResponse401
+    from .send_message_response_401_data import SendMessageResponse401Data
+    from .send_message_response_401_data_code import SendMessageResponse401DataCode
+    from .send_message_response_401_status import SendMessageResponse401Status
+    from .send_message_response_404 import SendMessageResponse404
+    from .send_message_response_404_data import SendMessageResponse404Data
+    from .send_message_response_404_data_code import SendMessageResponse404DataCode
+    from .send_message_response_404_data_message import SendMessageResponse404DataMessage
+    from .send_message_response_404_status import SendMessageResponse404Status
+    from .send_message_response_500 import SendMessageResponse500
+    from .send_message_response_500_data import SendMessageResponse500Data
+    from .send_message_response_500_data_code import SendMessageResponse500DataCode
+    from .send_message_response_500_status import SendMessageResponse500Status
+    from .stats_project_response_200 import StatsProjectResponse200
+    from .stats_project_response_200_data import StatsProjectResponse200Data
+    from .stats_project_response_200_status import StatsProjectResponse200Status
+    from .stats_project_response_400 import StatsProjectResponse400
+    from .stats_project_response_400_data import StatsProjectResponse400Data
+    from .stats_project_response_400_data_code import StatsProjectResponse400DataCode
+    from .stats_project_response_400_status import StatsProjectResponse400Status
+    from .stats_project_response_401 import StatsProjectResponse401
+    from .stats_project_response_401_data import StatsProjectResponse401Data
+    from .stats_project_response_401_data_code import StatsProjectResponse401DataCode
+    from .stats_project_response_401_status import StatsProjectResponse401Status
+    from .stats_project_response_404 import StatsProjectResponse404
+    from .stats_project_response_404_data import StatsProjectResponse404Data
+    from .stats_project_response_404_data_code import StatsProjectResponse404DataCode
+    from .stats_project_response_404_data_message import StatsProjectResponse404DataMessage
+    from .stats_project_response_404_status import StatsProjectResponse404Status
+    from .stats_project_response_500 import StatsProjectResponse500
+    from .stats_project_response_500_data import StatsProjectResponse500Data
+    from .stats_project_response_500_data_code import StatsProjectResponse500DataCode
+    from .stats_project_response_500_status import StatsProjectResponse500Status
+    from .update_conversation_json_body import UpdateConversationJsonBody
+    from .update_conversation_response_200 import UpdateConversationResponse200
+    from .update_conversation_response_200_data import UpdateConversationResponse200Data
+    from .update_conversation_response_200_status import UpdateConversationResponse200Status
+    from .update_conversation_response_400 import UpdateConversationResponse400
+    from .update_conversation_response_400_data import UpdateConversationResponse400Data
+    from .update_conversation_response_400_data_code import UpdateConversationResponse400DataCode
+    from .update_conversation_response_400_status import UpdateConversationResponse400Status
+    from .update_conversation_response_401 import UpdateConversationResponse401
+    from .update_conversation_response_401_data import UpdateConversationResponse401Data
+    from .update_conversation_response_401_data_code import UpdateConversationResponse401DataCode
+    from .update_conversation_response_401_status import UpdateConversationResponse401Status
+    from .update_conversation_response_404 import UpdateConversationResponse404
+    from .update_conversation_response_404_data import UpdateConversationResponse404Data
+    from .update_conversation_response_404_data_code import UpdateConversationResponse404DataCode
+    from .update_conversation_response_404_data_message import UpdateConversationResponse404DataMessage
+    from .update_conversation_response_404_status import UpdateConversationResponse404Status
+    from .update_conversation_response_500 import UpdateConversationResponse500
+    from .update_conversation_response_500_data import UpdateConversationResponse500Data
+    from .update_conversation_response_500_data_code import UpdateConversationResponse500DataCode
+    from .update_conversation_response_500_status import UpdateConversationResponse500Status
+    from .update_page_metadata_json_body import UpdatePageMetadataJsonBody
+    from .update_page_metadata_response_200 import UpdatePageMetadataResponse200
+    from .update_page_metadata_response_200_data import UpdatePageMetadataResponse200Data
+    from .update_page_metadata_response_200_status import UpdatePageMetadataResponse200Status
+    from .update_page_metadata_response_400 import UpdatePageMetadataResponse400
+    from .update_page_metadata_response_400_data import UpdatePageMetadataResponse400Data
+    from .update_page_metadata_response_400_data_code import UpdatePageMetadataResponse400DataCode
+    from .update_page_metadata_response_400_status import UpdatePageMetadataResponse400Status
+    from .update_page_metadata_response_401 import UpdatePageMetadataResponse401
+    from .update_page_metadata_response_401_data import UpdatePageMetadataResponse401Data
+    from .update_page_metadata_response_401_data_code import UpdatePageMetadataResponse401DataCode
+    from .update_page_metadata_response_401_status import UpdatePageMetadataResponse401Status
+    from .update_page_metadata_response_404 import UpdatePageMetadataResponse404
+    from .update_page_metadata_response_404_data import UpdatePageMetadataResponse404Data
+    from .update_page_metadata_response_404_data_code import UpdatePageMetadataResponse404DataCode
+    from .update_page_metadata_response_404_data_message import UpdatePageMetadataResponse404DataMessage
+    from .update_page_metadata_response_404_status import UpdatePageMetadataResponse404Status
+    from .update_page_metadata_response_500 import UpdatePageMetadataResponse500
+    from .update_page_metadata_response_500_data import UpdatePageMetadataResponse500Data
+    from .update_page_metadata_response_500_data_code import UpdatePageMetadataResponse500DataCode
+    from .update_page_metadata_response_500_status import UpdatePageMetadataResponse500Status
+    from .update_plugin_json_body import UpdatePluginJsonBody
+    from .update_plugin_response_200 import UpdatePluginResponse200
+    from .update_plugin_response_200_data import UpdatePluginResponse200Data
+    from .update_plugin_response_200_status import UpdatePluginResponse200Status
+    from .update_plugin_response_400 import UpdatePluginResponse400
+    from .update_plugin_response_400_data import UpdatePluginResponse400Data
+    from .update_plugin_response_400_data_code import UpdatePluginResponse400DataCode
+    from .update_plugin_response_400_status import UpdatePluginResponse400Status
+    from .update_plugin_response_401 import UpdatePluginResponse401
+    from .update_plugin_response_401_data import UpdatePluginResponse401Data
+    from .update_plugin_response_401_data_code import UpdatePluginResponse401DataCode
+    from .update_plugin_response_401_status import UpdatePluginResponse401Status
+    from .update_plugin_response_404 import UpdatePluginResponse404
+    from .update_plugin_response_404_data import UpdatePluginResponse404Data
+    from .update_plugin_response_404_data_code import UpdatePluginResponse404DataCode
+    from .update_plugin_response_404_data_message import UpdatePluginResponse404DataMessage
+    from .update_plugin_response_404_status import UpdatePluginResponse404Status
+    from .update_plugin_response_500 import UpdatePluginResponse500
+    from .update_plugin_response_500_data import UpdatePluginResponse500Data
+    from .update_plugin_response_500_data_code import UpdatePluginResponse500DataCode
+    from .update_plugin_response_500_status import UpdatePluginResponse500Status
+    from .update_project_multipart_data import UpdateProjectMultipartData
+    from .update_project_response_200 import UpdateProjectResponse200
+    from .update_project_response_200_data import UpdateProjectResponse200Data
+    from .update_project_response_200_data_type import UpdateProjectResponse200DataType
+    from .update_project_response_200_status import UpdateProjectResponse200Status
+    from .update_project_response_400 import UpdateProjectResponse400
+    from .update_project_response_400_data import UpdateProjectResponse400Data
+    from .update_project_response_400_data_code import UpdateProjectResponse400DataCode
+    from .update_project_response_400_status import UpdateProjectResponse400Status
+    from .update_project_response_401 import UpdateProjectResponse401
+    from .update_project_response_401_data import UpdateProjectResponse401Data
+    from .update_project_response_401_data_code import UpdateProjectResponse401DataCode
+    from .update_project_response_401_status import UpdateProjectResponse401Status
+    from .update_project_response_404 import UpdateProjectResponse404
+    from .update_project_response_404_data import UpdateProjectResponse404Data
+    from .update_project_response_404_data_code import UpdateProjectResponse404DataCode
+    from .update_project_response_404_data_message import UpdateProjectResponse404DataMessage
+    from .update_project_response_404_status import UpdateProjectResponse404Status
+    from .update_project_response_500 import UpdateProjectResponse500
+    from .update_project_response_500_data import UpdateProjectResponse500Data
+    from .update_project_response_500_data_code import UpdateProjectResponse500DataCode
+    from .update_project_response_500_status import UpdateProjectResponse500Status
+    from .update_settings_multipart_data import UpdateSettingsMultipartData
+    from .update_settings_multipart_data_citations_view_type import UpdateSettingsMultipartDataCitationsViewType
+    from .update_settings_response_200 import UpdateSettingsResponse200
+    from .update_settings_response_200_data import UpdateSettingsResponse200Data
+    from .update_settings_response_200_status import UpdateSettingsResponse200Status
+    from .update_settings_response_400 import UpdateSettingsResponse400
+    from .update_settings_response_400_data import UpdateSettingsResponse400Data
+    from .update_settings_response_400_data_code import UpdateSettingsResponse400DataCode
+    from .update_settings_response_400_data_message import UpdateSettingsResponse400DataMessage
+    from .update_settings_response_400_status import UpdateSettingsResponse400Status
+    from .update_settings_response_401 import UpdateSettingsResponse401
+    from .update_settings_response_401_data import UpdateSettingsResponse401Data
+    from .update_settings_response_401_data_code import UpdateSettingsResponse401DataCode
+    from .update_settings_response_401_status import UpdateSettingsResponse401Status
+    from .update_settings_response_500 import UpdateSettingsResponse500
+    from .update_settings_response_500_data import UpdateSettingsResponse500Data
+    from .update_settings_response_500_data_code import UpdateSettingsResponse500DataCode
+    from .update_settings_response_500_status import UpdateSettingsResponse500Status
+    from .update_user_multipart_data import UpdateUserMultipartData
+    from .update_user_response_200 import UpdateUserResponse200
+    from .update_user_response_200_data import UpdateUserResponse200Data
+    from .update_user_response_200_status import UpdateUserResponse200Status
+    from .update_user_response_401 import UpdateUserResponse401
+    from .update_user_response_401_data import UpdateUserResponse401Data
+    from .update_user_response_401_data_code import UpdateUserResponse401DataCode
+    from .update_user_response_401_status import UpdateUserResponse401Status
+    from .update_user_response_500 import UpdateUserResponse500
+    from .update_user_response_500_data import UpdateUserResponse500Data
+    from .update_user_response_500_data_code import UpdateUserResponse500DataCode
+    from .update_user_response_500_status import UpdateUserResponse500Status
+    from .user import User
+
+_MODULES = {
+    "Conversation": ".conversation",
+    "CreateConversationJsonBody": ".create_conversation_json_body",
+    "CreateConversationResponse201": ".create_conversation_response_201",
+    "CreateConversationResponse201Data": ".create_conversation_response_201_data",
+    "CreateConversationResponse201Status": ".create_conversation_response_201_status",
+    "CreateConversationResponse400": ".create_conversation_response_400",
+    "CreateConversationResponse400Data": ".create_conversation_response_400_data",
+    "CreateConversationResponse400DataCode": ".create_conversation_response_400_data_code",
+    "CreateConversationResponse400Status": ".create_conversation_response_400_status",
+    "CreateConversationResponse401": ".create_conversation_response_401",
+    "CreateConversationResponse401Data": ".create_conversation_response_401_data",
+    "CreateConversationResponse401DataCode": ".create_conversation_response_401_data_code",
+    "CreateConversationResponse401Status": ".create_conversation_response_401_status",
+    "CreateConversationResponse404": ".create_conversation_response_404",
+    "CreateConversationResponse404Data": ".create_conversation_response_404_data",
+    "CreateConversationResponse404DataCode": ".create_conversation_response_404_data_code",
+    "CreateConversationResponse404DataMessage": ".create_conversation_response_404_data_message",
+    "CreateConversationResponse404Status": ".create_conversation_response_404_status",
+    "CreateConversationResponse500": ".create_conversation_response_500",
+    "CreateConversationResponse500Data": ".create_conversation_response_500_data",
+    "CreateConversationResponse500DataCode": ".create_conversation_response_500_data_code",
+    "CreateConversationResponse500Status": ".create_conversation_response_500_status",
+    "CreatePluginJsonBody": ".create_plugin_json_body",
+    "CreatePluginResponse201": ".create_plugin_response_201",
+    "CreatePluginResponse201Data": ".create_plugin_response_201_data",
+    "CreatePluginResponse201Status": ".create_plugin_response_201_status",
+    "CreatePluginResponse400": ".create_plugin_response_400",
+    "CreatePluginResponse400Data": ".create_plugin_response_400_data",
+    "CreatePluginResponse400DataCode": ".create_plugin_response_400_data_code",
+    "CreatePluginResponse400Status": ".create_plugin_response_400_status",
+    "CreatePluginResponse401": ".create_plugin_response_401",
+    "CreatePluginResponse401Data": ".create_plugin_response_401_data",
+    "CreatePluginResponse401DataCode": ".create_plugin_response_401_data_code",
+    "CreatePluginResponse401Status": ".create_plugin_response_401_status",
+    "CreatePluginResponse404": ".create_plugin_response_404",
+    "CreatePluginResponse404Data": ".create_plugin_response_404_data",
+    "CreatePluginResponse404DataCode": ".create_plugin_response_404_data_code",
+    "CreatePluginResponse404DataMessage": ".create_plugin_response_404_data_message",
+    "CreatePluginResponse404Status": ".create_plugin_response_404_status",
+    "CreatePluginResponse500": ".create_plugin_response_500",
+    "CreatePluginResponse500Data": ".create_plugin_response_500_data",
+    "CreatePluginResponse500DataCode": ".create_plugin_response_500_data_code",
+    "CreatePluginResponse500Status": ".create_plugin_response_500_status",
+    "CreateProjectMultipartData": ".create_project_multipart_data",
+    "CreateProjectResponse201": ".create_project_response_201",
+    "CreateProjectResponse201Data": ".create_project_response_201_data",
+    "CreateProjectResponse201DataType": ".create_project_response_201_data_type",
+    "CreateProjectResponse201Status": ".create_project_response_201_status",
+    "CreateProjectResponse400": ".create_project_response_400",
+    "CreateProjectResponse400Data": ".create_project_response_400_data",
+    "CreateProjectResponse400DataCode": ".create_project_response_400_data_code",
+    "CreateProjectResponse400DataMessage": ".create_project_response_400_data_message",
+    "CreateProjectResponse400Status": ".create_project_response_400_status",
+    "CreateProjectResponse401": ".create_project_response_401",
+    "CreateProjectResponse401Data": ".create_project_response_401_data",
+    "CreateProjectResponse401DataCode": ".create_project_response_401_data_code",
+    "CreateProjectResponse401Status": ".create_project_response_401_status",
+    "CreateProjectResponse500": ".create_project_response_500",
+    "CreateProjectResponse500Data": ".create_project_response_500_data",
+    "CreateProjectResponse500DataCode": ".create_project_response_500_data_code",
+    "CreateProjectResponse500Status": ".create_project_response_500_status",
+    "CreateSourceMultipartData": ".create_source_multipart_data",
+    "CreateSourceResponse201": ".create_source_response_201",
+    "CreateSourceResponse201Data": ".create_source_response_201_data",
+    "CreateSourceResponse201DataPagesItem": ".create_source_response_201_data_pages_item",
+    "CreateSourceResponse201DataPagesItemCrawlStatus": ".create_source_response_201_data_pages_item_crawl_status",
+    "CreateSourceResponse201DataPagesItemIndexStatus": ".create_source_response_201_data_pages_item_index_status",
+    "CreateSourceResponse201DataSettings": ".create_source_response_201_data_settings",
+    "CreateSourceResponse201DataType": ".create_source_response_201_data_type",
+    "CreateSourceResponse201Status": ".create_source_response_201_status",
+    "CreateSourceResponse400": ".create_source_response_400",
+    "CreateSourceResponse400Data": ".create_source_response_400_data",
+    "CreateSourceResponse400DataCode": ".create_source_response_400_data_code",
+    "CreateSourceResponse400DataMessage": ".create_source_response_400_data_message",
+    "CreateSourceResponse400Status": ".create_source_response_400_status",
+    "CreateSourceResponse401": ".create_source_response_401",
+    "CreateSourceResponse401Data": ".create_source_response_401_data",
+    "CreateSourceResponse401DataCode": ".create_source_response_401_data_code",
+    "CreateSourceResponse401Status": ".create_source_response_401_status",
+    "CreateSourceResponse404": ".create_source_response_404",
+    "CreateSourceResponse404Data": ".create_source_response_404_data",
+    "CreateSourceResponse404DataCode": ".create_source_response_404_data_code",
+    "CreateSourceResponse404DataMessage": ".create_source_response_404_data_message",
+    "CreateSourceResponse404Status": ".create_source_response_404_status",
+    "CreateSourceResponse500": ".create_source_response_500",
+    "CreateSourceResponse500Data": ".create_source_response_500_data",
+    "CreateSourceResponse500DataCode": ".create_source_response_500_data_code",
+    "CreateSourceResponse500Status": ".create_source_response_500_status",
+    "DeleteConversationResponse200": ".delete_conversation_response_200",
+    "DeleteConversationResponse200Data": ".delete_conversation_response_200_data",
+    "DeleteConversationResponse200Status": ".delete_conversation_response_200_status",
+    "DeleteConversationResponse400": ".delete_conversation_response_400",
+    "DeleteConversationResponse400Data": ".delete_conversation_response_400_data",
+    "DeleteConversationResponse400DataCode": ".delete_conversation_response_400_data_code",
+    "DeleteConversationResponse400Status": ".delete_conversation_response_400_status",
+    "DeleteConversationResponse401": ".delete_conversation_response_401",
+    "DeleteConversationResponse401Data": ".delete_conversation_response_401_data",
+    "DeleteConversationResponse401DataCode": ".delete_conversation_response_401_data_code",
+    "DeleteConversationResponse401Status": ".delete_conversation_response_401_status",
+    "DeleteConversationResponse404": ".delete_conversation_response_404",
+    "DeleteConversationResponse404Data": ".delete_conversation_response_404_data",
+    "DeleteConversationResponse404DataCode": ".delete_conversation_response_404_data_code",
+    "DeleteConversationResponse404DataMessage": ".delete_conversation_response_404_data_message",
+    "DeleteConversationResponse404Status": ".delete_conversation_response_404_status",
+    "DeleteConversationResponse500": ".delete_conversation_response_500",
+    "DeleteConversationResponse500Data": ".delete_conversation_response_500_data",
+    "DeleteConversationResponse500DataCode": ".delete_conversation_response_500_data_code",
+    "DeleteConversationResponse500Status": ".delete_conversation_response_500_status",
+    "DeletePageResponse200": ".delete_page_response_200",
+    "DeletePageResponse200Data": ".delete_page_response_200_data",
+    "DeletePageResponse200Status": ".delete_page_response_200_status",
+    "DeletePageResponse400": ".delete_page_response_400",
+    "DeletePageResponse400Data": ".delete_page_response_400_data",
+    "DeletePageResponse400DataCode": ".delete_page_response_400_data_code",
+    "DeletePageResponse400Status": ".delete_page_response_400_status",
+    "DeletePageResponse401": ".delete_page_response_401",
+    "DeletePageResponse401Data": ".delete_page_response_401_data",
+    "DeletePageResponse401DataCode": ".delete_page_response_401_data_code",
+    "DeletePageResponse401Status": ".delete_page_response_401_status",
+    "DeletePageResponse404": ".delete_page_response_404",
+    "DeletePageResponse404Data": ".delete_page_response_404_data",
+    "DeletePageResponse404DataCode": ".delete_page_response_404_data_code",
+    "DeletePageResponse404DataMessage": ".delete_page_response_404_data_message",
+    "DeletePageResponse404Status": ".delete_page_response_404_status",
+    "DeletePageResponse500": ".delete_page_response_500",
+    "DeletePageResponse500Data": ".delete_page_response_500_data",
+    "DeletePageResponse500DataCode": ".delete_page_response_500_data_code",
+    "DeletePageResponse500Status": ".delete_page_response_500_status",
+    "DeleteProjectResponse200": ".delete_project_response_200",
+    "DeleteProjectResponse200Data": ".delete_project_response_200_data",
+    "DeleteProjectResponse200Status": ".delete_project_response_200_status",
+    "DeleteProjectResponse400": ".delete_project_response_400",
+    "DeleteProjectResponse400Data": ".delete_project_response_400_data",
+    "DeleteProjectResponse400DataCode": ".delete_project_response_400_data_code",
+    "DeleteProjectResponse400Status": ".delete_project_response_400_status",
+    "DeleteProjectResponse401": ".delete_project_response_401",
+    "DeleteProjectResponse401Data": ".delete_project_response_401_data",
+    "DeleteProjectResponse401DataCode": ".delete_project_response_401_data_code",
+    "DeleteProjectResponse401Status": ".delete_project_response_401_status",
+    "DeleteProjectResponse404": ".delete_project_response_404",
+    "DeleteProjectResponse404Data": ".delete_project_response_404_data",
+    "DeleteProjectResponse404DataCode": ".delete_project_response_404_data_code",
+    "DeleteProjectResponse404DataMessage": ".delete_project_response_404_data_message",
+    "DeleteProjectResponse404Status": ".delete_project_response_404_status",
+    "DeleteProjectResponse500": ".delete_project_response_500",
+    "DeleteProjectResponse500Data": ".delete_project_response_500_data",
+    "DeleteProjectResponse500DataCode": ".delete_project_response_500_data_code",
+    "DeleteProjectResponse500Status": ".delete_project_response_500_status",
+    "DeleteSourceResponse200": ".delete_source_response_200",
+    "DeleteSourceResponse200Data": ".delete_source_response_200_data",
+    "DeleteSourceResponse200Status": ".delete_source_response_200_status",
+    "DeleteSourceResponse400": ".delete_source_response_400",
+    "DeleteSourceResponse400Data": ".delete_source_response_400_data",
+    "DeleteSourceResponse400DataCode": ".delete_source_response_400_data_code",
+    "DeleteSourceResponse400Status": ".delete_source_response_400_status",
+    "DeleteSourceResponse401": ".delete_source_response_401",
+    "DeleteSourceResponse401Data": ".delete_source_response_401_data",
+    "DeleteSourceResponse401DataCode": ".delete_source_response_401_data_code",
+    "DeleteSourceResponse401Status": ".delete_source_response_401_status",
+    "DeleteSourceResponse404": ".delete_source_response_404",
+    "DeleteSourceResponse404Data": ".delete_source_response_404_data",
+    "DeleteSourceResponse404DataCode": ".delete_source_response_404_data_code",
+    "DeleteSourceResponse404DataMessage": ".delete_source_response_404_data_message",
+    "DeleteSourceResponse404Status": ".delete_source_response_404_status",
+    "DeleteSourceResponse500": ".delete_source_response_500",
+    "DeleteSourceResponse500Data": ".delete_source_response_500_data",
+    "DeleteSourceResponse500DataCode": ".delete_source_response_500_data_code",
+    "DeleteSourceResponse500Status": ".delete_source_response_500_status",
+    "GetCitationResponse200": ".get_citation_response_200",
+    "GetCitationResponse200Data": ".get_citation_response_200_data",
+    "GetCitationResponse200Status": ".get_citation_response_200_status",
+    "GetCitationResponse400": ".get_citation_response_400",
+    "GetCitationResponse400Data": ".get_citation_response_400_data",
+    "GetCitationResponse400DataCode": ".get_citation_response_400_data_code",
+    "GetCitationResponse400Status": ".get_citation_response_400_status",
+    "GetCitationResponse401": ".get_citation_response_401",
+    "GetCitationResponse401Data": ".get_citation_response_401_data",
+    "GetCitationResponse401DataCode": ".get_citation_response_401_data_code",
+    "GetCitationResponse401Status": ".get_citation_response_401_status",
+    "GetCitationResponse404": ".get_citation_response_404",
+    "GetCitationResponse404Data": ".get_citation_response_404_data",
+    "GetCitationResponse404DataCode": ".get_citation_response_404_data_code",
+    "GetCitationResponse404DataMessage": ".get_citation_response_404_data_message",
+    "GetCitationResponse404Status": ".get_citation_response_404_status",
+    "GetConversationsOrder": ".get_conversations_order",
+    "GetConversationsResponse200": ".get_conversations_response_200",
+    "GetConversationsResponse200Data": ".get_conversations_response_200_data",
+    "GetConversationsResponse200DataDataItem": ".get_conversations_response_200_data_data_item",
+    "GetConversationsResponse200Status": ".get_conversations_response_200_status",
+    "GetConversationsResponse400": ".get_conversations_response_400",
+    "GetConversationsResponse400Data": ".get_conversations_response_400_data",
+    "GetConversationsResponse400DataCode": ".get_conversations_response_400_data_code",
+    "GetConversationsResponse400Status": ".get_conversations_response_400_status",
+    "GetConversationsResponse401": ".get_conversations_response_401",
+    "GetConversationsResponse401Data": ".get_conversations_response_401_data",
+    "GetConversationsResponse401DataCode": ".get_conversations_response_401_data_code",
+    "GetConversationsResponse401Status": ".get_conversations_response_401_status",
+    "GetConversationsResponse404": ".get_conversations_response_404",
+    "GetConversationsResponse404Data": ".get_conversations_response_404_data",
+    "GetConversationsResponse404DataCode": ".get_conversations_response_404_data_code",
+    "GetConversationsResponse404DataMessage": ".get_conversations_response_404_data_message",
+    "GetConversationsResponse404Status": ".get_conversations_response_404_status",
+    "GetConversationsResponse500": ".get_conversations_response_500",
+    "GetConversationsResponse500Data": ".get_conversations_response_500_data",
+    "GetConversationsResponse500DataCode": ".get_conversations_response_500_data_code",
+    "GetConversationsResponse500Status": ".get_conversations_response_500_status",
+    "GetConversationsUserFilter": ".get_conversations_user_filter",
+    "GetPageMetadataResponse200": ".get_page_metadata_response_200",
+    "GetPageMetadataResponse200Data": ".get_page_metadata_response_200_data",
+    "GetPageMetadataResponse200Status": ".get_page_metadata_response_200_status",
+    "GetPageMetadataResponse400": ".get_page_metadata_response_400",
+    "GetPageMetadataResponse400Data": ".get_page_metadata_response_400_data",
+    "GetPageMetadataResponse400DataCode": ".get_page_metadata_response_400_data_code",
+    "GetPageMetadataResponse400Status": ".get_page_metadata_response_400_status",
+    "GetPageMetadataResponse401": ".get_page_metadata_response_401",
+    "GetPageMetadataResponse401Data": ".get_page_metadata_response_401_data",
+    "GetPageMetadataResponse401DataCode": ".get_page_metadata_response_401_data_code",
+    "GetPageMetadataResponse401Status": ".get_page_metadata_response_401_status",
+    "GetPageMetadataResponse404": ".get_page_metadata_response_404",
+    "GetPageMetadataResponse404Data": ".get_page_metadata_response_404_data",
+    "GetPageMetadataResponse404DataCode": ".get_page_metadata_response_404_data_code",
+    "GetPageMetadataResponse404DataMessage": ".get_page_metadata_response_404_data_message",
+    "GetPageMetadataResponse404Status": ".get_page_metadata_response_404_status",
+    "GetPagesOrder": ".get_pages_order",
+    "GetPagesResponse200": ".get_pages_response_200",
+    "GetPagesResponse200Data": ".get_pages_response_200_data",
+    "GetPagesResponse200DataPages": ".get_pages_response_200_data_pages",
+    "GetPagesResponse200DataPagesDataItem": ".get_pages_response_200_data_pages_data_item",
+    "GetPagesResponse200DataPagesDataItemCrawlStatus": ".get_pages_response_200_data_pages_data_item_crawl_status",
+    "GetPagesResponse200DataPagesDataItemIndexStatus": ".get_pages_response_200_data_pages_data_item_index_status",
+    "GetPagesResponse200DataProject": ".get_pages_response_200_data_project",
+    "GetPagesResponse200DataProjectType": ".get_pages_response_200_data_project_type",
+    "GetPagesResponse200Status": ".get_pages_response_200_status",
+    "GetPagesResponse400": ".get_pages_response_400",
+    "GetPagesResponse400Data": ".get_pages_response_400_data",
+    "GetPagesResponse400DataCode": ".get_pages_response_400_data_code",
+    "GetPagesResponse400Status": ".get_pages_response_400_status",
+    "GetPagesResponse401": ".get_pages_response_401",
+    "GetPagesResponse401Data": ".get_pages_response_401_data",
+    "GetPagesResponse401DataCode": ".get_pages_response_401_data_code",
+    "GetPagesResponse401Status": ".get_pages_response_401_status",
+    "GetPagesResponse404": ".get_pages_response_404",
+    "GetPagesResponse404Data": ".get_pages_response_404_data",
+    "GetPagesResponse404DataCode": ".get_pages_response_404_data_code",
+    "GetPagesResponse404DataMessage": ".get_pages_response_404_data_message",
+    "GetPagesResponse404Status": ".get_pages_response_404_status",
+    "GetPagesResponse500": ".get_pages_response_500",
+    "GetPagesResponse500Data": ".get_pages_response_500_data",
+    "GetPagesResponse500DataCode": ".get_pages_response_500_data_code",
+    "GetPagesResponse500Status": ".get_pages_response_500_status",
+    "GetPluginResponse200": ".get_plugin_response_200",
+    "GetPluginResponse200Data": ".get_plugin_response_200_data",
+    "GetPluginResponse200Status": ".get_plugin_response_200_status",
+    "GetPluginResponse400": ".get_plugin_response_400",
+    "GetPluginResponse400Data": ".get_plugin_response_400_data",
+    "GetPluginResponse400DataCode": ".get_plugin_response_400_data_code",
+    "GetPluginResponse400Status": ".get_plugin_response_400_status",
+    "GetPluginResponse401": ".get_plugin_response_401",
+    "GetPluginResponse401Data": ".get_plugin_response_401_data",
+    "GetPluginResponse401DataCode": ".get_plugin_response_401_data_code",
+    "GetPluginResponse401Status": ".get_plugin_response_401_status",
+    "GetPluginResponse404": ".get_plugin_response_404",
+    "GetPluginResponse404Data": ".get_plugin_response_404_data",
+    "GetPluginResponse404DataCode": ".get_plugin_response_404_data_code",
+    "GetPluginResponse404DataMessage": ".get_plugin_response_404_data_message",
+    "GetPluginResponse404Status": ".get_plugin_response_404_status",
+    "GetPluginResponse500": ".get_plugin_response_500",
+    "GetPluginResponse500Data": ".get_plugin_response_500_data",
+    "GetPluginResponse500DataCode": ".get_plugin_response_500_data_code",
+    "GetPluginResponse500Status": ".get_plugin_response_500_status",
+    "GetProjectResponse200": ".get_project_response_200",
+    "GetProjectResponse200Data": ".get_project_response_200_data",
+    "GetProjectResponse200DataType": ".get_project_response_200_data_type",
+    "GetProjectResponse200Status": ".get_project_response_200_status",
+    "GetProjectResponse400": ".get_project_response_400",
+    "GetProjectResponse400Data": ".get_project_response_400_data",
+    "GetProjectResponse400DataCode": ".get_project_response_400_data_code",
+    "GetProjectResponse400Status": ".get_project_response_400_status",
+    "GetProjectResponse401": ".get_project_response_401",
+    "GetProjectResponse401Data": ".get_project_response_401_data",
+    "GetProjectResponse401DataCode": ".get_project_response_401_data_code",
+    "GetProjectResponse401Status": ".get_project_response_401_status",
+    "GetProjectResponse404": ".get_project_response_404",
+    "GetProjectResponse404Data": ".get_project_response_404_data",
+    "GetProjectResponse404DataCode": ".get_project_response_404_data_code",
+    "GetProjectResponse404DataMessage": ".get_project_response_404_data_message",
+    "GetProjectResponse404Status": ".get_project_response_404_status",
+    "GetProjectResponse500": ".get_project_response_500",
+    "GetProjectResponse500Data": ".get_project_response_500_data",
+    "GetProjectResponse500DataCode": ".get_project_response_500_data_code",
+    "GetProjectResponse500Status": ".get_project_response_500_status",
+    "GetSettingsResponse200": ".get_settings_response_200",
+    "GetSettingsResponse200Data": ".get_settings_response_200_data",
+    "GetSettingsResponse200DataCitationsViewType": ".get_settings_response_200_data_citations_view_type",
+    "GetSettingsResponse200Status": ".get_settings_response_200_status",
+    "GetSettingsResponse400": ".get_settings_response_400",
+    "GetSettingsResponse400Data": ".get_settings_response_400_data",
+    "GetSettingsResponse400DataCode": ".get_settings_response_400_data_code",
+    "GetSettingsResponse400Status": ".get_settings_response_400_status",
+    "GetSettingsResponse401": ".get_settings_response_401",
+    "GetSettingsResponse401Data": ".get_settings_response_401_data",
+    "GetSettingsResponse401DataCode": ".get_settings_response_401_data_code",
+    "GetSettingsResponse401Status": ".get_settings_response_401_status",
+    "GetSettingsResponse404": ".get_settings_response_404",
+    "GetSettingsResponse404Data": ".get_settings_response_404_data",
+    "GetSettingsResponse404DataCode": ".get_settings_response_404_data_code",
+    "GetSettingsResponse404DataMessage": ".get_settings_response_404_data_message",
+    "GetSettingsResponse404Status": ".get_settings_response_404_status",
+    "GetSettingsResponse500": ".get_settings_response_500",
+    "GetSettingsResponse500Data": ".get_settings_response_500_data",
+    "GetSettingsResponse500DataCode": ".get_settings_response_500_data_code",
+    "GetSettingsResponse500Status": ".get_settings_response_500_status",
+    "GetUserResponse200": ".get_user_response_200",
+    "GetUserResponse200Data": ".get_user_response_200_data",
+    "GetUserResponse200Status": ".get_user_response_200_status",
+    "GetUserResponse401": ".get_user_response_401",
+    "GetUserResponse401Data": ".get_user_response_401_data",
+    "GetUserResponse401DataCode": ".get_user_response_401_data_code",
+    "GetUserResponse401Status": ".get_user_response_401_status",
+    "GetUserResponse500": ".get_user_response_500",
+    "GetUserResponse500Data": ".get_user_response_500_data",
+    "GetUserResponse500DataCode": ".get_user_response_500_data_code",
+    "GetUserResponse500Status": ".get_user_response_500_status",
+    "ListProjectsOrder": ".list_projects_order",
+    "ListProjectsResponse200": ".list_projects_response_200",
+    "ListProjectsResponse200Data": ".list_projects_response_200_data",
+    "ListProjectsResponse200DataDataItem": ".list_projects_response_200_data_data_item",
+    "ListProjectsResponse200DataDataItemType": ".list_projects_response_200_data_data_item_type",
+    "ListProjectsResponse200Status": ".list_projects_response_200_status",
+    "ListProjectsResponse401": ".list_projects_response_401",
+    "ListProjectsResponse401Data": ".list_projects_response_401_data",
+    "ListProjectsResponse401DataCode": ".list_projects_response_401_data_code",
+    "ListProjectsResponse401Status": ".list_projects_response_401_status",
+    "ListProjectsResponse500": ".list_projects_response_500",
+    "ListProjectsResponse500Data": ".list_projects_response_500_data",
+    "ListProjectsResponse500DataCode": ".list_projects_response_500_data_code",
+    "ListProjectsResponse500Status": ".list_projects_response_500_status",
+    "ListSourcesResponse200": ".list_sources_response_200",
+    "ListSourcesResponse200Data": ".list_sources_response_200_data",
+    "ListSourcesResponse200DataSitemapsItem": ".list_sources_response_200_data_sitemaps_item",
+    "ListSourcesResponse200DataSitemapsItemPagesItem": ".list_sources_response_200_data_sitemaps_item_pages_item",
+    "ListSourcesResponse200DataSitemapsItemPagesItemCrawlStatus": ".list_sources_response_200_data_sitemaps_item_pages_item_crawl_status",
+    "ListSourcesResponse200DataSitemapsItemPagesItemIndexStatus": ".list_sources_response_200_data_sitemaps_item_pages_item_index_status",
+    "ListSourcesResponse200DataSitemapsItemSettings": ".list_sources_response_200_data_sitemaps_item_settings",
+    "ListSourcesResponse200DataSitemapsItemType": ".list_sources_response_200_data_sitemaps_item_type",
+    "ListSourcesResponse200DataUploads": ".list_sources_response_200_data_uploads",
+    "ListSourcesResponse200DataUploadsPagesItem": ".list_sources_response_200_data_uploads_pages_item",
+    "ListSourcesResponse200DataUploadsPagesItemCrawlStatus": ".list_sources_response_200_data_uploads_pages_item_crawl_status",
+    "ListSourcesResponse200DataUploadsPagesItemIndexStatus": ".list_sources_response_200_data_uploads_pages_item_index_status",
+    "ListSourcesResponse200DataUploadsSettings": ".list_sources_response_200_data_uploads_settings",
+    "ListSourcesResponse200DataUploadsType": ".list_sources_response_200_data_uploads_type",
+    "ListSourcesResponse200Status": ".list_sources_response_200_status",
+    "ListSourcesResponse400": ".list_sources_response_400",
+    "ListSourcesResponse400Data": ".list_sources_response_400_data",
+    "ListSourcesResponse400DataCode": ".list_sources_response_400_data_code",
+    "ListSourcesResponse400Status": ".list_sources_response_400_status",
+    "ListSourcesResponse401": ".list_sources_response_401",
+    "ListSourcesResponse401Data": ".list_sources_response_401_data",
+    "ListSourcesResponse401DataCode": ".list_sources_response_401_data_code",
+    "ListSourcesResponse401Status": ".list_sources_response_401_status",
+    "ListSourcesResponse404": ".list_sources_response_404",
+    "ListSourcesResponse404Data": ".list_sources_response_404_data",
+    "ListSourcesResponse404DataCode": ".list_sources_response_404_data_code",
+    "ListSourcesResponse404DataMessage": ".list_sources_response_404_data_message",
+    "ListSourcesResponse404Status": ".list_sources_response_404_status",
+    "ListSourcesResponse500": ".list_sources_response_500",
+    "ListSourcesResponse500Data": ".list_sources_response_500_data",
+    "ListSourcesResponse500DataCode": ".list_sources_response_500_data_code",
+    "ListSourcesResponse500Status": ".list_sources_response_500_status",
+    "MessagesConversationOrder": ".messages_conversation_order",
+    "MessagesConversationResponse200": ".messages_conversation_response_200",
+    "MessagesConversationResponse200Data": ".messages_conversation_response_200_data",
+    "MessagesConversationResponse200DataConversation": ".messages_conversation_response_200_data_conversation",
+    "MessagesConversationResponse200DataMessages": ".messages_conversation_response_200_data_messages",
+    "MessagesConversationResponse200DataMessagesDataItem": ".messages_conversation_response_200_data_messages_data_item",
+    "MessagesConversationResponse200DataMessagesDataItemMetadata": ".messages_conversation_response_200_data_messages_data_item_metadata",
+    "MessagesConversationResponse200Status": ".messages_conversation_response_200_status",
+    "MessagesConversationResponse400": ".messages_conversation_response_400",
+    "MessagesConversationResponse400Data": ".messages_conversation_response_400_data",
+    "MessagesConversationResponse400DataCode": ".messages_conversation_response_400_data_code",
+    "MessagesConversationResponse400Status": ".messages_conversation_response_400_status",
+    "MessagesConversationResponse401": ".messages_conversation_response_401",
+    "MessagesConversationResponse401Data": ".messages_conversation_response_401_data",
+    "MessagesConversationResponse401DataCode": ".messages_conversation_response_401_data_code",
+    "MessagesConversationResponse401Status": ".messages_conversation_response_401_status",
+    "MessagesConversationResponse404": ".messages_conversation_response_404",
+    "MessagesConversationResponse404Data": ".messages_conversation_response_404_data",
+    "MessagesConversationResponse404DataCode": ".messages_conversation_response_404_data_code",
+    "MessagesConversationResponse404DataMessage": ".messages_conversation_response_404_data_message",
+    "MessagesConversationResponse404Status": ".messages_conversation_response_404_status",
+    "MessagesConversationResponse500": ".messages_conversation_response_500",
+    "MessagesConversationResponse500Data": ".messages_conversation_response_500_data",
+    "MessagesConversationResponse500DataCode": ".messages_conversation_response_500_data_code",
+    "MessagesConversationResponse500Status": ".messages_conversation_response_500_status",
+    "OpenGraphCache": ".open_graph_cache",
+    "Page": ".page",
+    "PageCrawlStatus": ".page_crawl_status",
+    "PageIndexStatus": ".page_index_status",
+    "PageMetadata": ".page_metadata",
+    "PreviewCitationResponse400": ".preview_citation_response_400",
+    "PreviewCitationResponse400Data": ".preview_citation_response_400_data",
+    "PreviewCitationResponse400DataCode": ".preview_citation_response_400_data_code",
+    "PreviewCitationResponse400Status": ".preview_citation_response_400_status",
+    "PreviewCitationResponse401": ".preview_citation_response_401",
+    "PreviewCitationResponse401Data": ".preview_citation_response_401_data",
+    "PreviewCitationResponse401DataCode": ".preview_citation_response_401_data_code",
+    "PreviewCitationResponse401Status": ".preview_citation_response_401_status",
+    "PreviewCitationResponse404": ".preview_citation_response_404",
+    "PreviewCitationResponse404Data": ".preview_citation_response_404_data",
+    "PreviewCitationResponse404DataCode": ".preview_citation_response_404_data_code",
+    "PreviewCitationResponse404DataMessage": ".preview_citation_response_404_data_message",
+    "PreviewCitationResponse404Status": ".preview_citation_response_404_status",
+    "PreviewCitationResponse500": ".preview_citation_response_500",
+    "PreviewCitationResponse500Data": ".preview_citation_response_500_data",
+    "PreviewCitationResponse500DataCode": ".preview_citation_response_500_data_code",
+    "PreviewCitationResponse500Status": ".preview_citation_response_500_status",
+    "Project": ".project",
+    "ProjectPlugin": ".project_plugin",
+    "ProjectSettings": ".project_settings",
+    "ProjectSettingsCitationsViewType": ".project_settings_citations_view_type",
+    "ProjectSettingsResponseSource": ".project_settings_response_source",
+    "ProjectSource": ".project_source",
+    "ProjectSourceSettings": ".project_source_settings",
+    "ProjectSourceType": ".project_source_type",
+    "ProjectType": ".project_type",
+    "PromptHistory": ".prompt_history",
+    "PromptHistoryMetadata": ".prompt_history_metadata",
+    "ReindexPageResponse200": ".reindex_page_response_200",
+    "ReindexPageResponse200Data": ".reindex_page_response_200_data",
+    "ReindexPageResponse200Status": ".reindex_page_response_200_status",
+    "ReindexPageResponse400": ".reindex_page_response_400",
+    "ReindexPageResponse400Data": ".reindex_page_response_400_data",
+    "ReindexPageResponse400DataCode": ".reindex_page_response_400_data_code",
+    "ReindexPageResponse400Status": ".reindex_page_response_400_status",
+    "ReindexPageResponse401": ".reindex_page_response_401",
+    "ReindexPageResponse401Data": ".reindex_page_response_401_data",
+    "ReindexPageResponse401DataCode": ".reindex_page_response_401_data_code",
+    "ReindexPageResponse401Status": ".reindex_page_response_401_status",
+    "ReindexPageResponse403": ".reindex_page_response_403",
+    "ReindexPageResponse403Data": ".reindex_page_response_403_data",
+    "ReindexPageResponse403DataCode": ".reindex_page_response_403_data_code",
+    "ReindexPageResponse403DataMessage": ".reindex_page_response_403_data_message",
+    "ReindexPageResponse403Status": ".reindex_page_response_403_status",
+    "ReindexPageResponse500": ".reindex_page_response_500",
+    "ReindexPageResponse500Data": ".reindex_page_response_500_data",
+    "ReindexPageResponse500DataCode": ".reindex_page_response_500_data_code",
+    "ReindexPageResponse500Status": ".reindex_page_response_500_status",
+    "SendMessageJsonBody": ".send_message_json_body",
+    "SendMessageResponse200": ".send_message_response_200",
+    "SendMessageResponse200Data": ".send_message_response_200_data",
+    "SendMessageResponse200DataMetadata": ".send_message_response_200_data_metadata",
+    "SendMessageResponse200Status": ".send_message_response_200_status",
+    "SendMessageResponse400": ".send_message_response_400",
+    "SendMessageResponse400Data": ".send_message_response_400_data",
+    "SendMessageResponse400DataCode": ".send_message_response_400_data_code",
+    "SendMessageResponse400Status": ".send_message_response_400_status",
+    "SendMessageResponse401": ".send_message_response_401",
+    "SendMessageResponse401Data": ".send_message_response_401_data",
+    "SendMessageResponse401DataCode": ".send_message_response_401_data_code",
+    "SendMessageResponse401Status": ".send_message_response_401_status",
+    "SendMessageResponse404": ".send_message_response_404",
+    "SendMessageResponse404Data": ".send_message_response_404_data",
+    "SendMessageResponse404DataCode": ".send_message_response_404_data_code",
+    "SendMessageResponse404DataMessage": ".send_message_response_404_data_message",
+    "SendMessageResponse404Status": ".send_message_response_404_status",
+    "SendMessageResponse500": ".send_message_response_500",
+    "SendMessageResponse500Data": ".send_message_response_500_data",
+    "SendMessageResponse500DataCode": ".send_message_response_500_data_code",
+    "SendMessageResponse500Status": ".send_message_response_500_status",
+    "StatsProjectResponse200": ".stats_project_response_200",
+    "StatsProjectResponse200Data": ".stats_project_response_200_data",
+    "StatsProjectResponse200Status": ".stats_project_response_200_status",
+    "StatsProjectResponse400": ".stats_project_response_400",
+    "StatsProjectResponse400Data": ".stats_project_response_400_data",
+    "StatsProjectResponse400DataCode": ".stats_project_response_400_data_code",
+    "StatsProjectResponse400Status": ".stats_project_response_400_status",
+    "StatsProjectResponse401": ".stats_project_response_401",
+    "StatsProjectResponse401Data": ".stats_project_response_401_data",
+    "StatsProjectResponse401DataCode": ".stats_project_response_401_data_code",
+    "StatsProjectResponse401Status": ".stats_project_response_401_status",
+    "StatsProjectResponse404": ".stats_project_response_404",
+    "StatsProjectResponse404Data": ".stats_project_response_404_data",
+    "StatsProjectResponse404DataCode": ".stats_project_response_404_data_code",
+    "StatsProjectResponse404DataMessage": ".stats_project_response_404_data_message",
+    "StatsProjectResponse404Status": ".stats_project_response_404_status",
+    "StatsProjectResponse500": ".stats_project_response_500",
+    "StatsProjectResponse500Data": ".stats_project_response_500_data",
+    "StatsProjectResponse500DataCode": ".stats_project_response_500_data_code",
+    "StatsProjectResponse500Status": ".stats_project_response_500_status",
+    "UpdateConversationJsonBody": ".update_conversation_json_body",
+    "UpdateConversationResponse200": ".update_conversation_response_200",
+    "UpdateConversationResponse200Data": ".update_conversation_response_200_data",
+    "UpdateConversationResponse200Status": ".update_conversation_response_200_status",
+    "UpdateConversationResponse400": ".update_conversation_response_400",
+    "UpdateConversationResponse400Data": ".update_conversation_response_400_data",
+    "UpdateConversationResponse400DataCode": ".update_conversation_response_400_data_code",
+    "UpdateConversationResponse400Status": ".update_conversation_response_400_status",
+    "UpdateConversationResponse401": ".update_conversation_response_401",
+    "UpdateConversationResponse401Data": ".update_conversation_response_401_data",
+    "UpdateConversationResponse401DataCode": ".update_conversation_response_401_data_code",
+    "UpdateConversationResponse401Status": ".update_conversation_response_401_status",
+    "UpdateConversationResponse404": ".update_conversation_response_404",
+    "UpdateConversationResponse404Data": ".update_conversation_response_404_data",
+    "UpdateConversationResponse404DataCode": ".update_conversation_response_404_data_code",
+    "UpdateConversationResponse404DataMessage": ".update_conversation_response_404_data_message",
+    "UpdateConversationResponse404Status": ".update_conversation_response_404_status",
+    "UpdateConversationResponse500": ".update_conversation_response_500",
+    "UpdateConversationResponse500Data": ".update_conversation_response_500_data",
+    "UpdateConversationResponse500DataCode": ".update_conversation_response_500_data_code",
+    "UpdateConversationResponse500Status": ".update_conversation_response_500_status",
+    "UpdatePageMetadataJsonBody": ".update_page_metadata_json_body",
+    "UpdatePageMetadataResponse200": ".update_page_metadata_response_200",
+    "UpdatePageMetadataResponse200Data": ".update_page_metadata_response_200_data",
+    "UpdatePageMetadataResponse200Status": ".update_page_metadata_response_200_status",
+    "UpdatePageMetadataResponse400": ".update_page_metadata_response_400",
+    "UpdatePageMetadataResponse400Data": ".update_page_metadata_response_400_data",
+    "UpdatePageMetadataResponse400DataCode": ".update_page_metadata_response_400_data_code",
+    "UpdatePageMetadataResponse400Status": ".update_page_metadata_response_400_status",
+    "UpdatePageMetadataResponse401": ".update_page_metadata_response_401",
+    "UpdatePageMetadataResponse401Data": ".update_page_metadata_response_401_data",
+    "UpdatePageMetadataResponse401DataCode": ".update_page_metadata_response_401_data_code",
+    "UpdatePageMetadataResponse401Status": ".update_page_metadata_response_401_status",
+    "UpdatePageMetadataResponse404": ".update_page_metadata_response_404",
+    "UpdatePageMetadataResponse404Data": ".update_page_metadata_response_404_data",
+    "UpdatePageMetadataResponse404DataCode": ".update_page_metadata_response_404_data_code",
+    "UpdatePageMetadataResponse404DataMessage": ".update_page_metadata_response_404_data_message",
+    "UpdatePageMetadataResponse404Status": ".update_page_metadata_response_404_status",
+    "UpdatePageMetadataResponse500": ".update_page_metadata_response_500",
+    "UpdatePageMetadataResponse500Data": ".update_page_metadata_response_500_data",
+    "UpdatePageMetadataResponse500DataCode": ".update_page_metadata_response_500_data_code",
+    "UpdatePageMetadataResponse500Status": ".update_page_metadata_response_500_status",
+    "UpdatePluginJsonBody": ".update_plugin_json_body",
+    "UpdatePluginResponse200": ".update_plugin_response_200",
+    "UpdatePluginResponse200Data": ".update_plugin_response_200_data",
+    "UpdatePluginResponse200Status": ".update_plugin_response_200_status",
+    "UpdatePluginResponse400": ".update_plugin_response_400",
+    "UpdatePluginResponse400Data": ".update_plugin_response_400_data",
+    "UpdatePluginResponse400DataCode": ".update_plugin_response_400_data_code",
+    "UpdatePluginResponse400Status": ".update_plugin_response_400_status",
+    "UpdatePluginResponse401": ".update_plugin_response_401",
+    "UpdatePluginResponse401Data": ".update_plugin_response_401_data",
+    "UpdatePluginResponse401DataCode": ".update_plugin_response_401_data_code",
+    "UpdatePluginResponse401Status": ".update_plugin_response_401_status",
+    "UpdatePluginResponse404": ".update_plugin_response_404",
+    "UpdatePluginResponse404Data": ".update_plugin_response_404_data",
+    "UpdatePluginResponse404DataCode": ".update_plugin_response_404_data_code",
+    "UpdatePluginResponse404DataMessage": ".update_plugin_response_404_data_message",
+    "UpdatePluginResponse404Status": ".update_plugin_response_404_status",
+    "UpdatePluginResponse500": ".update_plugin_response_500",
+    "UpdatePluginResponse500Data": ".update_plugin_response_500_data",
+    "UpdatePluginResponse500DataCode": ".update_plugin_response_500_data_code",
+    "UpdatePluginResponse500Status": ".update_plugin_response_500_status",
+    "UpdateProjectMultipartData": ".update_project_multipart_data",
+    "UpdateProjectResponse200": ".update_project_response_200",
+    "UpdateProjectResponse200Data": ".update_project_response_200_data",
+    "UpdateProjectResponse200DataType": ".update_project_response_200_data_type",
+    "UpdateProjectResponse200Status": ".update_project_response_200_status",
+    "UpdateProjectResponse400": ".update_project_response_400",
+    "UpdateProjectResponse400Data": ".update_project_response_400_data",
+    "UpdateProjectResponse400DataCode": ".update_project_response_400_data_code",
+    "UpdateProjectResponse400Status": ".update_project_response_400_status",
+    "UpdateProjectResponse401": ".update_project_response_401",
+    "UpdateProjectResponse401Data": ".update_project_response_401_data",
+    "UpdateProjectResponse401DataCode": ".update_project_response_401_data_code",
+    "UpdateProjectResponse401Status": ".update_project_response_401_status",
+    "UpdateProjectResponse404": ".update_project_response_404",
+    "UpdateProjectResponse404Data": ".update_project_response_404_data",
+    "UpdateProjectResponse404DataCode": ".update_project_response_404_data_code",
+    "UpdateProjectResponse404DataMessage": ".update_project_response_404_data_message",
+    "UpdateProjectResponse404Status": ".update_project_response_404_status",
+    "UpdateProjectResponse500": ".update_project_response_500",
+    "UpdateProjectResponse500Data": ".update_project_response_500_data",
+    "UpdateProjectResponse500DataCode": ".update_project_response_500_data_code",
+    "UpdateProjectResponse500Status": ".update_project_response_500_status",
+    "UpdateSettingsMultipartData": ".update_settings_multipart_data",
+    "UpdateSettingsMultipartDataCitationsViewType": ".update_settings_multipart_data_citations_view_type",
+    "UpdateSettingsResponse200": ".update_settings_response_200",
+    "UpdateSettingsResponse200Data": ".update_settings_response_200_data",
+    "UpdateSettingsResponse200Status": ".update_settings_response_200_status",
+    "UpdateSettingsResponse400": ".update_settings_response_400",
+    "UpdateSettingsResponse400Data": ".update_settings_response_400_data",
+    "UpdateSettingsResponse400DataCode": ".update_settings_response_400_data_code",
+    "UpdateSettingsResponse400DataMessage": ".update_settings_response_400_data_message",
+    "UpdateSettingsResponse400Status": ".update_settings_response_400_status",
+    "UpdateSettingsResponse401": ".update_settings_response_401",
+    "UpdateSettingsResponse401Data": ".update_settings_response_401_data",
+    "UpdateSettingsResponse401DataCode": ".update_settings_response_401_data_code",
+    "UpdateSettingsResponse401Status": ".update_settings_response_401_status",
+    "UpdateSettingsResponse500": ".update_settings_response_500",
+    "UpdateSettingsResponse500Data": ".update_settings_response_500_data",
+    "UpdateSettingsResponse500DataCode": ".update_settings_response_500_data_code",
+    "UpdateSettingsResponse500Status": ".update_settings_response_500_status",
+    "UpdateUserMultipartData": ".update_user_multipart_data",
+    "UpdateUserResponse200": ".update_user_response_200",
+    "UpdateUserResponse200Data": ".update_user_response_200_data",
+    "UpdateUserResponse200Status": ".update_user_response_200_status",
+    "UpdateUserResponse401": ".update_user_response_401",
+    "UpdateUserResponse401Data": ".update_user_response_401_data",
+    "UpdateUserResponse401DataCode": ".update_user_response_401_data_code",
+    "UpdateUserResponse401Status": ".update_user_response_401_status",
+    "UpdateUserResponse500": ".update_user_response_500",
+    "UpdateUserResponse500Data": ".update_user_response_500_data",
+    "UpdateUserResponse500DataCode": ".update_user_response_500_data_code",
+    "UpdateUserResponse500Status": ".update_user_response_500_status",
+    "User": ".user",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _MODULES)
 
 __all__ = (
     "Conversation",
@@ -2,15 +2,26 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..decoding import LazyModel, parse_datetime, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="CreateConversationResponse201Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "deleted_at": "deleted_at",
+    "id": "id",
+    "name": "name",
+    "project_id": "project_id",
+    "created_by": "created_by",
+    "session_id": "session_id",
+}
 
-@attr.s(auto_attribs=True)
-class CreateConversationResponse201Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class CreateConversationResponse201Data(LazyModel):
     """
     Attributes:
         created_at (Union[Unset, datetime.datetime]): When was this conversation created? Example: 2023-04-30 16:43:53.
@@ -82,14 +93,14 @@ class CreateConversationResponse201Data:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _updated_at = src_dict.get("updated_at")
         updated_at: Union[Unset, datetime.datetime]
         if isinstance(_updated_at, Unset):
             updated_at = UNSET
         else:
-            updated_at = isoparse(_updated_at)
+            updated_at = parse_datetime(_updated_at)
 
         _deleted_at = src_dict.get("deleted_at")
         deleted_at: Union[Unset, None, datetime.datetime]
@@ -98,7 +109,7 @@ class CreateConversationResponse201Data:
         elif isinstance(_deleted_at, Unset):
             deleted_at = UNSET
         else:
-            deleted_at = isoparse(_deleted_at)
+            deleted_at = parse_datetime(_deleted_at)
 
         id = src_dict.get("id")
 
@@ -121,7 +132,7 @@ class CreateConversationResponse201Data:
             session_id=session_id,
         )
 
-        create_conversation_response_201_data.additional_properties = src_dict
+        create_conversation_response_201_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return create_conversation_response_201_data
 
     @property
@@ -129,6 +140,10 @@ class CreateConversationResponse201Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -138,4 +153,6 @@ class CreateConversationResponse201Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -10,9 +11,15 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="CreateConversationResponse401")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "status": "status",
+    "url": "url",
+    "data": "data",
+}
 
-@attr.s(auto_attribs=True)
-class CreateConversationResponse401:
+
+@attr.s(auto_attribs=True, slots=True)
+class CreateConversationResponse401(LazyModel):
     """
     Attributes:
         status (Union[Unset, CreateConversationResponse401Status]): The status of the response Example: error.
@@ -68,7 +75,7 @@ class CreateConversationResponse401:
             data=data,
         )
 
-        create_conversation_response_401.additional_properties = src_dict
+        create_conversation_response_401.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return create_conversation_response_401
 
     @property
@@ -76,6 +83,10 @@ class CreateConversationResponse401:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -85,4 +96,6 @@ class CreateConversationResponse401:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -3,13 +3,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, File, FileJsonType, Unset
 
 T = TypeVar("T", bound="CreateProjectMultipartData")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "project_name": "project_name",
+    "sitemap_path": "sitemap_path",
+    "file_data_retension": "file_data_retension",
+    "file": "file",
+}
 
-@attr.s(auto_attribs=True)
-class CreateProjectMultipartData:
+
+@attr.s(auto_attribs=True, slots=True)
+class CreateProjectMultipartData(LazyModel):
     """
     Attributes:
         project_name (Union[Unset, str]): Project name Example: My project.
@@ -104,7 +112,7 @@ class CreateProjectMultipartData:
             file=file,
         )
 
-        create_project_multipart_data.additional_properties = src_dict
+        create_project_multipart_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return create_project_multipart_data
 
     @property
@@ -112,6 +120,10 @@ class CreateProjectMultipartData:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -121,4 +133,6 @@ class CreateProjectMultipartData:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
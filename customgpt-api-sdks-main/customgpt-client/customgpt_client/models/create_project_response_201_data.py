@@ -4,13 +4,31 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 import attr
 from dateutil.parser import isoparse
 
+from ..decoding import LazyModel, parse_datetime, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="CreateProjectResponse201Data")
 
-
-@attr.s(auto_attribs=True)
-class CreateProjectResponse201Data:
+_FIELD_NAMES: Dict[str, str] = {
+    "id": "id",
+    "project_name": "project_name",
+    "sitemap_path": "sitemap_path",
+    "is_chat_active": "is_chat_active",
+    "user_id": "user_id",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "deleted_at": "deleted_at",
+    "type": "type",
+    "is_shared": "is_shared",
+    "shareable_slug": "shareable_slug",
+    "shareable_link": "shareable_link",
+    "embed_code": "embed_code",
+    "live_chat_code": "live_chat_code",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class CreateProjectResponse201Data(LazyModel):
     """
     Attributes:
         id (Union[Unset, int]): Project ID Example: 1.
@@ -129,14 +147,14 @@ class CreateProjectResponse201Data:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _updated_at = src_dict.get("updated_at")
         updated_at: Union[Unset, datetime.datetime]
         if isinstance(_updated_at, Unset):
             updated_at = UNSET
         else:
-            updated_at = isoparse(_updated_at)
+            updated_at = parse_datetime(_updated_at)
 
         _deleted_at = src_dict.get("deleted_at")
         deleted_at: Union[Unset, None, datetime.datetime]
@@ -145,7 +163,7 @@ class CreateProjectResponse201Data:
         elif isinstance(_deleted_at, Unset):
             deleted_at = UNSET
         else:
-            deleted_at = isoparse(_deleted_at)
+            deleted_at = parse_datetime(_deleted_at)
 
         type = src_dict.get("type")
 
@@ -176,7 +194,7 @@ class CreateProjectResponse201Data:
             live_chat_code=live_chat_code,
         )
 
-        create_project_response_201_data.additional_properties = src_dict
+        create_project_response_201_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return create_project_response_201_data
 
     @property
@@ -184,6 +202,10 @@ class CreateProjectResponse201Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -193,4 +215,6 @@ class CreateProjectResponse201Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
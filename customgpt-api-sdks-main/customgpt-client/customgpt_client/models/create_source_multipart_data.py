@@ -3,13 +3,20 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, File, FileJsonType, Unset
 
 T = TypeVar("T", bound="CreateSourceMultipartData")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "sitemap_path": "sitemap_path",
+    "file_data_retension": "file_data_retension",
+    "file": "file",
+}
 
-@attr.s(auto_attribs=True)
-class CreateSourceMultipartData:
+
+@attr.s(auto_attribs=True, slots=True)
+class CreateSourceMultipartData(LazyModel):
     """
     Attributes:
         sitemap_path (Union[Unset, str]): The sitemap path Example: https://example.com/sitemap.xml.
@@ -89,7 +96,7 @@ class CreateSourceMultipartData:
             file=file,
         )
 
-        create_source_multipart_data.additional_properties = src_dict
+        create_source_multipart_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return create_source_multipart_data
 
     @property
@@ -97,6 +104,10 @@ class CreateSourceMultipartData:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -106,4 +117,6 @@ class CreateSourceMultipartData:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
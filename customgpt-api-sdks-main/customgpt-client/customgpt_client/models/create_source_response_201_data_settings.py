@@ -2,13 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="CreateSourceResponse201DataSettings")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "data_refresh": "data_refresh",
+    "executive_js": "executive_js",
+    "data_refresh_frequency": "data_refresh_frequency",
+    "sitemap_path": "sitemap_path",
+}
 
-@attr.s(auto_attribs=True)
-class CreateSourceResponse201DataSettings:
+
+@attr.s(auto_attribs=True, slots=True)
+class CreateSourceResponse201DataSettings(LazyModel):
     """The project source settings
 
     Attributes:
@@ -63,7 +71,7 @@ class CreateSourceResponse201DataSettings:
             sitemap_path=sitemap_path,
         )
 
-        create_source_response_201_data_settings.additional_properties = src_dict
+        create_source_response_201_data_settings.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return create_source_response_201_data_settings
 
     @property
@@ -71,6 +79,10 @@ class CreateSourceResponse201DataSettings:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -80,4 +92,6 @@ class CreateSourceResponse201DataSettings:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
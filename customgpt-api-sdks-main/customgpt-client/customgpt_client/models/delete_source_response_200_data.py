@@ -2,13 +2,18 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="DeleteSourceResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "deleted": "deleted",
+}
 
-@attr.s(auto_attribs=True)
-class DeleteSourceResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class DeleteSourceResponse200Data(LazyModel):
     """
     Attributes:
         deleted (Union[Unset, bool]): Whether the project source was deleted successfully or not Example: True.
@@ -36,7 +41,7 @@ class DeleteSourceResponse200Data:
             deleted=deleted,
         )
 
-        delete_source_response_200_data.additional_properties = src_dict
+        delete_source_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return delete_source_response_200_data
 
     @property
@@ -44,6 +49,10 @@ class DeleteSourceResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -53,4 +62,6 @@ class DeleteSourceResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
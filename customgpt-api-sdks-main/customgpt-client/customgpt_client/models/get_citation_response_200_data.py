@@ -2,13 +2,26 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="GetCitationResponse200Data")
 
-
-@attr.s(auto_attribs=True)
-class GetCitationResponse200Data:
+_FIELD_NAMES: Dict[str, str] = {
+    "page_url": "page_url",
+    "title": "title",
+    "description": "description",
+    "image": "image",
+    "image_width": "image_width",
+    "image_height": "image_height",
+    "url": "url",
+    "favicon": "favicon",
+    "site_name": "site_name",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class GetCitationResponse200Data(LazyModel):
     """
     Attributes:
         page_url (Union[Unset, str]): The URL of the page Example: https://www.example.com.
@@ -102,7 +115,7 @@ class GetCitationResponse200Data:
             site_name=site_name,
         )
 
-        get_citation_response_200_data.additional_properties = src_dict
+        get_citation_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return get_citation_response_200_data
 
     @property
@@ -110,6 +123,10 @@ class GetCitationResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -119,4 +136,6 @@ class GetCitationResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -11,9 +12,14 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="GetPagesResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "project": "project",
+    "pages": "pages",
+}
 
-@attr.s(auto_attribs=True)
-class GetPagesResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class GetPagesResponse200Data(LazyModel):
     """
     Attributes:
         project (Union[Unset, GetPagesResponse200DataProject]):
@@ -67,7 +73,7 @@ class GetPagesResponse200Data:
             pages=pages,
         )
 
-        get_pages_response_200_data.additional_properties = src_dict
+        get_pages_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return get_pages_response_200_data
 
     @property
@@ -75,6 +81,10 @@ class GetPagesResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -84,4 +94,6 @@ class GetPagesResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
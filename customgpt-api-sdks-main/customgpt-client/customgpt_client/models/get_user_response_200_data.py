@@ -2,15 +2,24 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..decoding import LazyModel, parse_datetime, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="GetUserResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "created_at": "created_at",
+    "email": "email",
+    "id": "id",
+    "name": "name",
+    "profile_photo_url": "profile_photo_url",
+    "updated_at": "updated_at",
+}
 
-@attr.s(auto_attribs=True)
-class GetUserResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class GetUserResponse200Data(LazyModel):
     """
     Attributes:
         created_at (Union[Unset, datetime.datetime]): When was this user created? Example: 2023-04-30 16:43:53.
@@ -68,7 +77,7 @@ class GetUserResponse200Data:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         email = src_dict.get("email")
 
@@ -83,7 +92,7 @@ class GetUserResponse200Data:
         if isinstance(_updated_at, Unset):
             updated_at = UNSET
         else:
-            updated_at = isoparse(_updated_at)
+            updated_at = parse_datetime(_updated_at)
 
         get_user_response_200_data = cls(
             created_at=created_at,
@@ -94,7 +103,7 @@ class GetUserResponse200Data:
             updated_at=updated_at,
         )
 
-        get_user_response_200_data.additional_properties = src_dict
+        get_user_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return get_user_response_200_data
 
     @property
@@ -102,6 +111,10 @@ class GetUserResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -111,4 +124,6 @@ class GetUserResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,19 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="GetUserResponse500Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "code": "code",
+    "message": "message",
+}
 
-@attr.s(auto_attribs=True)
-class GetUserResponse500Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class GetUserResponse500Data(LazyModel):
     """
     Attributes:
         code (Union[Unset, GetUserResponse500DataCode]): The error status code Example: 500.
@@ -47,7 +53,7 @@ class GetUserResponse500Data:
             message=message,
         )
 
-        get_user_response_500_data.additional_properties = src_dict
+        get_user_response_500_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return get_user_response_500_data
 
     @property
@@ -55,6 +61,10 @@ class GetUserResponse500Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -64,4 +74,6 @@ class GetUserResponse500Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -10,9 +11,24 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ListProjectsResponse200Data")
 
-
-@attr.s(auto_attribs=True)
-class ListProjectsResponse200Data:
+_FIELD_NAMES: Dict[str, str] = {
+    "current_page": "current_page",
+    "data": "data",
+    "first_page_url": "first_page_url",
+    "from": "from_",
+    "last_page": "last_page",
+    "last_page_url": "last_page_url",
+    "next_page_url": "next_page_url",
+    "path": "path",
+    "per_page": "per_page",
+    "prev_page_url": "prev_page_url",
+    "to": "to",
+    "total": "total",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class ListProjectsResponse200Data(LazyModel):
     """
     Attributes:
         current_page (Union[Unset, int]): The current page number Example: 1.
@@ -143,7 +159,7 @@ class ListProjectsResponse200Data:
             total=total,
         )
 
-        list_projects_response_200_data.additional_properties = src_dict
+        list_projects_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return list_projects_response_200_data
 
     @property
@@ -151,6 +167,10 @@ class ListProjectsResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -160,4 +180,6 @@ class ListProjectsResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
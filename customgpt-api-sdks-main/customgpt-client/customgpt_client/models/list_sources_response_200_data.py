@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -11,9 +12,14 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ListSourcesResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "sitemaps": "sitemaps",
+    "uploads": "uploads",
+}
 
-@attr.s(auto_attribs=True)
-class ListSourcesResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class ListSourcesResponse200Data(LazyModel):
     """
     Attributes:
         sitemaps (Union[Unset, List['ListSourcesResponse200DataSitemapsItem']]):
@@ -72,7 +78,7 @@ class ListSourcesResponse200Data:
             uploads=uploads,
         )
 
-        list_sources_response_200_data.additional_properties = src_dict
+        list_sources_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return list_sources_response_200_data
 
     @property
@@ -80,6 +86,10 @@ class ListSourcesResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -89,4 +99,6 @@ class ListSourcesResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,8 +2,8 @@ import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..decoding import LazyModel, parse_datetime, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -17,9 +17,18 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ListSourcesResponse200DataSitemapsItem")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "id": "id",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "type": "type",
+    "settings": "settings",
+    "pages": "pages",
+}
 
-@attr.s(auto_attribs=True)
-class ListSourcesResponse200DataSitemapsItem:
+
+@attr.s(auto_attribs=True, slots=True)
+class ListSourcesResponse200DataSitemapsItem(LazyModel):
     """
     Attributes:
         id (Union[Unset, int]): The project source ID Example: 1.
@@ -102,14 +111,14 @@ class ListSourcesResponse200DataSitemapsItem:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _updated_at = src_dict.get("updated_at")
         updated_at: Union[Unset, datetime.datetime]
         if isinstance(_updated_at, Unset):
             updated_at = UNSET
         else:
-            updated_at = isoparse(_updated_at)
+            updated_at = parse_datetime(_updated_at)
 
         type = src_dict.get("type")
 
@@ -136,7 +145,7 @@ class ListSourcesResponse200DataSitemapsItem:
             pages=pages,
         )
 
-        list_sources_response_200_data_sitemaps_item.additional_properties = src_dict
+        list_sources_response_200_data_sitemaps_item.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return list_sources_response_200_data_sitemaps_item
 
     @property
@@ -144,6 +153,10 @@ class ListSourcesResponse200DataSitemapsItem:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -153,4 +166,6 @@ class ListSourcesResponse200DataSitemapsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
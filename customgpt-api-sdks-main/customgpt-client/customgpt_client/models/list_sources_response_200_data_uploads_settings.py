@@ -2,13 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="ListSourcesResponse200DataUploadsSettings")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "data_refresh": "data_refresh",
+    "executive_js": "executive_js",
+    "data_refresh_frequency": "data_refresh_frequency",
+    "sitemap_path": "sitemap_path",
+}
 
-@attr.s(auto_attribs=True)
-class ListSourcesResponse200DataUploadsSettings:
+
+@attr.s(auto_attribs=True, slots=True)
+class ListSourcesResponse200DataUploadsSettings(LazyModel):
     """The project source settings
 
     Attributes:
@@ -63,7 +71,7 @@ class ListSourcesResponse200DataUploadsSettings:
             sitemap_path=sitemap_path,
         )
 
-        list_sources_response_200_data_uploads_settings.additional_properties = src_dict
+        list_sources_response_200_data_uploads_settings.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return list_sources_response_200_data_uploads_settings
 
     @property
@@ -71,6 +79,10 @@ class ListSourcesResponse200DataUploadsSettings:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -80,4 +92,6 @@ class ListSourcesResponse200DataUploadsSettings:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
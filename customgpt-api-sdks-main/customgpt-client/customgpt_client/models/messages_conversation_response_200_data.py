@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -13,9 +14,14 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="MessagesConversationResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "conversation": "conversation",
+    "messages": "messages",
+}
 
-@attr.s(auto_attribs=True)
-class MessagesConversationResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class MessagesConversationResponse200Data(LazyModel):
     """
     Attributes:
         conversation (Union[Unset, MessagesConversationResponse200DataConversation]):
@@ -73,7 +79,7 @@ class MessagesConversationResponse200Data:
             messages=messages,
         )
 
-        messages_conversation_response_200_data.additional_properties = src_dict
+        messages_conversation_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return messages_conversation_response_200_data
 
     @property
@@ -81,6 +87,10 @@ class MessagesConversationResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -90,4 +100,6 @@ class MessagesConversationResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
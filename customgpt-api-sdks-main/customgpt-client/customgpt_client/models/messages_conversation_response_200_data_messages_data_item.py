@@ -2,8 +2,8 @@ import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union, cast
 
 import attr
-from dateutil.parser import isoparse
 
+from ..decoding import LazyModel, parse_datetime, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -14,9 +14,21 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="MessagesConversationResponse200DataMessagesDataItem")
 
-
-@attr.s(auto_attribs=True)
-class MessagesConversationResponse200DataMessagesDataItem:
+_FIELD_NAMES: Dict[str, str] = {
+    "id": "id",
+    "user_id": "user_id",
+    "user_query": "user_query",
+    "openai_response": "openai_response",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "conversation_id": "conversation_id",
+    "citations": "citations",
+    "metadata": "metadata",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class MessagesConversationResponse200DataMessagesDataItem(LazyModel):
     """
     Attributes:
         id (Union[Unset, int]): The unique identifier of the prompt history. Example: 1.
@@ -112,14 +124,14 @@ class MessagesConversationResponse200DataMessagesDataItem:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _updated_at = src_dict.get("updated_at")
         updated_at: Union[Unset, datetime.datetime]
         if isinstance(_updated_at, Unset):
             updated_at = UNSET
         else:
-            updated_at = isoparse(_updated_at)
+            updated_at = parse_datetime(_updated_at)
 
         conversation_id = src_dict.get("conversation_id")
 
@@ -144,7 +156,7 @@ class MessagesConversationResponse200DataMessagesDataItem:
             metadata=metadata,
         )
 
-        messages_conversation_response_200_data_messages_data_item.additional_properties = src_dict
+        messages_conversation_response_200_data_messages_data_item.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return messages_conversation_response_200_data_messages_data_item
 
     @property
@@ -152,6 +164,10 @@ class MessagesConversationResponse200DataMessagesDataItem:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -161,4 +177,6 @@ class MessagesConversationResponse200DataMessagesDataItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,27 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="OpenGraphCache")
 
-
-@attr.s(auto_attribs=True)
-class OpenGraphCache:
+_FIELD_NAMES: Dict[str, str] = {
+    "id": "id",
+    "title": "title",
+    "page_url": "page_url",
+    "description": "description",
+    "image": "image",
+    "image_width": "image_width",
+    "image_height": "image_height",
+    "url": "url",
+    "favicon": "favicon",
+    "site_name": "site_name",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class OpenGraphCache(LazyModel):
     """
     Attributes:
         id (Union[Unset, int]): The unique identifier of the citation Example: 1.
@@ -110,7 +124,7 @@ class OpenGraphCache:
             site_name=site_name,
         )
 
-        open_graph_cache.additional_properties = src_dict
+        open_graph_cache.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return open_graph_cache
 
     @property
@@ -118,6 +132,10 @@ class OpenGraphCache:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -127,4 +145,6 @@ class OpenGraphCache:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
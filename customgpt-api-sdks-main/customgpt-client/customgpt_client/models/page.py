@@ -2,15 +2,32 @@ import datetime
 from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..decoding import LazyModel, parse_datetime, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="Page")
 
-
-@attr.s(auto_attribs=True)
-class Page:
+_FIELD_NAMES: Dict[str, str] = {
+    "id": "id",
+    "page_url": "page_url",
+    "page_url_hash": "page_url_hash",
+    "project_id": "project_id",
+    "s3_path": "s3_path",
+    "crawl_status": "crawl_status",
+    "index_status": "index_status",
+    "is_file": "is_file",
+    "is_file_kept": "is_file_kept",
+    "filename": "filename",
+    "filesize": "filesize",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "deleted_at": "deleted_at",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class Page(LazyModel):
     r"""
     Attributes:
         id (Union[Unset, int]): Page ID Example: 1.
@@ -148,21 +165,21 @@ class Page:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _updated_at = src_dict.get("updated_at")
         updated_at: Union[Unset, datetime.datetime]
         if isinstance(_updated_at, Unset):
             updated_at = UNSET
         else:
-            updated_at = isoparse(_updated_at)
+            updated_at = parse_datetime(_updated_at)
 
         _deleted_at = src_dict.get("deleted_at")
         deleted_at: Union[Unset, datetime.datetime]
         if isinstance(_deleted_at, Unset):
             deleted_at = UNSET
         else:
-            deleted_at = isoparse(_deleted_at)
+            deleted_at = parse_datetime(_deleted_at)
 
         page = cls(
             id=id,
@@ -181,7 +198,7 @@ class Page:
             deleted_at=deleted_at,
         )
 
-        page.additional_properties = src_dict
+        page.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return page
 
     @property
@@ -189,6 +206,10 @@ class Page:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -198,4 +219,6 @@ class Page:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
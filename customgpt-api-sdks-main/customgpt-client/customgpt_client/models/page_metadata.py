@@ -2,13 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="PageMetadata")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "url": "url",
+    "title": "title",
+    "description": "description",
+    "image": "image",
+}
 
-@attr.s(auto_attribs=True)
-class PageMetadata:
+
+@attr.s(auto_attribs=True, slots=True)
+class PageMetadata(LazyModel):
     """
     Attributes:
         url (Union[Unset, str]): The URL of the page Example: https://www.example.com.
@@ -62,7 +70,7 @@ class PageMetadata:
             image=image,
         )
 
-        page_metadata.additional_properties = src_dict
+        page_metadata.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return page_metadata
 
     @property
@@ -70,6 +78,10 @@ class PageMetadata:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -79,4 +91,6 @@ class PageMetadata:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,35 @@ from typing import Any, Dict, List, Type, TypeVar, Union, cast
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="ProjectSettings")
 
-
-@attr.s(auto_attribs=True)
-class ProjectSettings:
+_FIELD_NAMES: Dict[str, str] = {
+    "chatbot_avatar": "chatbot_avatar",
+    "chatbot_background": "chatbot_background",
+    "default_prompt": "default_prompt",
+    "example_questions": "example_questions",
+    "response_source": "response_source",
+    "chatbot_msg_lang": "chatbot_msg_lang",
+    "chatbot_color": "chatbot_color",
+    "persona_instructions": "persona_instructions",
+    "citations_answer_source_label_msg": "citations_answer_source_label_msg",
+    "citations_sources_label_msg": "citations_sources_label_msg",
+    "hang_in_there_msg": "hang_in_there_msg",
+    "chatbot_siesta_msg": "chatbot_siesta_msg",
+    "is_loading_indicator_enabled": "is_loading_indicator_enabled",
+    "enable_citations": "enable_citations",
+    "citations_view_type": "citations_view_type",
+    "no_answer_message": "no_answer_message",
+    "ending_message": "ending_message",
+    "remove_branding": "remove_branding",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class ProjectSettings(LazyModel):
     """
     Attributes:
         chatbot_avatar (Union[Unset, str]): This is the avatar that is shown in the bot response. You can make it a
@@ -208,7 +230,7 @@ class ProjectSettings:
             remove_branding=remove_branding,
         )
 
-        project_settings.additional_properties = src_dict
+        project_settings.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return project_settings
 
     @property
@@ -216,6 +238,10 @@ class ProjectSettings:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -225,4 +251,6 @@ class ProjectSettings:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,8 +2,8 @@ import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
-from dateutil.parser import isoparse
 
+from ..decoding import LazyModel, parse_datetime, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -13,9 +13,18 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ProjectSource")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "id": "id",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "type": "type",
+    "settings": "settings",
+    "pages": "pages",
+}
 
-@attr.s(auto_attribs=True)
-class ProjectSource:
+
+@attr.s(auto_attribs=True, slots=True)
+class ProjectSource(LazyModel):
     """
     Attributes:
         id (Union[Unset, int]): The project source ID Example: 1.
@@ -94,14 +103,14 @@ class ProjectSource:
         if isinstance(_created_at, Unset):
             created_at = UNSET
         else:
-            created_at = isoparse(_created_at)
+            created_at = parse_datetime(_created_at)
 
         _updated_at = src_dict.get("updated_at")
         updated_at: Union[Unset, datetime.datetime]
         if isinstance(_updated_at, Unset):
             updated_at = UNSET
         else:
-            updated_at = isoparse(_updated_at)
+            updated_at = parse_datetime(_updated_at)
 
         type = src_dict.get("type")
 
@@ -128,7 +137,7 @@ class ProjectSource:
             pages=pages,
         )
 
-        project_source.additional_properties = src_dict
+        project_source.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return project_source
 
     @property
@@ -136,6 +145,10 @@ class ProjectSource:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -145,4 +158,6 @@ class ProjectSource:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
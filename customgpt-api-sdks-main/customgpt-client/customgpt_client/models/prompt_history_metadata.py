@@ -2,13 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="PromptHistoryMetadata")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "user_ip": "user_ip",
+    "user_agent": "user_agent",
+    "external_id": "external_id",
+    "request_source": "request_source",
+}
 
-@attr.s(auto_attribs=True)
-class PromptHistoryMetadata:
+
+@attr.s(auto_attribs=True, slots=True)
+class PromptHistoryMetadata(LazyModel):
     """
     Example:
         {'user_ip': '127.0.0.1', 'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36
@@ -65,7 +73,7 @@ class PromptHistoryMetadata:
             request_source=request_source,
         )
 
-        prompt_history_metadata.additional_properties = src_dict
+        prompt_history_metadata.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return prompt_history_metadata
 
     @property
@@ -73,6 +81,10 @@ class PromptHistoryMetadata:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -82,4 +94,6 @@ class PromptHistoryMetadata:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,18 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="ReindexPageResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "updated": "updated",
+}
 
-@attr.s(auto_attribs=True)
-class ReindexPageResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class ReindexPageResponse200Data(LazyModel):
     """
     Attributes:
         updated (Union[Unset, bool]): Whether the page start reindex process successfully or not Example: True.
@@ -36,7 +41,7 @@ class ReindexPageResponse200Data:
             updated=updated,
         )
 
-        reindex_page_response_200_data.additional_properties = src_dict
+        reindex_page_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return reindex_page_response_200_data
 
     @property
@@ -44,6 +49,10 @@ class ReindexPageResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -53,4 +62,6 @@ class ReindexPageResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,19 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="SendMessageJsonBody")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "prompt": "prompt",
+    "custom_persona": "custom_persona",
+}
 
-@attr.s(auto_attribs=True)
-class SendMessageJsonBody:
+
+@attr.s(auto_attribs=True, slots=True)
+class SendMessageJsonBody(LazyModel):
     """
     Attributes:
         prompt (Union[Unset, str]): Prompt to send to OpenAI Example: Write me hello world program in C.
@@ -47,7 +53,7 @@ class SendMessageJsonBody:
             custom_persona=custom_persona,
         )
 
-        send_message_json_body.additional_properties = src_dict
+        send_message_json_body.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return send_message_json_body
 
     @property
@@ -55,6 +61,10 @@ class SendMessageJsonBody:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -64,4 +74,6 @@ class SendMessageJsonBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
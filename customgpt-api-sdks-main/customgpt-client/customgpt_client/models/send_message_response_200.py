@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 if TYPE_CHECKING:
@@ -10,9 +11,14 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="SendMessageResponse200")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "status": "status",
+    "data": "data",
+}
 
-@attr.s(auto_attribs=True)
-class SendMessageResponse200:
+
+@attr.s(auto_attribs=True, slots=True)
+class SendMessageResponse200(LazyModel):
     """
     Attributes:
         status (Union[Unset, SendMessageResponse200Status]): The status of the response Example: success.
@@ -60,7 +66,7 @@ class SendMessageResponse200:
             data=data,
         )
 
-        send_message_response_200.additional_properties = src_dict
+        send_message_response_200.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return send_message_response_200
 
     @property
@@ -68,6 +74,10 @@ class SendMessageResponse200:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -77,4 +87,6 @@ class SendMessageResponse200:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,23 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="StatsProjectResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "pages_found": "pages_found",
+    "pages_crawled": "pages_crawled",
+    "pages_indexed": "pages_indexed",
+    "crawl_credits_used": "crawl_credits_used",
+    "query_credits_used": "query_credits_used",
+    "index_credits_used": "index_credits_used",
+}
 
-@attr.s(auto_attribs=True)
-class StatsProjectResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class StatsProjectResponse200Data(LazyModel):
     """
     Attributes:
         pages_found (Union[Unset, int]): Number of pages found for the project Example: 100.
@@ -76,7 +86,7 @@ class StatsProjectResponse200Data:
             index_credits_used=index_credits_used,
         )
 
-        stats_project_response_200_data.additional_properties = src_dict
+        stats_project_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return stats_project_response_200_data
 
     @property
@@ -84,6 +94,10 @@ class StatsProjectResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -93,4 +107,6 @@ class StatsProjectResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
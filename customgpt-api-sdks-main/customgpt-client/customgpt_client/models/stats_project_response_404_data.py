@@ -2,13 +2,19 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="StatsProjectResponse404Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "code": "code",
+    "message": "message",
+}
 
-@attr.s(auto_attribs=True)
-class StatsProjectResponse404Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class StatsProjectResponse404Data(LazyModel):
     """
     Attributes:
         code (Union[Unset, StatsProjectResponse404DataCode]): The error status code Example: 404.
@@ -50,7 +56,7 @@ class StatsProjectResponse404Data:
             message=message,
         )
 
-        stats_project_response_404_data.additional_properties = src_dict
+        stats_project_response_404_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return stats_project_response_404_data
 
     @property
@@ -58,6 +64,10 @@ class StatsProjectResponse404Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -67,4 +77,6 @@ class StatsProjectResponse404Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
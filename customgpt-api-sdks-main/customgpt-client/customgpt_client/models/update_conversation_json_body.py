@@ -2,13 +2,18 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="UpdateConversationJsonBody")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "name": "name",
+}
 
-@attr.s(auto_attribs=True)
-class UpdateConversationJsonBody:
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdateConversationJsonBody(LazyModel):
     """
     Attributes:
         name (Union[Unset, str]): The new name of the conversation Example: My new conversation name.
@@ -36,7 +41,7 @@ class UpdateConversationJsonBody:
             name=name,
         )
 
-        update_conversation_json_body.additional_properties = src_dict
+        update_conversation_json_body.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_conversation_json_body
 
     @property
@@ -44,6 +49,10 @@ class UpdateConversationJsonBody:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -53,4 +62,6 @@ class UpdateConversationJsonBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
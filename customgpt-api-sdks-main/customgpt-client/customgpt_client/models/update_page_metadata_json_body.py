@@ -2,13 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="UpdatePageMetadataJsonBody")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "title": "title",
+    "url": "url",
+    "description": "description",
+    "image": "image",
+}
 
-@attr.s(auto_attribs=True)
-class UpdatePageMetadataJsonBody:
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdatePageMetadataJsonBody(LazyModel):
     """
     Attributes:
         title (Union[Unset, None, str]): The title of the page used in citations Example: Title.
@@ -61,7 +69,7 @@ class UpdatePageMetadataJsonBody:
             image=image,
         )
 
-        update_page_metadata_json_body.additional_properties = src_dict
+        update_page_metadata_json_body.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_page_metadata_json_body
 
     @property
@@ -69,6 +77,10 @@ class UpdatePageMetadataJsonBody:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -78,4 +90,6 @@ class UpdatePageMetadataJsonBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,21 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="UpdatePageMetadataResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "url": "url",
+    "title": "title",
+    "description": "description",
+    "image": "image",
+}
 
-@attr.s(auto_attribs=True)
-class UpdatePageMetadataResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdatePageMetadataResponse200Data(LazyModel):
     """
     Attributes:
         url (Union[Unset, str]): The URL of the page Example: https://www.example.com.
@@ -62,7 +70,7 @@ class UpdatePageMetadataResponse200Data:
             image=image,
         )
 
-        update_page_metadata_response_200_data.additional_properties = src_dict
+        update_page_metadata_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_page_metadata_response_200_data
 
     @property
@@ -70,6 +78,10 @@ class UpdatePageMetadataResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -79,4 +91,6 @@ class UpdatePageMetadataResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -2,13 +2,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="UpdatePluginJsonBody")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "model_name": "model_name",
+    "human_name": "human_name",
+    "keywords": "keywords",
+    "description": "description",
+    "is_active": "is_active",
+}
 
-@attr.s(auto_attribs=True)
-class UpdatePluginJsonBody:
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdatePluginJsonBody(LazyModel):
     """
     Attributes:
         model_name (Union[Unset, str]): Model Name Example: IndoorPlants.
@@ -69,7 +78,7 @@ class UpdatePluginJsonBody:
             is_active=is_active,
         )
 
-        update_plugin_json_body.additional_properties = src_dict
+        update_plugin_json_body.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_plugin_json_body
 
     @property
@@ -77,6 +86,10 @@ class UpdatePluginJsonBody:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -86,4 +99,6 @@ class UpdatePluginJsonBody:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
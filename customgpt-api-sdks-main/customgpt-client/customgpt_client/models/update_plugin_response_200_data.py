@@ -2,13 +2,23 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="UpdatePluginResponse200Data")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "model_name": "model_name",
+    "human_name": "human_name",
+    "keywords": "keywords",
+    "description": "description",
+    "logo": "logo",
+    "is_active": "is_active",
+}
 
-@attr.s(auto_attribs=True)
-class UpdatePluginResponse200Data:
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdatePluginResponse200Data(LazyModel):
     """
     Attributes:
         model_name (Union[Unset, str]): Model Name Example: IndoorPlants.
@@ -77,7 +87,7 @@ class UpdatePluginResponse200Data:
             is_active=is_active,
         )
 
-        update_plugin_response_200_data.additional_properties = src_dict
+        update_plugin_response_200_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_plugin_response_200_data
 
     @property
@@ -85,6 +95,10 @@ class UpdatePluginResponse200Data:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -94,4 +108,6 @@ class UpdatePluginResponse200Data:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -3,13 +3,22 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, File, FileJsonType, Unset
 
 T = TypeVar("T", bound="UpdateProjectMultipartData")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "project_name": "project_name",
+    "is_shared": "is_shared",
+    "sitemap_path": "sitemap_path",
+    "file_data_retension": "file_data_retension",
+    "file": "file",
+}
 
-@attr.s(auto_attribs=True)
-class UpdateProjectMultipartData:
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdateProjectMultipartData(LazyModel):
     """
     Attributes:
         project_name (Union[Unset, str]): Project name Example: My project.
@@ -119,7 +128,7 @@ class UpdateProjectMultipartData:
             file=file,
         )
 
-        update_project_multipart_data.additional_properties = src_dict
+        update_project_multipart_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_project_multipart_data
 
     @property
@@ -127,6 +136,10 @@ class UpdateProjectMultipartData:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -136,4 +149,6 @@ class UpdateProjectMultipartData:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
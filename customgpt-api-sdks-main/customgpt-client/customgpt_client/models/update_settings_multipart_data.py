@@ -3,13 +3,35 @@ from typing import Any, Dict, List, Tuple, Type, TypeVar, Union, cast
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, File, FileJsonType, Unset
 
 T = TypeVar("T", bound="UpdateSettingsMultipartData")
 
-
-@attr.s(auto_attribs=True)
-class UpdateSettingsMultipartData:
+_FIELD_NAMES: Dict[str, str] = {
+    "chat_bot_avatar": "chat_bot_avatar",
+    "chat_bot_bg": "chat_bot_bg",
+    "default_prompt": "default_prompt",
+    "example_questions": "example_questions",
+    "response_source": "response_source",
+    "chatbot_msg_lang": "chatbot_msg_lang",
+    "chatbot_color": "chatbot_color",
+    "persona_instructions": "persona_instructions",
+    "citations_answer_source_label_msg": "citations_answer_source_label_msg",
+    "citations_sources_label_msg": "citations_sources_label_msg",
+    "hang_in_there_msg": "hang_in_there_msg",
+    "chatbot_siesta_msg": "chatbot_siesta_msg",
+    "is_loading_indicator_enabled": "is_loading_indicator_enabled",
+    "enable_citations": "enable_citations",
+    "citations_view_type": "citations_view_type",
+    "no_answer_message": "no_answer_message",
+    "ending_message": "ending_message",
+    "remove_branding": "remove_branding",
+}
+
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdateSettingsMultipartData(LazyModel):
     """
     Attributes:
         chat_bot_avatar (Union[Unset, File]): This is the avatar that is shown in the bot response. You can make it a
@@ -361,7 +383,7 @@ class UpdateSettingsMultipartData:
             remove_branding=remove_branding,
         )
 
-        update_settings_multipart_data.additional_properties = src_dict
+        update_settings_multipart_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_settings_multipart_data
 
     @property
@@ -369,6 +391,10 @@ class UpdateSettingsMultipartData:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -378,4 +404,6 @@ class UpdateSettingsMultipartData:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
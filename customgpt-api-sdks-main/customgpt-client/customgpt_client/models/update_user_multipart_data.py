@@ -3,13 +3,19 @@ from typing import Any, Dict, List, Type, TypeVar, Union
 
 import attr
 
+from ..decoding import LazyModel, unknown_properties
 from ..types import UNSET, File, FileJsonType, Unset
 
 T = TypeVar("T", bound="UpdateUserMultipartData")
 
+_FIELD_NAMES: Dict[str, str] = {
+    "profile_photo": "profile_photo",
+    "name": "name",
+}
 
-@attr.s(auto_attribs=True)
-class UpdateUserMultipartData:
+
+@attr.s(auto_attribs=True, slots=True)
+class UpdateUserMultipartData(LazyModel):
     """
     Attributes:
         profile_photo (Union[Unset, File]): User profile photo Example: avatar.png.
@@ -72,7 +78,7 @@ class UpdateUserMultipartData:
             name=name,
         )
 
-        update_user_multipart_data.additional_properties = src_dict
+        update_user_multipart_data.additional_properties = unknown_properties(src_dict, _FIELD_NAMES)
         return update_user_multipart_data
 
     @property
@@ -80,6 +86,10 @@ class UpdateUserMultipartData:
         return list(self.additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
+        if key not in self.additional_properties and key in _FIELD_NAMES:
+            value = getattr(self, _FIELD_NAMES[key])
+            if not isinstance(value, Unset):
+                return value
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -89,4 +99,6 @@ class UpdateUserMultipartData:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
+        if key in _FIELD_NAMES:
+            return not isinstance(getattr(self, _FIELD_NAMES[key]), Unset)
         return key in self.additional_properties
@@ -0,0 +1,141 @@
+""" Contains the streaming multipart/form-data encoder used for file uploads """
+import os
+import uuid
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class ProgressReader:
+    """Wraps a binary file, reporting ``(bytes_read, total_bytes)`` to a callback on every read"""
+
+    def __init__(self, file: BinaryIO, on_progress: ProgressCallback, total: Optional[int] = None) -> None:
+        self.file = file
+        self.on_progress = on_progress
+        self.total = _payload_size(file) if total is None else total
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.file.read(size)
+        self.bytes_read += len(chunk)
+        self.on_progress(self.bytes_read, self.total)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        position = self.file.seek(offset, whence)
+        if whence == os.SEEK_SET:
+            self.bytes_read = max(offset, 0)
+        return position
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.file, name)
+
+
+def _payload_size(payload: Any) -> int:
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    position = payload.tell()
+    size = payload.seek(0, os.SEEK_END) - position
+    payload.seek(position)
+    return size
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartEncoder:
+    """Encodes the ``files`` of an endpoint's _get_kwargs as a multipart/form-data body that is produced in chunks
+
+    Field values are ``(file_name, payload, mime_type)`` tuples like the ones ``requests`` accepts. File payloads are
+    read ``chunk_size`` bytes at a time while the body is sent instead of being loaded into memory, so they must be
+    seekable; each payload is rewound once it has been sent, so the same File can be passed to a retried call.
+    """
+
+    def __init__(
+        self,
+        fields: Union[Dict[str, Any], List[Tuple[str, Any]]],
+        *,
+        boundary: Optional[str] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._parts: List[Tuple[bytes, Any, int]] = []
+        items = fields.items() if isinstance(fields, dict) else fields
+        for name, value in items:
+            if not isinstance(value, tuple):
+                value = (None, value)
+            file_name, payload = value[0], value[1]
+            mime_type = value[2] if len(value) > 2 else None
+            if isinstance(payload, str):
+                payload = payload.encode()
+            elif not isinstance(payload, (bytes, bytearray)) and not hasattr(payload, "read"):
+                payload = str(payload).encode()
+
+            header = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"'
+            if file_name is not None:
+                header += f'; filename="{_quote(file_name)}"'
+            if mime_type is not None:
+                header += f"\r\nContent-Type: {mime_type}"
+            header += "\r\n\r\n"
+            start = payload.tell() if hasattr(payload, "read") else 0
+            self._parts.append((header.encode(), payload, start))
+        self._closing = f"--{self.boundary}--\r\n".encode()
+        self._length = (
+            sum(len(header) + _payload_size(payload) + 2 for header, payload, _ in self._parts) + len(self._closing)
+        )
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, payload, start in self._parts:
+            yield header
+            if hasattr(payload, "read"):
+                payload.seek(start)
+                while True:
+                    chunk = payload.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+                # Leave the payload where it was found so a retried call can encode it again
+                payload.seek(start)
+            else:
+                yield bytes(payload)
+            yield b"\r\n"
+        yield self._closing
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """Iterate the body from an async HTTP client"""
+        for chunk in self:
+            yield chunk
+
+
+def encode_files(kwargs: Dict[str, Any], chunk_size: int = CHUNK_SIZE) -> Optional[MultipartEncoder]:
+    """Replace the ``files`` of an endpoint's _get_kwargs with a streaming body, returning its encoder"""
+    files = kwargs.pop("files", None)
+    if not files:
+        return None
+    encoder = MultipartEncoder(files, chunk_size=chunk_size)
+    kwargs["headers"] = {
+        **(kwargs.get("headers") or {}),
+        "Content-Type": encoder.content_type,
+        "Content-Length": str(len(encoder)),
+    }
+    return encoder
+
+
+__all__ = ["MultipartEncoder", "ProgressReader", "ProgressCallback", "encode_files", "CHUNK_SIZE"]
@@ -0,0 +1,105 @@
+""" Contains helpers for walking every page of the paginated endpoints """
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, AsyncIterator, Iterator, List, Tuple
+
+import attr
+
+from . import errors
+from .types import Response, Unset
+
+DEFAULT_CONCURRENCY = 4
+
+
+def _find_paginator(parsed: Any) -> Any:
+    """Find the object carrying ``data``/``last_page`` inside a parsed 200 response"""
+    data = getattr(parsed, "data", None)
+    if hasattr(data, "last_page"):
+        return data
+    if data is not None and attr.has(type(data)):
+        for field in attr.fields(type(data)):
+            value = getattr(data, field.name, None)
+            if hasattr(value, "last_page"):
+                return value
+    return None
+
+
+def _unpack(page: int, response: Response) -> Tuple[List[Any], int]:
+    """Get the items of a fetched page and the number of the last page"""
+    paginator = _find_paginator(response.parsed) if response.status_code == HTTPStatus.OK else None
+    if paginator is None:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    items = [] if isinstance(paginator.data, Unset) or paginator.data is None else paginator.data
+    last_page = paginator.last_page if isinstance(paginator.last_page, int) else page
+    return items, last_page
+
+
+def iter_all(
+    endpoint: ModuleType, *args: Any, client: Any, concurrency: int = DEFAULT_CONCURRENCY, **kwargs: Any
+) -> Iterator[Any]:
+    """Yield every item of a paginated endpoint, starting at ``page`` (default 1)
+
+    The first page is fetched on its own to learn ``last_page``; the remaining pages are then fetched on up to
+    ``concurrency`` threads at a time. Items are yielded in page order as soon as their page has arrived.
+
+    Args:
+        endpoint: The endpoint module, e.g. ``customgpt_client.api.projects.list_projects``.
+        client: The client to send the requests with.
+        concurrency: The maximum number of pages requested at once.
+
+    Raises:
+        errors.UnexpectedStatus: If a page can't be fetched.
+    """
+    first_page = kwargs.pop("page", 1) or 1
+    kwargs["parse"] = True
+    items, last_page = _unpack(first_page, endpoint.sync_detailed(*args, client=client, page=first_page, **kwargs))
+    yield from items
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        window: deque = deque()
+        for page in range(first_page + 1, last_page + 1):
+            window.append((page, executor.submit(endpoint.sync_detailed, *args, client=client, page=page, **kwargs)))
+            if len(window) >= concurrency:
+                done_page, future = window.popleft()
+                yield from _unpack(done_page, future.result())[0]
+        while window:
+            done_page, future = window.popleft()
+            yield from _unpack(done_page, future.result())[0]
+
+
+async def aiter_all(
+    endpoint: ModuleType, *args: Any, client: Any, concurrency: int = DEFAULT_CONCURRENCY, **kwargs: Any
+) -> AsyncIterator[Any]:
+    """Asynchronously yield every item of a paginated endpoint, starting at ``page`` (default 1)
+
+    Works like iter_all, with the remaining pages fetched as up to ``concurrency`` concurrent tasks.
+    """
+    first_page = kwargs.pop("page", 1) or 1
+    kwargs["parse"] = True
+    response = await endpoint.asyncio_detailed(*args, client=client, page=first_page, **kwargs)
+    items, last_page = _unpack(first_page, response)
+    for item in items:
+        yield item
+
+    window: deque = deque()
+    try:
+        for page in range(first_page + 1, last_page + 1):
+            task = asyncio.ensure_future(endpoint.asyncio_detailed(*args, client=client, page=page, **kwargs))
+            window.append((page, task))
+            if len(window) >= concurrency:
+                done_page, task = window.popleft()
+                for item in _unpack(done_page, await task)[0]:
+                    yield item
+        while window:
+            done_page, task = window.popleft()
+            for item in _unpack(done_page, await task)[0]:
+                yield item
+    finally:
+        for _, task in window:
+            task.cancel()
+
+
+__all__ = ["iter_all", "aiter_all", "DEFAULT_CONCURRENCY"]
@@ -0,0 +1,154 @@
+""" Contains the token bucket that paces the requests of a client to the API's rate limits """
+import asyncio
+import email.utils
+import threading
+import time
+from http import HTTPStatus
+from typing import Any, Callable, Mapping, Optional
+
+DEFAULT_BURST = 10
+DEFAULT_RETRY_AFTER = 1.0
+DEFAULT_MAX_RETRIES = 10
+
+# X-RateLimit-Reset values above this are Unix timestamps rather than a number of seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_seconds(value: Optional[str], now: float) -> Optional[float]:
+    """Turn a Retry-After / X-RateLimit-Reset header into a number of seconds from now"""
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(when.timestamp() - now, 0.0)
+    if seconds > _EPOCH_THRESHOLD:
+        seconds -= now
+    return max(seconds, 0.0)
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """A token bucket shared by every request of one or more clients, across threads and asyncio tasks
+
+    The bucket learns the API's limits from the ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` headers of every
+    response and refills at the rate that spreads the remaining requests over the rest of the window, so callers are
+    paced ahead of time instead of running into the limit together. A 429 response (or a window with no requests
+    left) holds every caller back until ``Retry-After`` / the reset; they are then let through one token at a time.
+
+    Until the API has reported its limits the bucket does not hold anything back. A 429 arriving before then paces the
+    callers it held back at a rate inferred from ``Retry-After``, which only lasts until the hold ends: only the rates
+    the API reported persist.
+
+    Args:
+        rate: The initial number of requests per second, None to wait for the API to report it.
+        burst: The maximum number of requests let through at once.
+    """
+
+    def __init__(
+        self, rate: Optional[float] = None, burst: int = DEFAULT_BURST, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        # The rate given or reported by the API, which self.rate goes back to once an inferred one expires
+        self._known_rate = rate
+        self._inferred_until: Optional[float] = None
+
+    def _advance(self, now: float) -> None:
+        if now > self._updated:
+            if self.rate is not None:
+                self._tokens = min(self._tokens + (now - self._updated) * self.rate, float(self.burst))
+            self._updated = now
+
+    def _refill(self, now: float) -> None:
+        if self._inferred_until is not None and now >= self._inferred_until:
+            self._advance(self._inferred_until)
+            self.rate = self._known_rate
+            self._inferred_until = None
+        self._advance(now)
+
+    def reserve(self) -> float:
+        """Take a token, returning the number of seconds the caller has to wait before sending its request"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = max(self._updated - now, 0.0)
+            if self.rate is None:
+                return wait
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def block(self, seconds: float) -> None:
+        """Let no request through for ``seconds``"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+            if self._known_rate is None:
+                # Without a known rate, release the callers held back one burst per blocked interval rather than all
+                # at once, until the hold ends
+                if self._inferred_until is None:
+                    self.rate = self.burst / max(seconds, DEFAULT_RETRY_AFTER)
+                self._inferred_until = self._updated
+
+    def update(self, status_code: int, headers: Mapping[str, Any]) -> Optional[float]:
+        """Adjust the bucket to the rate limit headers of a response
+
+        Returns:
+            The number of seconds to wait before retrying if the response was a 429, otherwise None.
+        """
+        wall_now = time.time()
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        reset = _parse_seconds(headers.get("X-RateLimit-Reset"), wall_now)
+
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_after = _parse_seconds(headers.get("Retry-After"), wall_now)
+            if retry_after is None:
+                retry_after = reset if reset else DEFAULT_RETRY_AFTER
+            self.block(retry_after)
+            return retry_after
+
+        if remaining is None:
+            return None
+        if remaining <= 0:
+            self.block(reset if reset else DEFAULT_RETRY_AFTER)
+            return None
+        with self._lock:
+            self._refill(self._clock())
+            if reset:
+                self.rate = self._known_rate = remaining / reset
+                self._inferred_until = None
+            self._tokens = min(self._tokens, float(remaining))
+        return None
+
+
+__all__ = ["RateLimiter", "DEFAULT_BURST", "DEFAULT_MAX_RETRIES"]
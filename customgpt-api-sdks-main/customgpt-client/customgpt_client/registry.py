@@ -0,0 +1,269 @@
+""" Contains the registry of per-tenant clients for servers relaying the requests of many API keys """
+import asyncio
+import contextlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple
+
+import attr
+
+from .client import CustomGPT
+from .ratelimit import RateLimiter
+
+DEFAULT_BASE_URL = "https://app.customgpt.ai"
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_CONNECTIONS_PER_CLIENT = 4
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_MAX_RATE_LIMITERS = 10000
+
+TenantKey = Tuple[str, str]
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _Tenant:
+    client: CustomGPT
+    leases: int = 0
+    last_used: float = 0.0
+    # The pools of the client leases were made for: its session, and its httpx pool in each of these event loops
+    session: bool = False
+    loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = attr.ib(factory=weakref.WeakSet)
+
+    def pools(self) -> int:
+        return int(self.session) + sum(not loop.is_closed() for loop in self.loops)
+
+    def has_pool(self, loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+        return self.session if loop is None else loop in self.loops
+
+    def add_pool(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        if loop is None:
+            self.session = True
+        else:
+            self.loops.add(loop)
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class ClientRegistry:
+    """One long-lived CustomGPT client per API key and base URL, shared by every request made for that tenant
+
+    A client has one connection pool for the ``client()`` leases, its session, and one for the ``aclient()`` leases of
+    each event loop. Each pool keeps at most ``connections_per_client`` connections open (it waits for a free one
+    rather than opening more) and at most ``max_connections // connections_per_client`` pools are open at once, so
+    however many tenants are served and however busy one of them is, the connections open stay under
+    ``max_connections``. A client leased with ``client()`` is to be used from threads, one leased with ``aclient()``
+    in the event loop that leased it.
+
+    A lease that needs a pool its tenant doesn't have open yet gets room by closing the least recently used client no
+    one is leasing; when every client is leased, the lease waits for one to be returned. Clients no one leased for
+    ``idle_timeout`` seconds are closed on the next lease or ``prune()``.
+
+    Every tenant has its own RateLimiter, so one being held back by the API doesn't hold back the others. It is kept
+    when the tenant's client is closed, so the limits learned from the API still apply when the tenant comes back, up
+    to ``max_rate_limiters`` tenants: past them the least recently used tenants without a client lose theirs.
+
+    Args:
+        max_connections: The number of connections open at most across every tenant.
+        connections_per_client: The number of connections open at most by one pool of a tenant's client.
+        idle_timeout: The number of seconds after which a client no one leased is closed.
+        acquire_timeout: The number of seconds a lease waits for a client to be returned before raising TimeoutError,
+            None to wait as long as it takes.
+        rate_limiter_factory: Builds the RateLimiter of a new tenant, or returns None to send its requests unpaced.
+        max_rate_limiters: The number of RateLimiters kept at most for tenants without a client.
+        **client_kwargs: Passed to every client built (timeout, json_codec, cache, hooks, ...).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        connections_per_client: int = DEFAULT_CONNECTIONS_PER_CLIENT,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        acquire_timeout: Optional[float] = None,
+        rate_limiter_factory: Callable[[], Optional[RateLimiter]] = RateLimiter,
+        max_rate_limiters: int = DEFAULT_MAX_RATE_LIMITERS,
+        clock: Callable[[], float] = time.monotonic,
+        **client_kwargs: Any,
+    ) -> None:
+        if not 0 < connections_per_client <= max_connections:
+            raise ValueError("connections_per_client must be between 1 and max_connections")
+        self.max_connections = max_connections
+        self.connections_per_client = connections_per_client
+        self.max_pools = max_connections // connections_per_client
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.max_rate_limiters = max_rate_limiters
+        self._rate_limiter_factory = rate_limiter_factory
+        self._clock = clock
+        self._client_kwargs = client_kwargs
+        # Least recently leased first
+        self._tenants: "OrderedDict[TenantKey, _Tenant]" = OrderedDict()
+        self._rate_limiters: "OrderedDict[TenantKey, Optional[RateLimiter]]" = OrderedDict()
+        self._condition = threading.Condition()
+        # The leases waiting in event loops, woken up with the threads waiting on the condition
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def _build(self, key: TenantKey) -> CustomGPT:
+        limiter = self._rate_limiters.pop(key) if key in self._rate_limiters else self._rate_limiter_factory()
+        self._rate_limiters[key] = limiter  # Least recently built first
+        unused = [other for other in self._rate_limiters if other != key and other not in self._tenants]
+        for other in unused[: len(unused) - self.max_rate_limiters]:
+            del self._rate_limiters[other]
+        api_key, base_url = key
+        return CustomGPT(
+            api_key=api_key,
+            base_url=base_url,
+            pool_connections=1,
+            pool_maxsize=self.connections_per_client,
+            pool_block=True,
+            rate_limiter=limiter,
+            **self._client_kwargs,
+        )
+
+    def _idle(self, now: float) -> List[CustomGPT]:
+        """Take out the clients no one leased for idle_timeout, to be closed once the lock is released"""
+        expired = [
+            key
+            for key, tenant in self._tenants.items()
+            if not tenant.leases and now - tenant.last_used >= self.idle_timeout
+        ]
+        return [self._tenants.pop(key).client for key in expired]
+
+    def _lease(
+        self, key: TenantKey, loop: Optional[asyncio.AbstractEventLoop], evicted: List[CustomGPT]
+    ) -> Optional[CustomGPT]:
+        """Lease the client of a tenant for the pool of a loop (None for its session), None if there is no room
+
+        The clients closed to make room are added to ``evicted``, to be closed once the lock is released.
+        """
+        evicted += self._idle(self._clock())
+        tenant = self._tenants.get(key)
+        if tenant is None or not tenant.has_pool(loop):
+            while sum(other.pools() for other in self._tenants.values()) >= self.max_pools:
+                unused = next((lru for lru, other in self._tenants.items() if not other.leases), None)
+                if unused is None:
+                    return None
+                evicted.append(self._tenants.pop(unused).client)
+            tenant = self._tenants.get(key)
+            if tenant is None:
+                tenant = self._tenants[key] = _Tenant(self._build(key))
+            tenant.add_pool(loop)
+        tenant.leases += 1
+        self._tenants.move_to_end(key)
+        return tenant.client
+
+    def _notify(self) -> None:
+        """Wake up the leases waiting for a client, the condition being held"""
+        self._condition.notify_all()
+        for loop, waiter in self._waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_wake, waiter)
+        self._waiters.clear()
+
+    def _release(self, key: TenantKey, client: CustomGPT) -> None:
+        with self._condition:
+            tenant = self._tenants.get(key)
+            if tenant is None or tenant.client is not client:  # The registry was closed during the lease
+                return
+            tenant.leases -= 1
+            tenant.last_used = self._clock()
+            self._notify()
+
+    @contextlib.contextmanager
+    def client(self, api_key: str, base_url: str = DEFAULT_BASE_URL) -> Iterator[CustomGPT]:
+        """Lease the client of a tenant for the duration of a with block
+
+        Raises:
+            TimeoutError: If every client stayed leased for acquire_timeout.
+        """
+        key = (api_key, base_url)
+        deadline = None if self.acquire_timeout is None else self._clock() + self.acquire_timeout
+        evicted: List[CustomGPT] = []
+        try:
+            with self._condition:
+                while True:
+                    client = self._lease(key, None, evicted)
+                    if client is not None:
+                        break
+                    remaining = None if deadline is None else deadline - self._clock()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"no client was returned within {self.acquire_timeout} seconds")
+                    self._condition.wait(remaining)
+        finally:
+            for evicted_client in evicted:
+                evicted_client.close()
+        try:
+            yield client
+        finally:
+            self._release(key, client)
+
+    @contextlib.asynccontextmanager
+    async def aclient(self, api_key: str, base_url: str = DEFAULT_BASE_URL) -> AsyncIterator[CustomGPT]:
+        """Lease the client of a tenant for the duration of an async with block, waiting without blocking the loop
+
+        Raises:
+            TimeoutError: If every client stayed leased for acquire_timeout.
+        """
+        key = (api_key, base_url)
+        loop = asyncio.get_running_loop()
+        deadline = None if self.acquire_timeout is None else self._clock() + self.acquire_timeout
+        while True:
+            evicted: List[CustomGPT] = []
+            with self._condition:
+                client = self._lease(key, loop, evicted)
+                if client is None:
+                    # Registered under the lock, so a client returned from now on wakes this lease up
+                    waiter = loop.create_future()
+                    self._waiters.append((loop, waiter))
+            for evicted_client in evicted:
+                evicted_client.close()
+            if client is not None:
+                break
+            remaining = None if deadline is None else deadline - self._clock()
+            try:
+                if remaining is not None and remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"no client was returned within {self.acquire_timeout} seconds") from None
+            finally:
+                with self._condition:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+        try:
+            yield client
+        finally:
+            self._release(key, client)
+
+    def rate_limiter(self, api_key: str, base_url: str = DEFAULT_BASE_URL) -> Optional[RateLimiter]:
+        """Get the RateLimiter of a tenant, None if it was never leased a client or is sent unpaced"""
+        return self._rate_limiters.get((api_key, base_url))
+
+    def prune(self) -> int:
+        """Close the clients no one leased for idle_timeout, returning how many were closed"""
+        with self._condition:
+            idle = self._idle(self._clock())
+        for client in idle:
+            client.close()
+        return len(idle)
+
+    def close(self) -> None:
+        """Close every client, leased or not"""
+        with self._condition:
+            clients = [tenant.client for tenant in self._tenants.values()]
+            self._tenants.clear()
+            self._notify()
+        for client in clients:
+            client.close()
+
+    def __enter__(self) -> "ClientRegistry":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
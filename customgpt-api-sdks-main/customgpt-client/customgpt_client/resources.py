@@ -0,0 +1,47 @@
+""" Contains the resource accessors of a client instance, e.g. client.projects.list(...) """
+import functools
+from typing import Any, Callable, List, Optional
+
+
+class BoundResource:
+    """The calls of a resource class of CustomGPT (CustomGPT.Project, ...) made through one client
+
+    ``client.projects.list(page=2)`` is ``CustomGPT.Project.list(page=2)`` sent with ``client``'s session, caches, rate
+    limiter and hooks instead of those of the default client built from the class level settings.
+    """
+
+    __slots__ = ("_resource", "_client")
+
+    def __init__(self, resource: type, client: Any) -> None:
+        self._resource = resource
+        self._client = client
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = getattr(self._resource, name)
+
+        @functools.wraps(method)
+        def bound(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, client=self._client, **kwargs)
+
+        return bound
+
+    def __dir__(self) -> List[str]:
+        return [name for name in vars(self._resource) if not name.startswith("_")]
+
+    def __repr__(self) -> str:
+        return f"<{self._resource.__qualname__} of {self._client.base_url}>"
+
+
+class ResourceAccessor:
+    """Exposes a resource class of CustomGPT on its instances as a BoundResource
+
+    Read from the class (``CustomGPT.projects``), it is the resource class itself, whose calls use the default client.
+    """
+
+    def __init__(self, resource: type) -> None:
+        self.resource = resource
+
+    def __get__(self, client: Optional[Any], owner: Optional[type] = None) -> Any:
+        if client is None:
+            return self.resource
+        return BoundResource(self.resource, client)
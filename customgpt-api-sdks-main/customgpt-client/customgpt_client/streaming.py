@@ -0,0 +1,306 @@
+""" Contains the decoder for the server-sent events returned by streamed message sends """
+import json
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, Iterator, List, MutableMapping, Optional
+
+import attr
+
+
+@attr.s(auto_attribs=True)
+class ServerSentEvent:
+    """A single event of a text/event-stream response"""
+
+    event: str = "message"
+    data: str = ""
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+@attr.s(auto_attribs=True)
+class MessageChunk:
+    """A decoded event of a streamed message send
+
+    Attributes:
+        event: The SSE event name, e.g. ``progress`` or ``finish``.
+        status: The ``status`` field of the event payload.
+        message: The piece of the answer carried by a ``progress`` event.
+        citations: The citation IDs carried by the event, usually only set on ``finish``.
+        data: The whole decoded event payload.
+    """
+
+    event: str
+    status: Optional[str] = None
+    message: str = ""
+    citations: List[Any] = attr.ib(factory=list)
+    data: Dict[str, Any] = attr.ib(factory=dict)
+
+    @classmethod
+    def from_event(cls, event: ServerSentEvent) -> "MessageChunk":
+        try:
+            payload = json.loads(event.data)
+        except ValueError:
+            return cls(event=event.event, message=event.data)
+        if not isinstance(payload, dict):
+            return cls(event=event.event, message=event.data)
+        message = payload.get("message")
+        return cls(
+            event=event.event,
+            status=payload.get("status"),
+            message=message if isinstance(message, str) else "",
+            citations=payload.get("citations") or [],
+            data=payload,
+        )
+
+
+class SSEDecoder:
+    """Incrementally turns the raw bytes of a text/event-stream body into events
+
+    Bytes can be fed in chunks of any size, events are returned as soon as their terminating blank line arrives.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._pending_cr = False
+        self._event = ""
+        self._data: List[str] = []
+        self._id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        if self._pending_cr and chunk.startswith(b"\n"):
+            chunk = chunk[1:]
+        self._pending_cr = False
+
+        lines = (self._buffer + chunk).splitlines(True)
+        self._buffer = b""
+        if lines and not lines[-1].endswith((b"\r", b"\n")):
+            self._buffer = lines.pop()
+        if lines and lines[-1].endswith(b"\r"):
+            # The "\n" of a "\r\n" pair might be the first byte of the next chunk
+            self._pending_cr = True
+
+        events = []
+        for line in lines:
+            event = self._process_line(line.rstrip(b"\r\n").decode("utf-8", errors="replace"))
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> List[ServerSentEvent]:
+        """Return the events left once the stream has ended"""
+        events = self.feed(b"\n") if self._buffer else []
+        event = self._process_line("")
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_line(self, line: str) -> Optional[ServerSentEvent]:
+        if not line:
+            if not self._data and not self._event:
+                return None
+            event = ServerSentEvent(
+                event=self._event or "message", data="\n".join(self._data), id=self._id, retry=self._retry
+            )
+            self._event, self._data = "", []
+            return event
+        if line.startswith(":"):
+            return None
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            self._id = value
+        elif field == "retry" and value.isdigit():
+            self._retry = int(value)
+        return None
+
+
+class _MessageStreamBase:
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.status_code = HTTPStatus(response.status_code)
+        self.headers: MutableMapping[str, str] = response.headers
+        self._decoder = SSEDecoder()
+        self._parts: List[str] = []
+        self._answer: Optional[str] = None
+        self.citations: List[Any] = []
+        self.final: Optional[MessageChunk] = None
+
+    @property
+    def answer(self) -> str:
+        """The text of every ``progress`` event received so far"""
+        if self._answer is None:
+            self._answer = "".join(self._parts)
+        return self._answer
+
+    def _collect(self, chunk: MessageChunk) -> MessageChunk:
+        if chunk.status == "progress" and chunk.message:
+            self._parts.append(chunk.message)
+            self._answer = None
+        if chunk.citations:
+            self.citations = chunk.citations
+        if chunk.status == "finish" or chunk.event == "finish":
+            self.final = chunk
+        return chunk
+
+
+class MessageStream(_MessageStreamBase):
+    """The streamed result of ``send_message.sync_detailed(..., stream=True)``
+
+    Iterating it yields a MessageChunk per event as soon as the event arrives; ``answer`` and ``citations`` hold the
+    assembled result once iteration has finished (see ``until_done``).
+    """
+
+    def events(self) -> Iterator[ServerSentEvent]:
+        """Yield the raw server-sent events, as ``sseclient.SSEClient.events`` did"""
+        try:
+            for chunk in self.response.iter_content(chunk_size=None):
+                yield from self._decoder.feed(chunk)
+            yield from self._decoder.flush()
+        finally:
+            self.close()
+
+    def __iter__(self) -> Iterator[MessageChunk]:
+        for event in self.events():
+            yield self._collect(MessageChunk.from_event(event))
+
+    def until_done(self) -> "MessageStream":
+        """Consume the whole stream, leaving the assembled ``answer`` and ``citations`` on this object"""
+        for _ in self:
+            pass
+        return self
+
+    def close(self) -> None:
+        self.response.close()
+
+    def __enter__(self) -> "MessageStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncMessageStream(_MessageStreamBase):
+    """The streamed result of ``send_message.asyncio_detailed(..., stream=True)``, see MessageStream"""
+
+    async def events(self) -> AsyncIterator[ServerSentEvent]:
+        try:
+            async for chunk in self.response.aiter_bytes():
+                for event in self._decoder.feed(chunk):
+                    yield event
+            for event in self._decoder.flush():
+                yield event
+        finally:
+            await self.aclose()
+
+    async def __aiter__(self) -> AsyncIterator[MessageChunk]:
+        async for event in self.events():
+            yield self._collect(MessageChunk.from_event(event))
+
+    async def until_done(self) -> "AsyncMessageStream":
+        async for _ in self:
+            pass
+        return self
+
+    async def aclose(self) -> None:
+        await self.response.aclose()
+
+    async def __aenter__(self) -> "AsyncMessageStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
+class RawResponse:
+    """The undecoded result of an endpoint called with ``parse=False``
+
+    Only the status and headers have been read; the body is read on demand, either whole (``content``) or chunk by
+    chunk as it arrives (``iter_bytes``, or ``iter_raw`` to relay it still compressed), so it can be passed on without
+    building any model.
+    """
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.status_code: int = response.status_code
+        self.headers: MutableMapping[str, str] = response.headers
+
+    @property
+    def content(self) -> bytes:
+        """The whole body, read on first access"""
+        return self.response.content
+
+    def iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the decompressed body as it arrives, closing the response once done"""
+        try:
+            yield from self.response.iter_content(chunk_size=chunk_size)
+        finally:
+            self.close()
+
+    def iter_raw(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the body as it was sent, without undoing its ``Content-Encoding``"""
+        try:
+            yield from self.response.raw.stream(chunk_size, decode_content=False)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self.response.close()
+
+    def __enter__(self) -> "RawResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncRawResponse:
+    """The undecoded result of an asyncio endpoint called with ``parse=False``, see RawResponse"""
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.status_code: int = response.status_code
+        self.headers: MutableMapping[str, str] = response.headers
+
+    async def read(self) -> bytes:
+        """Read the whole body"""
+        return await self.response.aread()
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.response.aiter_bytes():
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def aiter_raw(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.response.aiter_raw():
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.response.aclose()
+
+    async def __aenter__(self) -> "AsyncRawResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
+__all__ = [
+    "ServerSentEvent",
+    "MessageChunk",
+    "SSEDecoder",
+    "MessageStream",
+    "AsyncMessageStream",
+    "RawResponse",
+    "AsyncRawResponse",
+]
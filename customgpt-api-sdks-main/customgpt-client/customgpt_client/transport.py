@@ -0,0 +1,126 @@
+""" Contains the HTTP transports shared by every endpoint of a client """
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .instrumentation import time_connections
+from .multipart import encode_files
+
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+
+def build_session(
+    *,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+    verify_ssl: Optional[object] = True,
+) -> requests.Session:
+    """Build a pooled, keep-alive session for talking to the CustomGPT API
+
+    Args:
+        pool_connections: The number of distinct hosts to keep connection pools for.
+        pool_maxsize: The maximum number of connections kept open per host.
+        pool_block: Whether to wait for a free connection when a host's pool is exhausted instead of opening
+            a throwaway one.
+        keep_alive: Whether connections are returned to the pool and reused between requests.
+        verify_ssl: Passed to ``requests`` as ``Session.verify``.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    time_connections(adapter)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    if isinstance(verify_ssl, (bool, str)) and verify_ssl is not True:
+        session.verify = verify_ssl
+    return session
+
+
+def send(session: requests.Session, **kwargs: Any) -> requests.Response:
+    """Send a request built by an endpoint's _get_kwargs with ``requests``, streaming any multipart body"""
+    encoder = encode_files(kwargs)
+    if encoder is not None:
+        kwargs["data"] = encoder
+    return session.request(**kwargs)
+
+
+def build_async_client(
+    *,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    keep_alive: bool = True,
+    verify_ssl: Any = True,
+) -> "httpx.AsyncClient":
+    """Build a pooled, non-blocking HTTP client for the asyncio endpoint functions
+
+    ``httpx`` is only imported here, so programs that never make an asyncio call don't pay for importing it.
+
+    Args:
+        pool_connections: The number of distinct hosts the client is expected to talk to.
+        pool_maxsize: The maximum number of connections kept open per host.
+        keep_alive: Whether connections are returned to the pool and reused between requests.
+        verify_ssl: Passed to ``httpx`` as ``verify``.
+    """
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=pool_connections * pool_maxsize,
+        max_keepalive_connections=pool_maxsize if keep_alive else 0,
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY if keep_alive else 0,
+    )
+    return httpx.AsyncClient(limits=limits, verify=verify_ssl)
+
+
+async def send_async(
+    client: "httpx.AsyncClient",
+    trace: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+    **kwargs: Any,
+) -> "httpx.Response":
+    """Send a request built by an endpoint's _get_kwargs (``requests`` keyword arguments) with ``httpx``
+
+    When ``stream`` is true the response body is left unread; iterate it with ``aiter_bytes`` and close it with
+    ``aclose`` once done. ``trace`` is passed to ``httpx`` as the trace extension of the request.
+    """
+    stream = kwargs.pop("stream", False)
+    encoder = encode_files(kwargs)
+    data = kwargs.pop("data", None)
+    content = encoder.aiter() if encoder is not None else None
+    if isinstance(data, bytes):
+        # An encoded JSON body, httpx takes raw bytes as content
+        content, data = data, None
+    headers: Dict[str, str] = dict(kwargs.pop("headers", None) or {})
+    cookies = kwargs.pop("cookies", None)
+    if cookies:
+        headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in cookies.items())
+
+    request = client.build_request(
+        kwargs.pop("method"),
+        kwargs.pop("url"),
+        headers=headers,
+        params=kwargs.pop("params", None),
+        json=kwargs.pop("json", None),
+        data=data,
+        content=content,
+        timeout=kwargs.pop("timeout", None),
+        extensions={"trace": trace} if trace is not None else None,
+    )
+    return await client.send(request, stream=bool(stream), follow_redirects=kwargs.pop("allow_redirects", False))
+
+
+__all__ = [
+    "build_session",
+    "send",
+    "build_async_client",
+    "send_async",
+    "DEFAULT_POOL_CONNECTIONS",
+    "DEFAULT_POOL_MAXSIZE",
+]
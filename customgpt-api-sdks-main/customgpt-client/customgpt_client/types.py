@@ -1,9 +1,13 @@
 """ Contains some shared types for properties """
+import mimetypes
+import os
 from http import HTTPStatus
-from typing import BinaryIO, Generic, Literal, MutableMapping, Optional, Tuple, TypeVar
+from typing import Any, BinaryIO, Generic, Literal, MutableMapping, Optional, Tuple, TypeVar, Union
 
 import attr
 
+from .multipart import ProgressCallback, ProgressReader
+
 
 class Unset:
     def __bool__(self) -> Literal[False]:
@@ -27,6 +31,39 @@ class File:
         """Return a tuple representation that httpx will accept for multipart/form-data"""
         return self.file_name, self.payload, self.mime_type
 
+    @classmethod
+    def from_path(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        mime_type: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> "File":
+        """Open a file for an upload that is streamed from disk in chunks
+
+        Args:
+            path: The file to upload.
+            mime_type: The content type sent for the file, guessed from its name if omitted.
+            on_progress: Called with ``(bytes_sent, total_bytes)`` as the file is read during the upload.
+        """
+        payload: BinaryIO = open(path, "rb")
+        if on_progress is not None:
+            payload = ProgressReader(payload, on_progress)  # type: ignore[assignment]
+        return cls(
+            payload=payload,
+            file_name=os.path.basename(path),
+            mime_type=mime_type or mimetypes.guess_type(os.fspath(path))[0],
+        )
+
+    def close(self) -> None:
+        if hasattr(self.payload, "close"):
+            self.payload.close()
+
+    def __enter__(self) -> "File":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
 
 T = TypeVar("T")
 
@@ -0,0 +1,57 @@
+# Local stand-in for the CustomGPT API used by the tests that must not hit the live service
+
+import contextlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append((self.command, self.path, dict(self.headers), body))
+        self.server.connections.add(self.client_address)
+
+        route = self.server.routes.get((self.command, self.path.split("?")[0]))
+        if route is None:
+            status, headers, payload = 404, {}, {"status": "error", "data": {"code": 404, "message": "Not found"}}
+        elif callable(route):
+            status, headers, payload = route(self)
+        else:
+            status, headers, payload = route
+
+        if isinstance(payload, (dict, list)):
+            payload = json.dumps(payload).encode()
+            headers = {"Content-Type": "application/json", **headers}
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+@contextlib.contextmanager
+def serve(routes):
+    """Serve ``routes`` ({(method, path): (status, headers, payload) or callable}) on a local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.routes = routes
+    server.requests = []
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        server.base_url = "http://127.0.0.1:{}".format(server.server_address[1])
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,72 @@
+import time
+
+from customgpt_client import CustomGPT, bulk
+from tests.server import serve
+
+DELETED = (200, {}, {"status": "success", "data": {"deleted": True}})
+SERVER_ERROR = (500, {}, {"status": "error", "data": {"code": 500, "message": "Internal error"}})
+NOT_FOUND = (404, {}, {"status": "error", "data": {"code": 404, "message": "Project not found"}})
+
+
+def test_projects_are_deleted_concurrently(monkeypatch):
+    monkeypatch.setattr(bulk, "RETRY_BACKOFF", 0)
+    flaky_calls = []
+
+    def deleted(handler):
+        time.sleep(0.1)
+        return DELETED
+
+    def flaky(handler):
+        flaky_calls.append(handler.path)
+        return SERVER_ERROR if len(flaky_calls) == 1 else DELETED
+
+    routes = {("DELETE", f"/api/v1/projects/{project_id}"): deleted for project_id in range(1, 9)}
+    routes[("DELETE", "/api/v1/projects/9")] = flaky
+    routes[("DELETE", "/api/v1/projects/10")] = SERVER_ERROR
+    outcomes = []
+    with serve(routes) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            start = time.monotonic()
+            result = bulk.delete_projects(
+                range(1, 11), client=client, concurrency=8, on_project=lambda *outcome: outcomes.append(outcome)
+            )
+            elapsed = time.monotonic() - start
+
+    assert result.succeeded == list(range(1, 10))
+    assert list(result.failed) == [10]
+    assert result.retried == {9: 1, 10: bulk.DEFAULT_RETRIES}
+    assert elapsed < 0.5
+    assert (9, "retrying") in outcomes and (10, "failed") in outcomes
+    assert len([outcome for outcome in outcomes if outcome[1] != "retrying"]) == 10
+    assert result.to_dict()["failed"] == {10: "delete_project returned 500"}
+
+
+def test_a_retry_answered_with_a_404_counts_as_deleted(monkeypatch):
+    monkeypatch.setattr(bulk, "RETRY_BACKOFF", 0)
+    calls = []
+
+    def timed_out(handler):
+        calls.append(handler.path)
+        if len(calls) == 1:
+            time.sleep(0.5)  # Deleted, but the client gave up waiting for the answer
+            return DELETED
+        return NOT_FOUND
+
+    routes = {("DELETE", "/api/v1/projects/1"): timed_out, ("DELETE", "/api/v1/projects/2"): NOT_FOUND}
+    with serve(routes) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, timeout=0.2) as client:
+            result = bulk.delete_projects([1, 2], client=client)
+
+    assert result.succeeded == [1]
+    assert result.retried == {1: 1}
+    assert result.failed == {2: "delete_project returned 404"}
+
+
+def test_the_facade_deletes_with_the_default_client(monkeypatch):
+    with serve({("DELETE", "/api/v1/projects/1"): DELETED}) as server:
+        monkeypatch.setattr(CustomGPT, "api_key", "key", raising=False)
+        monkeypatch.setattr(CustomGPT, "base_url", server.base_url, raising=False)
+        result = CustomGPT.Project.delete_many(project_ids=[1])
+
+    assert result.succeeded == [1]
+    assert len(server.requests) == 1
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.users import get_user, update_user
+from customgpt_client.cache import ResponseCache
+from customgpt_client.models import UpdateUserMultipartData
+from tests.server import serve
+from tests.test_transport import USER
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def user_with_etag(handler):
+    if handler.headers.get("If-None-Match") == '"v1"':
+        return 304, {"ETag": '"v1"'}, b""
+    return 200, {"ETag": '"v1"'}, USER
+
+
+def test_responses_are_cached_and_revalidated():
+    clock = Clock()
+    cache = ResponseCache(clock=clock)
+    with serve({("GET", "/api/v1/user"): user_with_etag}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, cache=cache) as client:
+            first = get_user.sync_detailed(client=client)
+            second = get_user.sync_detailed(client=client)
+            assert len(server.requests) == 1
+            assert second.parsed == first.parsed and second.status_code == 200
+
+            clock.now += 301
+            third = get_user.sync_detailed(client=client)
+            assert len(server.requests) == 2
+            assert server.requests[1][2]["If-None-Match"] == '"v1"'
+            assert third.status_code == 200 and third.parsed.data.name == "test"
+            assert (cache.hits, cache.revalidations) == (1, 1)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_an_entry_evicted_during_revalidation_is_fetched_again(use_async):
+    clock = Clock()
+    cache = ResponseCache(clock=clock)
+
+    def evicting_user(handler):
+        if handler.headers.get("If-None-Match"):
+            cache.clear()  # Another request filled the cache in the meantime
+        return user_with_etag(handler)
+
+    with serve({("GET", "/api/v1/user"): evicting_user}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, cache=cache) as client:
+            get_user.sync_detailed(client=client)
+            clock.now += 301
+            if use_async:
+                response = asyncio.run(get_user.asyncio_detailed(client=client))
+            else:
+                response = get_user.sync_detailed(client=client)
+
+    assert response.status_code == 200 and response.parsed.data.name == "test"
+    assert [headers.get("If-None-Match") for _, _, headers, _ in server.requests] == [None, '"v1"', None]
+    assert len(cache) == 1
+
+
+def test_writes_invalidate_cached_responses():
+    routes = {("GET", "/api/v1/user"): (200, {}, USER), ("POST", "/api/v1/user"): (200, {}, USER)}
+    with serve(routes) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, cache=ResponseCache()) as client:
+            get_user.sync_detailed(client=client)
+            update_user.sync_detailed(client=client, multipart_data=UpdateUserMultipartData(name="new"))
+            get_user.sync_detailed(client=client)
+
+    assert [method for method, *_ in server.requests] == ["GET", "POST", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_async_requests_share_the_cache():
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url, cache=ResponseCache()) as client:
+            responses = [await get_user.asyncio_detailed(client=client) for _ in range(3)]
+
+    assert len(server.requests) == 1
+    assert all(response.parsed.data.name == "test" for response in responses)
+
+
+def test_cache_is_bounded_and_scoped():
+    cache = ResponseCache(maxsize=2, ttls={"get_settings": 0})
+
+    class Answer:
+        status_code, headers, content = 200, {}, b"{}"
+
+    def kwargs(path, method="get"):
+        return {"method": method, "url": "https://app.customgpt.ai" + path, "headers": {"Authorization": "Bearer k"}}
+
+    assert cache.key(kwargs("/api/v1/projects")) is None
+    assert cache.key(kwargs("/api/v1/projects/1/settings")) is None
+    assert cache.key(kwargs("/api/v1/projects/1", method="post")) is None
+
+    for path in ["/api/v1/projects/1", "/api/v1/projects/1/citations/2", "/api/v1/projects/10"]:
+        key, ttl = cache.key(kwargs(path))
+        cache.store(key, ttl, kwargs(path)["url"], Answer())
+    assert len(cache) == 2
+
+    cache.invalidate("https://app.customgpt.ai/api/v1/projects/1")
+    assert len(cache) == 1
+    assert cache.get(cache.key(kwargs("/api/v1/projects/10"))[0])[0] is not None
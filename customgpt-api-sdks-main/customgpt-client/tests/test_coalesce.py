@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.users import get_user
+from customgpt_client.coalesce import SingleFlight
+from tests.server import serve
+from tests.test_transport import USER
+
+
+def slow_user(handler):
+    time.sleep(0.3)
+    return 200, {}, USER
+
+
+def test_concurrent_identical_gets_share_one_request():
+    with serve({("GET", "/api/v1/user"): slow_user}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, coalesce_requests=True) as client:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(executor.map(lambda _: get_user.sync_detailed(client=client), range(8)))
+
+    assert len(server.requests) == 1
+    assert all(response is responses[0] for response in responses)
+    assert responses[0].parsed.data.name == "test"
+
+
+def test_requests_are_not_coalesced_by_default():
+    with serve({("GET", "/api/v1/user"): slow_user}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, pool_maxsize=4) as client:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda _: get_user.sync_detailed(client=client), range(4)))
+
+    assert len(server.requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_async_gets_share_one_request():
+    with serve({("GET", "/api/v1/user"): slow_user}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url, coalesce_requests=True) as client:
+            responses = await asyncio.gather(*(get_user.asyncio_detailed(client=client) for _ in range(8)))
+            assert len(client._single_flight) == 0
+
+    assert len(server.requests) == 1
+    assert all(response is responses[0] for response in responses)
+
+
+def test_errors_reach_every_waiting_caller():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", fail)
+        started.wait()
+        follower = executor.submit(flight.do, "key", lambda: "not called")
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+    assert flight.do("key", lambda: "again") == "again"
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_caller_leaves_the_call_to_the_others():
+    flight = SingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "done"
+
+    first = asyncio.ensure_future(flight.ado("key", slow))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(flight.ado("key", slow))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "done"
+    assert first.cancelled() and calls == [1]
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_the_call_is_cancelled_once_no_caller_waits():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    callers = [asyncio.ensure_future(flight.ado("key", slow)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert len(flight) == 0
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from customgpt_client import CustomGPT, codec
+from customgpt_client.api.conversations import create_conversation
+from customgpt_client.models import CreateConversationJsonBody
+from tests.server import serve
+
+TIMESTAMP = "2023-04-30 16:43:53"
+CONVERSATION = {
+    "status": "success",
+    "data": {"id": 1, "name": "chat", "created_at": TIMESTAMP, "updated_at": TIMESTAMP, "deleted_at": None},
+}
+
+
+class RecordingCodec(codec.JSONCodec):
+    def __init__(self):
+        self.calls = []
+
+    def loads(self, content):
+        self.calls.append(("loads", content))
+        return super().loads(content)
+
+    def dumps(self, obj):
+        self.calls.append(("dumps", obj))
+        return super().dumps(obj)
+
+
+def test_default_codec_prefers_orjson():
+    pytest.importorskip("orjson")
+    assert codec.default_codec().name == "orjson"
+
+
+@pytest.mark.parametrize("json_codec", [codec.JSONCodec(), codec.default_codec()], ids=lambda c: c.name)
+def test_codecs_round_trip(json_codec):
+    value = {"name": "café", "items": [1, 2.5, None, True]}
+
+    assert json_codec.loads(json_codec.dumps(value)) == value
+    assert json.loads(json_codec.dumps(value)) == value
+
+
+def test_endpoints_use_the_client_codec():
+    json_codec = RecordingCodec()
+    with serve({("POST", "/api/v1/projects/1/conversations"): (201, {}, CONVERSATION)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, json_codec=json_codec) as client:
+            body = CreateConversationJsonBody(name="chat")
+            response = create_conversation.sync_detailed(1, client=client, json_body=body)
+
+    assert response.parsed.data.name == "chat"
+    assert [call for call, _ in json_codec.calls] == ["dumps", "loads"]
+    assert json_codec.calls[1][1] == response.content
+    _, _, headers, sent = server.requests[0]
+    assert json.loads(sent) == {"name": "chat"}
+    assert headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_async_endpoints_use_the_client_codec():
+    json_codec = RecordingCodec()
+    with serve({("POST", "/api/v1/projects/1/conversations"): (201, {}, CONVERSATION)}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url, json_codec=json_codec) as client:
+            body = CreateConversationJsonBody(name="chat")
+            response = await create_conversation.asyncio_detailed(1, client=client, json_body=body)
+
+    assert response.parsed.data.name == "chat"
+    assert [call for call, _ in json_codec.calls] == ["dumps", "loads"]
+    assert json.loads(server.requests[0][3]) == {"name": "chat"}
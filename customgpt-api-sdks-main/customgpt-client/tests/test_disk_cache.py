@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.pages import preview_citation
+from customgpt_client.api.projects import delete_project
+from customgpt_client.disk_cache import DiskCache
+from tests.server import serve
+
+PREVIEW = b"%PDF-1.4 " + bytes(range(256)) * 64
+
+
+def test_previews_are_served_from_disk(tmp_path):
+    routes = {("GET", "/api/v1/preview/7"): (200, {"Content-Type": "application/pdf"}, PREVIEW)}
+    with serve(routes) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, disk_cache=DiskCache(str(tmp_path))) as client:
+            assert preview_citation.sync_detailed("7", client=client).content == PREVIEW
+            cached = preview_citation.sync_detailed("7", client=client)
+
+        # A cache opened on the same directory, as another process would, sees the stored preview
+        with CustomGPT(api_key="key", base_url=server.base_url, disk_cache=DiskCache(str(tmp_path))) as client:
+            shared = preview_citation.sync_detailed("7", client=client)
+
+    assert len(server.requests) == 1
+    assert cached.content == shared.content == PREVIEW
+    assert shared.headers["content-type"] == "application/pdf"
+
+
+def test_cache_is_shared_between_processes(tmp_path):
+    url = "http://127.0.0.1:1/api/v1/preview/7"
+    code = (
+        "import sys\n"
+        "from customgpt_client.disk_cache import DiskCache\n"
+        "cache = DiskCache(sys.argv[1])\n"
+        "key, ttl = cache.key({'method': 'get', 'url': sys.argv[2]})\n"
+        "sys.stdout.buffer.write(cache.get(key)[0].content)\n"
+    )
+
+    class Answer:
+        status_code, headers, content = 200, {}, PREVIEW
+
+    cache = DiskCache(str(tmp_path))
+    key, ttl = cache.key({"method": "get", "url": url})
+    cache.store(key, ttl, url, Answer())
+    output = subprocess.run([sys.executable, "-c", code, str(tmp_path), url], check=True, capture_output=True).stdout
+    assert output == PREVIEW
+
+
+def test_least_recently_read_bodies_are_evicted(tmp_path):
+    clock = iter(range(100)).__next__
+    cache = DiskCache(str(tmp_path), max_bytes=len(PREVIEW) * 2, clock=clock)
+
+    class Answer:
+        status_code, headers, content = 200, {}, PREVIEW
+
+    keys = []
+    for citation in range(3):
+        url = f"https://app.customgpt.ai/api/v1/projects/1/citations/{citation}"
+        key, ttl = cache.key({"method": "get", "url": url})
+        if citation == 2:
+            cache.get(keys[0])
+        cache.store(key, ttl, url, Answer())
+        keys.append(key)
+
+    assert len(cache) == 2
+    assert cache.get(keys[1])[0] is None
+    assert cache.get(keys[0])[0].content == PREVIEW
+
+
+def test_deleting_a_project_drops_its_citations(tmp_path):
+    routes = {
+        ("GET", "/api/v1/projects/1/citations/2"): (200, {}, {"status": "success", "data": {}}),
+        ("DELETE", "/api/v1/projects/1"): (200, {}, {"status": "success", "data": {"deleted": True}}),
+    }
+    with serve(routes) as server:
+        cache = DiskCache(str(tmp_path))
+        with CustomGPT(api_key="key", base_url=server.base_url, disk_cache=cache) as client:
+            kwargs = {"method": "get", "url": server.base_url + "/api/v1/projects/1/citations/2"}
+            client.request(**kwargs)
+            assert len(cache) == 1
+            delete_project.sync_detailed(1, client=client)
+
+    assert len(cache) == 0
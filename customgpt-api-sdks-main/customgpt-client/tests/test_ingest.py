@@ -0,0 +1,143 @@
+import hashlib
+import json
+import threading
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.ingest import CHECKPOINT_FILE_NAME, Checkpoint, ingest_directory
+from tests.server import serve
+
+DATES = {"created_at": "2023-04-30 16:43:53", "updated_at": "2023-04-30 16:43:53"}
+CREATED = {"status": "success", "data": {"id": 1, **DATES, "settings": {}}}
+
+
+def sources(*hashes):
+    pages = [{"id": index, "page_url_hash": page_url_hash, **DATES} for index, page_url_hash in enumerate(hashes)]
+    upload = {"id": 1, **DATES, "settings": {}, "pages": pages}
+    return {"status": "success", "data": {"sitemaps": [], "uploads": upload}}
+
+
+def make_docs(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "nested").mkdir(parents=True)
+    for index in range(6):
+        (docs / f"doc{index}.txt").write_bytes(f"document {index}".encode())
+    (docs / "nested" / "copy.txt").write_bytes(b"document 0")
+    (docs / "nested" / "notes.md").write_bytes(b"markdown")
+    return docs
+
+
+def test_ingest_skips_known_files_and_resumes(tmp_path):
+    docs = make_docs(tmp_path)
+    existing = hashlib.md5(b"document 1").hexdigest()
+    uploads = []
+
+    def create(handler):
+        uploads.append(handler)
+        return 201, {}, CREATED
+
+    routes = {
+        ("GET", "/api/v1/projects/1/sources"): (200, {}, sources(existing)),
+        ("POST", "/api/v1/projects/1/sources"): create,
+    }
+    with serve(routes) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            result = ingest_directory(1, docs, client=client, pattern="*.txt", concurrency=3)
+            assert len(result.uploaded) == 5
+            # doc1.txt is already in the project, one of doc0.txt / nested/copy.txt is skipped as a duplicate
+            assert len(result.skipped) == 2 and "doc1.txt" in result.skipped
+            assert result.failed == {}
+
+            checkpoint = json.loads((docs / CHECKPOINT_FILE_NAME).read_text())
+            assert checkpoint["project_id"] == 1
+            assert len(checkpoint["files"]) == 7
+
+            (docs / "doc6.txt").write_bytes(b"document 6")
+            resumed = ingest_directory(1, docs, client=client, pattern="*.txt")
+
+    assert resumed.uploaded == ["doc6.txt"]
+    assert len(resumed.skipped) == 7
+    assert len(uploads) == 6
+
+
+def test_ingest_pauses_every_worker_when_rate_limited(tmp_path):
+    docs = make_docs(tmp_path)
+    lock = threading.Lock()
+    calls = []
+
+    def create(handler):
+        with lock:
+            calls.append(handler)
+            if len(calls) == 1:
+                return 429, {"Retry-After": "0.3"}, {"status": "error", "data": {"code": 429, "message": "Too many"}}
+        return 201, {}, CREATED
+
+    routes = {
+        ("GET", "/api/v1/projects/1/sources"): (200, {}, sources()),
+        ("POST", "/api/v1/projects/1/sources"): create,
+    }
+    with serve(routes) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            result = ingest_directory(
+                1, docs, client=client, concurrency=1, checkpoint_path=tmp_path / "state.json"
+            )
+
+    assert result.failed == {}
+    assert len(result.uploaded) == 7
+    assert len(calls) == 8
+    assert (tmp_path / "state.json").exists()
+
+
+def test_ingest_leaves_a_checkpoint_inside_the_directory_alone(tmp_path):
+    docs = make_docs(tmp_path)
+    uploads = []
+
+    def create(handler):
+        uploads.append(handler)
+        return 201, {}, CREATED
+
+    routes = {
+        ("GET", "/api/v1/projects/1/sources"): (200, {}, sources()),
+        ("POST", "/api/v1/projects/1/sources"): create,
+    }
+    with serve(routes) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            result = ingest_directory(1, docs, client=client, checkpoint_path=docs / "nested" / "state.txt")
+            resumed = ingest_directory(1, docs, client=client, checkpoint_path=docs / "nested" / "state.txt")
+
+    assert len(result.uploaded) == 7 and "nested/state.txt" not in result.uploaded + result.skipped
+    assert resumed.uploaded == [] and len(resumed.skipped) == 8
+    assert len(uploads) == 7
+
+
+def test_checkpoint_appends_files_and_compacts(tmp_path):
+    docs = make_docs(tmp_path)
+    path = str(tmp_path / "state.json")
+    checkpoint = Checkpoint(path, 1)
+    for name in ("doc0.txt", "doc1.txt"):
+        checkpoint.record(name, (docs / name).stat(), "hash-" + name)
+    with open(path, "a") as file:
+        file.write('{"name": "doc2.txt", "ha')  # Cut short by an interruption
+
+    lines = (tmp_path / "state.json").read_text().splitlines()
+    assert len(lines) == 4 and json.loads(lines[0]) == {"project_id": 1, "files": {}}
+
+    resumed = Checkpoint(path, 1)
+    assert resumed.hashes() == {"hash-doc0.txt", "hash-doc1.txt"}
+    assert resumed.is_done("doc1.txt", (docs / "doc1.txt").stat())
+    assert len((tmp_path / "state.json").read_text().splitlines()) == 1
+    with pytest.raises(ValueError, match="checkpoint of project 1, not 2"):
+        Checkpoint(path, 2)
+    assert Checkpoint(path, 1).hashes() == {"hash-doc0.txt", "hash-doc1.txt"}
+
+
+def test_ingest_fails_when_the_sources_cannot_be_listed(tmp_path):
+    docs = make_docs(tmp_path)
+    error = {"status": "error", "data": {"code": 500, "message": "Internal error"}}
+    with serve({("GET", "/api/v1/projects/1/sources"): (500, {}, error)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            with pytest.raises(RuntimeError, match="list_sources returned 500"):
+                ingest_directory(1, docs, client=client)
+
+    assert [method for method, *_ in server.requests] == ["GET"]
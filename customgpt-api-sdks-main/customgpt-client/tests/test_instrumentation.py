@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.conversations import send_message
+from customgpt_client.api.projects import delete_project
+from customgpt_client.api.users import get_user
+from customgpt_client.instrumentation import MetricsCollector, endpoint_name
+from customgpt_client.models import SendMessageJsonBody
+from tests.server import serve
+from tests.test_transport import USER
+
+
+def test_endpoints_are_named_from_their_route():
+    assert endpoint_name("post", "https://app.customgpt.ai/api/v1/projects/1/conversations/abc/messages") == (
+        "send_message"
+    )
+    assert endpoint_name("GET", "https://app.customgpt.ai/api/v1/projects/1/pages") == "get_pages"
+    assert endpoint_name("GET", "https://app.customgpt.ai/api/v2/unknown") is None
+
+
+def test_hooks_see_each_request():
+    requests, responses, errors = [], [], []
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+        with CustomGPT(
+            api_key="key",
+            base_url=server.base_url,
+            on_request=requests.append,
+            on_response=responses.append,
+            on_error=errors.append,
+        ) as client:
+            get_user.sync_detailed(client=client)
+            get_user.sync_detailed(client=client)
+            raw = get_user.sync_detailed(client=client, parse=False)
+            raw.close()
+
+    assert len(requests) == len(responses) == 3 and not errors
+    first, second, streamed = responses
+    assert first.endpoint == "get_user" and first.method == "GET" and first.status_code == 200
+    assert first.connect is not None and second.connect is None  # The second request reuses the connection
+    assert first.ttfb <= first.total
+    assert first.response_bytes == streamed.response_bytes == len(json.dumps(USER))
+    assert first.parse_time is not None and streamed.parse_time is None
+    assert first.retries == 0 and first.request_bytes == 0
+
+
+def test_errors_are_reported():
+    errors = []
+    with CustomGPT(api_key="key", base_url="http://127.0.0.1:1", on_error=errors.append) as client:
+        with pytest.raises(OSError):
+            get_user.sync_detailed(client=client)
+
+    assert len(errors) == 1
+    assert errors[0].endpoint == "get_user" and isinstance(errors[0].error, OSError)
+
+
+@pytest.mark.asyncio
+async def test_async_hooks_record_connection_timings():
+    responses = []
+    deleted = {"status": "success", "data": {"deleted": True}}
+    with serve({("DELETE", "/api/v1/projects/1"): (200, {}, deleted)}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url, on_response=responses.append) as client:
+            await delete_project.asyncio_detailed(1, client=client)
+
+    (event,) = responses
+    assert event.endpoint == "delete_project" and event.status_code == 200
+    assert event.connect is not None and event.ttfb is not None and event.parse_time is not None
+
+
+@pytest.mark.asyncio
+async def test_sent_messages_time_their_parsing():
+    responses = []
+    created = "2023-04-30 16:43:53"
+    data = {"openai_response": "Hello", "created_at": created, "updated_at": created, "metadata": {}}
+    message = {"status": "success", "data": data}
+    route = (200, {}, message)
+    with serve({("POST", "/api/v1/projects/1/conversations/abc/messages"): route}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, on_response=responses.append) as client:
+            sync = send_message.sync_detailed(1, "abc", client=client, json_body=SendMessageJsonBody(prompt="Hi"))
+        async with CustomGPT(api_key="key", base_url=server.base_url, on_response=responses.append) as client:
+            await send_message.asyncio_detailed(1, "abc", client=client, json_body=SendMessageJsonBody(prompt="Hi"))
+
+    assert sync.parsed.data.openai_response == "Hello"
+    assert [event.endpoint for event in responses] == ["send_message", "send_message"]
+    assert all(event.parse_time is not None for event in responses)
+
+
+def test_metrics_are_kept_per_endpoint():
+    metrics = MetricsCollector(buckets=(0.5, 10.0))
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+        with CustomGPT(
+            api_key="key", base_url=server.base_url, on_response=metrics.on_response, on_error=metrics.on_error
+        ) as client:
+            for _ in range(4):
+                get_user.sync_detailed(client=client)
+
+    user = metrics.snapshot()["get_user"]
+    assert user.requests == 4 and user.errors == 0
+    assert user.counts == [4, 0, 0]
+    assert user.quantile(0.99) == 0.5
+    assert user.response_bytes > 0 and 0 < user.mean < 0.5
@@ -0,0 +1,56 @@
+import importlib
+import inspect
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+from customgpt_client import api, models
+
+
+def test_import_loads_no_models_or_endpoints():
+    code = (
+        "import sys, customgpt_client\n"
+        "loaded = [name for name in sys.modules if name.startswith(('customgpt_client.models.', 'httpx'))]\n"
+        "loaded += [\n"
+        "    name for name in sys.modules if name.count('.') == 3 and name.startswith('customgpt_client.api.')\n"
+        "]\n"
+        "print(loaded)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_models_resolve_on_access():
+    from customgpt_client.models.user import User
+
+    assert models.User is User
+    assert "User" in vars(models)
+    assert "CreateSourceMultipartData" in dir(models)
+    with pytest.raises(AttributeError):
+        models.NotAModel
+    assert all(getattr(models, name) for name in models.__all__)
+
+
+def test_every_model_module_is_indexed():
+    # The eager package imported the class of each of these modules; all of them must still resolve
+    for module_info in pkgutil.iter_modules(models.__path__):
+        module = importlib.import_module(f"customgpt_client.models.{module_info.name}")
+        classes = [
+            name
+            for name, value in vars(module).items()
+            if inspect.isclass(value) and value.__module__ == module.__name__ and not name.startswith("_")
+        ]
+        assert classes, module.__name__
+        for name in classes:
+            assert name in models.__all__, name
+            assert getattr(models, name) is getattr(module, name)
+
+
+def test_endpoint_modules_resolve_on_access():
+    from customgpt_client.api.projects import list_projects
+
+    assert api.projects.list_projects is list_projects
+    with pytest.raises(AttributeError):
+        api.projects.not_an_endpoint
@@ -0,0 +1,139 @@
+import os
+import pickle
+import sys
+from io import BytesIO
+
+import pytest
+from dateutil.parser import isoparse
+
+from customgpt_client import CustomGPT, decoding
+from customgpt_client.models import GetPagesResponse200, GetPagesResponse200DataPagesDataItem
+from customgpt_client.types import UNSET
+from tests.server import serve
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+from model_bench import cases  # noqa: E402
+from openapi_examples import load_spec  # noqa: E402
+
+PAGE = {
+    "id": 1,
+    "page_url": "https://example.com",
+    "page_url_hash": "d41d8cd98f00b204e9800998ecf8427e",
+    "project_id": 1,
+    "crawl_status": "ok",
+    "index_status": "ok",
+    "is_file": False,
+    "created_at": "2023-04-30 16:43:53",
+    "updated_at": "2023-04-30 16:43:53",
+    "deleted_at": None,
+}
+
+
+def test_models_are_slotted():
+    page = GetPagesResponse200DataPagesDataItem.from_dict(PAGE)
+
+    assert not hasattr(page, "__dict__")
+    with pytest.raises(AttributeError):
+        page.not_a_field = 1
+    assert pickle.loads(pickle.dumps(page)) == page
+
+
+def test_only_unknown_keys_are_kept():
+    page = GetPagesResponse200DataPagesDataItem.from_dict({**PAGE, "extra": "value"})
+
+    assert page.additional_properties == {"extra": "value"}
+    assert page["extra"] == "value"
+    assert page["id"] == 1
+    assert "page_url" in page and "extra" in page and "missing" not in page
+    assert page.to_dict()["extra"] == "value"
+    with pytest.raises(KeyError):
+        page["missing"]
+
+
+def test_unknown_keys_can_be_skipped(monkeypatch):
+    monkeypatch.setattr(decoding.options, "keep_additional_properties", False)
+    page = GetPagesResponse200DataPagesDataItem.from_dict({**PAGE, "extra": "value"})
+
+    assert page.additional_properties == {}
+    assert page.id == 1
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2023-04-30 16:43:53", "2023-04-30T16:43:53.000000Z", "2023-04-30T16:43:53+02:00", "2023-04-30", "20230430T1643"],
+)
+def test_parse_datetime_matches_isoparse(value):
+    parsed = decoding.parse_datetime(value)
+
+    assert parsed == isoparse(value)
+    assert parsed.utcoffset() == isoparse(value).utcoffset()
+
+
+def test_timestamps_are_shared_between_items():
+    first = GetPagesResponse200DataPagesDataItem.from_dict(PAGE)
+    second = GetPagesResponse200DataPagesDataItem.from_dict(PAGE)
+
+    assert first.created_at is second.created_at is first.updated_at
+
+
+def test_lazy_models_decode_fields_on_access():
+    project = {"id": 1, "created_at": PAGE["created_at"], "updated_at": PAGE["updated_at"]}
+    pages = {"total": 2, "data": [PAGE, {**PAGE, "id": 2}]}
+    body = {"status": "success", "data": {"project": project, "pages": pages, "extra": 1}}
+    response = decoding.decode(GetPagesResponse200, body, lazy=True)
+
+    assert response.data.pages.total == 2
+    pages = response.data.pages
+    assert pages.__getattribute__("_lazy_source")["data"][0] is PAGE
+    with pytest.raises(AttributeError):
+        pages.__getattribute__("data")
+
+    first = pages.data[0]
+    assert isinstance(first, GetPagesResponse200DataPagesDataItem)
+    assert first.created_at is decoding.parse_datetime(PAGE["created_at"])
+    assert first.deleted_at is None
+    assert decoding.decode(GetPagesResponse200, {}, lazy=True).data is UNSET
+    assert response.data.additional_properties == {"extra": 1}
+    assert response.to_dict() == GetPagesResponse200.from_dict(body).to_dict()
+    assert pickle.loads(pickle.dumps(response)) == GetPagesResponse200.from_dict(body)
+    with pytest.raises(AttributeError):
+        first.not_a_field
+
+
+def test_lazy_decoding_is_set_per_client():
+    project = {"id": 1, "created_at": PAGE["created_at"], "updated_at": PAGE["updated_at"]}
+    body = {"status": "success", "data": {"project": project, "pages": {"total": 1, "data": [PAGE]}}}
+    with serve({("GET", "/api/v1/projects/1/pages"): (200, {}, body)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, lazy_decoding=True) as lazy, CustomGPT(
+            api_key="key", base_url=server.base_url
+        ) as eager:
+            lazy_pages = lazy.pages.get(project_id=1).parsed.data.pages
+            eager_pages = eager.pages.get(project_id=1).parsed.data.pages
+
+    with pytest.raises(AttributeError):
+        lazy_pages.__getattribute__("data")
+    assert eager_pages.__getattribute__("data")[0].id == PAGE["id"]
+    assert lazy_pages.data[0].id == PAGE["id"]
+
+
+def comparable(value):
+    """Turn the file payloads of a to_dict, compared by identity, into their content"""
+    if isinstance(value, dict):
+        return {key: comparable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(comparable(item) for item in value)
+    return value.getvalue() if isinstance(value, BytesIO) else value
+
+
+@pytest.mark.parametrize(
+    "model, body",
+    [pytest.param(model, body, id=name) for name, model, _, body in cases(load_spec(), [2])],
+)
+def test_lazy_models_match_eager_ones(model, body):
+    # With every key missing too; from_dict fails on the nested models then, which lazy models leave unset
+    for src_dict in (body, {}):
+        try:
+            expected = comparable(model.from_dict(src_dict).to_dict())
+        except (AttributeError, TypeError):
+            continue
+        assert comparable(model.lazy_from_dict(src_dict).to_dict()) == expected
@@ -0,0 +1,48 @@
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.projects import list_projects
+from customgpt_client.pagination import aiter_all, iter_all
+from tests.server import serve
+
+PER_PAGE, LAST_PAGE = 3, 5
+
+
+def projects_page(handler):
+    time.sleep(0.1)
+    page = int(parse_qs(urlparse(handler.path).query)["page"][0])
+    items = [
+        {
+            "id": (page - 1) * PER_PAGE + index,
+            "project_name": "test",
+            "created_at": "2023-04-30 16:43:53",
+            "updated_at": "2023-04-30 16:43:53",
+            "deleted_at": None,
+        }
+        for index in range(PER_PAGE)
+    ]
+    data = {"current_page": page, "data": items, "last_page": LAST_PAGE, "per_page": PER_PAGE, "total": 15}
+    return 200, {}, {"status": "success", "data": data}
+
+
+def test_iter_all():
+    with serve({("GET", "/api/v1/projects"): projects_page}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            started = time.monotonic()
+            ids = [project.id for project in iter_all(list_projects, client=client, concurrency=4)]
+            elapsed = time.monotonic() - started
+
+    assert ids == list(range(PER_PAGE * LAST_PAGE))
+    assert elapsed < 0.1 * LAST_PAGE
+
+
+@pytest.mark.asyncio
+async def test_aiter_all():
+    with serve({("GET", "/api/v1/projects"): projects_page}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            ids = [project.id async for project in aiter_all(list_projects, client=client, page=2)]
+
+    assert ids == list(range(PER_PAGE, PER_PAGE * LAST_PAGE))
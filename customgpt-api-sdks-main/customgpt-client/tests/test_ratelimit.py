@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.users import get_user
+from customgpt_client.ratelimit import RateLimiter
+from tests.server import serve
+from tests.test_transport import USER
+
+LIMITED = {"status": "error", "data": {"code": 429, "message": "Too many requests"}}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_limiter_paces_to_reported_window():
+    clock = FakeClock()
+    limiter = RateLimiter(burst=2, clock=clock)
+    assert [limiter.reserve() for _ in range(5)] == [0.0] * 5
+
+    limiter.update(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"})
+    assert limiter.rate == 2.0
+    delays = [limiter.reserve() for _ in range(4)]
+    assert delays == [0.0, 0.0, 0.5, 1.0]
+
+
+def test_limiter_holds_everyone_after_429():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=4.0, burst=4, clock=clock)
+    assert limiter.update(429, {"Retry-After": "3"}) == 3.0
+    assert [limiter.reserve() for _ in range(3)] == [3.25, 3.5, 3.75]
+
+    clock.now += 10
+    limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+    assert limiter.reserve() == 2.25
+
+
+def test_limiter_recovers_after_429_without_rate_limit_headers():
+    clock = FakeClock()
+    limiter = RateLimiter(burst=2, clock=clock)
+    assert limiter.update(429, {"Retry-After": "30"}) == 30.0
+    assert [limiter.reserve() for _ in range(3)] == [45.0, 60.0, 75.0]
+
+    clock.now += 3600
+    assert [limiter.reserve() for _ in range(40)] == [0.0] * 40
+    assert limiter.rate is None
+
+
+def test_reported_rate_outlasts_a_429():
+    clock = FakeClock()
+    limiter = RateLimiter(burst=2, clock=clock)
+    limiter.update(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"})
+    limiter.update(429, {"Retry-After": "30"})
+
+    clock.now += 3600
+    assert limiter.rate == 2.0
+    assert [limiter.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+
+def test_client_retries_rate_limited_requests():
+    lock = threading.Lock()
+    calls = []
+
+    def user(handler):
+        with lock:
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                return 429, {"Retry-After": "0.2"}, LIMITED
+        return 200, {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "60"}, USER
+
+    with serve({("GET", "/api/v1/user"): user}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            response = get_user.sync_detailed(client=client)
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_async_tasks_share_the_limiter():
+    calls = []
+
+    def user(handler):
+        calls.append(time.monotonic())
+        if len(calls) <= 3:
+            return 429, {"Retry-After": "0.3"}, LIMITED
+        return 200, {}, USER
+
+    limiter = RateLimiter()
+    with serve({("GET", "/api/v1/user"): user}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url, rate_limiter=limiter) as client:
+            responses = await asyncio.gather(*(get_user.asyncio_detailed(client=client) for _ in range(3)))
+
+    assert [response.status_code for response in responses] == [200] * 3
+    assert len(calls) == 6
+    assert calls[3] - calls[0] >= 0.3
+
+
+def test_limiter_can_be_disabled():
+    with serve({("GET", "/api/v1/user"): (429, {"Retry-After": "5"}, LIMITED)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, rate_limiter=None) as client:
+            response = get_user.sync_detailed(client=client)
+
+    assert response.status_code == 429
+    assert len(server.requests) == 1
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.users import get_user
+from customgpt_client.streaming import AsyncRawResponse, RawResponse
+from customgpt_client.types import Response
+from tests.server import serve
+from tests.test_transport import USER
+
+
+def test_raw_client_returns_unparsed_bodies():
+    with serve({("GET", "/api/v1/user"): (200, {"X-Upstream": "1"}, USER)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, parse=False) as client:
+            with get_user.sync_detailed(client=client) as response:
+                assert isinstance(response, RawResponse)
+                assert response.status_code == 200
+                assert response.headers["X-Upstream"] == "1"
+                assert json.loads(b"".join(response.iter_bytes())) == USER
+
+            assert json.loads(get_user.sync_detailed(client=client).content) == USER
+            assert isinstance(get_user.sync_detailed(client=client, parse=True), Response)
+            assert get_user.sync(client=client).data.name == "test"
+
+
+def test_parse_can_be_turned_off_per_call():
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            response = get_user.sync_detailed(client=client, parse=False)
+            assert isinstance(response, RawResponse)
+            assert json.loads(b"".join(response.iter_raw())) == USER
+
+
+@pytest.mark.asyncio
+async def test_async_raw_responses():
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url, parse=False) as client:
+            async with await get_user.asyncio_detailed(client=client) as response:
+                assert isinstance(response, AsyncRawResponse)
+                assert json.loads(b"".join([chunk async for chunk in response.aiter_bytes()])) == USER
+
+            response = await get_user.asyncio_detailed(client=client)
+            assert json.loads(await response.read()) == USER
+            assert (await get_user.asyncio(client=client)).data.name == "test"
@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from customgpt_client.api.users import get_user
+from customgpt_client.registry import ClientRegistry
+from tests.server import serve
+from tests.test_transport import USER
+
+
+def test_idle_clients_are_evicted_least_recently_used_first():
+    now = [0.0]
+    registry = ClientRegistry(max_connections=4, connections_per_client=2, idle_timeout=60, clock=lambda: now[0])
+    with registry.client("a") as a:
+        a.get_session()
+        limiter = registry.rate_limiter("a")
+    with registry.client("b"):
+        pass
+    with registry.client("a") as again:
+        assert again is a
+    with registry.client("c"):
+        pass
+
+    assert len(registry) == 2  # b was the least recently used
+    with registry.client("b") as b:
+        assert b.pool_maxsize == 2 and b.pool_block
+    assert a._session is None  # a was evicted in its turn, and closed
+    with registry.client("a") as replaced:
+        assert replaced is not a
+        assert registry.rate_limiter("a") is limiter  # The tenant's bucket outlives its client
+
+    now[0] = 120.0
+    assert registry.prune() == 2 and len(registry) == 0
+
+
+def test_leases_wait_for_a_client_to_be_returned():
+    registry = ClientRegistry(max_connections=1, connections_per_client=1, acquire_timeout=0.1)
+    leased = []
+    with registry.client("a"):
+        with pytest.raises(TimeoutError):
+            with registry.client("b"):
+                pass
+
+        registry.acquire_timeout = None
+        waiting = threading.Thread(target=lambda: leased.append(registry.client("b").__enter__()))
+        waiting.start()
+        time.sleep(0.1)
+        assert not leased
+    waiting.join(timeout=1)
+    assert leased and leased[0].api_key == "b"
+    registry.close()
+
+
+def test_connections_are_capped_across_tenants():
+    def slow_user(handler):
+        time.sleep(0.05)
+        return 200, {}, USER
+
+    with serve({("GET", "/api/v1/user"): slow_user}) as server:
+        registry = ClientRegistry(max_connections=2, connections_per_client=1)
+
+        def call(api_key):
+            with registry.client(api_key, server.base_url) as client:
+                return get_user.sync_detailed(client=client).status_code
+
+        with registry, ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(call, ["noisy"] * 12 + ["quiet"] * 4))
+
+    assert statuses == [200] * 16
+    assert len(server.connections) <= 2
+    assert {headers["Authorization"] for _, _, headers, _ in server.requests} == {"Bearer noisy", "Bearer quiet"}
+
+
+@pytest.mark.asyncio
+async def test_async_leases():
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+        with ClientRegistry(max_connections=1, connections_per_client=1) as registry:
+            async with registry.aclient("a", server.base_url) as client:
+                response = await client.users.aget()
+            async with registry.aclient("b", server.base_url) as other:
+                assert other is not client
+                await other.users.aget()
+
+    assert response.status_code == 200
+    assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_pools_count_against_the_cap():
+    registry = ClientRegistry(max_connections=2, connections_per_client=2, acquire_timeout=0.1)
+    with registry.client("a") as a:
+        with pytest.raises(TimeoutError):  # Its session already takes every connection
+            async with registry.aclient("a"):
+                pass
+
+    async with registry.aclient("a") as replaced:
+        assert replaced is not a  # a was closed to make room for the pool of this loop
+        assert a._session is None
+    async with registry.aclient("a") as again:
+        assert again is replaced
+    registry.close()
+
+
+@pytest.mark.asyncio
+async def test_async_leases_are_woken_when_a_client_is_returned():
+    registry = ClientRegistry(max_connections=1, connections_per_client=1)
+    lease = registry.client("a")
+    lease.__enter__()
+    timer = threading.Timer(0.1, lease.__exit__, (None, None, None))
+    started = time.monotonic()
+    timer.start()
+    async with registry.aclient("b") as client:
+        assert client.api_key == "b"
+    assert time.monotonic() - started < 0.5
+    assert registry._waiters == []
+    registry.close()
+
+
+def test_rate_limiters_of_tenants_without_a_client_are_bounded():
+    registry = ClientRegistry(max_connections=1, connections_per_client=1, max_rate_limiters=2)
+    for api_key in "abcd":
+        with registry.client(api_key):
+            pass
+
+    assert [api_key for api_key, _ in registry._rate_limiters] == ["b", "c", "d"]  # d has a client, b and c don't
+    assert registry.rate_limiter("a") is None
@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from customgpt_client import CustomGPT
+from tests.server import serve
+from tests.test_transport import USER
+
+
+def test_each_client_calls_its_own_account():
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as first, serve(
+        {("GET", "/api/v1/user"): (200, {}, USER)}
+    ) as second:
+        with CustomGPT(api_key="first", base_url=first.base_url) as one, CustomGPT(
+            api_key="second", base_url=second.base_url
+        ) as other:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                calls = [executor.submit(client.users.get) for client in (one, other) * 3]
+                assert [call.result().status_code for call in calls] == [200] * 6
+
+    for server, api_key in ((first, "first"), (second, "second")):
+        assert len(server.requests) == 3
+        assert {headers["Authorization"] for _, _, headers, _ in server.requests} == {f"Bearer {api_key}"}
+    assert len(first.connections) <= 3  # Calls share the client's pooled session
+
+
+def test_accessors_bind_the_resource_classes():
+    client = CustomGPT(api_key="key")
+    assert CustomGPT.projects is CustomGPT.Project
+    assert client.projects.list.__name__ == "list"
+    assert "send" in dir(client.conversations) and "iter_all" in dir(client.pages)
+    with pytest.raises(AttributeError):
+        client.projects.missing
+
+
+@pytest.mark.asyncio
+async def test_async_calls_go_through_the_client():
+    deleted = {"status": "success", "data": {"deleted": True}}
+    with serve({("DELETE", "/api/v1/projects/1/pages/2"): (200, {}, deleted)}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            response = await client.pages.adelete(project_id=1, page_id=2)
+
+    assert response.status_code == 200
+    assert server.requests[0][2]["Authorization"] == "Bearer key"
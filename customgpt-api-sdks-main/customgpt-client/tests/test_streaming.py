@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.conversations import send_message
+from customgpt_client.models import SendMessageJsonBody
+from customgpt_client.streaming import SSEDecoder
+from tests.server import serve
+
+STREAM = (
+    b"event: progress\r\n"
+    b'data: {"status": "progress", "message": "Hello"}\r\n\r\n'
+    b": keep-alive\n\n"
+    b"event: progress\n"
+    b'data: {"status": "progress", "message": ", w\xc3\xb6rld"}\n\n'
+    b"event: finish\n"
+    b'data: {"status": "finish", "citations": [1, 2]}\n\n'
+)
+
+
+def test_decoder_handles_any_chunking():
+    whole = SSEDecoder().feed(STREAM)
+    decoder = SSEDecoder()
+    split = [event for index in range(len(STREAM)) for event in decoder.feed(STREAM[index : index + 1])]
+    split += decoder.flush()
+
+    assert split == whole
+    assert [event.event for event in whole] == ["progress", "progress", "finish"]
+    assert json.loads(whole[1].data)["message"] == ", wörld"
+
+
+def test_stream_assembles_answer():
+    route = (200, {"Content-Type": "text/event-stream"}, STREAM)
+    with serve({("POST", "/api/v1/projects/1/conversations/abc/messages"): route}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            stream = send_message.sync_detailed(
+                1, "abc", client=client, json_body=SendMessageJsonBody(prompt="Hi"), stream=True
+            )
+            messages = [chunk.message for chunk in stream if chunk.status == "progress"]
+
+    assert messages == ["Hello", ", wörld"]
+    assert stream.answer == "Hello, wörld"
+    assert stream.citations == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_assembles_answer():
+    route = (200, {"Content-Type": "text/event-stream"}, STREAM)
+    with serve({("POST", "/api/v1/projects/1/conversations/abc/messages"): route}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            stream = await send_message.asyncio_detailed(
+                1, "abc", client=client, json_body=SendMessageJsonBody(prompt="Hi"), stream=True
+            )
+            await stream.until_done()
+
+    assert stream.answer == "Hello, wörld"
+    assert stream.final.citations == [1, 2]
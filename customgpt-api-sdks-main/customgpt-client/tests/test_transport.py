@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from customgpt_client import CustomGPT
+from customgpt_client import client as client_module
+from customgpt_client.api.users import get_user
+from customgpt_client.client import set_client
+from tests.server import serve
+
+USER = {
+    "status": "success",
+    "data": {
+        "id": 1,
+        "name": "test",
+        "email": "test@example.com",
+        "created_at": "2023-04-30 16:43:53",
+        "updated_at": "2023-04-30 16:43:53",
+    },
+}
+
+
+def test_connections_are_reused():
+    with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url, pool_maxsize=2) as client:
+            for _ in range(5):
+                response = get_user.sync_detailed(client=client)
+                assert response.status_code == 200
+
+        assert len(server.requests) == 5
+        assert len(server.connections) == 1
+
+
+def test_default_client_is_shared(monkeypatch):
+    # The class level settings and the default client are put back once the test is over
+    monkeypatch.setattr(client_module, "_default_client", None)
+    monkeypatch.setattr(CustomGPT, "api_key", "key", raising=False)
+    monkeypatch.setattr(CustomGPT, "base_url", "http://127.0.0.1:1", raising=False)
+    client = set_client()
+    assert set_client() is client
+    assert client.get_session() is client.get_session()
+
+    monkeypatch.setattr(CustomGPT, "api_key", "other", raising=False)
+    assert set_client() is not client
+
+
+def test_close_closes_the_pools_of_every_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        with serve({("GET", "/api/v1/user"): (200, {}, USER)}) as server:
+            client = CustomGPT(api_key="key", base_url=server.base_url)
+            asyncio.run_coroutine_threadsafe(get_user.asyncio_detailed(client=client), loop).result(5)
+            async_client = client._async_clients[loop]
+            client.close()
+            deadline = time.monotonic() + 5
+            while not async_client.is_closed and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert async_client.is_closed
+        assert loop not in client._async_clients
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_async_requests_overlap():
+    def slow_user(handler):
+        time.sleep(0.2)
+        return 200, {}, USER
+
+    with serve({("GET", "/api/v1/user"): slow_user}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url, pool_maxsize=10) as client:
+            await get_user.asyncio_detailed(client=client)
+            started = time.monotonic()
+            responses = await asyncio.gather(*(get_user.asyncio_detailed(client=client) for _ in range(10)))
+            elapsed = time.monotonic() - started
+
+        assert [response.status_code for response in responses] == [200] * 10
+        assert responses[0].parsed.data.name == "test"
+        assert elapsed < 1.0
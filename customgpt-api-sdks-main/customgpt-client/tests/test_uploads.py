@@ -0,0 +1,66 @@
+import pytest
+from requests.models import RequestEncodingMixin
+
+from customgpt_client import CustomGPT
+from customgpt_client.api.sources import create_source
+from customgpt_client.models import CreateSourceMultipartData
+from customgpt_client.multipart import MultipartEncoder
+from customgpt_client.types import File
+from tests.server import serve
+
+SOURCE = {
+    "status": "success",
+    "data": {"id": 1, "created_at": "2023-04-30 16:43:53", "updated_at": "2023-04-30 16:43:53", "settings": {}},
+}
+
+
+def test_encoder_matches_requests(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF" * 1000)
+    with File.from_path(path) as file:
+        fields = CreateSourceMultipartData(file_data_retension=True, file=file).to_multipart()
+        expected, content_type = RequestEncodingMixin._encode_files(fields, {})
+        file.payload.seek(0)
+        encoder = MultipartEncoder(fields, chunk_size=512)
+        body = b"".join(encoder)
+
+    assert len(body) == len(encoder)
+    assert body == expected.replace(content_type.split("boundary=")[1].encode(), encoder.boundary.encode())
+
+
+def test_upload_streams_file_in_chunks(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"x" * 300_000)
+    progress = []
+
+    with serve({("POST", "/api/v1/projects/1/sources"): (201, {}, SOURCE)}) as server:
+        with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            with File.from_path(path, on_progress=lambda sent, total: progress.append((sent, total))) as file:
+                multipart_data = CreateSourceMultipartData(file=file)
+                response = create_source.sync_detailed(1, client=client, multipart_data=multipart_data)
+                retried = create_source.sync_detailed(1, client=client, multipart_data=multipart_data)
+
+    assert response.status_code == retried.status_code == 201
+    assert progress[-1] == (300_000, 300_000)
+    assert len(progress) > 2
+    for _, _, headers, body in server.requests:
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert body.count(b"x" * 300_000) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_upload(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"x" * 100_000)
+
+    with serve({("POST", "/api/v1/projects/1/sources"): (201, {}, SOURCE)}) as server:
+        async with CustomGPT(api_key="key", base_url=server.base_url) as client:
+            with File.from_path(path) as file:
+                multipart_data = CreateSourceMultipartData(sitemap_path="https://example.com/sitemap.xml", file=file)
+                response = await create_source.asyncio_detailed(1, client=client, multipart_data=multipart_data)
+
+    assert response.status_code == 201
+    _, _, headers, body = server.requests[0]
+    assert int(headers["Content-Length"]) == len(body)
+    assert b"https://example.com/sitemap.xml" in body
+    assert body.count(b"x" * 100_000) == 1
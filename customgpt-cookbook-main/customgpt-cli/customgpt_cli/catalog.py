@@ -0,0 +1,258 @@
+"""
+Local catalog of an account's projects and their stats.
+
+The catalog keeps the projects listed by the API in an SQLite database so that
+list-projects can filter them with indexed queries instead of downloading every
+project on each run. It is refreshed incrementally: the newest projects are
+listed first and the listing stops at the first project already known with the
+same update time.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from customgpt_client import CustomGPT
+from customgpt_client.models import ListProjectsOrder, ListProjectsResponse200DataDataItem, StatsProjectResponse200Data
+from customgpt_client.types import Unset
+
+# Where the catalogs are kept unless --catalog names a file
+DEFAULT_CATALOG_DIR = os.path.join(os.path.expanduser('~'), '.customgpt-cli')
+
+# Seconds the stats of a project are reused before they are requested again
+DEFAULT_STATS_MAX_AGE = 3600
+
+# The stats columns, by the name used in the list-projects filters (--min-<name> / --max-<name>)
+STAT_COLUMNS = {
+    'queries': 'total_queries',
+    'pages_found': 'pages_found',
+    'pages_crawled': 'pages_crawled',
+    'pages_indexed': 'pages_indexed',
+    'words_indexed': 'total_words_indexed',
+    'storage_credits': 'total_storage_credits_used',
+    'crawl_credits': 'crawl_credits_used',
+    'query_credits': 'query_credits_used',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    project_name TEXT NOT NULL,
+    updated_at REAL,
+    project TEXT NOT NULL,
+    stats TEXT,
+    stats_fetched_at REAL,
+    {stat_columns}
+);
+CREATE INDEX IF NOT EXISTS projects_updated_at ON projects (updated_at);
+CREATE INDEX IF NOT EXISTS projects_project_name ON projects (project_name);
+{stat_indexes}
+""".format(
+    stat_columns=',\n    '.join(f'{column} INTEGER' for column in STAT_COLUMNS.values()),
+    stat_indexes='\n'.join(
+        f'CREATE INDEX IF NOT EXISTS projects_{column} ON projects ({column});' for column in STAT_COLUMNS.values()
+    ),
+)
+
+
+def default_catalog_path(api_key: str, base_url: str) -> str:
+    """
+    Get the catalog file of an account, one per API key and base URL.
+
+    The key is hashed so it never ends up in a file name.
+    """
+    account = hashlib.sha256(f'{base_url}\n{api_key}'.encode()).hexdigest()[:16]
+    return os.path.join(DEFAULT_CATALOG_DIR, f'catalog-{account}.sqlite3')
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    """Get the POSIX time of a datetime, naive ones being UTC as the API sends them."""
+    if not isinstance(value, datetime):
+        return None
+    return (value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value).timestamp()
+
+
+def _stat(stats: Any, column: str) -> Optional[int]:
+    """Get a stat of a project; those the API sends beyond its spec (total_queries, ...) are additional properties."""
+    value = getattr(stats, column, None)
+    if value is None:
+        value = stats.additional_properties.get(column)
+    return None if isinstance(value, Unset) else value
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    return value is not None and re.search(pattern, value, re.IGNORECASE) is not None
+
+
+class ProjectCatalog:
+    """
+    An SQLite catalog of projects and their stats.
+
+    Args:
+        path: The database file; its directory is created if needed.
+        clock: The wall clock in seconds used to age the stats.
+    """
+
+    def __init__(self, path: str, clock=time.time):
+        self.path = path
+        self.clock = clock
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.create_function('REGEXP', 2, _regexp, deterministic=True)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM projects').fetchone()[0]
+
+    def refresh(self, full: bool = False) -> int:
+        """
+        Bring the catalog up to date with the API.
+
+        An empty catalog, or a full refresh, lists every project (pages fetched
+        concurrently) and replaces the catalog, dropping the deleted projects.
+        Otherwise pages are listed newest first until a project already known
+        with the same update time is met.
+
+        Args:
+            full: List every project instead of the new and updated ones.
+
+        Returns:
+            int: The number of projects added or updated
+        """
+        known = dict(self._connection.execute('SELECT id, updated_at FROM projects'))
+        if full or not known:
+            projects = list(CustomGPT.Project.iter_all(order=ListProjectsOrder.DESC))
+            with self._connection:
+                deleted = known.keys() - {p.id for p in projects}
+                self._connection.executemany('DELETE FROM projects WHERE id = ?', [(i,) for i in deleted])
+                return self._upsert(projects, known)
+
+        changed = 0
+        page = 1
+        while True:
+            response = CustomGPT.Project.list(page=page, order=ListProjectsOrder.DESC, parse=True)
+            listing = response.parsed.data if response.status_code == 200 else None
+            if listing is None or isinstance(listing, Unset):
+                raise RuntimeError(f'Listing projects failed with status {int(response.status_code)}')
+            projects = [] if isinstance(listing.data, Unset) else listing.data
+            reached = any(known.get(p.id) == _timestamp(p.updated_at) for p in projects)
+            with self._connection:
+                changed += self._upsert(projects, known)
+            last_page = listing.last_page if isinstance(listing.last_page, int) else page
+            if reached or page >= last_page:
+                break
+            page += 1
+        return changed
+
+    def _upsert(self, projects: Iterable[Any], known: Dict[int, Optional[float]]) -> int:
+        """Store listed projects; the stats of the updated ones are dropped so they are requested again."""
+        rows = [
+            (p.id, p.project_name, _timestamp(p.updated_at), json.dumps(p.to_dict()))
+            for p in projects
+            if p.id not in known or known[p.id] != _timestamp(p.updated_at)
+        ]
+        self._connection.executemany(
+            'INSERT INTO projects (id, project_name, updated_at, project) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (id) DO UPDATE SET project_name = excluded.project_name, updated_at = excluded.updated_at, '
+            'project = excluded.project, stats = NULL, stats_fetched_at = NULL, '
+            + ', '.join(f'{column} = NULL' for column in STAT_COLUMNS.values()),
+            rows,
+        )
+        return len(rows)
+
+    def forget(self, project_ids: Iterable[int]):
+        """Drop projects, e.g. once they are deleted."""
+        with self._connection:
+            self._connection.executemany('DELETE FROM projects WHERE id = ?', [(i,) for i in project_ids])
+
+    def query(self, name_filter: Optional[str] = None, inactive_days: Optional[int] = None,
+              **stats_filters: Optional[int]) -> List[Any]:
+        """
+        Find the catalogued projects matching the list-projects filters, newest first.
+
+        Args:
+            name_filter: Regex searched in the project names, ignoring case
+            inactive_days: Only keep the projects not updated for this many days
+            **stats_filters: min_<name> / max_<name> bounds on the stats columns (see STAT_COLUMNS);
+                projects whose stats are unknown don't match them
+
+        Returns:
+            list: The matching projects, as list_projects returns them
+        """
+        clauses, parameters = [], []
+        if name_filter:
+            clauses.append('project_name REGEXP ?')
+            parameters.append(name_filter)
+        if inactive_days is not None:
+            clauses.append('updated_at < ?')
+            parameters.append(self.clock() - inactive_days * 86400)
+        for name, value in stats_filters.items():
+            if value is None:
+                continue
+            bound, _, stat = name.partition('_')
+            if bound not in ('min', 'max') or stat not in STAT_COLUMNS:
+                raise ValueError(f'Unknown stats filter: {name}')
+            clauses.append(f"{STAT_COLUMNS[stat]} {'>=' if bound == 'min' else '<='} ?")
+            parameters.append(value)
+
+        sql = 'SELECT project FROM projects'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY id DESC'
+        return [
+            ListProjectsResponse200DataDataItem.from_dict(json.loads(project))
+            for (project,) in self._connection.execute(sql, parameters)
+        ]
+
+    def stale_stats(self, project_ids: Iterable[int], max_age: float = DEFAULT_STATS_MAX_AGE) -> List[int]:
+        """Get which of the projects have no stats in the catalog, or stats older than max_age seconds."""
+        cutoff = self.clock() - max_age
+        fresh = {
+            project_id
+            for (project_id,) in self._connection.execute(
+                'SELECT id FROM projects WHERE stats_fetched_at >= ?', (cutoff,)
+            )
+        }
+        return [project_id for project_id in project_ids if project_id not in fresh]
+
+    def store_stats(self, stats_by_project: Dict[int, Any]):
+        """Keep fetched project stats; projects whose stats could not be fetched are skipped."""
+        now = self.clock()
+        rows = []
+        for project_id, stats in stats_by_project.items():
+            if stats is None:
+                continue
+            values = [_stat(stats, column) for column in STAT_COLUMNS.values()]
+            rows.append((json.dumps(stats.to_dict()), now, *values, project_id))
+        with self._connection:
+            self._connection.executemany(
+                'UPDATE projects SET stats = ?, stats_fetched_at = ?, '
+                + ', '.join(f'{column} = ?' for column in STAT_COLUMNS.values())
+                + ' WHERE id = ?',
+                rows,
+            )
+
+    def stats(self, project_ids: Iterable[int]) -> Dict[int, Any]:
+        """Get the catalogued stats of the projects that have some."""
+        ids = set(project_ids)
+        rows = self._connection.execute('SELECT id, stats FROM projects WHERE stats IS NOT NULL')
+        return {
+            project_id: StatsProjectResponse200Data.from_dict(json.loads(stats))
+            for project_id, stats in rows
+            if project_id in ids
+        }
@@ -10,16 +10,17 @@ import argparse
 import sys
 import logging
 import os
-import time
 import json
 import ast
 
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from customgpt_client import CustomGPT
 from customgpt_client.types import File
+from customgpt_cli.catalog import DEFAULT_STATS_MAX_AGE, ProjectCatalog, default_catalog_path
 
 def setup_logging() -> logging.Logger:
     """
@@ -65,6 +66,12 @@ def setup_logging() -> logging.Logger:
 # Setup logging once at module level
 logger = setup_logging()
 
+# Number of project stats requested at once by list-projects and delete-projects
+DEFAULT_STATS_CONCURRENCY = 8
+
+# Number of projects deleted at once by delete-projects
+DEFAULT_DELETE_CONCURRENCY = 8
+
 # Type aliases
 ProjectID = str
 SessionID = str
@@ -74,6 +81,9 @@ JsonDict = Dict[str, Any]
 class CustomGPTCLI:
     def __init__(self):
         self.parser = self._create_parser()
+        # Project stats fetched during this invocation, by project ID
+        self._stats_cache: Dict[int, Any] = {}
+        self.stats_concurrency = DEFAULT_STATS_CONCURRENCY
         
     def _create_parser(self) -> argparse.ArgumentParser:
         # Create main parser
@@ -155,6 +165,15 @@ class CustomGPTCLI:
         list_projects.add_argument('--max-query-credits', type=int, help='Filter projects with at most X query credits used')
         list_projects.add_argument('--format', choices=['table', 'json', 'csv', 'id-only'], default='table', 
                                 help='Output format')
+        list_projects.add_argument('--concurrency', type=int, default=DEFAULT_STATS_CONCURRENCY,
+                                help=f'Number of project stats requested at once (default: {DEFAULT_STATS_CONCURRENCY})')
+        list_projects.add_argument('--catalog', nargs='?', const='', metavar='PATH',
+                                help='Answer from a local catalog of the projects, refreshed incrementally '
+                                     '(default path: one file per account under ~/.customgpt-cli)')
+        list_projects.add_argument('--full-refresh', action='store_true',
+                                help='With --catalog, list every project again, dropping the deleted ones')
+        list_projects.add_argument('--stats-max-age', type=int, default=DEFAULT_STATS_MAX_AGE,
+                                help=f'With --catalog, seconds catalogued stats are reused (default: {DEFAULT_STATS_MAX_AGE})')
                 
         # Update project
         update_project = subparsers.add_parser('update-project', help='Update project')
@@ -195,6 +214,12 @@ class CustomGPTCLI:
         delete_projects.add_argument('--project-ids', required=True, help='Comma-separated list of project IDs')
         delete_projects.add_argument('--dry-run', action='store_true', help='Show what would be deleted without actually deleting')
         delete_projects.add_argument('--force', action='store_true', help='Skip confirmation prompt')
+        delete_projects.add_argument('--concurrency', type=int, default=DEFAULT_DELETE_CONCURRENCY,
+                                help=f'Number of projects deleted at once (default: {DEFAULT_DELETE_CONCURRENCY})')
+        delete_projects.add_argument('--report', help='Write the JSON result report to this file instead of stdout')
+        delete_projects.add_argument('--catalog', metavar='PATH',
+                                help='The catalog to drop the deleted projects from, when list-projects --catalog '
+                                     'was given a PATH (default: the account\'s catalog, if there is one)')
     
     def _handle_default_format(self, response):
         try:
@@ -445,6 +470,20 @@ class CustomGPTCLI:
         sync_source.add_argument('--project-id', required=True, help='The unique identifier of the project')
         sync_source.add_argument('--source-id', required=True, help='The unique identifier of the source to sync')
 
+        # Ingest directory
+        ingest_dir = subparsers.add_parser(
+            'ingest-dir',
+            help='Upload every file of a directory as sources of a project',
+            description='Upload the files of a directory concurrently, skipping files whose content the project already has. Progress is kept in a checkpoint file so an interrupted run can be resumed by running the same command again.'
+        )
+        ingest_dir.add_argument('--project-id', required=True, type=int, help='The unique identifier of the project to add the files to')
+        ingest_dir.add_argument('--directory', required=True, help='Path to the directory to upload')
+        ingest_dir.add_argument('--pattern', default='*', help='Only upload files whose name matches this glob pattern (default: *)')
+        ingest_dir.add_argument('--no-recursive', action='store_true', help='Do not descend into subdirectories')
+        ingest_dir.add_argument('--concurrency', type=int, default=4, help='Number of files uploaded at once (default: 4)')
+        ingest_dir.add_argument('--checkpoint', help='Path of the checkpoint file (default: .customgpt-ingest.json inside the directory)')
+        ingest_dir.add_argument('--file-data-retension', action='store_true', help='Retain file data for future reference')
+
     def _add_reports_commands(self, subparsers):
         """Add all reports-related command parsers."""
         # Get traffic report
@@ -558,129 +597,64 @@ class CustomGPTCLI:
         preview_file = subparsers.add_parser('preview-file', help='Preview file')
         preview_file.add_argument('--id', required=True, help='Page Id')
 
-    def _handle_rate_limit(self, response, retry_count, max_retries):
-        """
-        Handle rate limiting for API responses.
-        
-        Args:
-            response: API response object
-            retry_count: Current retry attempt number
-            max_retries: Maximum number of retry attempts
-            
-        Returns:
-            tuple: (should_retry, retry_after)
-            - should_retry: Boolean indicating if retry should be attempted
-            - retry_after: Number of seconds to wait before retry
+    def _make_api_call(self, api_func, **kwargs):
         """
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 30))
-            remaining = response.headers.get('X-RateLimit-Remaining', 'unknown')
-            reset_time = response.headers.get('X-RateLimit-Reset', 'unknown')
-            
-            logger.warning(f"Rate limited. Remaining requests: {remaining}, "
-                        f"Reset time: {reset_time}, "
-                        f"Retry after: {retry_after}s")
-            
-            if retry_count < max_retries:
-                print(f"Rate limited, waiting {retry_after} seconds before retry...")
-                return True, retry_after
-            
-            return False, 0
-        return False, 0
+        Make an API call, logging any exception.
+
+        Rate limits are handled by the SDK client: it paces requests to the
+        X-RateLimit-* headers of the API and retries 429 responses itself.
 
-    def _make_api_call(self, api_func, max_retries=3, **kwargs):
-        """
-        Make an API call with retry logic for rate limiting.
-        
         Args:
             api_func: Function to call (e.g., CustomGPT.Project.list)
-            max_retries: Maximum number of retries for rate-limited requests
             **kwargs: Arguments to pass to the API function
-            
+
         Returns:
-            API response or None if failed after retries
+            API response or None if the call failed
         """
-        retry_count = 0
-        while retry_count <= max_retries:
-            try:
-                response = api_func(**kwargs)
-                
-                should_retry, retry_after = self._handle_rate_limit(response, retry_count, max_retries)
-                if should_retry:
-                    time.sleep(retry_after)
-                    retry_count += 1
-                    continue
-                
-                return response
-            except AttributeError as e:
-                return None
-            except Exception as e:
-                logger.error(f"Exception in API call to {api_func.__name__}: {str(e)}", exc_info=True)
-                return None
-                
-        return None
+        try:
+            return api_func(**kwargs)
+        except AttributeError as e:
+            return None
+        except Exception as e:
+            logger.error(f"Exception in API call to {api_func.__name__}: {str(e)}", exc_info=True)
+            return None
 
-    def _get_project_stats(self, project_id, max_retries=3):
-        """Get project stats using standard API call handler."""
+    def _get_project_stats(self, project_id):
+        """Get project stats using standard API call handler, fetching them at most once per invocation."""
+        if project_id in self._stats_cache:
+            return self._stats_cache[project_id]
         response = self._make_api_call(
             CustomGPT.Project.stats,
-            max_retries=max_retries,
             project_id=project_id
         )
-        return response.parsed.data if response and hasattr(response, 'parsed') else None
+        stats = response.parsed.data if response and hasattr(response, 'parsed') else None
+        self._stats_cache[project_id] = stats
+        return stats
+
+    def _prefetch_project_stats(self, projects):
+        """
+        Fetch the stats of the given projects that are not known yet, on a bounded pool of threads.
+
+        Filtering and formatting then read them from the memo instead of
+        requesting them one after the other.
+        """
+        missing = list({p.id for p in projects} - self._stats_cache.keys())
+        if len(missing) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=max(self.stats_concurrency, 1)) as executor:
+            list(executor.map(self._get_project_stats, missing))
 
-    def _get_all_projects(self, max_retries=3):
-        """Fetch all projects across multiple pages using standard API call handler."""
+    def _get_all_projects(self):
+        """Fetch all projects, requesting the pages after the first one concurrently."""
         all_projects = []
-        page = 1
-        
-        while True:
-            response = self._make_api_call(
-                CustomGPT.Project.list,
-                max_retries=max_retries,
-                page=page
-            )
-            
-            if not response or not hasattr(response, 'parsed') or not response.parsed or \
-            not hasattr(response.parsed, 'data') or not response.parsed.data or \
-            not hasattr(response.parsed.data, 'data'):
-                logger.warning(f"Incomplete or invalid response on page {page} - stopping pagination")
-                break
-                
-            projects = response.parsed.data.data
-            if not projects:
-                break
-                
-            all_projects.extend(projects)
-            
-            if hasattr(response.parsed.data, 'total') and len(all_projects) >= response.parsed.data.total:
-                break
-                
-            page += 1
-            
-        return all_projects
 
-    def _delete_single_project(self, project, max_retries=3):
-        """Delete a single project using standard API call handler."""
-        response = self._make_api_call(
-            CustomGPT.Project.delete,
-            max_retries=max_retries,
-            project_id=project.id
-        )
-        
-        if not response:
-            return False
-            
-        deleted_status = (response.parsed and 
-                        hasattr(response.parsed, 'data') and 
-                        response.parsed.data and 
-                        hasattr(response.parsed.data, 'deleted') and 
-                        response.parsed.data.deleted)
-        
-        if not deleted_status:
-            logger.warning(f"Failed to delete project {project.id}. Response: {response}")
-        
-        return deleted_status
+        try:
+            for project in CustomGPT.Project.iter_all():
+                all_projects.append(project)
+        except Exception as e:
+            logger.warning(f"Incomplete or invalid response after {len(all_projects)} projects - stopping pagination: {e}")
+
+        return all_projects
 
     def _parse_datetime(self, dt_value: Any) -> Optional[datetime]:
         """Safely parse a datetime value that might be a string or datetime object."""
@@ -723,6 +697,9 @@ class CustomGPTCLI:
         Returns:
             str: Formatted output string
         """
+        if format_type != 'id-only':
+            self._prefetch_project_stats(projects)
+
         if format_type == 'json':
             import json
             from datetime import datetime
@@ -835,7 +812,7 @@ class CustomGPTCLI:
             ]
             rows = []
             for p in projects:
-                stats = self._get_project_stats(p.id)  # Use the retry-enabled method
+                stats = self._get_project_stats(p.id)
                 if stats:
                     stats_values = [
                         getattr(stats, 'pages_found', 'N/A'),
@@ -922,6 +899,7 @@ class CustomGPTCLI:
         active_filters = {k: v for k, v in stats_filters.items() if v is not None}
         
         if active_filters:
+            self._prefetch_project_stats(filtered_projects)
             filtered_projects_with_stats = []
             for project in filtered_projects:
                 try:
@@ -975,61 +953,85 @@ class CustomGPTCLI:
 
         return filtered_projects
 
-    def _delete_single_project(self, project, max_retries=3):
+    def _catalog_path(self, path=None):
+        """Get the catalog file named by --catalog, or the default one of the current account."""
+        if path:
+            return path
+        base_url = getattr(CustomGPT, 'base_url', 'https://app.customgpt.ai')
+        return default_catalog_path(CustomGPT.api_key, base_url)
+
+    def _list_projects_from_catalog(self, args, stats_filters):
         """
-        Delete a single project with retry logic for rate limiting.
-        
+        Answer list-projects from the local project catalog.
+
+        The catalog is refreshed incrementally first; stats are only requested
+        for the projects whose catalogued stats are missing or too old.
+
         Args:
-            project: Project object containing id and project_name
-            max_retries: Maximum number of retries for rate-limited requests
-            
-        Returns:
-            bool: True if deletion was successful, False otherwise
+            args: Parsed list-projects arguments
+            stats_filters: The min_*/max_* stats filters
         """
-        retry_count = 0
-        while retry_count <= max_retries:
+        with ProjectCatalog(self._catalog_path(args.catalog)) as catalog:
             try:
-                response = CustomGPT.Project.delete(project_id=project.id)
-                
-                # Log the response
-                logger.debug(f"Delete response for project {project.id}:")
-                logger.debug(f"Response status code: {response.status_code}")
-                logger.debug(f"Response headers: {response.headers}")
-                logger.debug(f"Response parsed: {response.parsed}")
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 30))
-                    remaining = response.headers.get('X-RateLimit-Remaining', 'unknown')
-                    reset_time = response.headers.get('X-RateLimit-Reset', 'unknown')
-                    
-                    logger.warning(f"Rate limited when deleting project {project.id}. "
-                                f"Remaining requests: {remaining}, "
-                                f"Reset time: {reset_time}, "
-                                f"Retry after: {retry_after}s")
-                    
-                    if retry_count < max_retries:
-                        logger.warning(f"Rate limited, waiting {retry_after} seconds before retry...")
-                        time.sleep(retry_after)
-                        retry_count += 1
-                        continue
-                    return False
-                
-                # Get deletion status
-                deleted_status = (response.parsed and 
-                                hasattr(response.parsed, 'data') and 
-                                response.parsed.data and 
-                                hasattr(response.parsed.data, 'deleted') and 
-                                response.parsed.data.deleted)
-                
-                if not deleted_status:
-                    logger.warning(f"Failed to delete project {project.id}. Response: {response}")
-                
-                return deleted_status
-
+                changed = catalog.refresh(full=args.full_refresh)
+                logger.debug(f"Catalog refreshed: {changed} projects added or updated")
             except Exception as e:
-                logger.error(f"Exception deleting project {project.id}: {str(e)}", exc_info=True)
-                return False
+                if not len(catalog):
+                    print(f"Error: Unable to retrieve projects: {e}")
+                    sys.exit(1)
+                logger.warning(f"Could not refresh the project catalog, answering from the catalogued projects: {e}")
+
+            needs_stats = args.format != 'id-only' or any(v is not None for v in stats_filters.values())
+            if needs_stats:
+                candidates = catalog.query(name_filter=args.name_filter, inactive_days=args.inactive_days)
+                stale = catalog.stale_stats([p.id for p in candidates], args.stats_max_age)
+                self._prefetch_project_stats([p for p in candidates if p.id in set(stale)])
+                catalog.store_stats({project_id: self._get_project_stats(project_id) for project_id in stale})
+                self._stats_cache.update(catalog.stats(p.id for p in candidates))
+
+            projects = catalog.query(name_filter=args.name_filter, inactive_days=args.inactive_days, **stats_filters)
+
+        if not projects:
+            print("No projects found matching the criteria")
+            return
+        print(self._format_project_output(projects, args.format))
+
+    def _delete_projects(self, projects, args):
+        """
+        Delete projects through the SDK's bulk delete, reporting each one as it finishes.
+
+        Args:
+            projects: Project objects to delete
+            args: Parsed delete-projects arguments
+        """
+        names = {p.id: p.project_name for p in projects}
+        done = []
+
+        def report(project_id, outcome):
+            if outcome != 'retrying':
+                done.append(project_id)
+            print(f"[{len(done)}/{len(names)}] {outcome:>9}  {project_id}: {names[project_id]}", file=sys.stderr)
+
+        result = CustomGPT.Project.delete_many(
+            project_ids=list(names),
+            concurrency=max(args.concurrency, 1),
+            on_project=report
+        )
+        report_json = json.dumps(result.to_dict(), indent=2)
+        if args.report:
+            with open(args.report, 'w') as f:
+                f.write(report_json + '\n')
+        else:
+            print(report_json)
+
+        print(f"\nDeletion complete: {len(result.succeeded)} succeeded, {len(result.failed)} failed, "
+              f"{len(result.retried)} retried", file=sys.stderr)
+        catalog_path = self._catalog_path(args.catalog)
+        if result.succeeded and os.path.exists(catalog_path):
+            with ProjectCatalog(catalog_path) as catalog:
+                catalog.forget(result.succeeded)
+        if result.failed:
+            sys.exit(1)
 
     def _handle_create_project(self, args):
         """
@@ -1071,9 +1073,8 @@ class CustomGPTCLI:
                         print(f"Error: Not a file: {args.file}")
                         sys.exit(1)
                         
-                    with open(file_path, 'rb') as f:
-                        file_content = f.read()
-                    create_args['file'] = File(payload=file_content, file_name=str(file_path.name))
+                    # Streamed from disk in chunks while uploading, closed after the call below
+                    create_args['file'] = File.from_path(file_path)
                     logger.debug(f"Creating project with file: {file_path.name}")
                     
                 except Exception as e:
@@ -1082,7 +1083,11 @@ class CustomGPTCLI:
                     sys.exit(1)
             
             # Make API call with retry logic
-            result = self._make_api_call(CustomGPT.Project.create, **create_args)
+            try:
+                result = self._make_api_call(CustomGPT.Project.create, **create_args)
+            finally:
+                if 'file' in create_args:
+                    create_args['file'].close()
             
             if not result or not hasattr(result, 'parsed'):
                 print("Error: Failed to create project - invalid API response")
@@ -1297,6 +1302,17 @@ class CustomGPTCLI:
         elif args.command == 'show-project':
             self._handle_show_project(args)             
         elif args.command == 'list-projects':
+            self.stats_concurrency = args.concurrency
+            stats_filters = {
+                f'{bound}_{stat}': getattr(args, f'{bound}_{stat}')
+                for stat in ('queries', 'pages_found', 'pages_crawled', 'pages_indexed', 'words_indexed',
+                             'storage_credits', 'crawl_credits', 'query_credits')
+                for bound in ('min', 'max')
+            }
+            if args.catalog is not None:
+                self._list_projects_from_catalog(args, stats_filters)
+                return
+
             all_projects = self._get_all_projects()
             
             if not all_projects:
@@ -1308,15 +1324,7 @@ class CustomGPTCLI:
                     all_projects,
                     name_filter=args.name_filter,
                     inactive_days=args.inactive_days,
-                    min_queries=args.min_queries,
-                    max_queries=args.max_queries,
-                    min_pages_found=args.min_pages_found,
-                    min_pages_crawled=args.min_pages_crawled,
-                    min_pages_indexed=args.min_pages_indexed,
-                    min_words_indexed=args.min_words_indexed,
-                    min_storage_credits=args.min_storage_credits,
-                    min_crawl_credits=args.min_crawl_credits,
-                    min_query_credits=args.min_query_credits
+                    **stats_filters
                 )
                 print(self._format_project_output(filtered_projects, args.format))
             except Exception as e:
@@ -1422,19 +1430,7 @@ class CustomGPTCLI:
                     print("Operation cancelled")
                     return
 
-            # Perform deletion
-            success_count = 0
-            error_count = 0
-            
-            for project in projects_to_delete:
-                success = self._delete_single_project(project)
-                print(f"Deleted project {project.id}: {project.project_name} -> Status: {'success' if success else 'failed'}")
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-
-            print(f"\nDeletion complete: {success_count} succeeded, {error_count} failed")
+            self._delete_projects(projects_to_delete, args)
 
     def _handle_conversation_commands(self, args):
         """Handle all conversation-related commands."""
@@ -1540,17 +1536,12 @@ class CustomGPTCLI:
                                 import sys
                                 import time
 
-                                for event in result.events():
-                                    if hasattr(event, 'data'):
-                                        try:
-                                            event_data = json.loads(event.data)
-                                            if event_data.get('status') == 'progress' and 'message' in event_data:
-                                                sys.stdout.write(event_data['message'])
-                                                sys.stdout.flush()
-                                                # Small delay for typing effect (50ms)
-                                                time.sleep(0.05)
-                                        except json.JSONDecodeError:
-                                            continue
+                                for chunk in result:
+                                    if chunk.status == 'progress' and chunk.message:
+                                        sys.stdout.write(chunk.message)
+                                        sys.stdout.flush()
+                                        # Small delay for typing effect (50ms)
+                                        time.sleep(0.05)
                                 # Add newline at the end
                                 print()
                         except Exception as e:
@@ -1715,16 +1706,15 @@ class CustomGPTCLI:
                         print(f"Error: File {args.file} does not exist")
                         sys.exit(1)
                     try:
-                        with open(args.file, 'rb') as f:
-                            file_content = f.read()
-                        result = self._make_api_call(
-                            CustomGPT.Source.create,
-                            project_id=args.project_id,
-                            file_data_retension=args.file_data_retension,
-                            is_ocr_enabled=args.is_ocr_enabled,
-                            is_anonymized=args.is_anonymized,
-                            file=File(payload=file_content, file_name=os.path.basename(args.file))
-                        )
+                        with File.from_path(args.file) as upload:
+                            result = self._make_api_call(
+                                CustomGPT.Source.create,
+                                project_id=args.project_id,
+                                file_data_retension=args.file_data_retension,
+                                is_ocr_enabled=args.is_ocr_enabled,
+                                is_anonymized=args.is_anonymized,
+                                file=upload
+                            )
                     except IOError as e:
                         print(f"Error reading file: {e}")
                         sys.exit(1)
@@ -1766,11 +1756,42 @@ class CustomGPTCLI:
                     project_id=args.project_id,
                     source_id=args.source_id
                 )
+
+            elif args.command == 'ingest-dir':
+                self._handle_ingest_dir(args)
+                return
             self._handle_default_format(result)
         except Exception as e:
             print(f"Failed to perform source {args.command}")
             sys.exit(1)
 
+    def _handle_ingest_dir(self, args):
+        """Upload a directory through the SDK's bulk ingestion, reporting each file as it finishes."""
+        if not os.path.isdir(args.directory):
+            print(f"Error: Directory {args.directory} does not exist")
+            sys.exit(1)
+
+        def report(name, outcome):
+            print(f"{outcome:>8}  {name}", file=sys.stderr)
+
+        result = CustomGPT.Source.ingest_directory(
+            project_id=args.project_id,
+            directory=args.directory,
+            pattern=args.pattern,
+            recursive=not args.no_recursive,
+            concurrency=max(args.concurrency, 1),
+            checkpoint_path=args.checkpoint,
+            file_data_retension=args.file_data_retension,
+            on_file=report
+        )
+        print(json.dumps({
+            'uploaded': result.uploaded,
+            'skipped': result.skipped,
+            'failed': result.failed
+        }, indent=2))
+        if result.failed:
+            sys.exit(1)
+
     def _handle_reports_commands(self, args):
         """Handle all reports-related commands based on OpenAPI/openapi.json."""
         try:
@@ -2019,7 +2040,7 @@ class CustomGPTCLI:
             self._handle_page_commands(args)
         elif args.command in ['get-citation']:
             self._handle_citations_commands(args)
-        elif args.command in ['list-sources', 'create-source', 'update-source', 'delete-source', 'sync-source']:
+        elif args.command in ['list-sources', 'create-source', 'update-source', 'delete-source', 'sync-source', 'ingest-dir']:
             self._handle_sources_commands(args)
         elif args.command in ['get-traffic-report', 'get-queries-report', 'get-conversations-report', 'get-analysis-report']:
             self._handle_reports_commands(args)
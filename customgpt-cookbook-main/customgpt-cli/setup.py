@@ -5,7 +5,7 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "customgpt-client>=1.1.6",
+        "customgpt-client>=1.3.0",
         "tabulate>=0.9.0",
     ],
     entry_points={
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The catalog is tested against the SDK of this repository and its stand-in API server (tests/server.py)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SDK = os.path.join(ROOT, '..', '..', 'customgpt-api-sdks-main', 'customgpt-client')
+sys.path[:0] = [ROOT, os.path.abspath(SDK)]
@@ -0,0 +1,101 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from customgpt_cli.catalog import ProjectCatalog
+from customgpt_client import CustomGPT
+from customgpt_client import client as client_module
+from customgpt_client.models import StatsProjectResponse200Data
+from tests.server import serve
+
+PER_PAGE = 2
+
+
+def project(project_id, updated_at='2023-05-08 13:06:55', name=None):
+    return {
+        'id': project_id,
+        'project_name': name or f'Project {project_id}',
+        'created_at': '2023-05-08 13:06:55',
+        'updated_at': updated_at,
+    }
+
+
+class Account:
+    """The projects of an account, listed newest first PER_PAGE at a time like list_projects does."""
+
+    def __init__(self, *projects):
+        self.projects = list(projects)
+        self.pages = []
+
+    def list_projects(self, handler):
+        page = int(parse_qs(urlsplit(handler.path).query).get('page', ['1'])[0])
+        self.pages.append(page)
+        listing = sorted(self.projects, key=lambda p: p['id'], reverse=True)
+        last_page = max((len(listing) + PER_PAGE - 1) // PER_PAGE, 1)
+        data = listing[(page - 1) * PER_PAGE:page * PER_PAGE]
+        return 200, {}, {'status': 'success', 'data': {'current_page': page, 'data': data, 'last_page': last_page}}
+
+
+@pytest.fixture
+def account(monkeypatch):
+    account = Account(*(project(project_id) for project_id in range(1, 5)))
+    with serve({('GET', '/api/v1/projects'): account.list_projects}) as server:
+        monkeypatch.setattr(client_module, '_default_client', None)
+        monkeypatch.setattr(CustomGPT, 'api_key', 'key', raising=False)
+        monkeypatch.setattr(CustomGPT, 'base_url', server.base_url, raising=False)
+        yield account
+
+
+def stats(queries, pages_indexed):
+    return StatsProjectResponse200Data.from_dict({'total_queries': queries, 'pages_indexed': pages_indexed})
+
+
+def test_refresh_stops_at_the_first_project_known_unchanged(account, tmp_path):
+    with ProjectCatalog(str(tmp_path / 'catalog.sqlite3')) as catalog:
+        assert catalog.refresh() == 4
+        assert sorted(account.pages) == [1, 2]
+        catalog.store_stats({4: stats(10, 1), 3: stats(20, 2)})
+
+        account.projects[3] = project(4, updated_at='2023-06-01 00:00:00', name='Renamed')
+        account.projects.append(project(5))
+        account.pages.clear()
+        assert catalog.refresh() == 2  # 5 is new and 4 was updated; 3, on page 2, is known unchanged
+        assert account.pages == [1, 2]
+
+        assert [p.id for p in catalog.query()] == [5, 4, 3, 2, 1]
+        assert catalog.query(name_filter='^renamed$')[0].id == 4
+        # The stats of the updated project were dropped with its old listing
+        assert list(catalog.stats([3, 4])) == [3]
+        account.pages.clear()
+        assert catalog.refresh() == 0 and account.pages == [1]
+
+
+def test_full_refresh_drops_the_deleted_projects(account, tmp_path):
+    with ProjectCatalog(str(tmp_path / 'catalog.sqlite3')) as catalog:
+        catalog.refresh()
+        del account.projects[1]
+        assert catalog.refresh() == 0  # The deletion is on a page the incremental refresh doesn't reach
+        assert len(catalog) == 4
+
+        assert catalog.refresh(full=True) == 0
+        assert [p.id for p in catalog.query()] == [4, 3, 1]
+
+
+def test_query_filters_on_the_catalogued_stats(account, tmp_path):
+    now = [1_700_000_000.0]
+    with ProjectCatalog(str(tmp_path / 'catalog.sqlite3'), clock=lambda: now[0]) as catalog:
+        catalog.refresh()
+        catalog.store_stats({1: stats(0, 0), 2: stats(5, 3), 3: stats(50, 3), 4: None})
+
+        assert [p.id for p in catalog.query(min_queries=5)] == [3, 2]
+        assert [p.id for p in catalog.query(min_queries=1, max_queries=10)] == [2]
+        assert [p.id for p in catalog.query(max_pages_indexed=0)] == [1]  # 4 has no stats, so it can't match
+        assert [p.id for p in catalog.query(max_queries=None)] == [4, 3, 2, 1]
+        with pytest.raises(ValueError):
+            catalog.query(min_bogus=1)
+
+        assert catalog.stale_stats([1, 2, 3, 4], max_age=60) == [4]
+        now[0] += 30
+        catalog.store_stats({2: stats(6, 3)})
+        now[0] += 45
+        assert catalog.stale_stats([1, 2, 3, 4], max_age=60) == [1, 3, 4]
@@ -53,6 +53,11 @@ print_header "Testing create-source command with file"
 customgpt-cli create-source --project-id $PROJECT_ID --file ./tests/files/test.pdf --file-data-retension --is-ocr-enabled --is-anonymized
 check_success "Create source with file"
 
+# Test ingest directory
+print_header "Testing ingest-dir command"
+customgpt-cli ingest-dir --project-id $PROJECT_ID --directory ./tests/files --checkpoint /tmp/customgpt-ingest-test.json
+check_success "Ingest directory"
+
 # # Test update source
 print_header "Testing update-source command"
 customgpt-cli update-source --project-id $PROJECT_ID --source-id $SOURCE_ID --executive-js --data-refresh-frequency never --create-new-pages --remove-unexist-pages --refresh-existing-pages always --refresh-schedule ["00:00","08:00"]